@@ -1,7 +1,5 @@
-from dobot_api import DobotApiFeedBack,DobotApiDashboard
-import threading
+from dobot_api import FeedBackHub,DobotApiDashboard,parse_reply,REPLY_NOT_TCP,ROBOT_MODE_ERROR,ROBOT_MODE_COLLISION
 from time import sleep
-import re
 import sys
 
 class DobotDemo:
@@ -10,27 +8,18 @@ class DobotDemo:
         self.dashboardPort = 29999
         self.feedPortFour = 30004
         self.dashboard = None
-        self.feedInfo = []
-        
-        class item:
-            def __init__(self):
-                self.robotMode = 0     #
-                self.robotCurrentCommandID = 0
-                # 自定义添加所需反馈数据
-
-        self.feedData = item()  # 定义结构对象
+        self.feedHub = None
 
     def start(self):
         # 启动机器人并使能
         self.dashboard = DobotApiDashboard(self.ip, self.dashboardPort)
-        self.feedFour = DobotApiFeedBack(self.ip, self.feedPortFour)
         if self.parseResultId(self.dashboard.EnableRobot())[0] != 0:
             print("使能失败: 检查29999端口是否被占用")
             return
         print("使能成功")
 
-        # 启动状态反馈线程
-        threading.Thread(target=self.GetFeed, daemon=True).start()
+        # 启动状态反馈线程, 反馈数据由 feedHub.latest 读取
+        self.feedHub = FeedBackHub(self.ip, self.feedPortFour).start()
 
         # 定义两个目标点
         point_a = [0, 0, 202, -4, 9, -164]
@@ -42,44 +31,48 @@ class DobotDemo:
             #self.RunPoint(point_b)
             sleep(10000)
 
-    def GetFeed(self):
-        # 获取机器人状态
-        while True:
-            feedInfo = self.feedFour.feedBackData()
-            if feedInfo != None:   
-                if hex((feedInfo['test_value'][0])) == '0x123456789abcdef':
-                    self.feedData.robotMode = feedInfo['robot_mode'][0]
-                    self.feedData.robotCurrentCommandID = feedInfo['currentcommandid'][0]
-                    # 自主添加所需机械臂反馈的数据
-                    '''
-                    self.feedData.robotErrorState = feedInfo['error_status'][0]
-                    self.feedData.robotEnableStatus = feedInfo['enable_status'][0]
-                    self.feedData.robotCurrentCommandID = feedInfo['currentcommandid'][0]
-                    '''
-
     def RunPoint(self, point_list):
         # 走点指令
         recvmovemess = self.dashboard.MovJ(*point_list, 1)
         print("MovJ:", recvmovemess)
-        print(self.parseResultId(recvmovemess))
-        currentCommandID = self.parseResultId(recvmovemess)[1]
+        result = self.parseResultId(recvmovemess)
+        print(result)
+        if result[0] != 0 or len(result) < 2:
+            print("MovJ 下发失败")
+            return False
+        currentCommandID = result[1]
         print("指令 ID:", currentCommandID)
-        #sleep(0.02)
-        while True:  #完成判断循环
-            
-            print(self.feedData.robotMode)
-            if self.feedData.robotMode == 5 and self.feedData.robotCurrentCommandID == currentCommandID:
-                print("运动结束")
-                break
-            sleep(0.1)
+        # 等待时限: 按最大关节位移以 10°/s 估算, 另加 5 秒
+        # timeout: the largest joint move at a slow 10 deg/s, plus 5 s
+        latest = self.feedHub.latest
+        current = latest.data['QActual'][0] if latest is not None else point_list
+        timeout = 5 + max(abs(a - b) for a, b in zip(point_list, current)) / 10
+        # 完成判断: 每帧反馈都会唤醒等待 woken up by every feedback frame
+        feed = self.feedHub.wait_for_command(currentCommandID, timeout)
+        if feed is None:
+            print("运动超时, 停止运动")
+            self.dashboard.Stop()
+            return False
+        robotMode = feed.data['RobotMode'][0]
+        print(robotMode)
+        if robotMode == ROBOT_MODE_ERROR or robotMode == ROBOT_MODE_COLLISION:
+            print("机器报警或碰撞, 运动未完成")
+            return False
+        print("运动结束")
+        return True
 
     def parseResultId(self, valueRecv):
         # 解析返回值，确保机器人在 TCP 控制模式
-        if "Not Tcp" in valueRecv:
+        try:
+            reply = parse_reply(valueRecv)
+        except ValueError:
+            return [2]
+        if reply.error_id == REPLY_NOT_TCP:
             print("Control Mode Is Not Tcp")
             return [1]
-        return [int(num) for num in re.findall(r'-?\d+', valueRecv)] or [2]
+        return [reply.error_id, *reply.values]
 
     def __del__(self):
         del self.dashboard
-        del self.feedFour
+        if self.feedHub is not None:
+            self.feedHub.stop()
@@ -1,7 +1,7 @@
-from dobot_api import DobotApiDashMove,  alarmAlarmJsonFile
+from dobot_api import DobotApiDashMove, parse_reply, REPLY_NOT_TCP
+from dobot_alarms import AlarmCatalog
 import threading
 from time import sleep
-import re
 import sys
 
 
@@ -62,39 +62,33 @@ class DobotDemo2:
 
 
     def parseResultId(self, valueRecv):
-        if valueRecv.find("Not Tcp") != -1:  # 通过返回值判断机器是否处于tcp模式
+        try:
+            reply = parse_reply(valueRecv)
+        except ValueError:
+            return [2]
+        if reply.error_id == REPLY_NOT_TCP:  # 通过返回值判断机器是否处于tcp模式
             print("Control Mode Is Not Tcp")
             return [1]
-        recvData = re.findall(r'-?\d+', valueRecv)
-        recvData = [int(num) for num in recvData]
-        #  返回tcp指令返回值的所有数字数组
-        if len(recvData) == 0:
-            return [2]
-        return recvData
+        #  返回错误码和返回值 error id followed by the values
+        return [reply.error_id, *reply.values]
 
     def ClearRobotError(self):
-        dataController, dataServo = alarmAlarmJsonFile()    # 读取控制器和伺服告警码
+        alarms = AlarmCatalog()    # 控制器和伺服告警码 controller and servo alarm texts
         while True:
           with self.__globalLockValue:
             if self.feedInfo.robotErrorState:
                 geterrorID = self.parseResultId(self.dashboardmove.GetErrorID())
                 if geterrorID[0] == 0:
-                    for i in range(1, len(geterrorID)):
-                        alarmState = False
-                        for item in dataController:
-                            if geterrorID[i] == item["id"]:
-                                print("机器告警 Controller GetErrorID",
-                                      i, item["zh_CN"]["description"])
-                                alarmState = True
-                                break
-                        if alarmState:
-                            continue
-
-                        for item in dataServo:
-                            if geterrorID[i] == item["id"]:
-                                print("机器告警 Servo GetErrorID", i,
-                                      item["zh_CN"]["description"])
-                                break
+                    # 第一组为控制器告警, 其后依次为 J1-J6 伺服告警
+                    # the first list holds controller ids, then one list per servo J1-J6
+                    errorLists = geterrorID[1] if len(geterrorID) > 1 else []
+                    for i, ids in enumerate(errorLists):
+                        source = "controller" if i == 0 else "servo"
+                        for errorId in ids:
+                            alarm = alarms.lookup(source, errorId, "zh_CN")
+                            if alarm is not None:
+                                print("机器告警 Controller GetErrorID" if i == 0
+                                      else "机器告警 Servo GetErrorID", errorId, alarm.description)
 
                     choose = input("输入1, 将清除错误, 机器继续运行: ")
                     if int(choose) == 1:
@@ -0,0 +1,165 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from collections import namedtuple
+
+# 告警码目录: 由 files/alarm*.json 生成的 sqlite 索引, 按 (来源, ID, 语言) 查询
+# Alarm catalog: an sqlite index built from files/alarm*.json, keyed by (source, id, language)
+#
+#     catalog = AlarmCatalog()
+#     alarm = catalog.lookup("controller", 16, "zh_CN")
+#     print(alarm.level, alarm.description, alarm.solution)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ALARM_SOURCES = {
+    'controller': os.path.join(HERE, "files", "alarmController.json"),
+    'servo': os.path.join(HERE, "files", "alarmServo.json"),
+}
+ALARM_INDEX = os.path.join(HERE, "files", "alarms.sqlite")
+ALARM_INDEX_VERSION = 1
+
+Alarm = namedtuple('Alarm', ['source', 'id', 'language', 'level', 'description', 'cause', 'solution'])
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE alarm (
+    source TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    cause TEXT NOT NULL,
+    solution TEXT NOT NULL,
+    PRIMARY KEY (source, id, language)
+) WITHOUT ROWID;
+"""
+
+
+class AlarmCatalog:
+    """
+    Alarm descriptions looked up by (source, id, language).
+
+    Nothing is read until the first lookup. The index is then opened
+    memory-mapped, or (re)built from the JSON files when it is missing or
+    older than they are; only the alarms that are looked up are loaded into
+    Python, and kept in a dict. Translations that are empty in the JSON are
+    not stored and lookup() falls back to English for them. When the index
+    cannot be written next to the JSON files it is built in memory.
+    """
+
+    def __init__(self, path=ALARM_INDEX, sources=None):
+        self.path = path
+        self.sources = dict(ALARM_SOURCES if sources is None else sources)
+        self.__db = None
+        self.__cache = {}
+        self.__lock = threading.Lock()
+
+    def lookup(self, source, id, language='en'):
+        """
+        Return the Alarm for this source ("controller" or "servo") and id, or None.
+        """
+        key = (source, id, language)
+        try:
+            return self.__cache[key]
+        except KeyError:
+            pass
+        with self.__lock:
+            db = self.__open()
+            row = db.execute("SELECT level, description, cause, solution FROM alarm "
+                             "WHERE source = ? AND id = ? AND language IN (?, 'en') "
+                             "ORDER BY language = 'en' LIMIT 1", (source, int(id), language)).fetchone()
+        alarm = None if row is None else Alarm(source, int(id), language, *row)
+        self.__cache[key] = alarm
+        return alarm
+
+    def find(self, id, language='en'):
+        """
+        Return the Alarm with this id from the first source that has it, or None.
+        """
+        for source in self.sources:
+            alarm = self.lookup(source, id, language)
+            if alarm is not None:
+                return alarm
+        return None
+
+    def close(self):
+        with self.__lock:
+            if self.__db is not None:
+                self.__db.close()
+                self.__db = None
+
+    def __open(self):
+        if self.__db is None:
+            stamp = json.dumps({source: [os.path.getsize(path), os.path.getmtime(path)]
+                                for source, path in sorted(self.sources.items())})
+            db = self.__connect(self.path) if os.path.exists(self.path) else None
+            if db is not None and self.__stamp(db) != stamp:
+                db.close()
+                db = None
+            if db is None:
+                db = self.__build(stamp)
+            self.__db = db
+        return self.__db
+
+    def __connect(self, path):
+        try:
+            db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+            db.execute("PRAGMA mmap_size = 16777216")
+            return db
+        except sqlite3.Error:
+            return None
+
+    def __stamp(self, db):
+        try:
+            meta = dict(db.execute("SELECT key, value FROM meta"))
+        except sqlite3.Error:
+            return None
+        if meta.get('version') != str(ALARM_INDEX_VERSION):
+            return None
+        return meta.get('sources')
+
+    def __build(self, stamp):
+        rows = []
+        for source, path in self.sources.items():
+            with open(path, encoding='utf-8') as f:
+                alarms = json.load(f)
+            for alarm in alarms:
+                for language, text in alarm.items():
+                    if not isinstance(text, dict):
+                        continue
+                    description, cause, solution = (text.get(name, "") for name in ('description', 'cause', 'solution'))
+                    if language == 'en' or description or cause or solution:
+                        rows.append((source, alarm['id'], language, alarm.get('level', 0), description, cause, solution))
+
+        def fill(db):
+            db.executescript(_SCHEMA)
+            db.executemany("INSERT OR REPLACE INTO alarm VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            db.executemany("INSERT INTO meta VALUES (?, ?)",
+                           [('version', str(ALARM_INDEX_VERSION)), ('sources', stamp)])
+            db.commit()
+
+        # 先写临时文件再替换, 其他进程不会读到一半的索引 written aside, then renamed into place
+        try:
+            fd, temp = tempfile.mkstemp(suffix=".sqlite", dir=os.path.dirname(self.path) or ".")
+        except OSError:
+            temp = None
+        if temp is not None:
+            os.close(fd)
+            try:
+                db = sqlite3.connect(temp)
+                try:
+                    fill(db)
+                finally:
+                    db.close()
+                os.replace(temp, self.path)
+            except (OSError, sqlite3.Error):
+                os.unlink(temp)
+            else:
+                db = self.__connect(self.path)
+                if db is not None:
+                    return db
+        db = sqlite3.connect(":memory:", check_same_thread=False)
+        fill(db)
+        return db
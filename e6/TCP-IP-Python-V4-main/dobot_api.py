@@ -1,11 +1,17 @@
 import socket
 import numpy as np
 import os
-import re
 import json
 import threading
 import time
-from time import sleep
+import queue
+import asyncio
+import types
+import random
+import select
+from functools import lru_cache
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import Future, InvalidStateError, TimeoutError as FutureTimeoutError
 
 alarmControllerFile = "files/alarmController.json"
 alarmServoFile = "files/alarmServo.json"
@@ -96,6 +102,133 @@ MyType = np.dtype([('len', np.uint16,),
                    ('reserve9', np.byte,(19,))
                    ])
 
+# 早期V4协议的反馈帧格式(旧版 V4api.py): 无 CurrentCommandId, 相同字段使用 MyType 的名字
+# Earlier V4 frame layout (the one in the old V4api.py). Fields it shares
+# with MyType have the same names and offsets; it has no CurrentCommandId,
+# has TraceIndex at 1296 and an unaligned VibrationDisZ at 1417.
+MyTypeLegacy = np.dtype([('len', np.uint16,),
+                         ('reserve', np.byte, (6, )),
+                         ('DigitalInputs', np.uint64,),
+                         ('DigitalOutputs', np.uint64,),
+                         ('RobotMode', np.uint64,),
+                         ('TimeStamp', np.uint64,),
+                         ('RunTime', np.uint64,),
+                         ('TestValue', np.uint64,),
+                         ('reserve2', np.byte, (8, )),
+                         ('SpeedScaling', np.float64,),
+                         ('LinearMomentumNorm', np.float64,),
+                         ('VMain', np.float64,),
+                         ('VRobot', np.float64,),
+                         ('IRobot', np.float64,),
+                         ('ProgramState', np.float64,),
+                         ('SafetyStatus', np.float64,),
+                         ('ToolAcceleroMeter', np.float64, (3, )),
+                         ('ElbowPosition', np.float64, (3, )),
+                         ('ElbowVelocity', np.float64, (3, )),
+                         ('QTarget', np.float64, (6, )),
+                         ('QDTarget', np.float64, (6, )),
+                         ('QDDTarget', np.float64, (6, )),
+                         ('ITarget', np.float64, (6, )),
+                         ('MTarget', np.float64, (6, )),
+                         ('QActual', np.float64, (6, )),
+                         ('QDActual', np.float64, (6, )),
+                         ('IActual', np.float64, (6, )),
+                         ('ActualTCPForce', np.float64, (6, )),
+                         ('ToolVectorActual', np.float64, (6, )),
+                         ('TCPSpeedActual', np.float64, (6, )),
+                         ('TCPForce', np.float64, (6, )),
+                         ('ToolVectorTarget', np.float64, (6, )),
+                         ('TCPSpeedTarget', np.float64, (6, )),
+                         ('MotorTemperatures', np.float64, (6, )),
+                         ('JointModes', np.float64, (6, )),
+                         ('VActual', np.float64, (6, )),
+                         ('HandType', np.byte, (4, )),
+                         ('User', np.byte,),
+                         ('Tool', np.byte,),
+                         ('RunQueuedCmd', np.byte,),
+                         ('PauseCmdFlag', np.byte,),
+                         ('VelocityRatio', np.byte,),
+                         ('AccelerationRatio', np.byte,),
+                         ('JerkRatio', np.byte,),
+                         ('XYZVelocityRatio', np.byte,),
+                         ('RVelocityRatio', np.byte,),
+                         ('XYZAccelerationRatio', np.byte,),
+                         ('RAccelerationRatio', np.byte,),
+                         ('XYZJerkRatio', np.byte,),
+                         ('RJerkRatio', np.byte,),
+                         ('BrakeStatus', np.byte,),
+                         ('EnableStatus', np.byte,),
+                         ('DragStatus', np.byte,),
+                         ('RunningStatus', np.byte,),
+                         ('ErrorStatus', np.byte,),
+                         ('JogStatusCR', np.byte,),
+                         ('CRRobotType', np.byte,),
+                         ('DragButtonSignal', np.byte,),
+                         ('EnableButtonSignal', np.byte,),
+                         ('RecordButtonSignal', np.byte,),
+                         ('ReappearButtonSignal', np.byte,),
+                         ('JawButtonSignal', np.byte,),
+                         ('SixForceOnline', np.byte,),
+                         ('CollisionState', np.byte,),
+                         ('ArmApproachState', np.byte,),
+                         ('J4ApproachState', np.byte,),
+                         ('J5ApproachState', np.byte,),
+                         ('J6ApproachState', np.byte,),
+                         ('reserve7', np.byte, (77, )),
+                         ('MActual', np.float64, (6, )),
+                         ('Load', np.float64,),
+                         ('CenterX', np.float64,),
+                         ('CenterY', np.float64,),
+                         ('CenterZ', np.float64,),
+                         ('UserValue[6]', np.float64, (6, )),
+                         ('ToolValue[6]', np.float64, (6, )),
+                         ('TraceIndex', np.float64,),
+                         ('SixForceValue', np.float64, (6, )),
+                         ('TargetQuaternion', np.float64, (4, )),
+                         ('ActualQuaternion', np.float64, (4, )),
+                         ('AutoManualMode', np.byte,),
+                         ('VibrationDisZ', np.float64,),
+                         ('reserve9', np.byte, (15, ))
+                         ])
+
+# 反馈帧格式, 按协议版本 Feedback frame layouts by controller protocol version.
+# Every layout is 1440 bytes with TestValue at offset 48, and a field means
+# the same thing under the same name in every layout.
+FEEDBACK_LAYOUTS = {
+    'V4': MyType,
+    'V4-legacy': MyTypeLegacy,
+}
+FEEDBACK_DEFAULT_LAYOUT = 'V4'
+
+# 区分版本的字节 bytes that tell the layouts apart: CurrentCommandId is
+# reserved (zero) in the legacy layout, the top bytes of the legacy
+# VibrationDisZ fall into V4's reserve9.
+_V4_ONLY = slice(MyType.fields['CurrentCommandId'][1], MyType.fields['CurrentCommandId'][1] + 8)
+_LEGACY_ONLY = slice(MyType.fields['reserve9'][1], MyTypeLegacy.fields['reserve9'][1])
+
+
+def detect_feedback_layout(frames):
+    """
+    根据反馈帧判断协议版本
+    Return the FEEDBACK_LAYOUTS key that the raw 1440-byte frames were sent
+    in, or None when they fit every layout (e.g. no command has run yet).
+    """
+    legacy = False
+    for frame in frames:
+        frame = memoryview(frame)
+        if any(frame[_V4_ONLY]):
+            return 'V4'
+        if any(frame[_LEGACY_ONLY]):
+            legacy = True
+    return 'V4-legacy' if legacy else None
+
+# 反馈帧长度及校验值 TestValue == 0x0123456789ABCDEF
+# Feedback frame size and the TestValue marker used to find frame boundaries
+FEED_FRAME_SIZE = MyType.itemsize
+FEED_TEST_VALUE = 0x0123456789ABCDEF
+FEED_TEST_OFFSET = MyType.fields['TestValue'][1]
+FEED_TEST_BYTES = FEED_TEST_VALUE.to_bytes(8, 'little')
+
 # 读取控制器和伺服告警文件
 # Read controller and servo alarm files
 
@@ -111,77 +244,669 @@ def alarmAlarmJsonFile():
         dataServo = json.load(f)
     return dataController, dataServo
 
+# 回复解析 Dashboard reply parsing
+#
+#     reply = parse_reply("0,{600.0,-260.0,380.0,170.0,12.0,140.0},GetPose();")
+#     reply.error_id, reply.values, reply.command
+#     # 0 (600.0, -260.0, 380.0, 170.0, 12.0, 140.0) GetPose()
+
+# 控制器不在TCP模式时的错误码, 不是控制器返回的 ErrorID
+# error_id of a "Not Tcp" reply; not an ErrorID the controller sends
+REPLY_NOT_TCP = -99
+
+
+class DobotReply(namedtuple('DobotReply', ['error_id', 'values', 'command'])):
+    """
+    A parsed "ErrorID,{values},Command;" reply. values is a tuple of ints
+    and floats (items that are not numbers stay strings); a value written
+    as a list, like the alarm id lists of GetErrorID, is a list.
+    """
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error_id == 0
+
+    @property
+    def value(self):
+        """
+        The first value, or None when the reply has none.
+        """
+        return self.values[0] if self.values else None
+
+
+_new_reply = tuple.__new__
+
+
+def _reply_item(text):
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text.strip().strip('"')
+
+
+def parse_reply(reply):
+    """
+    Parse a dashboard reply into a DobotReply; raises ValueError when it is not one.
+    """
+    if isinstance(reply, bytes):
+        reply = reply.decode('utf-8')
+    comma = reply.find(',')
+    begin = reply.find('{', comma)
+    end = reply.find('}', begin)
+    try:
+        if comma < 0 or begin < 0 or end < 0:
+            raise ValueError
+        error_id = int(reply[:comma])
+    except ValueError:
+        if "Not Tcp" in reply:
+            return DobotReply(REPLY_NOT_TCP, (), "")
+        raise ValueError(f"not a dashboard reply: {reply!r}") from None
+
+    body = reply[begin + 1:end]
+    if not body or body.isspace():
+        values = ()
+    elif '[' in body:
+        values = tuple(json.loads('[' + body + ']'))
+    else:
+        # 数值快速路径, int() 和 float() 会忽略空格 numeric fast path; int() and float() skip spaces
+        items = body.split(',')
+        try:
+            values = tuple(map(float if '.' in body else int, items))
+        except ValueError:
+            values = tuple(map(_reply_item, items))
+    return _new_reply(DobotReply, (error_id, values, reply[end + 1:].strip(' ,;\r\n')))
+
+# 指令编码 Command encoding
+#
+#     encode_command("MovL", 600, -260, 380, 170, 12, 140, 0, v=50, cp=80)
+#     # 'MovL(pose={600.000000,-260.000000,380.000000,170.000000,12.000000,140.000000},v=50,cp=80)'
+#
+# 指令格式表: 指令名 -> (必选参数, 可选参数)
+# Command schema: name -> (required arguments, optional arguments)
+#   必选参数 required:  d 整数 int, f 浮点 float, s 字符串 string (sent as is),
+#                       f6/d6 six values, {f6}/{d6}/{d4} values in braces,
+#                       *d any number of ints,
+#                       P 点位 a point, pose={f6} or joint={f6} as chosen by
+#                       M, the coordinateMode argument (0 pose, 1 joint)
+#   可选参数 optional:  name=kind 写为 written as name=value,
+#                       name:kind 只写值 written as the value only,
+#                       v|speed=kind 互斥, 后者优先 exclusive, the later one wins;
+#                       -1 / '' / None 表示不传 mean "not given"
+_MOTION_J = 'user=d tool=d a=d v=d cp=d'
+_MOTION_L = 'user=d tool=d a=d v|speed=d cp|r=d'
+COMMAND_SCHEMA = {
+    # 控制指令 control
+    'DisableRobot': ('', ''),
+    'ClearError': ('', ''),
+    'PowerOn': ('', ''),
+    'RunScript': ('s', ''),
+    'Stop': ('', ''),
+    'Pause': ('', ''),
+    'Continue': ('', ''),
+    'EmergencyStop': ('d', ''),
+    'BrakeControl': ('d d', ''),
+    'SpeedFactor': ('d', ''),
+    'User': ('d', ''),
+    'SetUser': ('d s', ''),
+    'CalcUser': ('d d s', ''),
+    'Tool': ('d', ''),
+    'SetTool': ('d s', ''),
+    'CalcTool': ('d d s', ''),
+    'AccJ': ('d', ''),
+    'AccL': ('d', ''),
+    'VelJ': ('d', ''),
+    'VelL': ('d', ''),
+    'CP': ('d', ''),
+    'SetCollisionLevel': ('d', ''),
+    'SetBackDistance': ('d', ''),
+    'SetPostCollisionMode': ('d', ''),
+    'StartDrag': ('', ''),
+    'StopDrag': ('', ''),
+    'DragSensivity': ('d d', ''),
+    'EnableSafeSkin': ('d', ''),
+    'SetSafeSkin': ('d d', ''),
+    'SetSafeWallEnable': ('d d', ''),
+    'SetWorkZoneEnable': ('d d', ''),
+    'RequestControl': ('', ''),
+    # 查询指令 queries
+    'RobotMode': ('', ''),
+    'PositiveKin': ('f6', 'user=d tool=d'),
+    'InverseKin': ('f6', 'user=d tool=d useJointNear=d JointNear=s'),
+    'GetAngle': ('', ''),
+    'GetPose': ('', 'user=d tool=d'),
+    'GetErrorID': ('', ''),
+    'GetCurrentCommandID': ('', ''),
+    # IO指令 I/O
+    'DO': ('d d', 'time:d'),
+    'DOInstant': ('d d', ''),
+    'GetDO': ('d', ''),
+    'DOGroup': ('*d', ''),
+    'GetDOGroup': ('*d', ''),
+    'ToolDO': ('d d', ''),
+    'ToolDOInstant': ('d d', ''),
+    'GetToolDO': ('d', ''),
+    'AO': ('d f', ''),
+    'AOInstant': ('d f', ''),
+    'GetAO': ('d', ''),
+    'DI': ('d', ''),
+    'DIGroup': ('*d', ''),
+    'ToolDI': ('d', ''),
+    'AI': ('d', ''),
+    'ToolAI': ('d', ''),
+    'SetToolPower': ('d', 'identify:d'),
+    'SetToolMode': ('d d', 'identify:d'),
+    'ModbusCreate': ('s d d', 'isRTU:d'),
+    'ModbusClose': ('d', ''),
+    'GetInBits': ('d d d', ''),
+    'GetInRegs': ('d d d', 'valType:s'),
+    'GetCoils': ('d d d', ''),
+    'SetCoils': ('d d d s', ''),
+    'GetHoldRegs': ('d d d', 'valType:s'),
+    'SetHoldRegs': ('d d d s', 'valType:s'),
+    'GetInputBool': ('d', ''),
+    'GetInputInt': ('d', ''),
+    'GetInputFloat': ('d', ''),
+    'GetOutputBool': ('d', ''),
+    'GetOutputInt': ('d', ''),
+    'GetOutputFloat': ('d', ''),
+    'SetOutputBool': ('d d', ''),
+    'SetOutputInt': ('d d', ''),
+    'SetOutputFloat': ('d f', ''),
+    # 运动指令 motion
+    'MovJ': ('P M', _MOTION_J),
+    'MovL': ('P M', _MOTION_L),
+    'ServoJ': ('f6', 't=f aheadtime=f gain=f'),
+    'ServoP': ('f6', 't=f aheadtime=f gain=f'),
+    'MovLIO': ('P M {d4}', _MOTION_L),
+    'MovJIO': ('P M {d4}', _MOTION_J),
+    'Arc': ('P P M', _MOTION_L),
+    'Circle': ('P P M d', _MOTION_L),
+    'MoveJog': ('s', 'coordtype=d user=d tool=d'),
+    'GetStartPose': ('s', ''),
+    'StartPath': ('s', 'isConst=d multi=f user=d tool=d'),
+    'RelMovJTool': ('f6', _MOTION_J),
+    'RelMovLTool': ('f6', _MOTION_L),
+    'RelMovJUser': ('f6', _MOTION_J),
+    'RelMovLUser': ('f6', _MOTION_L),
+    'RelJointMovJ': ('f6', 'a=d v=d cp=d'),
+    'RelPointTool': ('M P {f6}', ''),
+    'RelPointUser': ('M P {f6}', ''),
+    'RelJoint': ('f6 {f6}', ''),
+    # 轨迹恢复及日志导出 path recovery and log export
+    'SetResumeOffset': ('f', ''),
+    'PathRecovery': ('', ''),
+    'PathRecoveryStop': ('', ''),
+    'PathRecoveryStatus': ('', ''),
+    'LogExportUSB': ('d', ''),
+    'GetExportStatus': ('', ''),
+    # 力控指令 force control
+    'EnableFTSensor': ('d', ''),
+    'SixForceHome': ('', ''),
+    'GetForce': ('', 'tool:d'),
+    'ForceDriveMode': ('{d6}', 'user:d'),
+    'ForceDriveSpeed': ('d', ''),
+    'FCForceMode': ('{d6} {d6}', 'reference=d user=d tool=d'),
+    'FCSetDeviation': ('{d6}', 'controltype:d'),
+    'FCSetForceLimit': ('d6', ''),
+    'FCSetMass': ('d6', ''),
+    'FCSetStiffness': ('d6', ''),
+    'FCSetDamping': ('d6', ''),
+    'FCOff': ('', ''),
+    'FCSetForceSpeedLimit': ('d6', ''),
+    'FCSetForce': ('d6', ''),
+}
+
+_KIND_FORMAT = {'d': '{:d}', 'f': '{:f}', 's': '{:s}'}
+_KIND_TYPES = {
+    'd': (int, np.integer),
+    'f': (int, float, np.integer, np.floating),
+    's': (str,),
+}
+_MISSING = (-1, '', None)
+
+# 解析后的指令格式 a schema entry, parsed once
+_CommandSpec = namedtuple('_CommandSpec', ['required', 'count', 'variadic', 'mode', 'slots', 'options'])
+
+
+def _parse_command_spec(required, optional):
+    tokens = tuple(required.split())
+    variadic = tokens == ('*d',)
+    count = 0
+    mode = None
+    for token in () if variadic else tokens:
+        if token == 'M':
+            mode = count
+        if token in ('d', 'f', 's', 'M'):
+            count += 1
+        elif token == 'P':
+            count += 6
+        else:
+            count += int(token.strip('{}')[1:])
+    slots = []
+    for option in optional.split():
+        keyword = '=' in option
+        names, kind = option.split('=' if keyword else ':')
+        slots.append((tuple(names.split('|')), kind, keyword))
+    # 可选参数名 -> (槽位, 互斥组内的次序) option name -> (slot, rank among exclusive names)
+    options = {name: (index, rank) for index, (names, _, _) in enumerate(slots) for rank, name in enumerate(names)}
+    return _CommandSpec(tokens, count, variadic, mode, tuple(slots), options)
+
+
+_COMMAND_SPECS = {name: _parse_command_spec(*spec) for name, spec in COMMAND_SCHEMA.items()}
+
+
+@lru_cache(maxsize=512)
+def _command_format(name, count, mode, present):
+    # 一条指令形式的格式串和各值的类型 format string and value kinds for one shape of a command
+    spec = _COMMAND_SPECS[name]
+    parts = []
+    kinds = []
+    if spec.variadic:
+        parts.append(','.join(['{:d}'] * count))
+        kinds += 'd' * count
+    for token in () if spec.variadic else spec.required:
+        if token == 'M':
+            continue
+        if token == 'P':
+            parts.append(('pose' if mode == 0 else 'joint') + '={{' + ','.join(['{:f}'] * 6) + '}}')
+            kinds += 'f' * 6
+        elif token in _KIND_FORMAT:
+            parts.append(_KIND_FORMAT[token])
+            kinds.append(token)
+        else:
+            kind, size = token.strip('{}')[0], int(token.strip('{}')[1:])
+            values = ','.join([_KIND_FORMAT[kind]] * size)
+            parts.append('{{' + values + '}}' if token.startswith('{') else values)
+            kinds += kind * size
+    for (names, kind, keyword), given in zip(spec.slots, present):
+        if given is not None:
+            parts.append(f"{given}={_KIND_FORMAT[kind]}" if keyword else _KIND_FORMAT[kind])
+            kinds.append(kind)
+    return f"{name}(" + ','.join(parts) + ")", tuple(_KIND_TYPES[kind] for kind in kinds)
+
+
+def encode_command(name, /, *args, **options):
+    """
+    Encode one dashboard command from its COMMAND_SCHEMA entry.
+
+    args are the required arguments in schema order (for a point, six
+    values and then coordinateMode); options are the optional ones by name,
+    -1, '' or None leaving one out. The number and types of the arguments
+    are checked before anything is sent; each shape of a command
+    (coordinateMode and which options are given) is compiled to a format
+    string once and cached.
+    """
+    try:
+        spec = _COMMAND_SPECS[name]
+    except KeyError:
+        raise ValueError(f"unknown command {name!r}") from None
+    count = len(args)
+    if spec.variadic:
+        if count == 0:
+            raise TypeError(f"{name}() needs at least one argument")
+    elif count != spec.count:
+        raise TypeError(f"{name}() takes {spec.count} arguments ({count} given)")
+    mode = None
+    values = list(args)
+    if spec.mode is not None:
+        mode = values.pop(spec.mode)
+        if mode != 0 and mode != 1:
+            raise ValueError(f"{name}(): coordinateMode must be 0 (pose) or 1 (joint), not {mode!r}")
+    present = (None,) * len(spec.slots)
+    if options:
+        unknown = options.keys() - spec.options.keys()
+        if unknown:
+            raise TypeError(f"{name}() got unexpected option(s) {sorted(unknown)}")
+        chosen = {}
+        for option, value in options.items():
+            if value not in _MISSING:
+                index, rank = spec.options[option]
+                if index not in chosen or chosen[index][0] < rank:
+                    chosen[index] = (rank, option, value)
+        if chosen:
+            present = list(present)
+            for index in sorted(chosen):
+                _, present[index], value = chosen[index]
+                values.append(value)
+            present = tuple(present)
+    string, types_ = _command_format(name, count, mode, present)
+    try:
+        # 格式码本身会拒绝类型不符的值 the format codes reject values of the wrong kind
+        return string.format(*values)
+    except (TypeError, ValueError):
+        for value, expected in zip(values, types_):
+            if not isinstance(value, expected):
+                raise TypeError(f"{name}(): {value!r} is not {_type_name(expected)}") from None
+        raise
+
+
+def encode_commands(commands):
+    """
+    Encode (name, args) or (name, args, options) tuples into one buffer of
+    wire bytes, to be sent with a single send.
+    """
+    return ''.join([encode_command(command[0], *command[1], **(command[2] if len(command) > 2 else {}))
+                    for command in commands]).encode('utf-8')
+
+
+def _type_name(expected):
+    return {_KIND_TYPES['d']: "an int", _KIND_TYPES['f']: "a number", _KIND_TYPES['s']: "a string"}[expected]
+
 # Tcp通信接口类
 # TCP communication interface
 
 
-class DobotApi:
-    def __init__(self, ip, port, *args):
+# 连接监管: 每个端口一个, 负责连接、断线重连和保活
+# Connection supervision: one per port, owns the socket, reconnects and keeps it alive
+
+LINK_CONNECTING = 'connecting'  # 首次连接中 not connected yet
+LINK_READY = 'ready'
+LINK_DEGRADED = 'degraded'  # 连接断开, 正在重连 lost, reconnecting
+LINK_CLOSED = 'closed'
+
+
+class DobotConnectionError(ConnectionError):
+    """
+    The port is not connected: raised at once instead of waiting for a reconnect.
+    """
+
+
+class DobotTimeoutError(TimeoutError):
+    """
+    No reply before the command's deadline. The command may still run; its
+    late reply is dropped.
+    """
+
+
+class ConnectionSupervisor:
+    """
+    Owns the socket of one port and its state: connecting, ready, degraded
+    (was ready, lost, reconnecting) or closed.
+
+    socket() returns the socket when ready and raises DobotConnectionError
+    otherwise, so callers fail fast instead of blocking while the link is
+    down. Whoever sees the connection fail calls lost(); a background thread
+    then reconnects with exponential backoff (backoff doubling up to
+    max_backoff, with full jitter so that several clients do not retry in
+    step). With keepalive set, an idle link is checked every keepalive
+    seconds: probe(timeout) is called and must not raise, or, without a
+    probe, data must have arrived (touch()) within keepalive_timeout once
+    the owner has started reading, or be waiting unread in the socket (the
+    owner is busy, the link is fine). io_timeout, if set, is the socket timeout
+    of every connection, so that no send or receive blocks for longer.
+    listeners are called with the new state on every change.
+    """
+
+    def __init__(self, ip, port, connect_timeout=3.0, backoff=0.2, max_backoff=10.0,
+                 keepalive=None, keepalive_timeout=2.0, probe=None, io_timeout=None):
         self.ip = ip
         self.port = port
-        self.socket_dobot = 0
-        self.__globalLock = threading.Lock()
-        if args:
-            self.text_log = args[0]
+        self.connect_timeout = connect_timeout
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.keepalive = keepalive
+        self.keepalive_timeout = keepalive_timeout
+        self.probe = probe
+        self.io_timeout = io_timeout
+        self.listeners = []
+        self.sock = None
+        self.state = LINK_CONNECTING
+        self.last_error = None
+        self.connects = 0
+        self.failed_attempts = 0
+        self.outages = 0
+        self.downtime = 0.0
+        self.last_outage = None
+        self.keepalives = 0
+        self.keepalive_failures = 0
+        self.__since = time.monotonic()
+        self.__activity = self.__since
+        self.__reading = False
+        self.__cond = threading.Condition()
+        self.__thread = None
+
+    def start(self):
+        """
+        Try to connect once, then leave the rest to the background thread.
+        """
+        self.__connect()
+        self.__thread = threading.Thread(target=self.__run, name=f"ConnectionSupervisor-{self.port}",
+                                         daemon=True)
+        self.__thread.start()
+        return self
+
+    def socket(self):
+        sock = self.sock
+        if sock is None or self.state != LINK_READY:
+            raise DobotConnectionError(
+                f"{self.ip}:{self.port} {self.state}"
+                + (f" ({self.last_error})" if self.last_error else "")
+                + ", 命令未发送 command not sent")
+        return sock
+
+    def touch(self):
+        self.__activity = time.monotonic()
+        self.__reading = True
+
+    def lost(self, sock, error=None):
+        """
+        Report that sock failed; ignored if it has already been replaced.
+        """
+        with self.__cond:
+            if sock is not self.sock or self.state != LINK_READY:
+                return
+            self.last_error = error
+            self.sock = None
+            self.outages += 1
+            self.__setState(LINK_DEGRADED)
+            self.__cond.notify_all()
+        _close_socket(sock)
+
+    def adopt(self, sock):
+        """
+        Use an already connected socket from now on.
+        """
+        with self.__cond:
+            old, self.sock = self.sock, sock
+            self.connects += 1
+            self.__activity = time.monotonic()
+            self.__reading = False
+            self.__setState(LINK_READY)
+            self.__cond.notify_all()
+        if old is not None and old is not sock:
+            _close_socket(old)
+
+    def wait_ready(self, timeout=None):
+        with self.__cond:
+            return self.__cond.wait_for(lambda: self.state in (LINK_READY, LINK_CLOSED), timeout) \
+                and self.state == LINK_READY
 
-        if self.port == 29999 or self.port == 30004 or self.port == 30005:
+    def close(self):
+        with self.__cond:
+            if self.state == LINK_CLOSED:
+                return
+            sock, self.sock = self.sock, None
+            self.__setState(LINK_CLOSED)
+            self.__cond.notify_all()
+        if sock is not None:
+            _close_socket(sock)
+
+    def metrics(self):
+        """
+        Counters and durations of this link, as a dict.
+        """
+        now = time.monotonic()
+        down = self.downtime + (now - self.__since if self.state in (LINK_CONNECTING, LINK_DEGRADED) else 0.0)
+        return {
+            'state': self.state,
+            'state_seconds': now - self.__since,
+            'connects': self.connects,
+            'reconnects': max(self.connects - 1, 0),
+            'failed_attempts': self.failed_attempts,
+            'outages': self.outages,
+            'downtime_seconds': down,
+            'last_outage_seconds': self.last_outage,
+            'keepalives': self.keepalives,
+            'keepalive_failures': self.keepalive_failures,
+            'last_error': None if self.last_error is None else str(self.last_error),
+        }
+
+    def __setState(self, state):
+        now = time.monotonic()
+        if self.state in (LINK_CONNECTING, LINK_DEGRADED) and state == LINK_READY:
+            self.downtime += now - self.__since
+            if self.state == LINK_DEGRADED:
+                self.last_outage = now - self.__since
+        self.state = state
+        self.__since = now
+        for listener in self.listeners:
             try:
-                self.socket_dobot = socket.socket()
-                self.socket_dobot.connect((self.ip, self.port))
-                self.socket_dobot.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 144000)
-            except socket.error:
-                print(socket.error)
+                listener(state)
+            except Exception as e:
+                print(f"connection listener failed: {e}")
 
-        else:
+    def __connect(self):
+        try:
+            sock = socket.create_connection((self.ip, self.port), timeout=self.connect_timeout)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 144000)
+            sock.settimeout(self.io_timeout)
+        except OSError as e:
+            self.failed_attempts += 1
+            self.last_error = e
+            return False
+        with self.__cond:
+            if self.state == LINK_CLOSED:
+                _close_socket(sock)
+                return False
+            self.sock = sock
+            self.connects += 1
+            self.__activity = time.monotonic()
+            self.__reading = False
+            self.__setState(LINK_READY)
+            self.__cond.notify_all()
+        return True
+
+    def __run(self):
+        failures = 0
+        while True:
+            with self.__cond:
+                if self.state == LINK_READY:
+                    self.__cond.wait(self.keepalive)
+                state = self.state
+            if state == LINK_CLOSED:
+                return
+            if state == LINK_READY:
+                failures = 0
+                if self.keepalive is not None and time.monotonic() - self.__activity >= self.keepalive:
+                    self.__keepAlive()
+                continue
+            # 抖动的指数退避 exponential backoff with full jitter
+            delay = random.uniform(0.0, min(self.max_backoff, self.backoff * 2 ** failures))
+            with self.__cond:
+                if self.__cond.wait_for(lambda: self.state == LINK_CLOSED, delay):
+                    return
+            if not self.__connect():
+                failures += 1
+
+    def __keepAlive(self):
+        sock = self.sock
+        self.keepalives += 1
+        try:
+            if self.probe is not None:
+                self.probe(self.keepalive_timeout)
+            elif self.__reading and time.monotonic() - self.__activity > self.keepalive_timeout \
+                    and not _has_unread(sock):
+                raise TimeoutError(f"no data for {self.keepalive_timeout} s")
+        except Exception as e:
+            self.keepalive_failures += 1
+            self.lost(sock, e)
+
+
+def _has_unread(sock):
+    # 接收缓冲区中有数据 (或对端关闭) 时可读 readable when data (or EOF) is waiting
+    try:
+        return bool(select.select([sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return False
+
+
+def _close_socket(sock):
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    sock.close()
+
+
+class DobotApi:
+    def __init__(self, ip, port, *args, keepalive=None, probe=None, io_timeout=None):
+        self.ip = ip
+        self.port = port
+        self.__globalLock = threading.Lock()
+        self.text_log = args[0] if args else None
+        if self.port not in (29999, 30004, 30005):
             print(f"Connect to dashboard server need use port {self.port} !")
+        self.link = ConnectionSupervisor(ip, port, keepalive=keepalive, probe=probe, io_timeout=io_timeout)
+        self.link.start()
+        if self.link.state != LINK_READY:
+            print(f"{ip}:{port} {self.link.last_error}, 后台重连中 reconnecting in the background")
+
+    @property
+    def socket_dobot(self):
+        # 兼容旧代码: 未连接时为0 for older code, 0 while not connected
+        sock = self.link.sock
+        return 0 if sock is None else sock
+
+    @socket_dobot.setter
+    def socket_dobot(self, sock):
+        self.link.adopt(sock)
 
     def log(self, text):
         if self.text_log:
             print(text)
 
     def send_data(self, string):
+        """
+        Send string (or bytes); DobotConnectionError if the port is not connected.
+        """
        # self.log(f"Send to {self.ip}:{self.port}: {string}")
+        data = string if isinstance(string, bytes) else str.encode(string, 'utf-8')
+        sock = self.link.socket()
         try:
-            self.socket_dobot.send(str.encode(string, 'utf-8'))
-        except Exception as e:
-            print(e)
-            while True:
-                try:
-                    self.socket_dobot = self.reConnect(self.ip, self.port)
-                    self.socket_dobot.send(str.encode(string, 'utf-8'))
-                    break
-                except Exception:
-                    sleep(1)
+            sock.sendall(data)
+        except OSError as e:
+            self.link.lost(sock, e)
+            raise DobotConnectionError(f"{self.ip}:{self.port} 发送失败 send failed: {e}") from e
+        return sock
 
     def wait_reply(self):
         """
         Read the return value
         """
-        data = ""
+        sock = self.link.socket()
         try:
-            data = self.socket_dobot.recv(1024)
-        except Exception as e:
-            print(e)
-            self.socket_dobot = self.reConnect(self.ip, self.port)
-
-        finally:
-            if len(data) == 0:
-                data_str = data
-            else:
-                data_str = str(data, encoding="utf-8")
-            # self.log(f'Receive from {self.ip}:{self.port}: {data_str}')
-            return data_str
+            data = sock.recv(1024)
+        except OSError as e:
+            self.link.lost(sock, e)
+            raise DobotConnectionError(f"{self.ip}:{self.port} 接收失败 receive failed: {e}") from e
+        if len(data) == 0:
+            self.link.lost(sock, ConnectionError("closed by peer"))
+            raise DobotConnectionError(f"{self.ip}:{self.port} 连接已断开 connection closed")
+        self.link.touch()
+        data_str = str(data, encoding="utf-8")
+        # self.log(f'Receive from {self.ip}:{self.port}: {data_str}')
+        return data_str
 
     def close(self):
         """
         Close the port
         """
-        if (self.socket_dobot != 0):
-            try:
-                self.socket_dobot.shutdown(socket.SHUT_RDWR)
-                self.socket_dobot.close()
-            except socket.error as e:
-                print(f"Error while closing socket: {e}")
+        self.link.close()
 
     def sendRecvMsg(self, string):
         """
@@ -194,17 +919,489 @@ class DobotApi:
             return recvData
 
     def __del__(self):
-        self.close()
+        link = self.__dict__.get('link')
+        if link is not None:
+            link.close()
 
     def reConnect(self, ip, port):
-        while True:
+        """
+        等待后台重连完成 Wait until the supervisor has reconnected; return the socket.
+        """
+        self.link.wait_ready()
+        return self.link.sock
+
+# 指令流水线: 多条指令同时在途, 按顺序匹配回复
+# Command pipeline: several commands in flight, replies matched in order
+
+
+class DobotCommandChannel:
+    """
+    Pipelined request/reply channel on the dashboard port (29999).
+
+    submit() sends a command without waiting for earlier replies and returns
+    a concurrent.futures.Future; at most max_in_flight commands are
+    outstanding, further submit() calls block until a reply arrives. A
+    reader thread splits the incoming stream on ';' and resolves the pending
+    futures in FIFO order, which is the order the controller answers in.
+    Replies are not limited in length.
+
+    request() takes a timeout: when it expires the Future is cancelled but
+    keeps its place in the queue, so the late reply is read and dropped
+    rather than given to the next command. cancel() does the same for every
+    command still waiting for its reply. Replies echo their command; a
+    cancelled command whose reply never comes is skipped when a reply for a
+    later command arrives instead.
+    """
+
+    def __init__(self, api, max_in_flight=32):
+        self.api = api
+        self.__pending = deque()
+        self.__slots = threading.BoundedSemaphore(max_in_flight)
+        self.__lock = threading.Lock()
+        self.__running = True
+        self.__thread = threading.Thread(
+            target=self.__run, name=f"DobotCommandChannel-{api.port}", daemon=True)
+        self.__thread.start()
+
+    def submit(self, string, timeout=None):
+        """
+        Send string and return a Future for its reply. With timeout, wait at
+        most that long for a free slot, else raise DobotTimeoutError.
+        """
+        if not self.__slots.acquire(timeout=timeout):
+            raise DobotTimeoutError(f"{self.api.ip}:{self.api.port} {timeout} s 内无空闲槽位 no free slot: {string}")
+        future = Future()
+        with self.__lock:
             try:
-                socket_dobot = socket.socket()
-                socket_dobot.connect((ip, port))
-                break
-            except Exception:
-                sleep(1)
-        return socket_dobot
+                sock = self.api.send_data(string)
+            except BaseException:
+                self.__slots.release()
+                raise
+            # 记录发送所用的连接 remember which connection it went out on
+            self.__pending.append((sock, future, _command_name(string)))
+        return future
+
+    def submit_many(self, strings):
+        """
+        Send several commands with as few sends as possible and return
+        their Futures. Commands go out in one buffer while free slots last;
+        when max_in_flight is reached what is gathered so far is sent and
+        the rest waits for replies.
+        """
+        futures = []
+        batch = []
+        try:
+            for string in strings:
+                if not self.__slots.acquire(blocking=False):
+                    self.__sendBatch(batch, futures)
+                    batch = []
+                    self.__slots.acquire()
+                batch.append(string)
+            self.__sendBatch(batch, futures)
+        except BaseException:
+            for _ in batch:
+                self.__slots.release()
+            raise
+        return futures
+
+    def request(self, string, timeout=None):
+        """
+        Send string and wait for its reply; DobotTimeoutError if none came
+        within timeout seconds, counting the wait for a free slot.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        future = self.submit(string, timeout)
+        try:
+            return future.result(None if deadline is None else max(deadline - time.monotonic(), 0.0))
+        except FutureTimeoutError:
+            future.cancel()  # 回复到达时丢弃 its reply is dropped when it comes
+            raise DobotTimeoutError(
+                f"{self.api.ip}:{self.api.port} {timeout} s 内无回复 no reply: {string}") from None
+
+    def cancel(self):
+        """
+        Cancel every command still waiting for its reply; return how many.
+        The commands have been sent, only their replies are dropped.
+        """
+        with self.__lock:
+            futures = [future for _, future, _ in self.__pending]
+        return sum(future.cancel() for future in futures if not future.done())
+
+    def close(self):
+        self.__running = False
+        with self.__lock:
+            self.__failPending(None, DobotConnectionError("指令通道已关闭 Command channel closed"))
+
+    def __sendBatch(self, batch, futures):
+        if not batch:
+            return
+        with self.__lock:
+            sock = self.api.send_data(''.join(batch))
+            for string in batch:
+                future = Future()
+                self.__pending.append((sock, future, _command_name(string)))
+                futures.append(future)
+
+    def __failPending(self, sock, error):
+        # 连接断开, 该连接上等待的指令都失败 fail everything sent on sock (None: all)
+        while self.__pending and (sock is None or self.__pending[0][0] is sock):
+            _, future, _ = self.__pending.popleft()
+            self.__slots.release()
+            _set_future_exception(future, error)
+
+    def __resolve(self, sock, reply):
+        name = _command_name(reply[reply.find('},') + 2:]) if reply.endswith(');') else None
+        with self.__lock:
+            while True:
+                if not self.__pending or self.__pending[0][0] is not sock:
+                    return  # 旧连接上的回复 stale reply from an old connection
+                _, future, sent = self.__pending.popleft()
+                self.__slots.release()
+                if not (future.cancelled() and name and sent != name and self.__expects(sock, name)):
+                    break
+                # 已取消且始终没有回复的指令 cancelled and never answered, skip it
+        _set_future_result(future, reply)
+
+    def __expects(self, sock, name):
+        return any(s is sock and sent == name for s, _, sent in self.__pending)
+
+    def __run(self):
+        buf = bytearray()
+        link = self.api.link
+        while self.__running:
+            sock = link.sock
+            if sock is None:
+                # 等待重连, 期间新指令直接失败 new commands fail while this waits
+                link.wait_ready(0.5)
+                if link.state == LINK_CLOSED:
+                    break
+                continue
+            try:
+                data = sock.recv(4096)
+            except socket.timeout:
+                continue  # io_timeout: 无数据不代表断开 no data is not a lost link
+            except OSError as e:
+                data = b''
+                error = e
+            else:
+                error = "closed by peer"
+            if not data:
+                if not self.__running:
+                    break
+                link.lost(sock, error)
+                with self.__lock:
+                    self.__failPending(sock, DobotConnectionError(
+                        f"连接断开, 指令未收到回复 Connection lost before reply ({error})"))
+                buf.clear()
+                continue
+
+            link.touch()
+            buf += data
+            end = buf.find(b';')
+            while end >= 0:
+                self.__resolve(sock, buf[:end + 1].decode('utf-8'))
+                del buf[:end + 1]
+                end = buf.find(b';')
+            if buf.find(b'Not Tcp') >= 0:
+                # 非TCP模式的提示不一定以';'结尾 may come without ';'
+                self.__resolve(sock, buf.decode('utf-8'))
+                buf.clear()
+
+
+def _command_name(string):
+    return string[:string.find('(')].strip()
+
+
+def _set_future_result(future, result):
+    if not future.done():
+        try:
+            future.set_result(result)
+        except InvalidStateError:
+            pass  # 已取消 cancelled
+
+
+def _set_future_exception(future, error):
+    if not future.done():
+        try:
+            future.set_exception(error)
+        except InvalidStateError:
+            pass  # 已取消 cancelled
+
+
+# 优先通道: Stop/Pause/EmergencyStop 走独立的控制端口连接
+# Priority lane: Stop/Pause/EmergencyStop on a connection of their own
+
+class DobotPriorityLane:
+    """
+    A second, pre-connected dashboard connection for the commands that must
+    not wait: Stop(), Pause() and EmergencyStop(). Nothing else is sent on
+    it, so they never queue behind a slow InverseKin or a full pipeline on
+    the main connection, and it is kept alive (RobotMode() when idle) so a
+    dead lane is found and reconnected before it is needed.
+
+    A command that gets no reply within timeout seconds drops the lane
+    connection, so a late reply can never be read as the answer to the next
+    one. The time from send() being called to the reply, lock wait
+    included, is kept for the last `history` commands of each kind;
+    stats() reports it.
+    """
+
+    def __init__(self, ip, port=29999, timeout=1.0, keepalive=2.0, history=256):
+        self.timeout = timeout
+        self.failures = 0
+        self.__lock = threading.Lock()
+        self.__history = history
+        self.__latency = {}
+        self.api = DobotApi(ip, port, keepalive=keepalive, probe=self.__probe, io_timeout=timeout)
+
+    @property
+    def link(self):
+        return self.api.link
+
+    def send(self, string, timeout=None):
+        """
+        Send one command on the lane and return its reply; raises
+        DobotConnectionError if the lane is down or the reply is late.
+        """
+        begin = time.perf_counter()
+        try:
+            reply = self.__roundTrip(string, timeout)
+        except DobotConnectionError:
+            self.failures += 1
+            raise
+        name = _command_name(string)
+        if name not in self.__latency:
+            self.__latency[name] = deque(maxlen=self.__history)
+        self.__latency[name].append(time.perf_counter() - begin)
+        return reply
+
+    def stats(self):
+        """
+        Latency per command in microseconds (count, p50, p99, max), failures
+        and the lane's connection metrics, as a dict.
+        """
+        commands = {}
+        for name, samples in list(self.__latency.items()):
+            samples = np.array(samples) * 1e6
+            commands[name] = {
+                'count': len(samples),
+                'p50_us': float(np.percentile(samples, 50)),
+                'p99_us': float(np.percentile(samples, 99)),
+                'max_us': float(samples.max()),
+            }
+        return {'commands': commands, 'failures': self.failures, 'link': self.link.metrics()}
+
+    def close(self):
+        self.api.close()
+
+    def __roundTrip(self, string, timeout):
+        with self.__lock:
+            sock = self.api.send_data(string)
+            if timeout is not None and timeout != self.timeout:
+                sock.settimeout(timeout)
+            try:
+                return self.api.wait_reply()
+            finally:
+                if timeout is not None and timeout != self.timeout:
+                    sock.settimeout(self.timeout)
+
+    def __probe(self, timeout):
+        # 空闲时的保活指令, 不计入时延统计 keepalive, not counted in stats()
+        self.__roundTrip("RobotMode()", timeout)
+
+
+# 正逆解结果缓存 Cache of InverseKin / PositiveKin replies
+
+
+class KinematicsCache:
+    """
+    LRU cache of successful InverseKin/PositiveKin replies.
+
+    Keys are the command name, the six values rounded to resolution (mm and
+    degrees) and the user/tool/useJointNear/JointNear options, so a pose
+    revisited with float noise below resolution is a hit. Everything is
+    dropped when a coordinate system is changed (SetUser, SetTool, CalcUser,
+    CalcTool, User, Tool) or when the User or Tool index in the feedback
+    changes (attach() to a FeedBackHub, or call sync() for every frame).
+    Until the feedback has been seen, calls with user or tool -1 (the
+    current coordinate system, which the pendant or another client may
+    change) are not cached: key() returns None. A reply still in flight
+    when the cache is cleared is not stored.
+
+    Without useJointNear the controller picks the solution nearest to the
+    current joints; the cache then keeps the first one it answered. Pass
+    JointNear, or call invalidate(), where the branch matters.
+    """
+
+    def __init__(self, maxsize=256, resolution=1e-3):
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__generation = 0
+        self.__frames = None
+        self.__hub = None
+        self.__subscriber = None
+        self.__thread = None
+
+    def key(self, command, values, *options):
+        """
+        options start with user, tool; None when the reply must not be cached.
+        """
+        if -1 in options[:2] and self.__frames is None:
+            return None  # 当前坐标系未知 the current user/tool is not followed
+        scale = 1.0 / self.resolution
+        return (command, tuple([round(value * scale) for value in values])) + options
+
+    def get(self, key):
+        if key is None:
+            return None
+        with self.__lock:
+            reply = self.__entries.get(key)
+            if reply is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return reply
+
+    def fetch(self, key, send):
+        """
+        Return the cached reply for key, or call send() and cache its reply.
+        """
+        reply = self.get(key)
+        if reply is None:
+            generation = self.__generation
+            reply = send()
+            self.store(key, reply, generation)
+        return reply
+
+    def store(self, key, reply, generation=None):
+        # 只缓存成功的回复 only successful replies are kept
+        if key is None:
+            return
+        try:
+            if parse_reply(reply).error_id != 0:
+                return
+        except ValueError:
+            return
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                return  # 发送后缓存已清空 cleared while the request was in flight
+            self.__entries[key] = reply
+            self.__entries.move_to_end(key)
+            if len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    @property
+    def generation(self):
+        return self.__generation
+
+    def invalidate(self):
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+
+    def sync(self, user, tool):
+        """
+        Clear the cache when the (user, tool) indices seen in the feedback change.
+        """
+        frames = (int(user), int(tool))
+        if frames != self.__frames:
+            if self.__frames is not None:
+                self.invalidate()
+            self.__frames = frames
+
+    def attach(self, hub, maxsize=16):
+        """
+        Follow the User/Tool indices of every snapshot of a FeedBackHub, in a background thread.
+        """
+        self.close()
+        self.__hub = hub
+        self.__subscriber = hub.subscribe(maxsize)
+        self.__thread = threading.Thread(target=self.__run, name="KinematicsCache", daemon=True)
+        self.__thread.start()
+        return self
+
+    def close(self):
+        if self.__hub is not None:
+            self.__hub.unsubscribe(self.__subscriber)
+            self.__hub = None
+            self.__subscriber.put(None)
+            self.__thread.join()
+        self.__frames = None
+        self.invalidate()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __run(self):
+        while True:
+            snapshot = self.__subscriber.get()
+            if snapshot is None:
+                return
+            frame = snapshot.data
+            self.sync(frame['User'][0], frame['Tool'][0])
+
+
+# 由反馈帧回答的状态查询 State queries answered from the feedback
+
+
+class DobotStateCache:
+    """
+    Answers RobotMode(), GetAngle(), GetPose(), DI(index) and GetDO(index)
+    from the newest feedback frame instead of a dashboard round trip. The
+    same values (RobotMode, QActual, ToolVectorActual, DigitalInputs,
+    DigitalOutputs) arrive with every frame, every 8 ms on port 30004.
+
+    source is anything with a `latest` FeedBackSnapshot, a FeedBackHub or a
+    FleetRobot. reply() returns a reply in the controller's format, e.g.
+    "0,{5},RobotMode();", or None when the dashboard has to be asked: the
+    newest frame is older than max_age seconds, GetPose() was given
+    user/tool or the feedback shows a user or tool other than 0, or the
+    DI/DO index is not in the 64-bit feedback words.
+    """
+
+    COMMANDS = ('RobotMode', 'GetAngle', 'GetPose', 'DI', 'GetDO')
+
+    def __init__(self, source, max_age=0.05):
+        self.source = source
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+
+    def reply(self, name, args=(), max_age=None):
+        snapshot = self.source.latest
+        limit = self.max_age if max_age is None else max_age
+        value = None
+        if snapshot is not None and time.perf_counter() - snapshot.recv_time <= limit:
+            value = self.__value(name, args, snapshot.data)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return f"0,{{{value}}},{name}({','.join(map(str, args))});"
+
+    def __value(self, name, args, frame):
+        if name == 'RobotMode':
+            return str(int(frame['RobotMode'][0]))
+        if name == 'GetAngle':
+            return ','.join(f'{v:f}' for v in frame['QActual'][0])
+        if name == 'GetPose':
+            # 仅全局(0号)用户和工具坐标系 only with user and tool 0
+            if args or frame['User'][0] or frame['Tool'][0]:
+                return None
+            return ','.join(f'{v:f}' for v in frame['ToolVectorActual'][0])
+        if name == 'DI' or name == 'GetDO':
+            index = args[0]
+            if not 1 <= index <= 64:
+                return None
+            bits = int(frame['DigitalInputs' if name == 'DI' else 'DigitalOutputs'][0])
+            return str(bits >> (index - 1) & 1)
+        return None
+
 
 # 控制及运动指令接口类
 # Control and motion command interface
@@ -212,8 +1409,108 @@ class DobotApi:
 
 class DobotApiDashboard(DobotApi):
 
-    def __init__(self, ip, port, *args):
-        super().__init__(ip, port, *args)
+    def __init__(self, ip, port, *args, keepalive=None, timeout=None, io_timeout=None, priority=False):
+        """
+        timeout: 每条指令等待回复的默认时限 default deadline of every command, seconds
+        (None: wait until the reply or a lost connection), see also deadline().
+        keepalive: 空闲时发送 RobotMode() 的间隔 send RobotMode() after this many idle
+        seconds, see ConnectionSupervisor; off by default.
+        io_timeout: socket timeout, a send blocked this long drops the connection; off by default.
+        priority: 为 Stop/Pause/EmergencyStop 另开一条连接 open a DobotPriorityLane for them;
+        off by default, it is a second 29999 client and counts against the controller's limit.
+        """
+        super().__init__(ip, port, *args, keepalive=keepalive, probe=self.__probe, io_timeout=io_timeout)
+        self.timeout = timeout
+        self.channel = DobotCommandChannel(self)
+        self.kin_cache = KinematicsCache()
+        self.priority = DobotPriorityLane(ip, port) if priority else None
+        self.state_cache = None
+
+    def __probe(self, timeout):
+        # 空闲时的保活指令 keepalive on an idle link
+        self.channel.request("RobotMode()", timeout)
+
+    def sendRecvMsg(self, string, timeout=None):
+        """
+        send-recv Sync, through the pipelined command channel;
+        DobotTimeoutError after timeout (default self.timeout) seconds
+        """
+        recvData = self.channel.request(string, self.timeout if timeout is None else timeout)
+        self.ParseResultId(recvData)
+        return recvData
+
+    def sendCached(self, key, string, timeout=None):
+        """
+        send-recv Sync, answered from kin_cache when key is cached
+        """
+        return self.kin_cache.fetch(key, lambda: self.sendRecvMsg(string, timeout))
+
+    def sendPriority(self, string, timeout=None):
+        """
+        send-recv Sync on the priority lane; on the command channel if there
+        is no lane or it is down
+        """
+        lane = self.priority
+        if lane is not None and lane.link.state == LINK_READY:
+            try:
+                recvData = lane.send(string, timeout)
+            except DobotConnectionError as e:
+                print(f"优先通道失败, 改用主连接 priority lane failed, using the main connection: {e}")
+            else:
+                self.ParseResultId(recvData)
+                return recvData
+        return self.sendRecvMsg(string, timeout)
+
+    def use_feedback(self, source, max_age=0.05):
+        """
+        由反馈回答状态查询 Answer RobotMode/GetAngle/GetPose/DI/GetDO from the
+        feedback of source (a FeedBackHub) when its newest frame is at most
+        max_age seconds old; see DobotStateCache. None turns it off.
+        The InverseKin/PositiveKin cache follows the User/Tool indices of
+        a FeedBackHub source.
+        """
+        self.state_cache = None if source is None else DobotStateCache(source, max_age)
+        if hasattr(source, 'subscribe'):
+            self.kin_cache.attach(source)
+        else:
+            self.kin_cache.close()
+        return self
+
+    def sendState(self, string, name, args=(), max_age=None, timeout=None):
+        """
+        send-recv Sync, answered from state_cache when the feedback is fresh
+        enough; max_age=0 always asks the controller
+        """
+        cache = self.state_cache
+        if cache is not None and max_age != 0:
+            reply = cache.reply(name, args, max_age)
+            if reply is not None:
+                return reply
+        return self.sendRecvMsg(string, timeout)
+
+    def deadline(self, timeout):
+        """
+        返回带时限的视图: 每条指令最多等待 timeout 秒。
+        Return a DobotApiDeadline: same commands, each one answered within
+        timeout seconds or DobotTimeoutError.
+
+            dashboard.deadline(0.2).GetPose()
+        """
+        return DobotApiDeadline(self, timeout)
+
+    def pipeline(self):
+        """
+        返回流水线视图, 指令返回 Future 而不等待回复。
+        Return a DobotApiPipeline: same commands, but each returns a Future.
+        """
+        return DobotApiPipeline(self)
+
+    def close(self):
+        if self.priority is not None:
+            self.priority.close()
+        self.kin_cache.close()
+        self.channel.close()
+        super().close()
 
     def EnableRobot(self, load=0.0, centerX=0.0, centerY=0.0, centerZ=0.0, isCheck=-1,):
         """
@@ -290,8 +1587,7 @@ class DobotApiDashboard(DobotApi):
         Run the script file
         project_name ：Script file name
         """
-        string = "RunScript({:s})".format(project_name)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("RunScript", project_name))
 
     def Stop(self):
         """
@@ -299,7 +1595,7 @@ class DobotApiDashboard(DobotApi):
        Stop the delivered motion command queue or the RunScript command from running.
         """
         string = "Stop()"
-        return self.sendRecvMsg(string)
+        return self.sendPriority(string)
 
     def Pause(self):
         """
@@ -307,7 +1603,7 @@ class DobotApiDashboard(DobotApi):
        Pause the delivered motion command queue or the RunScript command from running.
         """
         string = "Pause()"
-        return self.sendRecvMsg(string)
+        return self.sendPriority(string)
 
     def Continue(self):
         """
@@ -328,8 +1624,7 @@ class DobotApiDashboard(DobotApi):
        Parameter name     Type     Description
         mode     int     E-Stop operation mode. 1: press the E-Stop, 0: release the E-Stop.
         """
-        string = "EmergencyStop({:d})".format(mode)
-        return self.sendRecvMsg(string)
+        return self.sendPriority(encode_command("EmergencyStop", mode))
 
     def BrakeControl(self, axisID, value):
         """
@@ -351,8 +1646,7 @@ class DobotApiDashboard(DobotApi):
         axisID     int     joint ID, 1: J1, 2: J2, and so on
         Value     int     Set the status of brake. 0: switch off brake (joints cannot be dragged). 1: switch on brake (joints can be dragged).
         """
-        string = "BrakeControl({:d},{:d})".format(axisID, value)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("BrakeControl", axisID, value))
 
     #####################################################################
 
@@ -379,8 +1673,7 @@ class DobotApiDashboard(DobotApi):
         If it is not set, the value set by the software before entering TCP/IP control mode will be adopted.
         Range: [1, 100].
         """
-        string = "SpeedFactor({:d})".format(speed)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SpeedFactor", speed))
 
     def User(self, index):
         """
@@ -389,8 +1682,8 @@ class DobotApiDashboard(DobotApi):
         Set the global tool coordinate system. You can select a tool coordinate system while delivering motion commands. If you do not specify the tool coordinate system, the global tool coordinate system will be used.
         If it is not set, the default global user coordinate system is User coordinate system 0.
         """
-        string = "User({:d})".format(index)
-        return self.sendRecvMsg(string)
+        self.kin_cache.invalidate()
+        return self.sendRecvMsg(encode_command("User", index))
 
     def SetUser(self, index, table):
         """
@@ -406,8 +1699,8 @@ class DobotApiDashboard(DobotApi):
         index    int     user coordinate system index, range: [0,9]. The initial value of coordinate system 0 refers to the base coordinate system.
         table    string     user coordinate system after modification (format: {x, y, z, rx, ry, rz}), which is recommended to obtain through "CalcUser" command.
         """
-        string = "SetUser({:d},{:s})".format(index, table)
-        return self.sendRecvMsg(string)
+        self.kin_cache.invalidate()
+        return self.sendRecvMsg(encode_command("SetUser", index, table))
 
     def CalcUser(self, index, matrix_direction, table):
         """
@@ -426,9 +1719,8 @@ class DobotApiDashboard(DobotApi):
             0: right multiplication, indicating that the coordinate system specified by "index" deflects the value specified by "table" along itself.
         table    string     user coordinate system offset (format: {x, y, z, rx, ry, rz}).
         """
-        string = "SetUser({:d},{:d},{:s})".format(
-            index, matrix_direction, table)
-        return self.sendRecvMsg(string)
+        self.kin_cache.invalidate()
+        return self.sendRecvMsg(encode_command("CalcUser", index, matrix_direction, table))
 
     def Tool(self, index):
         """
@@ -437,8 +1729,8 @@ class DobotApiDashboard(DobotApi):
         Set the global tool coordinate system. You can select a tool coordinate system while delivering motion commands. If you do not specify the tool coordinate system, the global tool coordinate system will be used.
         If it is not set, the default global tool coordinate system is Tool coordinate system 0.
         """
-        string = "Tool({:d})".format(index)
-        return self.sendRecvMsg(string)
+        self.kin_cache.invalidate()
+        return self.sendRecvMsg(encode_command("Tool", index))
 
     def SetTool(self, index, table):
         """
@@ -454,8 +1746,8 @@ class DobotApiDashboard(DobotApi):
         Index    int     tool coordinate system index, range: [0,9]. The initial value of coordinate system 0 refers to the flange coordinate system.
         table    string     tool coordinate system after modification (format: {x, y, z, rx, ry, rz})
         """
-        string = "SetTool({:d},{:s})".format(index, table)
-        return self.sendRecvMsg(string)
+        self.kin_cache.invalidate()
+        return self.sendRecvMsg(encode_command("SetTool", index, table))
 
     def CalcTool(self, index, matrix_direction, table):
         """
@@ -476,9 +1768,8 @@ class DobotApiDashboard(DobotApi):
           0: right multiplication, indicating that the coordinate system specified by "index" deflects the value specified by "table" along itself.
         table    string     tool coordinate system offset (format: {x, y, z, rx, ry, rz}).
         """
-        string = "CalcTool({:d},{:d},{:s})".format(
-            index, matrix_direction, table)
-        return self.sendRecvMsg(string)
+        self.kin_cache.invalidate()
+        return self.sendRecvMsg(encode_command("CalcTool", index, matrix_direction, table))
 
     def SetPayload(self, load=0.0, X=0.0, Y=0.0, Z=0.0, name='F'):
         '''设置机械臂末端负载，⽀持两种设置⽅式。
@@ -534,8 +1825,7 @@ class DobotApiDashboard(DobotApi):
         Set acceleration ratio of joint motion.
         Defaults to 100 if not set.
         """
-        string = "AccJ({:d})".format(speed)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("AccJ", speed))
 
     def AccL(self, speed):
         """
@@ -544,8 +1834,7 @@ class DobotApiDashboard(DobotApi):
         Set acceleration ratio of linear and arc motion.
         Defaults to 100 if not set.
         """
-        string = "AccL({:d})".format(speed)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("AccL", speed))
 
     def VelJ(self, speed):
         """
@@ -554,8 +1843,7 @@ class DobotApiDashboard(DobotApi):
         Set the speed ratio of joint motion.
         Defaults to 100 if not set.
         """
-        string = "VelJ({:d})".format(speed)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("VelJ", speed))
 
     def VelL(self, speed):
         """
@@ -564,8 +1852,7 @@ class DobotApiDashboard(DobotApi):
         Set the speed ratio of linear and arc motion.
         Defaults to 100 if not set.
         """
-        string = "VelL({:d})".format(speed)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("VelL", speed))
 
     def CP(self, ratio):
         """
@@ -576,8 +1863,7 @@ class DobotApiDashboard(DobotApi):
         Defaults to 0 if not set.
         Continuous path ratio. Range: [0, 100].
         """
-        string = "CP({:d})".format(ratio)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("CP", ratio))
 
     def SetCollisionLevel(self, level):
         """
@@ -592,8 +1878,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         level     int     collision detection level, 0: switch off collision detection, 1 – 5: the larger the number, the higher the sensitivity.
         """
-        string = "SetCollisionLevel({:d})".format(level)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetCollisionLevel", level))
 
     def SetBackDistance(self, distance):
         """
@@ -608,8 +1893,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         distance     double     collision backoff distance, range: [0,50], unit: mm.
         """
-        string = "SetBackDistance({:d})".format(distance)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetBackDistance", distance))
 
     def SetPostCollisionMode(self, mode):
         """
@@ -625,8 +1909,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         mode     int     post-collision processing mode, 0: enter the stop status after the collision is detected, 1: enter the pause status after the collision is detected
         """
-        string = "SetPostCollisionMode({:d})".format(mode)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetPostCollisionMode", mode))
 
     def StartDrag(self):
         """
@@ -659,8 +1942,7 @@ class DobotApiDashboard(DobotApi):
         index     int      axis ID, 1 – 6: J1 – J6, 0: set all axes at the same time.
         value     int     Drag sensitivity. The smaller the value, the greater the force when dragging. Range: [1, 90].
         """
-        string = "DragSensivity({:d},{:d})".format(index, value)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("DragSensivity", index, value))
 
     def EnableSafeSkin(self, status):
         """
@@ -673,8 +1955,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         status     int     SafeSkin switch, 0: off, 1: on.
         """
-        string = "EnableSafeSkin({:d})".format(status)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("EnableSafeSkin", status))
 
     def SetSafeSkin(self, part, status):
         """
@@ -691,8 +1972,7 @@ class DobotApiDashboard(DobotApi):
         part     int     The part to be set. 3: forearm, 4 – 6: J4 – J6
         status     int     sensitivity, 0: off, 1: low, 2: middle, 3: high
         """
-        string = "SetSafeSkin({:d},{:d})".format(part, status)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetSafeSkin", part, status))
 
     def SetSafeWallEnable(self, index, value):
         """
@@ -707,8 +1987,7 @@ class DobotApiDashboard(DobotApi):
         index     int     safety wall index, which needs to be added in the software first. Range: [1.8].
         value      int     SafeSkin switch, 0: off, 1: on.
         """
-        string = "SetSafeWallEnable({:d},{:d})".format(index, value)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetSafeWallEnable", index, value))
 
     def SetWorkZoneEnable(self, index, value):
         """
@@ -723,12 +2002,11 @@ class DobotApiDashboard(DobotApi):
         index     int     interference area index, which needs to be added in the software first. Range: [1.6].
         value      int     interference area switch, 0: off, 1: on.
         """
-        string = "SetWorkZoneEnable({:d},{:d})".format(index, value)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetWorkZoneEnable", index, value))
 
     #########################################################################
 
-    def RobotMode(self):
+    def RobotMode(self, max_age=None):
         """
         获取机器⼈当前状态。
         1 ROBOT_MODE_INIT 初始化状态
@@ -757,9 +2035,10 @@ class DobotApiDashboard(DobotApi):
              There are uncleared alarms. This status has the highest priority. It returns 9 when there is an alarm, regardless of the status of the robot arm.
         10 ROBOT_MODE_PAUSE  Pause status
         11 ROBOT_MODE_COLLISION  Collision status
+        max_age: see use_feedback()
         """
         string = "RobotMode()"
-        return self.sendRecvMsg(string)
+        return self.sendState(string, "RobotMode", (), max_age)
 
     def PositiveKin(self, J1, J2, J3, J4, J5, J6, user=-1, tool=-1):
         """
@@ -794,17 +2073,8 @@ class DobotApiDashboard(DobotApi):
        User     string     The global user coordinate system will be used if it is not specified.
        Tool     string     Format: "tool=index", index: index of the calibrated tool coordinate system. The global tool coordinate system will be used if it is not set.
         """
-        string = "PositiveKin({:f},{:f},{:f},{:f},{:f},{:f}".format(
-            J1, J2, J3, J4, J5, J6)
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        for ii in params:
-            string = string + ','+ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        key = self.kin_cache.key("PositiveKin", (J1, J2, J3, J4, J5, J6), user, tool)
+        return self.sendCached(key, encode_command("PositiveKin", J1, J2, J3, J4, J5, J6, user=user, tool=tool))
 
     def InverseKin(self, X, Y, Z, Rx, Ry, Rz, user=-1, tool=-1, useJointNear=-1, JointNear=''):
         """
@@ -850,31 +2120,21 @@ class DobotApiDashboard(DobotApi):
             "useJointNear=1": the algorithm selects the joint angles according to JointNear data.
         jointNear     string     Format: "jointNear={j1,j2,j3,j4,j5,j6}", joint coordinates for selecting joint angles.
         """
-        string = "InverseKin({:f},{:f},{:f},{:f},{:f},{:f}".format(
-            X, Y, Z, Rx, Ry, Rz)
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        if useJointNear != -1:
-            params.append('useJointNear={:d}'.format(useJointNear))
-        if JointNear != '':
-            params.append('JointNear={:s}'.format(JointNear))
-        for ii in params:
-            string = string + ','+ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        key = self.kin_cache.key("InverseKin", (X, Y, Z, Rx, Ry, Rz), user, tool, useJointNear, JointNear)
+        return self.sendCached(key, encode_command(
+            "InverseKin", X, Y, Z, Rx, Ry, Rz, user=user, tool=tool, useJointNear=useJointNear,
+            JointNear=JointNear))
 
-    def GetAngle(self):
+    def GetAngle(self, max_age=None):
         """
         获取机械臂当前位姿的关节坐标。
         Get the joint coordinates of current posture.
+        max_age: see use_feedback()
         """
         string = "GetAngle()"
-        return self.sendRecvMsg(string)
+        return self.sendState(string, "GetAngle", (), max_age)
 
-    def GetPose(self, user=-1, tool=-1):
+    def GetPose(self, user=-1, tool=-1, max_age=None):
         """
         获取机械臂当前位姿在指定的坐标系下的笛卡尔坐标。
         可选参数
@@ -888,27 +2148,12 @@ class DobotApiDashboard(DobotApi):
         User      string     Format: "user=index", index: index of the calibrated user coordinate system.
         Tool     string     Format: "tool=index", index: index of the calibrated tool coordinate system.
         They need to be set or not set at the same time. They are global user coordinate system and global tool coordinate system if not set.
+        max_age: see use_feedback()
         """
-        string = "GetPose("
-        params = []
-        state = True
-        if user != -1:
-            params.append('user={:d}'.format(user))
-            state = not state
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-            state = not state
-        if not state:
+        if (user == -1) != (tool == -1):
             return 'need to be set or not set at the same time. They are global user coordinate system and global tool coordinate system if not set' # 必须同时传或同时不传坐标系，不传时默认为全局⽤⼾和⼯具坐标系
-
-        for i, param in enumerate(params):
-            if i == len(params)-1:
-                string = string + param
-            else:
-                string = string + param+","
-
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        args = () if user == -1 else (user, tool)
+        return self.sendState(encode_command("GetPose", user=user, tool=tool), "GetPose", args, max_age)
 
     def GetErrorID(self):
         """
@@ -943,14 +2188,7 @@ class DobotApiDashboard(DobotApi):
         If this parameter is set, the system will automatically invert the DO after the specified time.
         The inversion is an asynchronous action, which will not block the command queue. After the DO output is executed, the system will execute the next command.
         """
-        string = "DO({:d},{:d}".format(index, status)
-        params = []
-        if time != -1:
-            params.append('{:d}'.format(time))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("DO", index, status, time=time))
 
     def DOInstant(self, index, status):
         """
@@ -965,10 +2203,9 @@ class DobotApiDashboard(DobotApi):
         index     int     DO index
         status     int     DO index, 1: ON, 0: OFF
         """
-        string = "DOInstant({:d},{:d})".format(index, status)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("DOInstant", index, status))
 
-    def GetDO(self, index):
+    def GetDO(self, index, max_age=None):
         """
         获取数字输出端⼝状态。
         必选参数
@@ -978,9 +2215,9 @@ class DobotApiDashboard(DobotApi):
         Required parameter:
         Parameter name     Type     Description
         index     int     DO index
+        max_age: see use_feedback()
         """
-        string = "GetDO({:d})".format(index)
-        return self.sendRecvMsg(string)
+        return self.sendState(encode_command("GetDO", index), "GetDO", (index,), max_age)
 
     def DOGroup(self, *index_value):
         """
@@ -1013,12 +2250,7 @@ class DobotApiDashboard(DobotApi):
         DOGroup(4,1,6,0,2,1,7,0)
         Set DO_4 to ON, DO_6 to OFF, DO_2 to ON, DO_7 to OFF.
         """
-        string = "DOGroup({:d}".format(index_value[0])
-        for ii in index_value[1:]:
-            string = string + ',' + str(ii)
-        string = string + ')'
-
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("DOGroup", *index_value))
 
     def GetDOGroup(self, *index_value):
         """
@@ -1047,11 +2279,7 @@ class DobotApiDashboard(DobotApi):
         GetDOGroup(1,2)
         Get the status of DO_1 and DO_2.
         """
-        string = "GetDOGroup({:d}".format(index_value[0])
-        for ii in index_value[1:]:
-            string = string + ',' + str(ii)
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetDOGroup", *index_value))
 
     def ToolDO(self, index, status):
         """
@@ -1066,8 +2294,7 @@ class DobotApiDashboard(DobotApi):
         index     int     index of the tool DO
         status     int     status of the tool DO, 1: ON, 0: OFF
         """
-        string = "ToolDO({:d},{:d})".format(index, status)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("ToolDO", index, status))
 
     def ToolDOInstant(self, index, status):
         """
@@ -1082,8 +2309,7 @@ class DobotApiDashboard(DobotApi):
         index     int     index of the tool DO
         status     int     status of the tool DO, 1: ON, 0: OFF
         """
-        string = "ToolDOInstant({:d},{:d})".format(index, status)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("ToolDOInstant", index, status))
 
     def GetToolDO(self, index):
         """
@@ -1098,8 +2324,7 @@ class DobotApiDashboard(DobotApi):
         index     int     index of the tool DO
         status     int     status of the tool DO, 1: ON, 0: OFF
         """
-        string = "GetToolDO({:d})".format(index)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetToolDO", index))
 
     def AO(self, index, value):
         """
@@ -1116,8 +2341,7 @@ class DobotApiDashboard(DobotApi):
         index     int     AO index
         value     double     AO output, voltage range: [0,10], unit: V; current range: [4,20], unit: mA
         """
-        string = "AO({:d},{:f})".format(index, value)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("AO", index, value))
 
     def AOInstant(self, index, value):
         """
@@ -1134,8 +2358,7 @@ class DobotApiDashboard(DobotApi):
         value     double     AO output, voltage range: [0,10], unit: V; current range:
         [4,20], unit: mA
         """
-        string = "AOInstant({:d},{:f})".format(index, value)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("AOInstant", index, value))
 
     def GetAO(self, index):
         """
@@ -1148,10 +2371,9 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         index     int     AO index
         """
-        string = "GetAO({:d})".format(index)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetAO", index))
 
-    def DI(self, index):
+    def DI(self, index, max_age=None):
         """
         获取DI端⼝的状态。
         必选参数
@@ -1161,9 +2383,9 @@ class DobotApiDashboard(DobotApi):
         Required parameter:
         Parameter name     Type     Description
         index     int     DI index
+        max_age: see use_feedback()
         """
-        string = "DI({:d})".format(index)
-        return self.sendRecvMsg(string)
+        return self.sendState(encode_command("DI", index), "DI", (index,), max_age)
 
     def DIGroup(self, *index_value):
         """
@@ -1192,11 +2414,7 @@ class DobotApiDashboard(DobotApi):
         DIGroup(4,6,2,7)
         Get the status of DI_4, DI_6, DI_2 and DI_7.
         """
-        string = "DIGroup({:d}".format(index_value[0])
-        for ii in index_value[1:]:
-            string = string + ',' + str(ii)
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("DIGroup", *index_value))
 
     def ToolDI(self, index):
         """
@@ -1209,8 +2427,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         index     int     index of the tool DI
         """
-        string = "ToolDI({:d})".format(index)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("ToolDI", index))
 
     def AI(self, index):
         """
@@ -1223,8 +2440,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         index     int     AI index
         """
-        string = "AI({:d})".format(index)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("AI", index))
 
     def ToolAI(self, index):
         """
@@ -1237,8 +2453,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         index     int     index of the tool AI
         """
-        string = "ToolAI({:d})".format(index)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("ToolAI", index))
 
     def SetTool485(self, index, parity='', stopbit=-1, identify=-1):
         """
@@ -1324,14 +2539,7 @@ class DobotApiDashboard(DobotApi):
         SetToolPower(0)
         Power off the tool.
         """
-        string = "SetToolPower({:d}".format(status)
-        params = []
-        if identify != -1:
-            params.append('{:d}'.format(identify))
-        for ii in params:
-            string = string + ','+ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetToolPower", status, identify=identify))
 
     def SetToolMode(self, mode, type, identify=-1):
         """
@@ -1392,14 +2600,7 @@ class DobotApiDashboard(DobotApi):
         SetToolMode(2,0)
         Set the mode of the end multiplex terminal to AI, both are 0 – 10V voltage input mode.
         """
-        string = "SetToolMode({:d},{:d}".format(mode, type)
-        params = []
-        if identify != -1:
-            params.append('{:d}'.format(identify))
-        for ii in params:
-            string = string + ','+ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetToolMode", mode, type, identify=identify))
 
      ##################################################################
 
@@ -1424,14 +2625,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         isRTU     int     null or 0: establish ModbusTCP communication; 1: establish ModbusRTU communication
         """
-        string = "ModbusCreate({:s},{:d},{:d}".format(ip, port, slave_id)
-        params = []
-        if isRTU != -1:
-            params.append('{:d}'.format(isRTU))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("ModbusCreate", ip, port, slave_id, isRTU=isRTU))
 
     def ModbusRTUCreate(self, slave_id, baud, parity='', data_bit=8, stop_bit=-1):
         """
@@ -1482,8 +2676,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         index     int     master index
         """
-        string = "ModbusClose({:d})".format(index)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("ModbusClose", index))
 
     def GetInBits(self, index, addr, count):
         """
@@ -1500,8 +2693,7 @@ class DobotApiDashboard(DobotApi):
         addr     int     starting address of the contact register
         count     int     number of contact registers Range: [1, 16].
         """
-        string = "GetInBits({:d},{:d},{:d})".format(index, addr, count)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetInBits", index, addr, count))
 
     def GetInRegs(self, index, addr, count, valType=''):
         """
@@ -1536,14 +2728,7 @@ class DobotApiDashboard(DobotApi):
         F64: 64-bit double-precision floating-point number (eight bytes, occupy four registers)
         U16 by default.
         """
-        string = "GetInRegs({:d},{:d},{:d}".format(index, addr, count)
-        params = []
-        if valType != '':
-            params.append('{:s}'.format(valType))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetInRegs", index, addr, count, valType=valType))
 
     def GetCoils(self, index, addr, count):
         """
@@ -1560,8 +2745,7 @@ class DobotApiDashboard(DobotApi):
         addr     int     starting address of the coil register
         count     int     number of coil registers Range: [1, 16].
         """
-        string = "GetCoils({:d},{:d},{:d})".format(index, addr, count)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetCoils", index, addr, count))
 
     def SetCoils(self, index, addr, count, valTab):
         """
@@ -1592,9 +2776,7 @@ class DobotApiDashboard(DobotApi):
         SetCoils(0,1000,3,{1,0,1})
         Write three values (1 , 0, 1) to the coil register starting from address 1000.
         """
-        string = "SetCoils({:d},{:d},{:d},{:s})".format(
-            index, addr, count, valTab)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetCoils", index, addr, count, valTab))
 
     def GetHoldRegs(self, index, addr, count, valType=''):
         """
@@ -1629,14 +2811,7 @@ class DobotApiDashboard(DobotApi):
         F64: 64-bit double-precision floating-point number (eight bytes, occupy four registers)
         U16 by default.
         """
-        string = "GetHoldRegs({:d},{:d},{:d}".format(index, addr, count)
-        params = []
-        if valType != '':
-            params.append('{:s}'.format(valType))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetHoldRegs", index, addr, count, valType=valType))
 
     def SetHoldRegs(self, index, addr, count, valTab, valType=''):
         """
@@ -1673,15 +2848,7 @@ class DobotApiDashboard(DobotApi):
         F64: 64-bit double-precision floating-point number (eight bytes, occupy four registers)
         U16 by default.
         """
-        string = "SetHoldRegs({:d},{:d},{:d},{:s}".format(
-            index, addr, count, valTab)
-        params = []
-        if valType != '':
-            params.append('{:s}'.format(valType))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetHoldRegs", index, addr, count, valTab, valType=valType))
     ########################################################################
 
     def GetInputBool(self, address):
@@ -1695,8 +2862,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         address     int     register address, range: [0-63]
         """
-        string = "GetInputBool({:d})".format(address)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetInputBool", address))
 
     def GetInputInt(self, address):
         """
@@ -1709,8 +2875,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         address     int     register address, range: [0-23]
         """
-        string = "GetInputInt({:d})".format(address)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetInputInt", address))
 
     def GetInputFloat(self, address):
         """
@@ -1723,8 +2888,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         address     int     register address, range: [0-23]
         """
-        string = "GetInputFloat({:d})".format(address)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetInputFloat", address))
 
     def GetOutputBool(self, address):
         """
@@ -1737,8 +2901,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         address     int     register address, range: [0-63]
         """
-        string = "GetOutputBool({:d})".format(address)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetOutputBool", address))
 
     def GetOutputInt(self, address):
         """
@@ -1751,8 +2914,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         address     int     register address, range: [0-23]
         """
-        string = "GetOutputInt({:d})".format(address)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetOutputInt", address))
 
     def GetOutputFloat(self, address):
         """
@@ -1765,8 +2927,7 @@ class DobotApiDashboard(DobotApi):
         Parameter name     Type     Description
         address     int     register address, range: [0-23]
         """
-        string = "GetInputFloat({:d})".format(address)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetOutputFloat", address))
 
     def SetOutputBool(self, address, value):
         """
@@ -1781,8 +2942,7 @@ class DobotApiDashboard(DobotApi):
         address     int     register address, range: [0-63]
         value     int     value to be set (0 or 1)
         """
-        string = "GetInputFloat({:d},{:d})".format(address, value)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetOutputBool", address, value))
 
     def SetOutputInt(self, address, value):
         """
@@ -1797,8 +2957,7 @@ class DobotApiDashboard(DobotApi):
         address     int     register address, range: [0-23]
         value     int     value to be set (integer)
         """
-        string = "SetOutputInt({:d},{:d})".format(address, value)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetOutputInt", address, value))
 
     def SetOutputFloat(self, address, value):
         """
@@ -1813,8 +2972,7 @@ class DobotApiDashboard(DobotApi):
         address     int     register address, range: [0-23]
         value     int     value to be set (integer)
         """
-        string = "SetOutputFloat({:d},{:d})".format(address, value)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetOutputFloat", address, value))
 
     #######################################################################
 
@@ -1847,31 +3005,8 @@ class DobotApiDashboard(DobotApi):
         v     int     velocity rate of the robot arm when executing this command. Range: (0,100].
         cp     int     continuous path rate. Range: [0,100].
         """
-        string = ""
-        if coordinateMode == 0:
-            string = "MovJ(pose={{{:f},{:f},{:f},{:f},{:f},{:f}}}".format(
-                a1, b1, c1, d1, e1, f1)
-        elif coordinateMode == 1:
-            string = "MovJ(joint={{{:f},{:f},{:f},{:f},{:f},{:f}}}".format(
-                a1, b1, c1, d1, e1, f1)
-        else:
-            print("coordinateMode param is wrong")
-            return ""
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        if a != -1:
-            params.append('a={:d}'.format(a))
-        if v != -1:
-            params.append('v={:d}'.format(v))
-        if cp != -1:
-            params.append('cp={:d}'.format(cp))
-        for ii in params:
-            string = string + ','+ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "MovJ", a1, b1, c1, d1, e1, f1, coordinateMode, user=user, tool=tool, a=a, v=v, cp=cp))
 
     def MovL(self, a1, b1, c1, d1, e1, f1, coordinateMode, user=-1, tool=-1, a=-1, v=-1, speed=-1, cp=-1, r=-1):
         """
@@ -1907,39 +3042,9 @@ class DobotApiDashboard(DobotApi):
         cp     int     continuous path rate, incompatible with “r”. Range: [0,100].
         r     int     continuous path radius, incompatible with “cp”. If both "r" and "cp” exist, r takes precedence. Unit: mm.
         """
-        string = ""
-        if coordinateMode == 0:
-            string = "MovL(pose={{{:f},{:f},{:f},{:f},{:f},{:f}}}".format(
-                a1, b1, c1, d1, e1, f1)
-        elif coordinateMode == 1:
-            string = "MovL(joint={{{:f},{:f},{:f},{:f},{:f},{:f}}}".format(
-                a1, b1, c1, d1, e1, f1)
-        else:
-            print("coordinateMode  param  is wrong")
-            return ""
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        if a != -1:
-            params.append('a={:d}'.format(a))
-        if v != -1 and speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif v != -1:
-            params.append('v={:d}'.format(v))
-        if cp != -1 and r != -1:
-            params.append('r={:d}'.format(r))
-        elif r != -1:
-            params.append('r={:d}'.format(r))
-        elif cp != -1:
-            params.append('cp={:d}'.format(cp))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "MovL", a1, b1, c1, d1, e1, f1, coordinateMode, user=user, tool=tool, a=a, v=v, speed=speed,
+            cp=cp, r=r))
 
     def ServoJ(self, J1, J2, J3, J4, J5, J6, t=-1.0,aheadtime=-1.0, gain=-1.0):
         """
@@ -1959,19 +3064,8 @@ class DobotApiDashboard(DobotApi):
         aheadtime float Optional parameter.Advanced time, similar to the D in PID control. Scalar, no unit, valuerange: [20.0,100.0], default value: 50.
         gain float Optional parameter.Proportional gain of the target position, similar to the P in PID control.Scalar, no unit, value range: [200.0,1000.0], default value: 500.
         """
-        string = ""
-        string = "ServoJ({:f},{:f},{:f},{:f},{:f},{:f}".format(J1, J2, J3, J4, J5, J6)
-        params = []
-        if t != -1:
-            params.append('t={:f}'.format(t))
-        if aheadtime != -1:
-            params.append('aheadtime={:f}'.format(aheadtime))
-        if gain != -1:
-            params.append('gain={:f}'.format(gain))
-        for ii in params:
-            string = string + ','+ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "ServoJ", J1, J2, J3, J4, J5, J6, t=t, aheadtime=aheadtime, gain=gain))
     def ServoP(self, X, Y, Z, RX, RY, RZ, t=-1.0,aheadtime=-1.0, gain=-1.0):
         """
         参数名 类型 含义 是否必填 参数范围
@@ -1989,19 +3083,8 @@ class DobotApiDashboard(DobotApi):
         aheadtime float Optional parameter.Advanced time, similar to the D in PID control. Scalar, no unit, valuerange: [20.0,100.0], default value: 50.
         gain float Optional parameter.Proportional gain of the target position, similar to the P in PID control.Scalar, no unit, value range: [200.0,1000.0], default value: 500.
         """
-        string = ""
-        string = "ServoP({:f},{:f},{:f},{:f},{:f},{:f}".format(X, Y, Z, RX, RY, RZ)
-        params = []
-        if t != -1:
-            params.append('t={:f}'.format(t))
-        if aheadtime != -1:
-            params.append('aheadtime={:f}'.format(aheadtime))
-        if gain != -1:
-            params.append('gain={:f}'.format(gain))
-        for ii in params:
-            string = string + ','+ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "ServoP", X, Y, Z, RX, RY, RZ, t=t, aheadtime=aheadtime, gain=gain))
 
     def MovLIO(self, a1, b1, c1, d1, e1, f1, coordinateMode, Mode, Distance, Index, Status, user=-1, tool=-1, a=-1, v=-1, speed=-1, cp=-1, r=-1):
         """
@@ -2058,39 +3141,9 @@ class DobotApiDashboard(DobotApi):
         cp     int     continuous path rate, incompatible with “r”. Range: [0,100].
         r     int     continuous path radius, incompatible with “cp”. If both "r" and "cp” exist, r takes precedence. Unit: mm.
         """
-        string = ""
-        if coordinateMode == 0:
-            string = "MovLIO(pose={{{:f},{:f},{:f},{:f},{:f},{:f}}},{{{:d},{:d},{:d},{:d}}}".format(
-                a1, b1, c1, d1, e1, f1, Mode, Distance, Index, Status)
-        elif coordinateMode == 1:
-            string = "MovLIO(joint={{{:f},{:f},{:f},{:f},{:f},{:f}}},{{{:d},{:d},{:d},{:d}}}".format(
-                a1, b1, c1, d1, e1, f1, Mode, Distance, Index, Status)
-        else:
-            print("coordinateMode  param  is wrong")
-            return ""
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        if a != -1:
-            params.append('a={:d}'.format(a))
-        if v != -1 and speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif v != -1:
-            params.append('v={:d}'.format(v))
-        if cp != -1 and r != -1:
-            params.append('r={:d}'.format(r))
-        elif r != -1:
-            params.append('r={:d}'.format(r))
-        elif cp != -1:
-            params.append('cp={:d}'.format(cp))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "MovLIO", a1, b1, c1, d1, e1, f1, coordinateMode, Mode, Distance, Index, Status, user=user,
+            tool=tool, a=a, v=v, speed=speed, cp=cp, r=r))
 
     def MovJIO(self,  a1, b1, c1, d1, e1, f1, coordinateMode, Mode, Distance, Index, Status, user=-1, tool=-1, a=-1, v=-1, cp=-1,):
         """
@@ -2144,31 +3197,9 @@ class DobotApiDashboard(DobotApi):
         v     int     velocity rate of the robot arm when executing this command. Range: (0,100].
         cp     int     continuous path rate. Range: [0,100].
         """
-        string = ""
-        if coordinateMode == 0:
-            string = "MovJIO(pose={{{:f},{:f},{:f},{:f},{:f},{:f}}},{{{:d},{:d},{:d},{:d}}}".format(
-                a1, b1, c1, d1, e1, f1, Mode, Distance, Index, Status)
-        elif coordinateMode == 1:
-            string = "MovJIO(joint={{{:f},{:f},{:f},{:f},{:f},{:f}}},{{{:d},{:d},{:d},{:d}}}".format(
-                a1, b1, c1, d1, e1, f1, Mode, Distance, Index, Status)
-        else:
-            print("coordinateMode  param  is wrong")
-            return ""
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        if a != -1:
-            params.append('a={:d}'.format(a))
-        if v != -1:
-            params.append('v={:d}'.format(v))
-        if cp != -1:
-            params.append('cp={:d}'.format(cp))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "MovJIO", a1, b1, c1, d1, e1, f1, coordinateMode, Mode, Distance, Index, Status, user=user,
+            tool=tool, a=a, v=v, cp=cp))
 
     def Arc(self, a1, b1, c1, d1, e1, f1,  a2, b2, c2, d2, e2, f2, coordinateMode, user=-1, tool=-1, a=-1, v=-1, speed=-1, cp=-1, r=-1):
         """
@@ -2209,39 +3240,9 @@ class DobotApiDashboard(DobotApi):
         cp     int     continuous path rate, incompatible with “r”. Range: [0,100].
         r     int     continuous path radius, incompatible with “cp”. If both "r" and "cp” exist, r takes precedence. Unit: mm.
         """
-        string = ""
-        if coordinateMode == 0:
-            string = "Arc(pose={{{:f},{:f},{:f},{:f},{:f},{:f}}},pose={{{:f},{:f},{:f},{:f},{:f},{:f}}}".format(
-                a1, b1, c1, d1, e1, f1,  a2, b2, c2, d2, e2, f2)
-        elif coordinateMode == 1:
-            string = "Arc(joint={{{:f},{:f},{:f},{:f},{:f},{:f}}},joint={{{:f},{:f},{:f},{:f},{:f},{:f}}}".format(
-                a1, b1, c1, d1, e1, f1,  a2, b2, c2, d2, e2, f2)
-        else:
-            print("coordinateMode  param  is wrong")
-            return ""
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        if a != -1:
-            params.append('a={:d}'.format(a))
-        if v != -1 and speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif v != -1:
-            params.append('v={:d}'.format(v))
-        if cp != -1 and r != -1:
-            params.append('r={:d}'.format(r))
-        elif r != -1:
-            params.append('r={:d}'.format(r))
-        elif cp != -1:
-            params.append('cp={:d}'.format(cp))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "Arc", a1, b1, c1, d1, e1, f1, a2, b2, c2, d2, e2, f2, coordinateMode, user=user, tool=tool, a=a,
+            v=v, speed=speed, cp=cp, r=r))
 
     def Circle(self, a1, b1, c1, d1, e1, f1,  a2, b2, c2, d2, e2, f2, coordinateMode, count, user=-1, tool=-1, a=-1, v=-1, speed=-1, cp=-1, r=-1):
         """
@@ -2284,39 +3285,9 @@ class DobotApiDashboard(DobotApi):
         cp     int     continuous path rate, incompatible with “r”. Range: [0,100].
         r     int     continuous path radius, incompatible with “cp”. If both "r" and "cp” exist, r takes precedence. Unit: mm.
         """
-        string = ""
-        if coordinateMode == 0:
-            string = "Circle(pose={{{:f},{:f},{:f},{:f},{:f},{:f}}},pose={{{:f},{:f},{:f},{:f},{:f},{:f}}},{:d}".format(
-                a1, b1, c1, d1, e1, f1,  a2, b2, c2, d2, e2, f2, count)
-        elif coordinateMode == 1:
-            string = "Circle(joint={{{:f},{:f},{:f},{:f},{:f},{:f}}},joint={{{:f},{:f},{:f},{:f},{:f},{:f}}},{:d}".format(
-                a1, b1, c1, d1, e1, f1,  a2, b2, c2, d2, e2, f2, count)
-        else:
-            print("coordinateMode  param  is wrong")
-            return ""
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        if a != -1:
-            params.append('a={:d}'.format(a))
-        if v != -1 and speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif v != -1:
-            params.append('v={:d}'.format(v))
-        if cp != -1 and r != -1:
-            params.append('r={:d}'.format(r))
-        elif r != -1:
-            params.append('r={:d}'.format(r))
-        elif cp != -1:
-            params.append('cp={:d}'.format(cp))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "Circle", a1, b1, c1, d1, e1, f1, a2, b2, c2, d2, e2, f2, coordinateMode, count, user=user,
+            tool=tool, a=a, v=v, speed=speed, cp=cp, r=r))
 
     def MoveJog(self, axis_id='', coordtype=-1, user=-1, tool=-1):
         """
@@ -2331,18 +3302,7 @@ class DobotApiDashboard(DobotApi):
                     user_index: user index is 0 ~ 9 (default value is 0)
                     tool_index: tool index is 0 ~ 9 (default value is 0)
         """
-        string = "MoveJog({:s}".format(axis_id)
-        params = []
-        if coordtype != -1:
-            params.append('coordtype={:d}'.format(coordtype))
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("MoveJog", axis_id, coordtype=coordtype, user=user, tool=tool))
 
     def GetStartPose(self, trace_name):
         """
@@ -2363,8 +3323,7 @@ class DobotApiDashboard(DobotApi):
         If the name contains Chinese, the encoding of the sender must be set to UTF-8, otherwise
         it will cause an exception for receiving Chinese.
         """
-        string = "GetStartPose({:s})".format(trace_name)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetStartPose", trace_name))
 
     def StartPath(self, trace_name, isConst=-1, multi=-1.0, user=-1, tool=-1):
         """
@@ -2406,20 +3365,8 @@ class DobotApiDashboard(DobotApi):
         user     int     User coordinate system index corresponding to the specified trajectory point (use the user coordinate system index recorded in the trajectory file if not specified).
         tool     int     tool coordinate system index corresponding to the specified trajectory point (use the tool coordinate system index recorded in the trajectory file if not specified).
         """
-        string = "StartPath({:s}".format(trace_name)
-        params = []
-        if isConst != -1:
-            params.append('isConst={:d}'.format(isConst))
-        if multi != -1:
-            params.append('multi={:f}'.format(multi))
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "StartPath", trace_name, isConst=isConst, multi=multi, user=user, tool=tool))
 
     def RelMovJTool(self, offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz, user=-1, tool=-1, a=-1, v=-1, cp=-1):
         """
@@ -2458,23 +3405,9 @@ class DobotApiDashboard(DobotApi):
         v     int     velocity rate of the robot arm when executing this command. Range: (0,100].
         cp     int     continuous path rate. Range: [0,100].
         """
-        string = "RelMovJTool({:f},{:f},{:f},{:f},{:f},{:f}".format(
-            offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz)
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        if a != -1:
-            params.append('a={:d}'.format(a))
-        if v != -1:
-            params.append('v={:d}'.format(v))
-        if cp != -1:
-            params.append('cp={:d}'.format(cp))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "RelMovJTool", offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz, user=user,
+            tool=tool, a=a, v=v, cp=cp))
 
     def RelMovLTool(self, offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz, user=-1, tool=-1, a=-1, v=-1, speed=-1, cp=-1, r=-1):
         """
@@ -2520,31 +3453,9 @@ class DobotApiDashboard(DobotApi):
         cp     int     continuous path rate, incompatible with “r”. Range: [0,100].
         r     int     continuous path radius, incompatible with “cp”. If both "r" and "cp” exist, r takes precedence. Unit: mm.
         """
-        string = "RelMovLTool({:f},{:f},{:f},{:f},{:f},{:f}".format(
-            offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz)
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        if a != -1:
-            params.append('a={:d}'.format(a))
-        if v != -1 and speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif v != -1:
-            params.append('v={:d}'.format(v))
-        if cp != -1 and r != -1:
-            params.append('r={:d}'.format(r))
-        elif r != -1:
-            params.append('r={:d}'.format(r))
-        elif cp != -1:
-            params.append('cp={:d}'.format(cp))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "RelMovLTool", offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz, user=user,
+            tool=tool, a=a, v=v, speed=speed, cp=cp, r=r))
 
     def RelMovJUser(self, offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz, user=-1, tool=-1, a=-1, v=-1, cp=-1):
         """
@@ -2583,23 +3494,9 @@ class DobotApiDashboard(DobotApi):
         v     int     velocity rate of the robot arm when executing this command. Range: (0,100].
         cp     int     continuous path rate. Range: [0,100].
         """
-        string = "RelMovJUser({:f},{:f},{:f},{:f},{:f},{:f}".format(
-            offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz)
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        if a != -1:
-            params.append('a={:d}'.format(a))
-        if v != -1:
-            params.append('v={:d}'.format(v))
-        if cp != -1:
-            params.append('cp={:d}'.format(cp))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "RelMovJUser", offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz, user=user,
+            tool=tool, a=a, v=v, cp=cp))
 
     def RelMovLUser(self, offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz, user=-1, tool=-1, a=-1, v=-1, speed=-1, cp=-1, r=-1):
         """
@@ -2643,31 +3540,9 @@ class DobotApiDashboard(DobotApi):
         cp     int     continuous path rate, incompatible with “r”. Range: [0,100].
         r     int     continuous path radius, incompatible with “cp”. If both "r" and "cp” exist, r takes precedence. Unit: mm.
         """
-        string = "RelMovLUser({:f},{:f},{:f},{:f},{:f},{:f}".format(
-            offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz)
-        params = []
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        if a != -1:
-            params.append('a={:d}'.format(a))
-        if v != -1 and speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif speed != -1:
-            params.append('speed={:d}'.format(speed))
-        elif v != -1:
-            params.append('v={:d}'.format(v))
-        if cp != -1 and r != -1:
-            params.append('r={:d}'.format(r))
-        elif r != -1:
-            params.append('r={:d}'.format(r))
-        elif cp != -1:
-            params.append('cp={:d}'.format(cp))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "RelMovLUser", offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz, user=user,
+            tool=tool, a=a, v=v, speed=speed, cp=cp, r=r))
 
     def RelJointMovJ(self, offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz, a=-1, v=-1, cp=-1):
         """
@@ -2702,19 +3577,8 @@ class DobotApiDashboard(DobotApi):
         v     int     velocity rate of the robot arm when executing this command. Range: (0,100].
         cp     int     continuous path rate. Range: [0,100].
         """
-        string = "RelMovJUser({:f},{:f},{:f},{:f},{:f},{:f}".format(
-            offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz)
-        params = []
-        if a != -1:
-            params.append('a={:d}'.format(a))
-        if v != -1:
-            params.append('v={:d}'.format(v))
-        if cp != -1:
-            params.append('cp={:d}'.format(cp))
-        for ii in params:
-            string = string + ',' + ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "RelJointMovJ", offset_x, offset_y, offset_z, offset_rx, offset_ry, offset_rz, a=a, v=v, cp=cp))
 
     def GetCurrentCommandID(self):
         """
@@ -2727,28 +3591,28 @@ class DobotApiDashboard(DobotApi):
     def ParseResultId(self, valueRecv):
         """
         解析Tcp返回值
-        Parse the TCP return values
+        Parse the TCP return values, return a DobotReply (None if it is not a reply)
         """
-        if valueRecv.find("Not Tcp") != -1:  # 通过返回值判断机器是否处于tcp模式 Judge whether the robot is in TCP mode by the return value
-            print("Control Mode Is Not Tcp")
-            return
-        recvData = re.findall(r'-?\d+', valueRecv)
-        recvData = [int(num) for num in recvData]
-        if len(recvData) > 0:
-            if recvData[0] != 0:
-                # 根据返回值来判断机器处于什么状态 Judge what status the robot is in based on the return value
-                if recvData[0] == -1:
-                    print("Command execution failed")
-                elif recvData[0] == -2:
-                    print("The robot is in an error state")
-                elif recvData[0] == -3:
-                    print("The robot is in emergency stop state")
-                elif recvData[0] == -4:
-                    print("The robot is in power down state")
-                else:
-                    print("ErrorId is ", recvData[0])
-        else:
+        try:
+            reply = parse_reply(valueRecv)
+        except ValueError:
             print("ERROR VALUE")
+            return None
+        if reply.error_id != 0:
+            # 根据返回值来判断机器处于什么状态 Judge what status the robot is in based on the return value
+            if reply.error_id == REPLY_NOT_TCP:  # 通过返回值判断机器是否处于tcp模式 Judge whether the robot is in TCP mode by the return value
+                print("Control Mode Is Not Tcp")
+            elif reply.error_id == -1:
+                print("Command execution failed")
+            elif reply.error_id == -2:
+                print("The robot is in an error state")
+            elif reply.error_id == -3:
+                print("The robot is in emergency stop state")
+            elif reply.error_id == -4:
+                print("The robot is in power down state")
+            else:
+                print("ErrorId is ", reply.error_id)
+        return reply
 
     ###################################460新增#############################
     
@@ -2757,8 +3621,7 @@ class DobotApiDashboard(DobotApi):
         """
        该指令仅用于焊接工艺。设置轨迹恢复的目标点位相对暂停时的点位沿焊缝回退的距离
         """
-        string = "SetResumeOffset({:f})".format(distance)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("SetResumeOffset", distance))
     
     def PathRecovery(self):
         """
@@ -2789,8 +3652,7 @@ class DobotApiDashboard(DobotApi):
         0   导出logs/all 和logs/user文件夹的内容。
         1   导出logs文件夹所有内容。
         """
-        string = "SetResumeOffset({:d})".format(range)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("LogExportUSB", range))
     
     def GetExportStatus(self):
         """
@@ -2812,8 +3674,7 @@ class DobotApiDashboard(DobotApi):
         """
        开启/关闭力传感器。
         """
-        string = "EnableFTSensor({:d})".format(status)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("EnableFTSensor", status))
 
     def SixForceHome(self):
         """
@@ -2828,11 +3689,7 @@ class DobotApiDashboard(DobotApi):
         tool int 用于指定获取数值时参考的工具坐标系，取值范围：[0,50]。
         不指定时使用全局工具坐标系
         """
-        if tool == -1:
-            string = "GetForce()"
-        else:
-            string = "GetForce({:d})".format(tool)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("GetForce", tool=tool))
 
     def ForceDriveMode(self, x, y, z, rx, ry, rz, user=-1):
         """
@@ -2845,20 +3702,14 @@ class DobotApiDashboard(DobotApi):
         {1,1,1,0,0,0}表示机械臂仅可在XYZ轴方向上拖动
         {0,0,0,1,1,1}表示机械臂仅可在RxRyRz轴方向上旋转
         """
-        string = ""
-        string = "ForceDriveMode("+"{"+"{:d},{:d},{:d},{:d},{:d},{:d}".format(x,y,z,rx,ry,rz)+"}"
-        if user != -1:
-            string = string + ',{:d}'.format(user)
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("ForceDriveMode", x, y, z, rx, ry, rz, user=user))
     
     def ForceDriveSpeed(self, speed):
         """
         设置力控拖拽速度比例。
         speed int 力控拖拽速度比例，取值范围：[1,100]。
         """
-        string = "ForceDriveSpeed({:d})".format(speed)
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("ForceDriveSpeed", speed))
     
     def FCForceMode(self, x, y, z, rx, ry, rz, fx,fy,fz,frx,fry,frz, reference=-1, user=-1,tool=-1):
         """
@@ -2881,19 +3732,9 @@ class DobotApiDashboard(DobotApi):
         tool  
             格式为"tool=index"，index为已标定的工具坐标系索引。取值范围：[0,50]。
         """
-        string = ""
-        string = "FCForceMode("+"{"+"{:d},{:d},{:d},{:d},{:d},{:d}".format(x,y,z,rx,ry,rz)+"},"+"{"+"{:d},{:d},{:d},{:d},{:d},{:d}".format(fx,fy,fz,frx,fry,frz)+"}"
-        params = []
-        if reference != -1:
-            params.append('reference={:d}'.format(reference))
-        if user != -1:
-            params.append('user={:d}'.format(user))
-        if tool != -1:
-            params.append('tool={:d}'.format(tool))
-        for ii in params:
-            string = string + ','+ii
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "FCForceMode", x, y, z, rx, ry, rz, fx, fy, fz, frx, fry, frz, reference=reference, user=user,
+            tool=tool))
 
     def FCSetDeviation(self, x, y, z, rx, ry, rz, controltype=-1):
         """
@@ -2907,48 +3748,32 @@ class DobotApiDashboard(DobotApi):
         0：超过阈值时，机械臂报警（默认值）。
         1：超过阈值时，机械臂停止搜寻而在原有轨迹上继续运动。
         """
-        string = ""
-        string = "FCSetDeviation("+"{"+"{:d},{:d},{:d},{:d},{:d},{:d}".format(x,y,z,rx,ry,rz)+"}"
-        if controltype != -1:
-            string = string + ',{:d}'.format(controltype)
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "FCSetDeviation", x, y, z, rx, ry, rz, controltype=controltype))
     
     def FCSetForceLimit(self, x, y, z, rx, ry, rz):
         """
         设置各方向的最大力限制（该设置对所有方向均生效，包含未启用力控的方向）。
         """
-        string = ""
-        string = "FCSetForceLimit("+"{:d},{:d},{:d},{:d},{:d},{:d}".format(x,y,z,rx,ry,rz)
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("FCSetForceLimit", x, y, z, rx, ry, rz))
     
     def FCSetMass(self, x, y, z, rx, ry, rz):
         """
         设置力控模式下各方向的惯性系数。
         """
-        string = ""
-        string = "FCSetMass("+"{:d},{:d},{:d},{:d},{:d},{:d}".format(x,y,z,rx,ry,rz)
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("FCSetMass", x, y, z, rx, ry, rz))
     
     def FCSetStiffness(self, x, y, z, rx, ry, rz):
         """
         设置力控模式下各方向的弹性系数。
         """
-        string = ""
-        string = "FCSetStiffness("+"{:d},{:d},{:d},{:d},{:d},{:d}".format(x,y,z,rx,ry,rz)
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("FCSetStiffness", x, y, z, rx, ry, rz))
     
     def FCSetDamping(self, x, y, z, rx, ry, rz):
         """
         设置力控模式下各方向的阻尼系数。
         """
-        string = ""
-        string = "FCSetDamping("+"{:d},{:d},{:d},{:d},{:d},{:d}".format(x,y,z,rx,ry,rz)
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("FCSetDamping", x, y, z, rx, ry, rz))
 
     def FCOff(self):
         """
@@ -2962,19 +3787,13 @@ class DobotApiDashboard(DobotApi):
         设置各方向的力控调节速度。力控速度上限较小时，力控调节速度较慢，适合低速平缓的接触面。
         力控速度上限较大时，力控调节速度快，适合高速力控应用。需要根据具体的应用场景进行调整。
         """
-        string = ""
-        string = "FCSetForceSpeedLimit("+"{:d},{:d},{:d},{:d},{:d},{:d}".format(x,y,z,rx,ry,rz)
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("FCSetForceSpeedLimit", x, y, z, rx, ry, rz))
     
     def FCSetForce(self, x, y, z, rx, ry, rz):
         """
         实时调整各方向的恒力设置。
         """
-        string = ""
-        string = "FCSetForce("+"{:d},{:d},{:d},{:d},{:d},{:d}".format(x,y,z,rx,ry,rz)
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("FCSetForce", x, y, z, rx, ry, rz))
     
     def RequestControl(self):
         """
@@ -2990,88 +3809,486 @@ class DobotApiDashboard(DobotApi):
         """
         沿工具坐标系笛卡尔点偏移。
         """
-        string = ""
-        if coordinateMode == 0:
-            string = "RelPointTool(pose={{{:f},{:f},{:f},{:f},{:f},{:f}}},".format(
-                a1, b1, c1, d1, e1, f1)
-        elif coordinateMode == 1:
-            string = "RelPointTool(joint={{{:f},{:f},{:f},{:f},{:f},{:f}}},".format(
-                a1, b1, c1, d1, e1, f1)
-        string = string + "{"+"{:f},{:f},{:f},{:f},{:f},{:f}".format(x,y,z,rx,ry,rz)+"}"
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "RelPointTool", coordinateMode, a1, b1, c1, d1, e1, f1, x, y, z, rx, ry, rz))
     
     def RelPointUser(self,coordinateMode,a1, b1, c1, d1, e1, f1, x, y, z, rx, ry, rz):
         """
         沿用户坐标系笛卡尔点偏移。
         """
-        string = ""
-        string = ""
-        if coordinateMode == 0:
-            string = "RelPointUser(pose={{{:f},{:f},{:f},{:f},{:f},{:f}}},".format(
-                a1, b1, c1, d1, e1, f1)
-        elif coordinateMode == 1:
-            string = "RelPointUser(joint={{{:f},{:f},{:f},{:f},{:f},{:f}}},".format(
-                a1, b1, c1, d1, e1, f1)
-        string =string + "{"+"{:f},{:f},{:f},{:f},{:f},{:f}".format(x,y,z,rx,ry,rz)+"}"
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command(
+            "RelPointUser", coordinateMode, a1, b1, c1, d1, e1, f1, x, y, z, rx, ry, rz))
 
-    def RelPointTool(self, J1, J2, J3, J4, J5, J6, x, y, z, rx, ry, rz):
+    def RelJoint(self, J1, J2, J3, J4, J5, J6, x, y, z, rx, ry, rz):
         """
         关节点位偏移。
+        Offset the joint point {J1..J6} by {x, y, z, rx, ry, rz} degrees.
         """
-        string = ""
-        string = "RelPointTool("+"{:f},{:f},{:f},{:f},{:f},{:f}".format(J1,J2,J3,J4,J5,J6)+"{"+"{:f},{:f},{:f},{:f},{:f},{:f}".format(x,y,z,rx,ry,rz)+"}"
-        string = string + ')'
-        return self.sendRecvMsg(string)
+        return self.sendRecvMsg(encode_command("RelJoint", J1, J2, J3, J4, J5, J6, x, y, z, rx, ry, rz))
     
 
+# 流水线指令接口
+# Pipelined command interface
+
+
+class DobotApiPipeline:
+    """
+    Every DobotApiDashboard command, but the command is only sent and its
+    reply is returned as a Future. A path of MovL points then costs one
+    round trip instead of one per point:
+
+        pipe = dashboard.pipeline()
+        futures = [pipe.MovL(*point, 0) for point in points]
+        replies = [f.result() for f in futures]
+    """
+
+    def __init__(self, dashboard):
+        self.dashboard = dashboard
+
+    def sendRecvMsg(self, string):
+        return self.dashboard.channel.submit(string)
+
+    @property
+    def kin_cache(self):
+        return self.dashboard.kin_cache
+
+    def sendCached(self, key, string):
+        cache = self.dashboard.kin_cache
+        reply = cache.get(key)
+        if reply is not None:
+            future = Future()
+            future.set_result(reply)
+            return future
+        generation = cache.generation
+        future = self.sendRecvMsg(string)
+        future.add_done_callback(
+            lambda done: done.cancelled() or done.exception() or cache.store(key, done.result(), generation))
+        return future
+
+    def sendState(self, string, name, args=(), max_age=None):
+        cache = self.dashboard.state_cache
+        reply = None if cache is None or max_age == 0 else cache.reply(name, args, max_age)
+        if reply is None:
+            return self.sendRecvMsg(string)
+        future = Future()
+        future.set_result(reply)
+        return future
+
+    def sendPriority(self, string):
+        # 优先通道是同步的, 直接返回已完成的 Future the lane is synchronous
+        future = Future()
+        try:
+            future.set_result(self.dashboard.sendPriority(string))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def batch(self, commands):
+        """
+        Encode (name, args) or (name, args, options) tuples with
+        encode_command() and send them together; return their Futures.
+        Nothing is sent if any of them does not encode.
+        """
+        strings = [encode_command(command[0], *command[1], **(command[2] if len(command) > 2 else {}))
+                   for command in commands]
+        return self.dashboard.channel.submit_many(strings)
+
+    def __getattr__(self, name):
+        command = getattr(DobotApiDashboard, name)
+        return types.MethodType(command, self)
+
+
+class DobotApiDeadline:
+    """
+    Every DobotApiDashboard command with a deadline: the reply must come
+    within timeout seconds, otherwise DobotTimeoutError is raised and the
+    late reply is dropped when it arrives.
+    """
+
+    def __init__(self, dashboard, timeout):
+        self.dashboard = dashboard
+        self.timeout = timeout
+
+    def sendRecvMsg(self, string):
+        return self.dashboard.sendRecvMsg(string, self.timeout)
+
+    @property
+    def kin_cache(self):
+        return self.dashboard.kin_cache
+
+    def sendCached(self, key, string):
+        return self.dashboard.sendCached(key, string, self.timeout)
+
+    def sendPriority(self, string):
+        return self.dashboard.sendPriority(string, self.timeout)
+
+    def sendState(self, string, name, args=(), max_age=None):
+        return self.dashboard.sendState(string, name, args, max_age, self.timeout)
+
+    def __getattr__(self, name):
+        command = getattr(DobotApiDashboard, name)
+        return types.MethodType(command, self)
+
+
+# 反馈数据接收缓冲区
+# Feedback receive buffer
+
+
+class FeedBackReader:
+    """
+    按帧对齐读取30004/30005端口的反馈数据。
+    Frame-aligned reader for the 30004/30005 feedback stream.
+
+    Data is received with recv_into() into one preallocated buffer holding
+    `capacity` frames, so nothing is allocated per frame and a frame split
+    across several reads is kept until the rest of it arrives. Every complete
+    frame is returned as a zero-copy np.frombuffer(..., dtype=self.dtype) view.
+    If TestValue is not where a frame should start, the reader skips ahead to
+    the next 0x0123456789ABCDEF marker and adds the discarded bytes to
+    skipped_bytes.
+
+    A returned view is only valid until the reader receives more data; call
+    .copy() on it to keep the frame.
+
+    layout is a FEEDBACK_LAYOUTS key, or None to detect it from the frames:
+    they are decoded as FEEDBACK_DEFAULT_LAYOUT until one of them shows which
+    layout the controller sends, then with that layout. Fields both layouts
+    share decode the same either way.
+    """
+
+    def __init__(self, sock=None, capacity=64, layout=None):
+        if capacity < 4:
+            raise ValueError("capacity must hold at least 4 frames")
+        self.sock = sock
+        self.layout = layout
+        self.dtype = FEEDBACK_LAYOUTS[layout or FEEDBACK_DEFAULT_LAYOUT]
+        self.__buf = bytearray(capacity * FEED_FRAME_SIZE)
+        self.__view = memoryview(self.__buf)
+        self.__head = 0
+        self.__tail = 0
+        self.frames = 0
+        self.resyncs = 0
+        self.skipped_bytes = 0
+
+    def reset(self, sock=None):
+        """
+        Drop buffered data, e.g. after the socket was reconnected.
+        """
+        self.sock = sock
+        self.__head = 0
+        self.__tail = 0
+
+    def writable(self):
+        """
+        Free space at the end of the buffer, to be passed to recv_into().
+        """
+        if len(self.__buf) - self.__tail < FEED_FRAME_SIZE:
+            self.__compact()
+        return self.__view[self.__tail:]
+
+    def commit(self, nbytes):
+        """
+        Mark nbytes written into writable() as received.
+        """
+        self.__tail += nbytes
+
+    def next_frame(self):
+        """
+        Return the next complete frame already in the buffer, or None.
+        """
+        buf = self.__buf
+        while self.__tail - self.__head >= FEED_FRAME_SIZE:
+            head = self.__head
+            marker = head + FEED_TEST_OFFSET
+            if buf.startswith(FEED_TEST_BYTES, marker):
+                self.__head = head + FEED_FRAME_SIZE
+                self.frames += 1
+                if self.layout is None:
+                    self.__detectLayout(head)
+                return np.frombuffer(buf, dtype=self.dtype, count=1, offset=head)
+
+            # 帧不对齐, 跳到下一个校验值 out of sync, skip to the next marker
+            found = buf.find(FEED_TEST_BYTES, marker + 1, self.__tail)
+            if found < 0:
+                # 保留可能被截断的校验值 keep a marker that may be cut in half
+                self.__head = max(head + 1, self.__tail - 7 - FEED_TEST_OFFSET)
+            else:
+                self.__head = found - FEED_TEST_OFFSET
+            self.resyncs += 1
+            self.skipped_bytes += self.__head - head
+        return None
+
+    def read_frame(self):
+        """
+        Block until the next complete frame is received and return it.
+        """
+        frame = self.next_frame()
+        while frame is None:
+            nbytes = self.sock.recv_into(self.writable())
+            if nbytes == 0:
+                raise ConnectionError("反馈端口连接已断开 Feedback connection closed")
+            self.commit(nbytes)
+            frame = self.next_frame()
+        return frame
+
+    def __iter__(self):
+        while True:
+            yield self.read_frame()
+
+    def __detectLayout(self, head):
+        layout = detect_feedback_layout([self.__view[head:head + FEED_FRAME_SIZE]])
+        if layout is not None:
+            self.layout = layout
+            self.dtype = FEEDBACK_LAYOUTS[layout]
+
+    def __compact(self):
+        head, tail = self.__head, self.__tail
+        remain = tail - head
+        if remain > head:
+            # 区域重叠时先复制 overlapping areas, copy first (rare)
+            self.__buf[:remain] = bytes(self.__view[head:tail])
+        else:
+            self.__buf[:remain] = self.__view[head:tail]
+        self.__head = 0
+        self.__tail = remain
+
+
 # Feedback interface
 # 反馈数据接口类
 
 
 class DobotApiFeedBack(DobotApi):
-    def __init__(self, ip, port, *args):
-        super().__init__(ip, port, *args)
+    def __init__(self, ip, port, *args, layout=None, keepalive=None):
+        """
+        layout: FEEDBACK_LAYOUTS 中的版本, None 为自动识别 frame layout, None detects it
+        keepalive: 每隔多少秒检查是否仍有数据 how often to check that frames still
+        arrive; off by default. Frames are only counted when feedBackData() reads
+        them, so set it when something reads continuously, as FeedBackHub does.
+        """
+        super().__init__(ip, port, *args, keepalive=keepalive)
         self.__MyType = []
         self.last_recv_time = time.perf_counter()
-        
+        self.reader = FeedBackReader(layout=layout)
 
     def feedBackData(self):
         """
         返回机械臂状态
         Return the robot status
-        """
-        self.socket_dobot.setblocking(True)  # 设置为阻塞模式
-        data = bytes()
-        current_recv_time = time.perf_counter() #计时，获取当前时间
-        temp = self.socket_dobot.recv(144000) #缓冲区
-        if len(temp) > 1440:    
-            temp = self.socket_dobot.recv(144000)
-        #print("get:",len(temp))
-        i=0
-        if len(temp) < 1440:
-            while i < 5 :
-                #print("重新接收")
-                temp = self.socket_dobot.recv(144000)
-                if len(temp) > 1440:
-                    break
-                i+=1
-            if i >= 5:
-                raise Exception("接收数据包缺失，请检查网络环境")
-        
-        interval = (current_recv_time - self.last_recv_time) * 1000  # 转换为毫秒
-        self.last_recv_time = current_recv_time
-        #print(f"Time interval since last receive: {interval:.3f} ms")
-        
-        data = temp[0:1440] #截取1440字节
-        #print(len(data))
-        #print(f"Single element size of MyType: {MyType.itemsize} bytes")
-        self.__MyType = None   
-
-        if len(data) == 1440:        
-            self.__MyType = np.frombuffer(data, dtype=MyType)
 
+        每一帧完整数据都按顺序返回, 返回值在下一次调用前有效。
+        Every complete frame is returned in order, as a zero-copy view that
+        stays valid until the next call.
+        """
+        sock = self.link.socket()
+        if self.reader.sock is not sock:
+            # 新连接或重连后 new or reconnected socket
+            sock.setblocking(True)  # 设置为阻塞模式
+            self.reader.reset(sock)
+        try:
+            self.__MyType = self.reader.read_frame()
+        except OSError as e:
+            self.link.lost(sock, e)
+            raise
+        self.link.touch()
+        self.last_recv_time = time.perf_counter()
         return self.__MyType
-        
+
+
+# 反馈数据分发: 每台机器人一个读取线程
+# Feedback fan-out: one reader thread per robot
+
+
+FeedBackSnapshot = namedtuple('FeedBackSnapshot', ['seq', 'recv_time', 'data'])
+
+# RobotMode: 5 使能且空闲 enabled and idle, 9 报警 error, 11 碰撞 collision
+ROBOT_MODE_ENABLE = 5
+ROBOT_MODE_ERROR = 9
+ROBOT_MODE_COLLISION = 11
+
+
+def _command_done(command_id):
+    def done(frame):
+        if 'CurrentCommandId' not in frame.dtype.fields:
+            raise ValueError("反馈帧不含 CurrentCommandId The feedback layout has no CurrentCommandId")
+        mode = frame['RobotMode'][0]
+        if mode == ROBOT_MODE_ERROR or mode == ROBOT_MODE_COLLISION:
+            return True
+        current = frame['CurrentCommandId'][0]
+        return current > command_id or (current == command_id and mode == ROBOT_MODE_ENABLE)
+    return done
+
+
+def _mode_in(modes):
+    modes = {modes} if isinstance(modes, int) else set(modes)
+    return lambda frame: frame['RobotMode'][0] in modes
+
+
+class FeedBackHub:
+    """
+    每台机器人只打开一个反馈端口, 每帧只解析一次, 供界面、运动等待和日志共用。
+    Owns the feedback connection of one robot and decodes every frame once.
+
+    latest is the newest FeedBackSnapshot(seq, recv_time, data); data is a
+    read-only copy of the MyType frame. It is replaced by a plain reference
+    swap, so readers never take a lock. subscribe() gives a consumer its own
+    bounded queue; a consumer that falls behind loses its oldest snapshots
+    (counted in dropped) instead of slowing down the reader.
+
+    wait_for_command()/wait_for_mode() block on a condition variable that is
+    notified on every frame, so a finished motion is seen within one feedback
+    period; the *_async variants do the same for asyncio code.
+    """
+
+    def __init__(self, ip, port=30004, feed=None):
+        self.feed = feed if feed is not None else DobotApiFeedBack(ip, port, keepalive=1.0)
+        self.latest = None
+        self.dropped = 0
+        self.__subscribers = ()
+        self.__subLock = threading.Lock()
+        self.__frameCond = threading.Condition()
+        self.__asyncWaiters = []
+        self.__running = False
+        self.__thread = None
+
+    def start(self):
+        if self.__thread is None:
+            self.__running = True
+            self.__thread = threading.Thread(
+                target=self.__run, name=f"FeedBackHub-{self.feed.port}", daemon=True)
+            self.__thread.start()
+        return self
+
+    def stop(self):
+        self.__running = False
+        self.feed.close()
+
+    def subscribe(self, maxsize=16):
+        """
+        Return a queue that receives every new snapshot.
+        """
+        subscriber = queue.Queue(maxsize)
+        with self.__subLock:
+            self.__subscribers = self.__subscribers + (subscriber,)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.__subLock:
+            self.__subscribers = tuple(
+                q for q in self.__subscribers if q is not subscriber)
+
+    def wait_until(self, predicate, timeout=None):
+        """
+        Block until predicate(frame) is true for the newest frame.
+        Return that snapshot, or None when timeout (seconds) expires first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.__frameCond:
+            while True:
+                snapshot = self.latest
+                if snapshot is not None and predicate(snapshot.data):
+                    return snapshot
+                if deadline is None:
+                    self.__frameCond.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self.__frameCond.wait(remaining)
+
+    async def wait_until_async(self, predicate, timeout=None):
+        """
+        asyncio version of wait_until().
+        """
+        loop = asyncio.get_running_loop()
+        waiter = (predicate, loop, loop.create_future())
+        with self.__frameCond:
+            snapshot = self.latest
+            if snapshot is not None and predicate(snapshot.data):
+                return snapshot
+            self.__asyncWaiters.append(waiter)
+        try:
+            return await asyncio.wait_for(waiter[2], timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            with self.__frameCond:
+                if waiter in self.__asyncWaiters:
+                    self.__asyncWaiters.remove(waiter)
+
+    def wait_for_command(self, command_id, timeout=None):
+        """
+        等待运动指令执行完成 Wait until the motion command command_id is done.
+        Also returns early when the robot is in error (9) or collision (11)
+        mode, so check RobotMode of the returned snapshot. None on timeout.
+        """
+        return self.wait_until(_command_done(command_id), timeout)
+
+    async def wait_for_command_async(self, command_id, timeout=None):
+        # 首帧之前也检查格式 check the layout even before the first frame
+        reader = getattr(self.feed, 'reader', None)
+        if reader is not None and 'CurrentCommandId' not in reader.dtype.fields:
+            raise ValueError("反馈帧不含 CurrentCommandId The feedback layout has no CurrentCommandId")
+        return await self.wait_until_async(_command_done(command_id), timeout)
+
+    def wait_for_mode(self, modes, timeout=None):
+        """
+        等待机器人进入指定模式 Wait until RobotMode is one of modes.
+        """
+        return self.wait_until(_mode_in(modes), timeout)
+
+    async def wait_for_mode_async(self, modes, timeout=None):
+        return await self.wait_until_async(_mode_in(modes), timeout)
+
+    def __publish(self, snapshot):
+        with self.__frameCond:
+            self.latest = snapshot
+            self.__frameCond.notify_all()
+            if self.__asyncWaiters:
+                self.__wakeAsyncWaiters(snapshot)
+        for subscriber in self.__subscribers:
+            try:
+                subscriber.put_nowait(snapshot)
+            except queue.Full:
+                # 丢弃最旧的一帧 drop the oldest snapshot
+                try:
+                    subscriber.get_nowait()
+                except queue.Empty:
+                    pass
+                self.dropped += 1
+                try:
+                    subscriber.put_nowait(snapshot)
+                except queue.Full:
+                    pass
+
+    def __wakeAsyncWaiters(self, snapshot):
+        waiting = []
+        for waiter in self.__asyncWaiters:
+            predicate, loop, future = waiter
+            try:
+                ready = predicate(snapshot.data)
+            except Exception as e:
+                # 异常交给等待方, 不能让读取线程退出 the waiter gets the error, the reader thread goes on
+                loop.call_soon_threadsafe(_set_future_exception, future, e)
+                continue
+            if ready:
+                loop.call_soon_threadsafe(_set_future_result, future, snapshot)
+            else:
+                waiting.append(waiter)
+        self.__asyncWaiters = waiting
+
+    def __run(self):
+        seq = 0
+        while self.__running:
+            try:
+                frame = self.feed.feedBackData()
+            except OSError as e:
+                if not self.__running:
+                    break
+                if self.feed.link.state == LINK_READY:
+                    print(e)
+                self.feed.link.wait_ready(0.5)
+                continue
+            seq += 1
+            data = frame.copy()
+            data.flags.writeable = False
+            self.__publish(FeedBackSnapshot(seq, time.perf_counter(), data))
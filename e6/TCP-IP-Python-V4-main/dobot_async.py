@@ -0,0 +1,244 @@
+import asyncio
+import functools
+import inspect
+import socket
+from collections import deque
+
+from dobot_api import DobotApiDashboard, DobotStateCache, DobotTimeoutError, FeedBackReader, KinematicsCache, \
+    _command_name
+
+# asyncio 版本的控制指令及反馈接口
+# asyncio clients for the dashboard and feedback ports
+#
+#     async with AsyncDobotDashboard("192.168.5.1") as dash, \
+#                AsyncDobotFeedback("192.168.5.1") as feed:
+#         await dash.EnableRobot()
+#         await dash.MovJ(600, -260, 380, 170, 12, 140, 0)
+#         async for frame in feed:
+#             print(frame['RobotMode'][0])
+
+
+class AsyncDobotDashboard:
+    """
+    asyncio client for the dashboard port (29999).
+
+    Has the same commands as DobotApiDashboard (MovJ, MovL, InverseKin,
+    GetPose, the FC* commands, ...); each one is a coroutine that returns the
+    reply string. Commands are pipelined on one connection and every command
+    has a deadline: `timeout` seconds by default, or wrap calls in
+    asyncio.timeout(). A command that times out or is cancelled keeps its
+    place in the reply queue, so its late reply is dropped instead of being
+    handed to the next command; if that reply never comes, the command is
+    skipped once a reply for a later one arrives.
+    """
+
+    def __init__(self, ip, port=29999, timeout=5.0):
+        if port != 29999:
+            raise ValueError(f"Connect to dashboard server need use port 29999, not {port} !")
+        self.ip = ip
+        self.port = port
+        self.timeout = timeout
+        self.__reader = None
+        self.__writer = None
+        self.__pending = deque()
+        self.__readTask = None
+        self.kin_cache = KinematicsCache()
+        self.state_cache = None
+
+    async def connect(self):
+        self.__reader, self.__writer = await asyncio.wait_for(
+            asyncio.open_connection(self.ip, self.port), self.timeout)
+        self.__readTask = asyncio.get_running_loop().create_task(self.__readReplies())
+        return self
+
+    async def close(self):
+        if self.__readTask is not None:
+            self.__readTask.cancel()
+            self.__readTask = None
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
+        self.kin_cache.close()
+        self.__failPending(ConnectionError("指令通道已关闭 Command channel closed"))
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def sendRecvMsg(self, string, timeout=None):
+        """
+        Send one command and return its reply, within timeout seconds.
+        """
+        if self.__writer is None:
+            raise ConnectionError("未连接 Not connected")
+        future = asyncio.get_running_loop().create_future()
+        self.__pending.append((future, _command_name(string)))
+        self.__writer.write(string.encode('utf-8'))
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            async with asyncio.timeout(timeout):
+                await self.__writer.drain()
+                return await future
+        except TimeoutError:
+            future.cancel()
+            raise DobotTimeoutError(f"{self.ip}:{self.port} {timeout} s 内无回复 no reply: {string}") from None
+
+    async def sendCached(self, key, string, timeout=None):
+        """
+        sendRecvMsg(), answered from kin_cache when key is cached.
+        """
+        reply = self.kin_cache.get(key)
+        if reply is None:
+            generation = self.kin_cache.generation
+            reply = await self.sendRecvMsg(string, timeout)
+            self.kin_cache.store(key, reply, generation)
+        return reply
+
+    def use_feedback(self, source, max_age=0.05):
+        """
+        Answer RobotMode/GetAngle/GetPose/DI/GetDO from the feedback of
+        source, as DobotApiDashboard.use_feedback(); kin_cache follows the
+        User/Tool indices of a FeedBackHub source.
+        """
+        self.state_cache = None if source is None else DobotStateCache(source, max_age)
+        if hasattr(source, 'subscribe'):
+            self.kin_cache.attach(source)
+        else:
+            self.kin_cache.close()
+        return self
+
+    async def sendState(self, string, name, args=(), max_age=None, timeout=None):
+        cache = self.state_cache
+        reply = None if cache is None or max_age == 0 else cache.reply(name, args, max_age)
+        if reply is None:
+            reply = await self.sendRecvMsg(string, timeout)
+        return reply
+
+    async def sendPriority(self, string, timeout=None):
+        """
+        Stop/Pause/EmergencyStop: no separate lane here, the commands are
+        pipelined and never wait behind another command's reply.
+        """
+        return await self.sendRecvMsg(string, timeout)
+
+    def __getattr__(self, name):
+        command = getattr(DobotApiDashboard, name)
+
+        # 借用的同步方法可能直接返回字符串 (如参数校验), 统一成协程
+        # a borrowed method may return a plain string (e.g. a parameter check): always a coroutine
+        @functools.wraps(command)
+        async def call(*args, **kwargs):
+            result = command(self, *args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        return call
+
+    def __failPending(self, error):
+        while self.__pending:
+            future, _ = self.__pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    async def __readReplies(self):
+        buf = bytearray()
+        error = ConnectionError("连接断开, 指令未收到回复 Connection lost before reply")
+        try:
+            while True:
+                data = await self.__reader.read(4096)
+                if not data:
+                    return
+                buf += data
+                end = buf.find(b';')
+                while end >= 0:
+                    reply = buf[:end + 1].decode('utf-8')
+                    del buf[:end + 1]
+                    self.__resolve(reply)
+                    end = buf.find(b';')
+                if buf.find(b'Not Tcp') >= 0:
+                    self.__resolve(buf.decode('utf-8'))
+                    buf.clear()
+        except Exception as e:
+            error = ConnectionError(f"读取回复失败 Reply reader failed: {e!r}")
+        finally:
+            # 读取结束后不再有回复, 等待中的指令立即失败 no more replies: fail what is waiting
+            if self.__writer is not None:
+                self.__writer.close()
+                self.__writer = None
+            self.__failPending(error)
+
+    def __resolve(self, reply):
+        name = _command_name(reply[reply.find('},') + 2:]) if reply.endswith(');') else None
+        while self.__pending:
+            future, sent = self.__pending.popleft()
+            if future.done() and name and sent != name and any(n == name for _, n in self.__pending):
+                continue  # 已取消且始终没有回复 cancelled and never answered, skip it
+            if not future.done():  # 超时或取消的指令丢弃回复 drop late replies
+                future.set_result(reply)
+            return
+
+
+class AsyncDobotFeedback:
+    """
+    asyncio client for the feedback ports (30004: 8ms, 30005: 200ms).
+
+    `async for frame in feedback` yields every decoded MyType frame, using
+    the same FeedBackReader buffer as DobotApiFeedBack. A frame is a
+    zero-copy view that is valid until the next one is requested; call
+    .copy() to keep it. Waiting for a frame longer than `timeout` seconds
+    raises asyncio.TimeoutError.
+    """
+
+    def __init__(self, ip, port=30004, timeout=1.0):
+        if port != 30004 and port != 30005:
+            raise ValueError(f"Feedback need use port 30004 or 30005, not {port} !")
+        self.ip = ip
+        self.port = port
+        self.timeout = timeout
+        self.reader = FeedBackReader()
+
+    async def connect(self):
+        sock = socket.socket()
+        sock.setblocking(False)
+        await asyncio.wait_for(
+            asyncio.get_running_loop().sock_connect(sock, (self.ip, self.port)), self.timeout)
+        self.reader.reset(sock)
+        return self
+
+    async def close(self):
+        if self.reader.sock is not None:
+            self.reader.sock.close()
+            self.reader.reset()
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def read_frame(self, timeout=None):
+        """
+        Return the next complete frame.
+        """
+        loop = asyncio.get_running_loop()
+        reader = self.reader
+        frame = reader.next_frame()
+        while frame is None:
+            nbytes = await asyncio.wait_for(
+                loop.sock_recv_into(reader.sock, reader.writable()),
+                self.timeout if timeout is None else timeout)
+            if nbytes == 0:
+                raise ConnectionError("反馈端口连接已断开 Feedback connection closed")
+            reader.commit(nbytes)
+            frame = reader.next_frame()
+        return frame
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.reader.sock is None:
+            raise StopAsyncIteration
+        return await self.read_frame()
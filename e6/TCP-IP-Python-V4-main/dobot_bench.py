@@ -0,0 +1,386 @@
+import argparse
+import json
+import os
+import platform
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+from dobot_api import DobotApiDashboard, DobotApiFeedBack, FeedBackReader, MyType, FEED_TEST_VALUE, parse_reply, \
+    encode_command, encode_commands
+
+# 性能测试: 指令往返时延、运动指令吞吐、反馈帧解码速度
+# Benchmarks for the robot I/O hot path, run against dobot_sim.py
+#
+#     python dobot_bench.py -o bench.json
+#
+# The simulator is started in a child process so that it does not compete
+# with the client for the GIL. Results are printed and, with -o, written as
+# JSON so runs can be compared release to release.
+
+BENCH_VERSION = 4
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _percentiles(samples):
+    samples = np.asarray(samples) * 1e6  # 微秒 microseconds
+    return {
+        'count': int(len(samples)),
+        'mean_us': float(samples.mean()),
+        'p50_us': float(np.percentile(samples, 50)),
+        'p99_us': float(np.percentile(samples, 99)),
+        'max_us': float(samples.max()),
+    }
+
+
+def _timeit(func, number):
+    begin = time.perf_counter()
+    for _ in range(number):
+        func()
+    elapsed = time.perf_counter() - begin
+    return {'count': number, 'per_call_us': elapsed / number * 1e6, 'calls_per_s': number / elapsed}
+
+
+def start_simulator(host, move_time, jitter, split, drop):
+    """
+    Start dobot_sim.py in a child process and wait until its ports accept connections.
+    """
+    command = [sys.executable, os.path.join(HERE, "dobot_sim.py"), "--host", host,
+               "--move-time", str(move_time), "--jitter", str(jitter), "--drop", str(drop), "--seed", "1"]
+    if split:
+        command.append("--split")
+    sim = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    for port in (29999, 30004, 30005):
+        while True:
+            try:
+                socket.create_connection((host, port), timeout=0.5).close()
+                break
+            except OSError:
+                if sim.poll() is not None or time.monotonic() > deadline:
+                    sim.kill()
+                    raise RuntimeError(f"simulator did not start on {host}:{port}")
+                time.sleep(0.05)
+    return sim
+
+
+def bench_round_trip(dashboard, number):
+    """
+    同步指令往返时延 Round trip of sendRecvMsg(), one command at a time.
+    """
+    samples = []
+    for _ in range(number):
+        begin = time.perf_counter()
+        dashboard.RobotMode()
+        samples.append(time.perf_counter() - begin)
+    return _percentiles(samples)
+
+
+def bench_queued_motion(dashboard, number):
+    """
+    运动指令吞吐 Queued MovL commands per second, blocking and pipelined.
+    """
+    dashboard.EnableRobot()
+    begin = time.perf_counter()
+    for i in range(number):
+        dashboard.MovL(600 + i % 10, -260, 380, 170, 12, 140, 0)
+    blocking = time.perf_counter() - begin
+
+    pipeline = dashboard.pipeline()
+    begin = time.perf_counter()
+    futures = [pipeline.MovL(600 + i % 10, -260, 380, 170, 12, 140, 0) for i in range(number)]
+    for future in futures:
+        future.result()
+    pipelined = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    futures = pipeline.batch([("MovL", (600 + i % 10, -260, 380, 170, 12, 140, 0)) for i in range(number)])
+    for future in futures:
+        future.result()
+    batched = time.perf_counter() - begin
+    dashboard.Stop()
+    return {
+        'count': number,
+        'blocking_cmds_per_s': number / blocking,
+        'pipelined_cmds_per_s': number / pipelined,
+        'batched_cmds_per_s': number / batched,
+    }
+
+
+def bench_priority(dashboard, number):
+    """
+    负载下的停止指令时延 Stop() latency while the command channel is kept full
+    of InverseKin: on the priority lane, and on the main connection for comparison.
+    """
+    running = threading.Event()
+    running.set()
+
+    def load():
+        pipeline = dashboard.pipeline()
+        while running.is_set():
+            futures = [pipeline.InverseKin(600, -260, 380 + i * 0.01, 170, 12, 140) for i in range(32)]
+            for future in futures:
+                future.result()
+
+    thread = threading.Thread(target=load, daemon=True)
+    thread.start()
+    lane, main = [], []
+    try:
+        for _ in range(number):
+            begin = time.perf_counter()
+            dashboard.Stop()
+            lane.append(time.perf_counter() - begin)
+            begin = time.perf_counter()
+            dashboard.sendRecvMsg("Stop()")
+            main.append(time.perf_counter() - begin)
+    finally:
+        running.clear()
+        thread.join()
+    return {'priority_lane': _percentiles(lane), 'main_channel': _percentiles(main)}
+
+
+def bench_feedback(host, port, seconds, period):
+    """
+    反馈帧接收 Frames decoded per second through feedBackData(), with dropped
+    frames detected from gaps in TimeStamp and the reader thread's CPU time.
+    """
+    feed = DobotApiFeedBack(host, port)
+    frames = 0
+    dropped = 0
+    lastStamp = None
+    latencies = []
+    cpuBegin = time.thread_time()
+    begin = time.perf_counter()
+    while time.perf_counter() - begin < seconds:
+        frame = feed.feedBackData()
+        frames += 1
+        stamp = int(frame['TimeStamp'][0])
+        if lastStamp is not None:
+            # 时间戳为毫秒, 间隔超过1.5个周期视为丢帧 ms stamps, gap > 1.5 periods is a loss
+            gap = (stamp - lastStamp) / 1000.0
+            if gap > 1.5 * period:
+                dropped += int(round(gap / period)) - 1
+        lastStamp = stamp
+        latencies.append(time.time() - stamp / 1000.0)
+    elapsed = time.perf_counter() - begin
+    cpu = time.thread_time() - cpuBegin
+    reader = feed.reader
+    feed.close()
+    return {
+        'port': port,
+        'frames': frames,
+        'frames_per_s': frames / elapsed,
+        'expected_frames_per_s': 1.0 / period,
+        'dropped_frames': dropped,
+        'resyncs': reader.resyncs,
+        'skipped_bytes': reader.skipped_bytes,
+        'cpu_us_per_frame': cpu / max(frames, 1) * 1e6,
+        'stamp_age_p99_ms': float(np.percentile(latencies, 99) * 1e3) if latencies else None,
+    }
+
+
+def bench_decode(number):
+    """
+    不经网络的解码速度 Decode speed of FeedBackReader on a buffer already in memory.
+    """
+    frame = np.zeros(1, dtype=MyType)
+    frame['TestValue'] = FEED_TEST_VALUE
+    data = frame.tobytes() * 32
+    reader = FeedBackReader(capacity=64)
+    begin = time.perf_counter()
+    cpuBegin = time.process_time()
+    decoded = 0
+    while decoded < number:
+        view = reader.writable()
+        view[:len(data)] = data
+        reader.commit(len(data))
+        frame = reader.next_frame()
+        while frame is not None:
+            frame['RobotMode'][0]
+            decoded += 1
+            frame = reader.next_frame()
+    elapsed = time.perf_counter() - begin
+    return {
+        'frames': decoded,
+        'frames_per_s': decoded / elapsed,
+        'cpu_us_per_frame': (time.process_time() - cpuBegin) / decoded * 1e6,
+    }
+
+
+def _regex_numbers(reply):
+    # 旧的解析方式, 作为对照 the former ParseResultId approach, as a baseline
+    return [int(num) for num in re.findall(r'-?\d+', reply)]
+
+
+def _regex_fullmatch(reply):
+    # 旧的 rae6 parse_rsp 方式, 加上调用方对返回值的解码, 作为对照
+    # the former rae6 parse_rsp approach plus the decoding its callers did, as a baseline
+    match = re.fullmatch(r"^\s*(-?\d+)\s*,\s*{(.*?)}\s*,\s*(.*)\s*$", reply.strip().rstrip(";"))
+    value = match.group(2).strip()
+    if '[' in value:
+        values = json.loads(value)
+    else:
+        values = [float(item) for item in value.split(',')] if value else []
+    return int(match.group(1)), values, match.group(3).strip()
+
+
+def _rae6_parse_rsp(response):
+    # rae6 RobotArmDashBoard.parse_rsp() 原样拷贝 (去掉日志), 作为对照
+    # a copy of rae6 RobotArmDashBoard.parse_rsp() without its logging, as a baseline
+    if not isinstance(response, str):
+        raise ValueError("response must be a string")
+    if "Not Tcp" in response:
+        return {"error_id": -99, "value": "", "command": ""}
+    cleaned_response = response.strip().rstrip(";")
+    match = re.fullmatch(r"^\s*(-?\d+)\s*,\s*{(.*?)}\s*,\s*(.*)\s*$", cleaned_response)
+    if not match:
+        raise ValueError(f"invalid response: '{response}'")
+    return {
+        "error_id": int(match.group(1)),
+        "value": match.group(2).strip(),
+        "command": match.group(3).strip(),
+    }
+
+
+def bench_parsers(number):
+    """
+    回复解析 Parsing dashboard replies: parse_reply() against the regex
+    approaches it replaced, ParseResultId() and rae6 parse_rsp().
+    """
+    replies = {
+        'pose': "0,{600.000000,-260.000000,380.000000,170.000000,12.000000,140.000000},GetPose();",
+        'command_id': "0,{1234},MovL(pose={600,-260,380,170,12,140});",
+        'error_id': "0,{[[22,23],[],[],[],[],[],[]]},GetErrorID();",
+    }
+    results = {}
+    for name, reply in replies.items():
+        results[f'parse_reply.{name}'] = _timeit(lambda: parse_reply(reply), number)
+        results[f'regex_findall.{name}'] = _timeit(lambda: _regex_numbers(reply), number)
+        results[f'regex_fullmatch.{name}'] = _timeit(lambda: _regex_fullmatch(reply), number)
+    reply = replies['pose']
+    results['ParseResultId'] = _timeit(lambda: DobotApiDashboard.ParseResultId(None, reply), number)
+    results['rae6.parse_rsp'] = _timeit(lambda: _rae6_parse_rsp(reply), number)
+    return results
+
+
+def _concat_movl(a, b, c, d, e, f, coordinateMode, user=-1, tool=-1, a_=-1, v=-1, speed=-1, cp=-1, r=-1):
+    # 改为指令表之前的拼接方式 string building as the methods did before the schema
+    if coordinateMode == 0:
+        string = "MovL(pose={{{:f},{:f},{:f},{:f},{:f},{:f}}}".format(a, b, c, d, e, f)
+    else:
+        string = "MovL(joint={{{:f},{:f},{:f},{:f},{:f},{:f}}}".format(a, b, c, d, e, f)
+    params = []
+    if user != -1:
+        params.append('user={:d}'.format(user))
+    if tool != -1:
+        params.append('tool={:d}'.format(tool))
+    if a_ != -1:
+        params.append('a={:d}'.format(a_))
+    if speed != -1:
+        params.append('speed={:d}'.format(speed))
+    elif v != -1:
+        params.append('v={:d}'.format(v))
+    if cp != -1:
+        params.append('cp={:d}'.format(cp))
+    elif r != -1:
+        params.append('r={:d}'.format(r))
+    for param in params:
+        string = string + ',' + param
+    string = string + ')'
+    return string
+
+
+def bench_encoders(number):
+    """
+    指令编码 Building command strings: encode_command() against the old
+    concatenation, and a 100-command batch through encode_commands().
+    """
+    point = (600.0, -260.0, 380.0, 170.0, 12.0, 140.0)
+    batch = [("MovL", point + (0,), {'v': 50, 'cp': 20})] * 100
+    return {
+        'encode_command.MovL': _timeit(lambda: encode_command("MovL", *point, 0, v=50, cp=20), number),
+        'concat.MovL': _timeit(lambda: _concat_movl(*point, 0, v=50, cp=20), number),
+        'encode_commands.MovL_x100': _timeit(lambda: encode_commands(batch), max(1, number // 100)),
+    }
+
+
+def run(args):
+    results = {
+        'version': BENCH_VERSION,
+        'time': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'config': vars(args),
+    }
+    results['decode'] = bench_decode(args.frames)
+    results['parse'] = bench_parsers(args.parse)
+    results['encode'] = bench_encoders(args.parse)
+
+    sim = start_simulator(args.host, 0.0, args.jitter, args.split, args.drop)
+    try:
+        dashboard = DobotApiDashboard(args.host, 29999, priority=True)
+        try:
+            results['round_trip'] = bench_round_trip(dashboard, args.commands)
+            results['queued_motion'] = bench_queued_motion(dashboard, args.commands)
+            results['stop_under_load'] = bench_priority(dashboard, max(1, args.commands // 10))
+        finally:
+            dashboard.close()
+        results['feedback_30004'] = bench_feedback(args.host, 30004, args.seconds, 0.008)
+    finally:
+        sim.terminate()
+        sim.wait()
+    return results
+
+
+def report(results):
+    rt = results['round_trip']
+    print(f"round trip      p50 {rt['p50_us']:9.1f} us   p99 {rt['p99_us']:9.1f} us   ({rt['count']} cmds)")
+    qm = results['queued_motion']
+    print(f"queued MovL     {qm['blocking_cmds_per_s']:9.0f} cmd/s blocking   "
+          f"{qm['pipelined_cmds_per_s']:9.0f} cmd/s pipelined   {qm['batched_cmds_per_s']:9.0f} cmd/s batched")
+    for name, stop in results['stop_under_load'].items():
+        print(f"Stop() {name:<14} p50 {stop['p50_us']:9.1f} us   p99 {stop['p99_us']:9.1f} us   "
+              f"max {stop['max_us']:9.1f} us")
+    fb = results['feedback_30004']
+    print(f"feedback 30004  {fb['frames_per_s']:9.1f} frames/s (of {fb['expected_frames_per_s']:.0f})   "
+          f"dropped {fb['dropped_frames']}   {fb['cpu_us_per_frame']:.1f} us CPU/frame")
+    dc = results['decode']
+    print(f"decode          {dc['frames_per_s']:9.0f} frames/s   {dc['cpu_us_per_frame']:.2f} us CPU/frame")
+    for name, parse in results['parse'].items():
+        if 'skipped' in parse:
+            print(f"{name:<28} skipped: {parse['skipped']}")
+        else:
+            print(f"{name:<28} {parse['per_call_us']:9.2f} us/call")
+    for name, encode in results['encode'].items():
+        print(f"{name:<28} {encode['per_call_us']:9.2f} us/call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Dobot TCP/IP client against dobot_sim.py")
+    parser.add_argument('--host', default="127.0.0.1", help="address the simulator listens on")
+    parser.add_argument('--commands', type=int, default=2000, help="commands per dashboard benchmark")
+    parser.add_argument('--seconds', type=float, default=5.0, help="feedback benchmark duration")
+    parser.add_argument('--frames', type=int, default=200000, help="frames for the decode benchmark")
+    parser.add_argument('--parse', type=int, default=20000, help="calls per parser benchmark")
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--split', action='store_true')
+    parser.add_argument('--drop', type=float, default=0.0)
+    parser.add_argument('-o', '--output', help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    results = run(args)
+    report(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
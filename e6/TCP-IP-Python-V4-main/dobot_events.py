@@ -0,0 +1,143 @@
+import threading
+from collections import namedtuple
+
+# 反馈数据变化事件: 只在输入输出位或状态字段变化时产生事件
+# Change events from the feedback stream: DI/DO edges and status transitions
+#
+#     detector = FeedbackChangeDetector(callback=print).attach(hub)
+#     # DI3 rose
+#     # RobotMode 5→9
+#     # Collision
+
+# 按位比较的字段及事件名前缀 fields compared bit by bit, and their event name prefix
+CHANGE_BITS = {'DigitalInputs': 'DI', 'DigitalOutputs': 'DO'}
+CHANGE_FIELDS = ('RobotMode', 'EnableStatus', 'ErrorStatus', 'CollisionState', 'RunningStatus',
+                 'BrakeStatus', 'DragStatus', 'User', 'Tool', 'AutoManualMode', 'SafetyState')
+# 标志位置位/清除时的事件名 names for flags being set / cleared
+CHANGE_FLAGS = {'CollisionState': 'Collision', 'ErrorStatus': 'Error'}
+
+
+class FeedbackEvent(namedtuple('FeedbackEvent', ['field', 'name', 'old', 'new', 'time'])):
+    """
+    One transition: field is the MyType field, name is e.g. "DI3" or
+    "RobotMode", old/new are the values (0/1 for a bit) and time is the
+    TimeStamp of the frame that showed it.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        if self.field in CHANGE_BITS:
+            return f"{self.name} {'rose' if self.new else 'fell'}"
+        if self.field in CHANGE_FLAGS and (self.old == 0 or self.new == 0):
+            return CHANGE_FLAGS[self.field] if self.new else f"{CHANGE_FLAGS[self.field]} cleared"
+        return f"{self.name} {self.old}→{self.new}"
+
+
+class FeedbackChangeDetector:
+    """
+    Turns feedback frames into FeedbackEvents for real transitions only.
+
+    The raw bytes of the watched fields are compared with the previous
+    frame's first; only when they differ are the fields decoded, and the
+    DigitalInputs/DigitalOutputs words are XORed with their previous value
+    to find the bits that changed. A frame without changes costs a few
+    bytes comparisons and returns an empty tuple. The first frame only sets
+    the baseline (state), it produces no events.
+    """
+
+    def __init__(self, fields=CHANGE_FIELDS, bits=tuple(CHANGE_BITS), callback=None):
+        self.fields = tuple(fields)
+        self.bits = tuple(bits)
+        self.callback = callback
+        self.state = None
+        self.events = 0
+        self.__dtype = None
+        self.__spans = ()
+        self.__raw = ()
+        self.__hub = None
+        self.__subscriber = None
+        self.__thread = None
+
+    def update(self, frame):
+        """
+        Compare frame with the previous one and return the tuple of events.
+        """
+        raw = frame.tobytes()
+        if frame.dtype is not self.__dtype and frame.dtype != self.__dtype:
+            self.__watch(frame.dtype)
+        chunks = tuple(raw[begin:end] for begin, end in self.__spans)
+        if chunks == self.__raw:
+            return ()
+        self.__raw = chunks
+
+        record = frame.reshape(-1)[0] if frame.shape else frame
+        state = {name: int(record[name]) for name in self.__names}
+        old, self.state = self.state, state
+        if old is None:
+            return ()
+        stamp = int(record['TimeStamp'])
+        events = []
+        for name in self.__bitNames:
+            diff = old[name] ^ state[name]
+            prefix = CHANGE_BITS.get(name, name)
+            while diff:
+                low = diff & -diff
+                diff ^= low
+                index = low.bit_length()
+                events.append(FeedbackEvent(name, f"{prefix}{index}", int(bool(old[name] & low)),
+                                            int(bool(state[name] & low)), stamp))
+        for name in self.__fieldNames:
+            if old[name] != state[name]:
+                events.append(FeedbackEvent(name, name, old[name], state[name], stamp))
+        if events:
+            self.events += len(events)
+            events = tuple(events)
+            if self.callback is not None:
+                self.callback(events)
+            return events
+        return ()
+
+    def attach(self, hub, maxsize=256):
+        """
+        Watch every snapshot published by a FeedBackHub, in a background thread;
+        callback(events) is called for each frame with transitions.
+        """
+        self.__hub = hub
+        self.__subscriber = hub.subscribe(maxsize)
+        self.__thread = threading.Thread(target=self.__run, name="FeedbackChangeDetector", daemon=True)
+        self.__thread.start()
+        return self
+
+    def close(self):
+        if self.__hub is not None:
+            self.__hub.unsubscribe(self.__subscriber)
+            self.__hub = None
+            self.__subscriber.put(None)
+            self.__thread.join()
+
+    def __run(self):
+        while True:
+            snapshot = self.__subscriber.get()
+            if snapshot is None:
+                return
+            self.update(snapshot.data)
+
+    def __watch(self, dtype):
+        # 只比较本帧格式中存在的字段 watch the fields this layout has
+        self.__dtype = dtype
+        self.__bitNames = [name for name in self.bits if name in dtype.fields]
+        self.__fieldNames = [name for name in self.fields if name in dtype.fields]
+        self.__names = self.__bitNames + self.__fieldNames
+        spans = sorted((dtype.fields[name][1], dtype.fields[name][1] + dtype.fields[name][0].itemsize)
+                       for name in self.__names)
+        merged = []
+        for begin, end in spans:
+            # 相近的字段合并为一段 merge fields that are close together
+            if merged and begin - merged[-1][1] <= 32:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([begin, end])
+        self.__spans = tuple((begin, end) for begin, end in merged)
+        self.__raw = ()
+        self.state = None
+
@@ -0,0 +1,436 @@
+import errno
+import os
+import selectors
+import socket
+import threading
+import time
+import types
+from collections import deque
+from concurrent.futures import Future
+
+from dobot_api import (DobotApiDashboard, DobotStateCache, FeedBackReader, FeedBackSnapshot, KinematicsCache,
+                       _command_done, _mode_in, _set_future_exception, _set_future_result)
+
+# 多台机器人共用一个线程: 所有29999及反馈端口都由同一个selector管理
+# Fleet manager: every robot's dashboard and feedback socket in one selector loop
+#
+#     fleet = DobotFleet().start()
+#     arm1 = fleet.add("192.168.5.1")
+#     arm2 = fleet.add("192.168.5.2")
+#     arm1.EnableRobot()
+#     arm2.MovJ(600, -260, 380, 170, 12, 140, 0)
+#     print(arm1.latest.data['RobotMode'][0])
+#     fleet.close()
+
+
+class _FleetLink:
+    """
+    One non-blocking connection of a robot: dashboard (29999) or feedback.
+    """
+
+    def __init__(self, port):
+        self.port = port
+        self.sock = None
+        self.connected = False
+        self.events = 0
+        self.deadline = 0.0  # 连接超时或下次重连的时间 connect timeout / next retry
+        self.failures = 0
+        self.lastError = None
+
+
+class FleetRobot:
+    """
+    One robot of a DobotFleet.
+
+    Has the same commands as DobotApiDashboard (MovJ, GetPose, ...); they
+    block until the reply arrives or `timeout` seconds pass. submit() queues
+    a command string and returns a concurrent.futures.Future instead. At most
+    max_in_flight commands are queued or waiting for a reply. Commands fail
+    with ConnectionError at once while the dashboard port is disconnected.
+
+    latest is the newest FeedBackSnapshot of this robot; wait_for_command()
+    and wait_for_mode() work like the FeedBackHub ones. kin_cache follows the
+    User/Tool indices of every frame.
+    """
+
+    def __init__(self, fleet, ip, feed_port, max_in_flight, timeout):
+        self.ip = ip
+        self.timeout = timeout
+        self.latest = None
+        self.kin_cache = KinematicsCache()
+        self.state_cache = None
+        self.dash = _FleetLink(29999)
+        self.feed = _FleetLink(feed_port)
+        self.reader = FeedBackReader(capacity=8)
+        self._pending = deque()  # 已发送待回复, 仅由循环线程访问 loop thread only
+        self._sendBuf = bytearray()
+        self._recvBuf = bytearray()
+        self.__fleet = fleet
+        self.__slots = threading.BoundedSemaphore(max_in_flight)
+        self.__lock = threading.Lock()
+        self.__outbox = deque()
+        self.__frameCond = threading.Condition()
+
+    def submit(self, string):
+        """
+        Queue string for sending and return a Future for its reply.
+        """
+        if self.__fleet.closed:
+            raise ConnectionError("机器人管理已关闭 Fleet closed")
+        if not self.__slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"{self.ip}: too many commands in flight")
+        future = Future()
+        with self.__lock:
+            self.__outbox.append((string.encode('utf-8'), future))
+        self.__fleet._wake()
+        return future
+
+    def sendRecvMsg(self, string):
+        recvData = self.submit(string).result(self.timeout)
+        self.ParseResultId(recvData)
+        return recvData
+
+    def sendCached(self, key, string):
+        return self.kin_cache.fetch(key, lambda: self.sendRecvMsg(string))
+
+    def sendPriority(self, string):
+        # 所有指令共用一条连接 one connection per robot, no separate lane
+        return self.sendRecvMsg(string)
+
+    def use_feedback(self, max_age=0.05):
+        """
+        Answer RobotMode/GetAngle/GetPose/DI/GetDO from this robot's own
+        feedback when it is at most max_age seconds old; None turns it off.
+        """
+        self.state_cache = None if max_age is None else DobotStateCache(self, max_age)
+        return self
+
+    def sendState(self, string, name, args=(), max_age=None):
+        cache = self.state_cache
+        reply = None if cache is None or max_age == 0 else cache.reply(name, args, max_age)
+        return self.sendRecvMsg(string) if reply is None else reply
+
+    def __getattr__(self, name):
+        command = getattr(DobotApiDashboard, name)
+        return types.MethodType(command, self)
+
+    def wait_until(self, predicate, timeout=None):
+        """
+        Block until predicate(frame) is true for the newest frame.
+        Return that snapshot, or None when timeout (seconds) expires first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.__frameCond:
+            while True:
+                snapshot = self.latest
+                if snapshot is not None and predicate(snapshot.data):
+                    return snapshot
+                if deadline is None:
+                    self.__frameCond.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self.__frameCond.wait(remaining)
+
+    def wait_for_command(self, command_id, timeout=None):
+        return self.wait_until(_command_done(command_id), timeout)
+
+    def wait_for_mode(self, modes, timeout=None):
+        return self.wait_until(_mode_in(modes), timeout)
+
+    # 以下由循环线程调用 called from the fleet loop thread
+
+    def _hasOutbox(self):
+        return bool(self.__outbox)
+
+    def _takeOutbox(self):
+        with self.__lock:
+            while self.__outbox:
+                data, future = self.__outbox.popleft()
+                self._sendBuf += data
+                self._pending.append(future)
+
+    def _resolve(self, reply):
+        if self._pending:
+            future = self._pending.popleft()
+            self.__slots.release()
+            _set_future_result(future, reply)
+
+    def _failAll(self, error):
+        with self.__lock:
+            failed = list(self._pending) + [future for _, future in self.__outbox]
+            self._pending.clear()
+            self.__outbox.clear()
+        self._sendBuf.clear()
+        self._recvBuf.clear()
+        for future in failed:
+            self.__slots.release()
+            _set_future_exception(future, error)
+
+    def _publish(self, frame):
+        data = frame.copy()
+        data.flags.writeable = False
+        with self.__frameCond:
+            self.latest = FeedBackSnapshot(self.reader.frames, time.perf_counter(), data)
+            self.__frameCond.notify_all()
+        self.kin_cache.sync(data['User'][0], data['Tool'][0])
+
+
+class DobotFleet:
+    """
+    多机器人管理 Supervises many robots from one thread.
+
+    All dashboard and feedback sockets are non-blocking and served by one
+    selectors loop, so N robots cost one thread and about 12 KB of feedback
+    buffer each. A dropped connection never blocks the loop: its pending
+    commands fail and it is reconnected after retry_interval seconds. Only
+    the newest frame of each read is decoded into a snapshot; use
+    feed_port=30005 (200ms) when the 8ms stream is not needed.
+    """
+
+    def __init__(self, feed_port=30004, max_in_flight=32, timeout=5.0,
+                 connect_timeout=3.0, retry_interval=1.0):
+        if feed_port != 30004 and feed_port != 30005:
+            raise ValueError(f"Feedback need use port 30004 or 30005, not {feed_port} !")
+        self.feed_port = feed_port
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.retry_interval = retry_interval
+        self.robots = {}
+        self.closed = False
+        self.__lock = threading.Lock()
+        self.__removed = deque()
+        self.__selector = selectors.DefaultSelector()
+        self.__wakeRecv, self.__wakeSend = socket.socketpair()
+        self.__wakeRecv.setblocking(False)
+        self.__wakeSend.setblocking(False)
+        self.__selector.register(self.__wakeRecv, selectors.EVENT_READ, None)
+        self.__nextTimer = 0.0
+        self.__thread = None
+
+    def add(self, ip, feed_port=None):
+        """
+        Register a robot and return its FleetRobot; it connects in the background.
+        """
+        with self.__lock:
+            if ip in self.robots:
+                return self.robots[ip]
+            robot = FleetRobot(self, ip, feed_port or self.feed_port,
+                               self.max_in_flight, self.timeout)
+            self.robots = {**self.robots, ip: robot}
+        self._wake()
+        return robot
+
+    def remove(self, ip):
+        with self.__lock:
+            robots = dict(self.robots)
+            robot = robots.pop(ip, None)
+            self.robots = robots
+            if robot is not None:
+                self.__removed.append(robot)
+        self._wake()
+
+    def __getitem__(self, ip):
+        return self.robots[ip]
+
+    def __iter__(self):
+        return iter(self.robots.values())
+
+    def start(self):
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__run, name="DobotFleet", daemon=True)
+            self.__thread.start()
+        return self
+
+    def close(self):
+        self.closed = True
+        self._wake()
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join()
+        elif self.__thread is None:
+            self.__shutdown()
+
+    def _wake(self):
+        try:
+            self.__wakeSend.send(b'\0')
+        except (BlockingIOError, OSError):
+            pass  # 已有未处理的唤醒 a wake-up is already pending
+
+    def __run(self):
+        while not self.closed:
+            now = time.monotonic()
+            timeout = None if self.__nextTimer == float('inf') else max(0.0, self.__nextTimer - now)
+            woken = now >= self.__nextTimer
+            for key, events in self.__selector.select(timeout):
+                if key.data is None:
+                    self.__drainWake()
+                    woken = True
+                    continue
+                robot, link = key.data
+                if link.sock is None:
+                    continue  # 本轮已断开 dropped earlier in this round
+                try:
+                    if not link.connected:
+                        self.__finishConnect(robot, link)
+                    elif link is robot.feed:
+                        self.__readFeed(robot)
+                    else:
+                        if events & selectors.EVENT_READ:
+                            self.__readDash(robot)
+                        if events & selectors.EVENT_WRITE and link.sock is not None:
+                            self.__flush(robot)
+                except BlockingIOError:
+                    pass
+                except OSError as e:
+                    self.__drop(robot, link, e)
+            if woken or time.monotonic() >= self.__nextTimer:
+                self.__maintain(time.monotonic())
+        self.__shutdown()
+
+    def __maintain(self, now):
+        with self.__lock:
+            removed = list(self.__removed)
+            self.__removed.clear()
+        for robot in removed:
+            for link in (robot.dash, robot.feed):
+                self.__close(link)
+            robot._failAll(ConnectionError("机器人已移除 Robot removed from fleet"))
+
+        nextTimer = float('inf')
+        for robot in self.robots.values():
+            for link in (robot.dash, robot.feed):
+                if link.sock is None:
+                    if now >= link.deadline:
+                        self.__connect(robot, link, now)
+                elif not link.connected and now >= link.deadline:
+                    self.__drop(robot, link, TimeoutError("connect timed out"))
+                if not link.connected:
+                    nextTimer = min(nextTimer, link.deadline)
+            if robot._hasOutbox():
+                if robot.dash.connected:
+                    try:
+                        self.__flush(robot)
+                    except BlockingIOError:
+                        pass
+                    except OSError as e:
+                        self.__drop(robot, robot.dash, e)
+                elif robot.dash.sock is None:
+                    # 未连接时立即失败 fail fast while disconnected
+                    robot._failAll(ConnectionError(
+                        f"{robot.ip}: 未连接 Not connected ({robot.dash.lastError})"))
+        self.__nextTimer = nextTimer
+
+    def __connect(self, robot, link, now):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        err = sock.connect_ex((robot.ip, link.port))
+        if err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+            sock.close()
+            link.failures += 1
+            link.lastError = OSError(err, os.strerror(err))
+            link.deadline = now + self.retry_interval
+            return
+        link.sock = sock
+        link.connected = False
+        link.events = selectors.EVENT_WRITE
+        link.deadline = now + self.connect_timeout
+        self.__selector.register(sock, link.events, (robot, link))
+
+    def __finishConnect(self, robot, link):
+        err = link.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if err:
+            raise OSError(err, os.strerror(err))
+        link.connected = True
+        link.lastError = None
+        if link is robot.feed:
+            robot.reader.reset(link.sock)
+            self.__setEvents(robot, link, selectors.EVENT_READ)
+        else:
+            robot._recvBuf.clear()
+            self.__flush(robot)
+
+    def __drop(self, robot, link, error):
+        self.__close(link)
+        link.failures += 1
+        link.lastError = error
+        link.deadline = time.monotonic() + self.retry_interval
+        self.__nextTimer = min(self.__nextTimer, link.deadline)
+        if link is robot.dash:
+            robot._failAll(ConnectionError(
+                f"{robot.ip}: 连接断开, 指令未收到回复 Connection lost before reply ({error})"))
+
+    def __close(self, link):
+        if link.sock is not None:
+            try:
+                self.__selector.unregister(link.sock)
+            except (KeyError, ValueError):
+                pass
+            link.sock.close()
+        link.sock = None
+        link.connected = False
+        link.events = 0
+
+    def __setEvents(self, robot, link, events):
+        if events != link.events:
+            self.__selector.modify(link.sock, events, (robot, link))
+            link.events = events
+
+    def __flush(self, robot):
+        robot._takeOutbox()
+        sendBuf = robot._sendBuf
+        if sendBuf:
+            try:
+                sent = robot.dash.sock.send(sendBuf)
+                del sendBuf[:sent]
+            except BlockingIOError:
+                pass
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if sendBuf else 0)
+        self.__setEvents(robot, robot.dash, events)
+
+    def __readDash(self, robot):
+        data = robot.dash.sock.recv(4096)
+        if not data:
+            raise ConnectionError("dashboard connection closed")
+        buf = robot._recvBuf
+        buf += data
+        end = buf.find(b';')
+        while end >= 0:
+            robot._resolve(buf[:end + 1].decode('utf-8'))
+            del buf[:end + 1]
+            end = buf.find(b';')
+        if buf.find(b'Not Tcp') >= 0:
+            robot._resolve(buf.decode('utf-8'))
+            buf.clear()
+
+    def __readFeed(self, robot):
+        reader = robot.reader
+        nbytes = robot.feed.sock.recv_into(reader.writable())
+        if nbytes == 0:
+            raise ConnectionError("feedback connection closed")
+        reader.commit(nbytes)
+        newest = None
+        frame = reader.next_frame()
+        while frame is not None:
+            newest = frame
+            frame = reader.next_frame()
+        if newest is not None:
+            robot._publish(newest)
+
+    def __drainWake(self):
+        try:
+            while self.__wakeRecv.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def __shutdown(self):
+        error = ConnectionError("机器人管理已关闭 Fleet closed")
+        for robot in list(self.robots.values()) + list(self.__removed):
+            for link in (robot.dash, robot.feed):
+                self.__close(link)
+            robot._failAll(error)
+        self.__selector.close()
+        self.__wakeRecv.close()
+        self.__wakeSend.close()
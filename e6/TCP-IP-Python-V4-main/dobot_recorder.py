@@ -0,0 +1,254 @@
+import json
+import os
+import threading
+
+import numpy as np
+
+from dobot_api import FEEDBACK_LAYOUTS
+
+# 反馈数据记录: 预分配的内存映射环形文件, 按 TimeStamp 查询
+# Feedback recorder: a preallocated memory-mapped ring file, queried by TimeStamp
+#
+#     hub = FeedBackHub("192.168.5.1").start()
+#     recorder = FeedbackRecorder("arm1.rec", capacity=125 * 3600 * 24,
+#                                 fields=['TimeStamp', 'RobotMode', 'QActual', 'IActual', 'MotorTemperatures'])
+#     recorder.attach(hub)
+#     ...
+#     data = FeedbackRecorder("arm1.rec", readonly=True).query(t0, t1, ['QActual', 'IActual'])
+
+RECORDER_MAGIC = b'DOBOTREC'
+RECORDER_VERSION = 1
+RECORDER_CLOCK_JUMP = 1000  # TimeStamp 倒退超过此值(毫秒)即换新文件 a step back this large (ms) starts a new file
+
+# 文件头, 后接 JSON 格式的记录格式说明 fixed header, followed by the record dtype as JSON
+_HEADER = np.dtype([('magic', 'S8'),
+                    ('version', '<u4'),
+                    ('header_size', '<u4'),
+                    ('capacity', '<u8'),
+                    ('count', '<u8'),
+                    ('dropped', '<u8'),
+                    ('descr_size', '<u4'),
+                    ('reserve', 'V28'),
+                    ])
+_PAGE = 4096
+
+
+class FeedbackRecorder:
+    """
+    Records feedback frames into a ring file of `capacity` records.
+
+    The file is a fixed header followed by a preallocated array of records,
+    both memory-mapped: append() copies one frame into its slot with numpy,
+    so no Python objects are created per frame, and the OS writes the pages
+    back. fields selects the MyType fields to keep (TimeStamp is always
+    kept); a full 1440-byte frame at 125 Hz is about 15.5 GB per day, the
+    five fields in the example above about 1.7 GB.
+
+    Records are in TimeStamp order, so query(t0, t1) finds its range with a
+    binary search over the two sorted halves of the ring and returns numpy
+    arrays. A frame whose TimeStamp is a little older than the last one
+    (less than RECORDER_CLOCK_JUMP ms) is not recorded and is counted in
+    dropped. A larger step back means the controller rebooted or its clock
+    was set: the recording so far is renamed to "<path>.<newest TimeStamp>"
+    (listed in rotated) and a new, empty one is started at path.
+
+    An existing file is reopened and appended to; readonly=True opens it for
+    queries only, also while another process is recording into it.
+    """
+
+    def __init__(self, path, capacity=125 * 3600, fields=None, layout='V4', readonly=False):
+        self.path = path
+        if os.path.exists(path):
+            self.__open(readonly)
+        elif readonly:
+            raise FileNotFoundError(path)
+        else:
+            self.__create(capacity, fields, FEEDBACK_LAYOUTS[layout])
+        self.__frameFields = None
+        self.rotated = []
+        self.__lastStamp = self.__stamps[(self.count - 1) % self.capacity] if self.count else 0
+        self.__thread = None
+        self.__hub = None
+        self.__subscriber = None
+
+    @property
+    def count(self):
+        """
+        Frames recorded since the file was created; the ring keeps the last capacity of them.
+        """
+        return int(self.__header['count'])
+
+    @property
+    def dropped(self):
+        return int(self.__header['dropped'])
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, frame):
+        """
+        Record one frame (a MyType record or a 1-element MyType array).
+        """
+        frame = frame.reshape(-1)[0] if isinstance(frame, np.ndarray) else frame
+        stamp = frame['TimeStamp']
+        count = int(self.__header['count'])
+        if stamp < self.__lastStamp:
+            if self.__lastStamp - stamp < RECORDER_CLOCK_JUMP:
+                self.__header['dropped'] += 1
+                return
+            self.__rotate()
+            count = 0
+        if self.__frameFields is None:
+            self.__frameFields = self.__fieldsOf(frame.dtype)
+        # 记录全部字段时直接复制整帧 whole frames are copied as they are
+        self.__data[count % self.capacity] = frame if self.__frameFields is True else frame[self.__frameFields]
+        self.__lastStamp = stamp
+        self.__header['count'] = count + 1
+
+    def query(self, t0, t1, fields=None):
+        """
+        Return {field: array} of the records with t0 <= TimeStamp <= t1
+        (TimeStamp is in controller milliseconds), oldest first.
+        """
+        fields = list(self.dtype.names if fields is None else fields)
+        parts = [self.__data[a:b] for a, b in self.__segments(t0, t1) if a < b]
+        if not parts:
+            return {name: self.__data[name][:0].copy() for name in fields}
+        return {name: np.concatenate([part[name] for part in parts]) for name in fields}
+
+    def latest(self, n, fields=None):
+        """
+        Return {field: array} of the newest n records, oldest first.
+        """
+        fields = list(self.dtype.names if fields is None else fields)
+        count, capacity = self.count, self.capacity
+        n = min(n, count, capacity)
+        index = np.arange(count - n, count) % capacity
+        return {name: self.__data[name][index] for name in fields}
+
+    def time_range(self):
+        """
+        Return (oldest, newest) TimeStamp in the ring, or None when it is empty.
+        """
+        count = self.count
+        if count == 0:
+            return None
+        oldest = 0 if count <= self.capacity else count % self.capacity
+        return int(self.__stamps[oldest]), int(self.__stamps[(count - 1) % self.capacity])
+
+    def attach(self, hub, maxsize=256):
+        """
+        Record every snapshot published by a FeedBackHub, in a background thread.
+        """
+        self.__hub = hub
+        self.__subscriber = hub.subscribe(maxsize)
+        self.__thread = threading.Thread(target=self.__run, name="FeedbackRecorder", daemon=True)
+        self.__thread.start()
+        return self
+
+    def flush(self):
+        self.__map.flush()
+
+    def close(self):
+        if self.__hub is not None:
+            self.__hub.unsubscribe(self.__subscriber)
+            self.__hub = None
+            self.__subscriber.put(None)
+            self.__thread.join()
+        if self.__map is not None:
+            if self.__map.mode != 'r':
+                self.__map.flush()
+            self.__map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __run(self):
+        while True:
+            snapshot = self.__subscriber.get()
+            if snapshot is None:
+                return
+            self.append(snapshot.data)
+
+    def __rotate(self):
+        # 控制器时钟倒退: 旧记录改名保存, 新建一个 clock went back: keep the old file, start a new one
+        archive = f"{self.path}.{int(self.__lastStamp)}"
+        self.__map.flush()
+        self.__map = self.__header = self.__data = self.__stamps = None
+        os.replace(self.path, archive)
+        self.rotated.append(archive)
+        self.__create(self.capacity, None, self.dtype)
+        self.__lastStamp = 0
+
+    def __fieldsOf(self, frameDtype):
+        if frameDtype == self.dtype:
+            return True
+        missing = [name for name in self.dtype.names if name not in frameDtype.fields]
+        if missing:
+            raise ValueError(f"frame has no field(s) {missing}")
+        return list(self.dtype.names)
+
+    def __segments(self, t0, t1):
+        # 环形缓冲区由两段有序数据组成 the ring is two sorted runs
+        count, capacity = self.count, self.capacity
+        if count <= capacity:
+            runs = [(0, count)]
+        else:
+            split = count % capacity
+            runs = [(split, capacity), (0, split)]
+        for begin, end in runs:
+            stamps = self.__stamps[begin:end]
+            yield (begin + int(np.searchsorted(stamps, t0, 'left')),
+                   begin + int(np.searchsorted(stamps, t1, 'right')))
+
+    def __create(self, capacity, fields, frameDtype):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if fields is None:
+            dtype = frameDtype
+        else:
+            names = ['TimeStamp'] + [name for name in fields if name != 'TimeStamp']
+            dtype = np.dtype([(name, frameDtype.fields[name][0]) for name in names])
+        descr = json.dumps(np.lib.format.dtype_to_descr(dtype)).encode('utf-8')
+        headerSize = -(-(_HEADER.itemsize + len(descr)) // _PAGE) * _PAGE
+        header = np.zeros(1, dtype=_HEADER)
+        header['magic'] = RECORDER_MAGIC
+        header['version'] = RECORDER_VERSION
+        header['header_size'] = headerSize
+        header['capacity'] = capacity
+        header['descr_size'] = len(descr)
+        size = headerSize + capacity * dtype.itemsize
+        with open(self.path, 'wb') as file:
+            file.write(header.tobytes() + descr)
+            if hasattr(os, 'posix_fallocate'):
+                # 预先分配磁盘空间, 避免运行中磁盘写满 reserve the disk space up front
+                os.posix_fallocate(file.fileno(), 0, size)
+            else:
+                file.truncate(size)
+        self.__open(False)
+
+    def __open(self, readonly):
+        mode = 'r' if readonly else 'r+'
+        with open(self.path, 'rb') as file:
+            header = np.frombuffer(file.read(_HEADER.itemsize), dtype=_HEADER)[0]
+            if header['magic'] != RECORDER_MAGIC or header['version'] != RECORDER_VERSION:
+                raise ValueError(f"{self.path} is not a feedback recording")
+            descr = json.loads(file.read(int(header['descr_size'])).decode('utf-8'))
+        self.dtype = np.lib.format.descr_to_dtype(_tuples(descr))
+        self.capacity = int(header['capacity'])
+        headerSize = int(header['header_size'])
+        self.__map = np.memmap(self.path, dtype=np.uint8, mode=mode,
+                               shape=(headerSize + self.capacity * self.dtype.itemsize,))
+        self.__header = self.__map[:_HEADER.itemsize].view(_HEADER)[0]
+        self.__data = self.__map[headerSize:].view(self.dtype)
+        self.__stamps = self.__data['TimeStamp']
+
+
+def _tuples(descr):
+    # JSON 把元组存成列表 JSON turned the descr tuples into lists
+    if isinstance(descr, list):
+        return [tuple(_tuples(item) for item in field) if isinstance(field, list) else field for field in descr]
+    return descr
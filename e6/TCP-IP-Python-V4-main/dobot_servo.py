@@ -0,0 +1,166 @@
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from dobot_api import ROBOT_MODE_COLLISION, ROBOT_MODE_ERROR, encode_command, parse_reply
+
+# ServoJ/ServoP 定时下发: 按绝对时间点发送轨迹, 统计迟到和抖动
+# Streams an (N,6) trajectory as ServoJ/ServoP on an absolute-deadline clock
+#
+#     hub = FeedBackHub("192.168.5.1").start()
+#     streamer = ServoStreamer(dashboard, hub, period=0.03)
+#     report = streamer.run(np.linspace(start_joints, end_joints, 300))
+#     print(report.late, report.jitter_us, report.stopped)
+
+SERVO_SPIN = 0.0015  # 最后这段时间忙等 busy-wait this close to a deadline, seconds
+
+# sent: 已发送的点 points sent; late: 晚于 late_after 发送的点; realigned: 落后超过一个周期后重新对齐的次数
+# lateness_us: 发送时刻相对计划时刻 send time minus deadline (mean, p99, max);
+# jitter_us: 相邻发送间隔与周期之差的标准差 std of (send interval - period);
+# latency_us: 发送到收到回复 send to reply (p50, p99, max); stopped: None, or why the stream stopped
+ServoReport = namedtuple('ServoReport', ['sent', 'late', 'realigned', 'lateness_us', 'jitter_us', 'latency_us',
+                                         'duration', 'stopped'])
+
+
+class ServoStreamer:
+    """
+    Sends one ServoJ (or ServoP with mode='pose') per point of a trajectory,
+    every `period` seconds, with t=period.
+
+    Point k is due at start + k * period, so time lost on one tick is not
+    carried into the next: the loop sleeps until shortly before the deadline
+    and busy-waits the last SERVO_SPIN seconds. A point sent more than
+    late_after (default half a period) after its deadline counts as late;
+    when the loop falls a whole period behind, the remaining deadlines are
+    moved back rather than sending a burst to catch up. Commands are
+    pipelined, the tick never waits for a reply.
+
+    All commands are encoded before the first one is sent. The stream stops,
+    and Stop() is sent, when a reply is not 0, when the feedback shows
+    RobotMode error (9) or collision (11), or when no feedback frame has
+    arrived for feedback_timeout seconds; stop() does the same from another
+    thread.
+    """
+
+    def __init__(self, dashboard, hub=None, period=0.02, mode='joint', aheadtime=-1.0, gain=-1.0,
+                 late_after=None, feedback_timeout=0.2):
+        if mode not in ('joint', 'pose'):
+            raise ValueError(f"mode must be 'joint' or 'pose', not {mode!r}")
+        self.dashboard = dashboard
+        self.hub = hub
+        self.period = period
+        self.command = 'ServoJ' if mode == 'joint' else 'ServoP'
+        self.aheadtime = aheadtime
+        self.gain = gain
+        self.late_after = period / 2 if late_after is None else late_after
+        self.feedback_timeout = feedback_timeout
+        self.__stop = threading.Event()
+        self.__reason = None
+
+    def stop(self, reason="stop() called"):
+        self.__reason = reason
+        self.__stop.set()
+
+    def run(self, trajectory):
+        """
+        Stream the (N,6) trajectory and return a ServoReport once the last
+        point is sent and its reply received, or the stream was stopped.
+        """
+        points = np.asarray(trajectory, dtype=np.float64).reshape(-1, 6)
+        commands = [encode_command(self.command, *point, t=float(self.period),
+                                   aheadtime=self.aheadtime, gain=self.gain)
+                    for point in points.tolist()]
+        self.__stop.clear()
+        self.__reason = None
+        channel = self.dashboard.channel
+        sent = np.zeros(len(commands))
+        due = np.zeros(len(commands))
+        replied = np.full(len(commands), np.nan)
+        futures = []
+        late = 0
+        realigned = 0
+
+        begin = time.perf_counter()
+        deadline = begin
+        for index, command in enumerate(commands):
+            if index:
+                deadline += self.period
+            self.__check()
+            if self.__stop.is_set():
+                break
+            delay = deadline - time.perf_counter()
+            if delay > SERVO_SPIN:
+                time.sleep(delay - SERVO_SPIN)
+            while time.perf_counter() < deadline:
+                pass
+            now = time.perf_counter()
+            if now - deadline > self.late_after:
+                late += 1
+            future = channel.submit(command)
+            sent[index] = now
+            due[index] = deadline
+            future.add_done_callback(self.__onReply(replied, index))
+            futures.append(future)
+            if now - deadline > self.period:
+                # 落后超过一个周期, 以后的时间点顺延 a whole period behind, shift the rest
+                deadline = now
+                realigned += 1
+
+        count = len(futures)
+        for future in futures:
+            if self.__stop.is_set():
+                break
+            try:
+                future.result(self.period + 1.0)
+            except Exception as e:
+                self.stop(f"no reply: {e!r}")
+        if self.__stop.is_set():
+            self.__safeStop()
+        return self.__report(count, late, realigned, sent[:count], due[:count], replied[:count],
+                             time.perf_counter() - begin)
+
+    def __onReply(self, replied, index):
+        def done(future):
+            replied[index] = time.perf_counter()
+            if future.cancelled() or future.exception() is not None:
+                return
+            try:
+                error_id = parse_reply(future.result()).error_id
+            except ValueError:
+                error_id = None
+            if error_id != 0:
+                self.stop(f"reply to point {index}: {future.result()!r}")
+        return done
+
+    def __check(self):
+        if self.hub is None or self.__stop.is_set():
+            return
+        snapshot = self.hub.latest
+        if snapshot is None or time.perf_counter() - snapshot.recv_time > self.feedback_timeout:
+            self.stop("no feedback")
+            return
+        mode = snapshot.data['RobotMode'][0]
+        if mode == ROBOT_MODE_ERROR or mode == ROBOT_MODE_COLLISION:
+            self.stop(f"RobotMode {mode}")
+
+    def __safeStop(self):
+        try:
+            self.dashboard.Stop()
+        except Exception as e:
+            print(f"Stop() failed: {e}")
+
+    def __report(self, count, late, realigned, sent, due, replied, duration):
+        if count == 0:
+            return ServoReport(0, 0, 0, None, None, None, duration, self.__reason)
+        lateness = (sent - due) * 1e6
+        intervals = np.diff(sent) - self.period
+        latency = (replied - sent)[~np.isnan(replied)] * 1e6
+        return ServoReport(
+            count, late, realigned,
+            (float(lateness.mean()), float(np.percentile(lateness, 99)), float(lateness.max())),
+            float(intervals.std() * 1e6) if len(intervals) else 0.0,
+            (float(np.percentile(latency, 50)), float(np.percentile(latency, 99)), float(latency.max()))
+            if len(latency) else None,
+            duration, self.__reason)
@@ -0,0 +1,465 @@
+import argparse
+import random
+import re
+import socket
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from dobot_api import FEED_FRAME_SIZE, FEED_TEST_VALUE, MyType
+
+# 本地控制器模拟器, 无需真机即可测试29999/30004/30005的通信
+# Local stand-in for the controller: dashboard (29999) and feedback (30004/30005)
+#
+#     with DobotSimulator("127.0.0.1", move_time=0.2) as sim:
+#         dashboard = DobotApiDashboard("127.0.0.1", 29999)
+#         ...
+#
+# or from a shell:  python dobot_sim.py --host 127.0.0.1 --jitter 0.002 --split --drop 0.01
+#
+# The clients only accept the real port numbers, so run several simulators
+# on 127.0.0.2, 127.0.0.3, ... to stand in for a fleet, or alias the robot
+# address on the loopback device (ip addr add 192.168.5.1/32 dev lo).
+
+# RobotMode
+MODE_DISABLED = 4
+MODE_ENABLE = 5
+MODE_RUNNING = 7
+MODE_ERROR = 9
+MODE_PAUSE = 10
+MODE_COLLISION = 11
+
+# 运动指令, 回复中返回指令ID motion commands, answered with their command id
+MOTION_COMMANDS = {
+    'MovJ', 'MovL', 'JointMovJ', 'MovLIO', 'MovJIO', 'Arc', 'Circle', 'ServoJ', 'ServoP',
+    'RelMovJTool', 'RelMovLTool', 'RelMovJUser', 'RelMovLUser', 'RelJointMovJ',
+}
+
+_COMMAND = re.compile(r'\s*(\w+)\((.*)\)\s*$', re.S)
+_VECTOR = re.compile(r'(pose|joint)=\{([^}]*)\}')
+
+
+def _format(values):
+    return ','.join(f'{v:f}' for v in values)
+
+
+class _Move:
+    __slots__ = ('command_id', 'joint', 'pose', 'duration')
+
+    def __init__(self, command_id, joint, pose, duration):
+        self.command_id = command_id
+        self.joint = joint
+        self.pose = pose
+        self.duration = duration
+
+
+class DobotSimulator:
+    """
+    模拟控制器 Simulated controller speaking the TCP/IP V4 protocol.
+
+    The dashboard port answers in the controller's "ErrorID,{values},Cmd;"
+    format. Motion commands are queued and each one takes move_time seconds
+    (scaled by SpeedFactor); while a move runs RobotMode is 7 and
+    CurrentCommandId is its id, and when the queue is empty RobotMode goes
+    back to 5. Joints and pose are interpolated linearly and independently:
+    there is no kinematic model, so InverseKin returns the current joints and
+    PositiveKin the current pose.
+
+    The feedback ports stream 1440-byte MyType frames every 8ms (30004) and
+    200ms (30005) on absolute deadlines. jitter adds up to that many seconds
+    of random delay to each frame, split sends every frame in 2-3 pieces and
+    drop_rate skips that fraction of frames (counted in dropped_frames).
+    """
+
+    def __init__(self, host="127.0.0.1", move_time=0.5, jitter=0.0, split=False, drop_rate=0.0,
+                 seed=None, dash_port=29999, feed_ports=((30004, 0.008), (30005, 0.2))):
+        self.host = host
+        self.move_time = move_time
+        self.jitter = jitter
+        self.split = split
+        self.drop_rate = drop_rate
+        self.seed = seed
+        self.dash_port = dash_port
+        self.feed_ports = feed_ports
+        self.digital_inputs = 0
+        self.digital_outputs = 0
+        self.commands = 0
+        self.frames = 0
+        self.dropped_frames = 0
+        self.__lock = threading.Condition()
+        self.__mode = MODE_DISABLED
+        self.__estop = False
+        self.__errorIds = []
+        self.__collision = False
+        self.__speed = 100
+        self.__user = 0
+        self.__tool = 0
+        self.__joint = np.zeros(6)
+        self.__pose = np.array([600.0, -260.0, 380.0, 170.0, 12.0, 140.0])
+        self.__startJoint = self.__joint.copy()
+        self.__startPose = self.__pose.copy()
+        self.__queue = deque()
+        self.__progress = 0.0
+        self.__commandId = 0
+        self.__currentId = 0
+        self.__lastTime = time.monotonic()
+        self.__startTime = time.time()
+        self.__frame = np.zeros(1, dtype=MyType)
+        self.__frame['len'] = FEED_FRAME_SIZE
+        self.__frame['TestValue'] = FEED_TEST_VALUE
+        self.__handlers = {
+            'EnableRobot': self.__enableRobot,
+            'DisableRobot': self.__disableRobot,
+            'ClearError': self.__clearError,
+            'Stop': self.__stop,
+            'Pause': self.__pause,
+            'Continue': self.__continue,
+            'EmergencyStop': self.__emergencyStop,
+            'SpeedFactor': self.__speedFactor,
+            'User': self.__setUser,
+            'Tool': self.__setTool,
+            'RobotMode': lambda args: f'{{{self.__mode}}}',
+            'GetAngle': lambda args: f'{{{_format(self.__joint)}}}',
+            'GetPose': lambda args: f'{{{_format(self.__pose)}}}',
+            'InverseKin': lambda args: f'{{{_format(self.__joint)}}}',
+            'PositiveKin': lambda args: f'{{{_format(self.__pose)}}}',
+            'GetErrorID': self.__getErrorId,
+            'DI': lambda args: f'{{{self.digital_inputs >> (int(args[0]) - 1) & 1}}}',
+            'GetDO': lambda args: f'{{{self.digital_outputs >> (int(args[0]) - 1) & 1}}}',
+            'DO': self.__setDO,
+            'DOInstant': self.__setDO,
+            'Sync': self.__sync,
+        }
+        self.__servers = []
+        self.__running = False
+
+    def start(self):
+        self.__running = True
+        self.__listen(self.dash_port, self.__serveDashboard)
+        for port, period in self.feed_ports:
+            self.__listen(port, lambda conn, period=period: self.__stream(conn, period))
+        return self
+
+    def stop(self):
+        self.__running = False
+        for server in self.__servers:
+            try:
+                server.shutdown(socket.SHUT_RDWR)  # 唤醒阻塞的 accept, 立即释放端口 wake accept(), free the port
+            except OSError:
+                pass
+            server.close()
+        self.__servers = []
+        with self.__lock:
+            self.__lock.notify_all()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def inject_error(self, error_id=22):
+        """
+        进入报警状态 Put the robot into error mode (9); the motion queue is dropped.
+        """
+        with self.__lock:
+            self.__advance()
+            self.__errorIds.append(error_id)
+            self.__halt(MODE_ERROR)
+
+    def inject_collision(self):
+        with self.__lock:
+            self.__advance()
+            self.__collision = True
+            self.__halt(MODE_COLLISION)
+
+    def handle(self, command):
+        """
+        Execute one dashboard command string and return the reply.
+        """
+        self.commands += 1
+        match = _COMMAND.match(command)
+        if match is None:
+            return f'-10000,{{}},{command.strip()};'
+        name, inner = match.groups()
+        args = [arg for arg in _VECTOR.sub('', inner).split(',') if arg and '=' not in arg]
+        with self.__lock:
+            self.__advance()
+            try:
+                if name in MOTION_COMMANDS:
+                    error_id, value = self.__queueMove(name, inner, args)
+                else:
+                    handler = self.__handlers.get(name)
+                    error_id, value = 0, '{}' if handler is None else handler(args)
+            except (ValueError, IndexError):
+                error_id, value = -10001, '{}'  # 参数错误 bad parameters
+        return f'{error_id},{value},{command.strip()};'
+
+    def frame_bytes(self):
+        """
+        Return the current state as one 1440-byte feedback frame.
+        """
+        frame = self.__frame
+        with self.__lock:
+            self.__advance()
+            move = self.__queue[0] if self.__queue else None
+            frame['DigitalInputs'] = self.digital_inputs
+            frame['DigitalOutputs'] = self.digital_outputs
+            frame['RobotMode'] = self.__mode
+            frame['TimeStamp'] = int(time.time() * 1000)
+            frame['RunTime'] = int((time.time() - self.__startTime) * 1000)
+            frame['SpeedScaling'] = self.__speed
+            frame['QActual'] = self.__joint
+            frame['QTarget'] = self.__joint if move is None else move.joint
+            frame['ToolVectorActual'] = self.__pose
+            frame['ToolVectorTarget'] = self.__pose if move is None else move.pose
+            frame['User'] = self.__user
+            frame['Tool'] = self.__tool
+            frame['EnableStatus'] = self.__mode in (MODE_ENABLE, MODE_RUNNING, MODE_PAUSE)
+            frame['RunningStatus'] = self.__mode == MODE_RUNNING
+            frame['ErrorStatus'] = bool(self.__errorIds) or self.__estop
+            frame['CollisionState'] = self.__collision
+            frame['CurrentCommandId'] = self.__currentId
+            frame['RunQueuedCmd'] = bool(self.__queue)
+            return frame.tobytes()
+
+    # 运动队列 motion queue
+
+    def __queueMove(self, name, inner, args):
+        if self.__estop:
+            return -3, '{}'
+        if self.__mode in (MODE_ERROR, MODE_COLLISION):
+            return -2, '{}'
+        if self.__mode == MODE_DISABLED:
+            return -1, '{}'
+        tail = self.__queue[-1] if self.__queue else None
+        joint = self.__joint.copy() if tail is None else tail.joint.copy()
+        pose = self.__pose.copy() if tail is None else tail.pose.copy()
+        vectors = _VECTOR.findall(inner)
+        duration = self.move_time
+        if vectors:
+            kind, values = vectors[-1]
+            target = np.array([float(v) for v in values.split(',')])
+            if kind == 'joint':
+                joint = target
+            else:
+                pose = target
+        elif name in ('JointMovJ', 'ServoJ'):
+            joint = np.array([float(v) for v in args[:6]])
+        elif name == 'ServoP':
+            pose = np.array([float(v) for v in args[:6]])
+        elif name == 'RelJointMovJ':
+            joint += [float(v) for v in args[:6]]
+        else:  # RelMov*: 偏移量 offsets
+            pose += [float(v) for v in args[:6]]
+        if name in ('ServoJ', 'ServoP'):
+            duration = float(re.search(r't=([\d.]+)', inner).group(1)) if 't=' in inner else 0.1
+
+        self.__commandId += 1
+        self.__queue.append(_Move(self.__commandId, joint, pose, duration))
+        if len(self.__queue) == 1:
+            self.__beginMove()
+        return 0, f'{{{self.__commandId}}}'
+
+    def __beginMove(self):
+        self.__startJoint = self.__joint.copy()
+        self.__startPose = self.__pose.copy()
+        self.__progress = 0.0
+        self.__currentId = self.__queue[0].command_id
+        if self.__mode == MODE_ENABLE:
+            self.__mode = MODE_RUNNING
+
+    def __advance(self):
+        now = time.monotonic()
+        dt = now - self.__lastTime
+        self.__lastTime = now
+        while self.__queue and self.__mode == MODE_RUNNING and dt > 0:
+            move = self.__queue[0]
+            rate = self.__speed / 100.0 / max(move.duration, 1e-6)
+            step = min(dt * rate, 1.0 - self.__progress)
+            self.__progress += step
+            dt -= step / rate
+            fraction = self.__progress
+            self.__joint = self.__startJoint + (move.joint - self.__startJoint) * fraction
+            self.__pose = self.__startPose + (move.pose - self.__startPose) * fraction
+            if self.__progress >= 1.0:
+                self.__queue.popleft()
+                if self.__queue:
+                    self.__beginMove()
+                else:
+                    self.__mode = MODE_ENABLE
+                    self.__lock.notify_all()
+
+    def __halt(self, mode):
+        self.__queue.clear()
+        self.__mode = mode
+        self.__lock.notify_all()
+
+    # 指令 commands
+
+    def __enableRobot(self, args):
+        if self.__estop or self.__errorIds or self.__collision:
+            return '{}'
+        if self.__mode == MODE_DISABLED:
+            self.__mode = MODE_ENABLE
+        return '{}'
+
+    def __disableRobot(self, args):
+        self.__halt(MODE_DISABLED)
+        return '{}'
+
+    def __clearError(self, args):
+        if self.__mode in (MODE_ERROR, MODE_COLLISION) and not self.__estop:
+            self.__errorIds = []
+            self.__collision = False
+            self.__mode = MODE_ENABLE
+        return '{}'
+
+    def __stop(self, args):
+        if self.__mode in (MODE_RUNNING, MODE_PAUSE):
+            self.__halt(MODE_ENABLE)
+        return '{}'
+
+    def __pause(self, args):
+        if self.__mode == MODE_RUNNING:
+            self.__mode = MODE_PAUSE
+        return '{}'
+
+    def __continue(self, args):
+        if self.__mode == MODE_PAUSE:
+            self.__mode = MODE_RUNNING if self.__queue else MODE_ENABLE
+        return '{}'
+
+    def __emergencyStop(self, args):
+        self.__estop = bool(int(args[0]))
+        if self.__estop:
+            self.__halt(MODE_ERROR)
+        return '{}'
+
+    def __speedFactor(self, args):
+        speed = int(args[0])
+        if not 1 <= speed <= 100:
+            raise ValueError(speed)
+        self.__speed = speed
+        return '{}'
+
+    def __setUser(self, args):
+        self.__user = int(args[0])
+        return '{}'
+
+    def __setTool(self, args):
+        self.__tool = int(args[0])
+        return '{}'
+
+    def __setDO(self, args):
+        bit = 1 << (int(args[0]) - 1)
+        if int(args[1]):
+            self.digital_outputs |= bit
+        else:
+            self.digital_outputs &= ~bit
+        return '{}'
+
+    def __getErrorId(self, args):
+        # 控制器 + 6个伺服 controller, then servo 1-6
+        controller = ','.join(str(error_id) for error_id in self.__errorIds)
+        return '{[[' + controller + '],[],[],[],[],[],[]]}'
+
+    def __sync(self, args):
+        # 等待队列执行完 block until the motion queue is empty
+        while self.__running and self.__mode == MODE_RUNNING:
+            self.__lock.wait(0.05)
+            self.__advance()
+        return '{}'
+
+    # 网络 network
+
+    def __listen(self, port, serve):
+        server = socket.create_server((self.host, port))
+        self.__servers.append(server)
+
+        def accept():
+            while self.__running:
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    return
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                threading.Thread(target=serve, args=(conn,), daemon=True).start()
+
+        threading.Thread(target=accept, name=f"DobotSimulator-{port}", daemon=True).start()
+
+    def __serveDashboard(self, conn):
+        buf = bytearray()
+        with conn:
+            while self.__running:
+                try:
+                    data = conn.recv(4096)
+                except OSError:
+                    return
+                if not data:
+                    return
+                buf += data
+                end = buf.find(b')')
+                while end >= 0:
+                    # 指令以')'结尾, 向量中没有')' commands end with ')'
+                    command = buf[:end + 1].decode('utf-8')
+                    del buf[:end + 1]
+                    try:
+                        conn.sendall(self.handle(command).encode('utf-8'))
+                    except OSError:
+                        return
+                    end = buf.find(b')')
+
+    def __stream(self, conn, period):
+        rng = random.Random(self.seed)
+        deadline = time.monotonic()
+        with conn:
+            while self.__running:
+                deadline += period
+                delay = deadline - time.monotonic()
+                if delay < -period:
+                    deadline -= delay  # 落后太多时重新对齐 too far behind, realign
+                if self.jitter:
+                    delay += rng.uniform(0.0, self.jitter)
+                if delay > 0:
+                    time.sleep(delay)
+                data = self.frame_bytes()
+                if self.drop_rate and rng.random() < self.drop_rate:
+                    self.dropped_frames += 1
+                    continue
+                try:
+                    if self.split:
+                        cuts = sorted(rng.sample(range(1, FEED_FRAME_SIZE), rng.randint(1, 2)))
+                        for begin, end in zip([0] + cuts, cuts + [FEED_FRAME_SIZE]):
+                            conn.sendall(data[begin:end])
+                            time.sleep(0.0002)
+                    else:
+                        conn.sendall(data)
+                except OSError:
+                    return
+                self.frames += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dobot E6 controller simulator (TCP/IP V4)")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--move-time', type=float, default=0.5, help="seconds per queued move")
+    parser.add_argument('--jitter', type=float, default=0.0, help="max extra delay per frame, seconds")
+    parser.add_argument('--split', action='store_true', help="send every frame in pieces")
+    parser.add_argument('--drop', type=float, default=0.0, help="fraction of frames to drop")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    sim = DobotSimulator(args.host, args.move_time, args.jitter, args.split, args.drop, args.seed).start()
+    print(f"simulator on {args.host}: 29999, 30004, 30005 (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        sim.stop()
+
+
+if __name__ == '__main__':
+    main()
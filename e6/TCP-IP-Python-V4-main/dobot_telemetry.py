@@ -0,0 +1,127 @@
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+from dobot_api import FEEDBACK_LAYOUTS
+
+# 反馈数据统计: 按时间窗口计算各关节的最小值、最大值、平均值和均方根
+# Windowed per-joint min/max/mean/RMS of feedback fields
+#
+#     hub = FeedBackHub("192.168.5.1").start()
+#     telemetry = TelemetryAggregator(window=5.0, interval=1.0, callback=print).attach(hub)
+#     ...
+#     telemetry.latest.rms['IActual']     # 6 joint currents, RMS over the last 5 s
+
+TELEMETRY_FIELDS = ('IActual', 'QDActual', 'MotorTemperatures', 'SixForceValue')
+
+# min/max/mean/rms: {field: 数组 array shaped like the field}
+TelemetryWindow = namedtuple('TelemetryWindow', ['start', 'end', 'frames', 'min', 'max', 'mean', 'rms'])
+
+
+class TelemetryAggregator:
+    """
+    Aggregates feedback frames into windowed statistics.
+
+    Frames are copied into a preallocated structured block that holds the
+    last `window` seconds (at up to `rate` frames per second). Every
+    `interval` seconds of controller TimeStamp, min, max, mean and RMS are
+    computed over the frames of the last `window` seconds in four numpy
+    reductions for all fields and joints at once, and the TelemetryWindow is
+    stored in latest and passed to callback. All fields must be float64
+    (the joint, current, temperature and force arrays of MyType are).
+    """
+
+    def __init__(self, fields=TELEMETRY_FIELDS, window=1.0, interval=None, rate=125, callback=None,
+                 layout='V4'):
+        frameDtype = FEEDBACK_LAYOUTS[layout]
+        for name in fields:
+            if frameDtype.fields[name][0].base != np.float64:
+                raise ValueError(f"{name} is not a float64 field")
+        self.fields = tuple(fields)
+        self.__fieldList = list(self.fields)
+        self.window = window
+        self.interval = window if interval is None else interval
+        self.callback = callback
+        self.latest = None
+        self.frames = 0
+        self.__dtype = np.dtype([(name, frameDtype.fields[name][0]) for name in self.fields])
+        capacity = int(np.ceil(window * rate)) + 1
+        self.__block = np.zeros(capacity, dtype=self.__dtype)
+        self.__stamps = np.zeros(capacity, dtype=np.uint64)
+        # 整个数据块看作一个 float64 矩阵 the whole block as one float64 matrix
+        self.__matrix = self.__block.view(np.float64).reshape(capacity, -1)
+        self.__columns = {}
+        column = 0
+        for name in self.fields:
+            shape = self.__dtype.fields[name][0].shape
+            size = int(np.prod(shape))
+            self.__columns[name] = (slice(column, column + size), shape)
+            column += size
+        self.__nextEmit = None
+        self.__hub = None
+        self.__subscriber = None
+        self.__thread = None
+
+    def add(self, frame):
+        """
+        Add one frame; return the TelemetryWindow if this frame completed one.
+        """
+        frame = frame.reshape(-1)[0] if isinstance(frame, np.ndarray) else frame
+        stamp = int(frame['TimeStamp'])
+        index = self.frames % len(self.__block)
+        self.__block[index] = frame[self.__fieldList]
+        self.__stamps[index] = stamp
+        self.frames += 1
+        if self.__nextEmit is None:
+            self.__nextEmit = stamp + self.interval * 1000
+        elif stamp >= self.__nextEmit:
+            self.__nextEmit += self.interval * 1000
+            if stamp >= self.__nextEmit:
+                # 中断后重新对齐 realign after a gap in the stream
+                self.__nextEmit = stamp + self.interval * 1000
+            return self.__emit(stamp)
+        return None
+
+    def attach(self, hub, maxsize=256):
+        """
+        Aggregate every snapshot published by a FeedBackHub, in a background thread.
+        """
+        self.__hub = hub
+        self.__subscriber = hub.subscribe(maxsize)
+        self.__thread = threading.Thread(target=self.__run, name="TelemetryAggregator", daemon=True)
+        self.__thread.start()
+        return self
+
+    def close(self):
+        if self.__hub is not None:
+            self.__hub.unsubscribe(self.__subscriber)
+            self.__hub = None
+            self.__subscriber.put(None)
+            self.__thread.join()
+
+    def __run(self):
+        while True:
+            snapshot = self.__subscriber.get()
+            if snapshot is None:
+                return
+            self.add(snapshot.data)
+
+    def __emit(self, end):
+        filled = min(self.frames, len(self.__block))
+        stamps = self.__stamps[:filled]
+        mask = stamps > end - self.window * 1000
+        values = self.__matrix[:filled][mask]
+        low = values.min(axis=0)
+        high = values.max(axis=0)
+        mean = values.mean(axis=0)
+        rms = np.sqrt(np.einsum('ij,ij->j', values, values) / len(values))
+        result = TelemetryWindow(int(stamps[mask].min()), end, len(values),
+                                 self.__split(low), self.__split(high), self.__split(mean), self.__split(rms))
+        self.latest = result
+        if self.callback is not None:
+            self.callback(result)
+        return result
+
+    def __split(self, row):
+        return {name: row[columns].reshape(shape) for name, (columns, shape) in self.__columns.items()}
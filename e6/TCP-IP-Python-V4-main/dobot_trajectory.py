@@ -0,0 +1,139 @@
+import time
+from bisect import bisect_left
+from collections import namedtuple
+
+import numpy as np
+
+from dobot_api import ROBOT_MODE_COLLISION, ROBOT_MODE_ENABLE, ROBOT_MODE_ERROR, encode_command, parse_reply
+
+# 轨迹下发: 带 cp/r 过渡的 MovL/MovJ, 按控制器队列深度分批发送
+# Trajectory executor: blended MovL/MovJ, kept `depth` commands ahead of the robot
+#
+#     hub = FeedBackHub("192.168.5.1").start()
+#     executor = TrajectoryExecutor(dashboard, hub, depth=8, cp=50)
+#     report = executor.run(poses)                 # (N,6) x, y, z, rx, ry, rz
+#     report = executor.run(joints, coordinateMode=1)
+#     print(report.done, report.duration, report.stopped)
+
+# sent/done: 已下发/已完成的点数 points sent / finished; max_depth: 最大队列深度 deepest queue seen;
+# command_ids: 各点的指令ID, 未发送的为0 command id per point, 0 when not sent; stopped: None or why
+TrajectoryReport = namedtuple('TrajectoryReport', ['sent', 'done', 'max_depth', 'command_ids', 'duration',
+                                                   'stopped'])
+
+
+class TrajectoryExecutor:
+    """
+    Streams a sequence of poses or joints as queued MovL/MovJ commands with
+    cp (or, for MovL, r) blending, so the arm moves through the points
+    without stopping at each one.
+
+    At most `depth` of the commands are in the controller's motion queue at
+    a time. How far the robot has got is read from the feedback: a command
+    is still queued while its id is not below CurrentCommandId, and the
+    whole queue has run when RunQueuedCmd is 0 again with the robot enabled
+    and idle. When the queue is full the executor waits on the FeedBackHub
+    instead of polling GetCurrentCommandID() over the dashboard port; when
+    there is room, the missing commands go out in one send.
+
+    All commands are encoded before the first one is sent. A reply other
+    than 0, or RobotMode error (9) or collision (11) in the feedback, stops
+    the run and sends Stop().
+    """
+
+    def __init__(self, dashboard, hub, depth=8, command='MovL', cp=-1, r=-1, **options):
+        if command not in ('MovL', 'MovJ'):
+            raise ValueError(f"command must be 'MovL' or 'MovJ', not {command!r}")
+        if r != -1 and command != 'MovL':
+            raise ValueError("r blending is only available for MovL")
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self.dashboard = dashboard
+        self.hub = hub
+        self.depth = depth
+        self.command = command
+        self.options = dict(options, cp=cp) if command == 'MovJ' else dict(options, cp=cp, r=r)
+
+    def run(self, points, coordinateMode=0, timeout=60.0):
+        """
+        Move through the (N,6) points; return a TrajectoryReport once the
+        last one is reached, the run was stopped, or timeout seconds passed
+        without progress.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 6)
+        commands = [encode_command(self.command, *point, coordinateMode, **self.options)
+                    for point in points.tolist()]
+        channel = self.dashboard.channel
+        ids = []
+        maxDepth = 0
+        stopped = None
+        begin = time.perf_counter()
+
+        while len(ids) < len(commands) and stopped is None:
+            _, queued, stopped = self.__wait(lambda frame, queued: queued < self.depth, ids, timeout)
+            if stopped is not None:
+                break
+            count = min(self.depth - queued, len(commands) - len(ids))
+            try:
+                futures = channel.submit_many(commands[len(ids):len(ids) + count])
+            except Exception as e:
+                stopped = f"point {len(ids)}: not sent: {e!r}"
+                break
+            for future in futures:
+                try:
+                    reply = future.result(timeout)
+                except Exception as e:
+                    # 已下发的指令仍在队列中, 需要 Stop() earlier commands are still queued
+                    stopped = f"point {len(ids)}: no reply: {e!r}"
+                    break
+                try:
+                    result = parse_reply(reply)
+                except ValueError:
+                    result = None
+                if result is None or result.error_id != 0 or not result.values:
+                    stopped = f"point {len(ids)}: {reply!r}"
+                    break
+                ids.append(int(result.value))
+            maxDepth = max(maxDepth, queued + len(futures))
+
+        if ids and stopped is None:
+            _, _, stopped = self.__wait(lambda frame, queued: queued == 0, ids, timeout)
+        done = len(ids) if stopped is None else self.__done(ids, self.hub.latest)
+        if stopped is not None:
+            try:
+                self.dashboard.Stop()
+            except Exception as e:
+                print(f"Stop() failed: {e}")
+        commandIds = ids + [0] * (len(commands) - len(ids))
+        return TrajectoryReport(len(ids), done, maxDepth, commandIds, time.perf_counter() - begin, stopped)
+
+    def __wait(self, ready, ids, timeout):
+        # 等待反馈直到 ready(frame, queued) 成立或出错 wait on the feedback until ready or failed
+        state = {}
+
+        def check(frame):
+            mode = frame['RobotMode'][0]
+            if mode == ROBOT_MODE_ERROR or mode == ROBOT_MODE_COLLISION:
+                state['stopped'] = f"RobotMode {mode}"
+                return True
+            queued = self.__queued(ids, frame)
+            state['queued'] = queued
+            return ready(frame, queued)
+
+        snapshot = self.hub.wait_until(check, timeout)
+        if snapshot is None:
+            return None, None, f"no progress in {timeout} s"
+        return snapshot.data, state.get('queued'), state.get('stopped')
+
+    def __queued(self, ids, frame):
+        if not ids:
+            return 0
+        current = int(frame['CurrentCommandId'][0])
+        if (current >= ids[-1] and not frame['RunQueuedCmd'][0]
+                and frame['RobotMode'][0] == ROBOT_MODE_ENABLE):
+            return 0  # 队列已执行完 queue has run
+        return len(ids) - bisect_left(ids, current)
+
+    def __done(self, ids, snapshot):
+        if snapshot is None:
+            return 0
+        return len(ids) - self.__queued(ids, snapshot.data)
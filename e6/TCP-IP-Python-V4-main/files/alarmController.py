@@ -1,20121 +0,0 @@
-alarm_controller_list=[
-  {
-    "id": 16,
-    "level": 5,
-    "en": {
-      "description": "The planned point is closed to the shoulder singularity point",
-      "cause": "",
-      "solution": "Reselect the movement points or The joint interpolation command is used near the singularity point"
-    },
-    "zh_CN": {
-      "description": "规划位置接近肩奇异点",
-      "cause": "",
-      "solution": "重新选取运动点位或在奇异点附近采用关节插补指令"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "計画位置はショルダーの特異点に接近しています",
-      "cause": "",
-      "solution": "移動点位置を再度選択するか、特異点付近で関節補間コマンドを使用します"
-    },
-    "de": {
-      "description": "Geplante Position in der Nähe von der Schultersingularität",
-      "cause": "",
-      "solution": "Neuauswahl von Bewegungspunkten oder Befehlen zur Gelenkinterpolation in der Nähe von Singularität"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El punto planificado está cerca del punto singular de hombro",
-      "cause": "",
-      "solution": "Vuelva a seleccionar los puntos de movimiento o se utiliza el comando de interpolación de articulación cerca del punto singular"
-    },
-    "ru": {
-      "description": "Плановая точка замкнута с особой точкой плеча",
-      "cause": "",
-      "solution": "Повторно выберите точки перемещения или команда совместной интерполяции будет использована вблизи особой точки."
-    },
-    "ko": {
-      "description": "계획된 위치가 어깨 특이점에 가깝습니다",
-      "cause": "",
-      "solution": "운동 포인트 위치를 다시 선택하거나 특이점 근처에서 조인트 보간 지령을 사용하시오"
-    },
-    "fr": {
-      "description": "规划位置接近肩奇异点",
-      "cause": "",
-      "solution": "重新选取运动点位或在奇异点附近采用关节插补指令"
-    }
-  },
-  {
-    "id": 17,
-    "level": 5,
-    "en": {
-      "description": "Inverse kinematics error with no solution",
-      "cause": "",
-      "solution": "The moving point position of the target is selected again to avoid the singular point and the unreachable point"
-    },
-    "zh_CN": {
-      "description": "逆解算无解",
-      "cause": "",
-      "solution": "重新选取目标运动点位，避开奇异点和不可达点"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "逆計算が解なし",
-      "cause": "",
-      "solution": "目標移動点位置を再度選択し、特異点と到達不可点を回避します"
-    },
-    "de": {
-      "description": "Inverse Lösung ohne Lösung",
-      "cause": "",
-      "solution": "Neuwahl der Zielbewegungspunkte, Vermeidung von Singularitäten und unzugänglichen Punkten"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de cinemática inversa sin solución",
-      "cause": "",
-      "solution": "La posición del punto móvil del destino se selecciona de nuevo para evitar el punto singular y el punto inalcanzable"
-    },
-    "ru": {
-      "description": "Ошибка обратной кинематики без решения",
-      "cause": "",
-      "solution": "Положение движущейся точки цели выбирается снова, чтобы избежать особой точки и недостижимой точки."
-    },
-    "ko": {
-      "description": "역연산에 해가 없음",
-      "cause": "",
-      "solution": "타깃 운동 포인트 위치를 다시 선택하여 특이점과 도달할 수 없는 포인트를 피하십시오"
-    },
-    "fr": {
-      "description": "逆解算无解",
-      "cause": "",
-      "solution": "重新选取目标运动点位，避开奇异点和不可达点"
-    }
-  },
-  {
-    "id": 18,
-    "level": 5,
-    "en": {
-      "description": "Inverse kinematics error with result out of working area",
-      "cause": "",
-      "solution": "Reselect the target movement points"
-    },
-    "zh_CN": {
-      "description": "逆解结果限位",
-      "cause": "",
-      "solution": "重新选取目标运动点位"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "逆計算の結果は位置制限",
-      "cause": "",
-      "solution": "目標移動点位置を再度選択します"
-    },
-    "de": {
-      "description": "Grenzen des inversen Lösungsergebnisses",
-      "cause": "",
-      "solution": "Neuwahl der Zielbewegungspunkte"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de cinemática inversa con resultado fuera del área de trabajo",
-      "cause": "",
-      "solution": "Vuelva a seleccionar los puntos de movimiento objetivo"
-    },
-    "ru": {
-      "description": "Ошибка обратной кинематики с результатом вне рабочей зоны",
-      "cause": "",
-      "solution": "Повторно выберите целевые точки движения"
-    },
-    "ko": {
-      "description": "역연산 결과 위치 제한",
-      "cause": "",
-      "solution": "타깃 운동 포인트 위치를 다시 선택하십시오"
-    },
-    "fr": {
-      "description": "逆解结果限位",
-      "cause": "",
-      "solution": "重新选取目标运动点位"
-    }
-  },
-  {
-    "id": 19,
-    "level": 5,
-    "en": {
-      "description": "The starting point and the end point are the same when the JUMP command, ARC command or Circle command is running",
-      "cause": "",
-      "solution": "Reselect the target movement points to make it meet the requirements of corresponding instructions"
-    },
-    "zh_CN": {
-      "description": "JUMP或ARC或Circles指令点位重复",
-      "cause": "",
-      "solution": "重新选取运动点位，使之符合对应指令的要求"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "JUMPまたはARCまたはCircleコマンドの点位置が重複しています",
-      "cause": "",
-      "solution": "移動点位置を再度選択し、これを対応するコマンドの要求に合わせます"
-    },
-    "de": {
-      "description": "Befehlspunktwiederholung von JUMP oder ARC oder Circles",
-      "cause": "",
-      "solution": "Neuauswahl der Bewegungspunkte entsprechend den entsprechenden Befehlsanweisungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El punto inicial y el punto final son los mismos cuando se ejecuta el comando JUMP, el comando ARC o el comando Círculo",
-      "cause": "",
-      "solution": "Vuelva a seleccionar los puntos de movimiento objetivo para que cumplan los requisitos de los comandos correspondientes"
-    },
-    "ru": {
-      "description": "Начальная и конечная точки совпадают при выполнении команды JUMP, ARC или Circle.",
-      "cause": "",
-      "solution": "Повторно выберите целевые точки движения, чтобы они соответствовали требованиям соответствующих команд."
-    },
-    "ko": {
-      "description": "JUMP 또는 ARC 또는 Circles 지령 포인트 위치가 중복됩니다",
-      "cause": "",
-      "solution": "운동 포인트 위치를 다시 선택하여 해당 지령의 요구사항을 충족시키십시오"
-    },
-    "fr": {
-      "description": "JUMP或ARC或Circles指令点位重复",
-      "cause": "",
-      "solution": "重新选取运动点位，使之符合对应指令的要求"
-    }
-  },
-  {
-    "id": 26,
-    "level": 5,
-    "en": {
-      "description": "The planned point is closed to the wrist singularity point",
-      "cause": "",
-      "solution": "Reselect the movement points or The joint interpolation command is used near the singularity point"
-    },
-    "zh_CN": {
-      "description": "规划位置接近腕奇异点",
-      "cause": "",
-      "solution": "重新选取运动点位或在奇异点附近采用关节插补指令"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "計画位置はアームの特異点に接近しています",
-      "cause": "",
-      "solution": "移動点位置を再度選択するか、特異点付近で関節補間コマンドを使用します"
-    },
-    "de": {
-      "description": "Geplante Position in der Nähe der Singularität des Handgelenks",
-      "cause": "",
-      "solution": "Neuauswahl von Bewegungspunkten oder Befehlen zur Gelenkinterpolation in der Nähe von Singularität"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El punto planificado está cerca del punto singular de muñeca",
-      "cause": "",
-      "solution": "Vuelva a seleccionar los puntos de movimiento o se utiliza el comando de interpolación de articulación cerca del punto singular"
-    },
-    "ru": {
-      "description": "Планируемая точка замыкается на особой точке запястья.",
-      "cause": "",
-      "solution": "Повторно выберите точки перемещения или команда совместной интерполяции будет использована вблизи особой точки."
-    },
-    "ko": {
-      "description": "계획된 위치가 손목 특이점에 가깝습니다",
-      "cause": "",
-      "solution": "운동 포인트 위치를 다시 선택하거나 특이점 근처에서 조인트 보간 지령을 사용하시오"
-    },
-    "fr": {
-      "description": "规划位置接近腕奇异点",
-      "cause": "",
-      "solution": "重新选取运动点位或在奇异点附近采用关节插补指令"
-    }
-  },
-  {
-    "id": 27,
-    "level": 5,
-    "en": {
-      "description": "The planned point is closed to the elbow singularity point",
-      "cause": "Reselect the movement points or The joint interpolation command is used near the singularity point",
-      "solution": ""
-    },
-    "zh_CN": {
-      "description": "规划位置接近肘奇异点",
-      "cause": "",
-      "solution": "重新选取运动点位或在奇异点附近采用关节插补指令"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "計画位置はエルボーの特異点に接近しています",
-      "cause": "",
-      "solution": "移動点位置を再度選択するか、特異点付近で関節補間コマンドを使用します"
-    },
-    "de": {
-      "description": "Geplante Position in der Nähe der Ellenbogensingularität",
-      "cause": "",
-      "solution": "Neuauswahl von Bewegungspunkten oder Befehlen zur Gelenkinterpolation in der Nähe von Singularität"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El punto planificado está cerca del punto singular de codo",
-      "cause": "",
-      "solution": "Vuelva a seleccionar los puntos de movimiento o se utiliza el comando de interpolación de articulación cerca del punto singular"
-    },
-    "ru": {
-      "description": "Планируемая точка замкнута с особой точкой локтя",
-      "cause": "",
-      "solution": "Повторно выберите точки перемещения или команда совместной интерполяции будет использована вблизи особой точки."
-    },
-    "ko": {
-      "description": "계획된 위치가 팔꿈치 특이점에 가깝습니다",
-      "cause": "",
-      "solution": "운동 포인트 위치를 다시 선택하거나 특이점 근처에서 조인트 보간 지령을 사용하시오"
-    },
-    "fr": {
-      "description": "规划位置接近肘奇异点",
-      "cause": "",
-      "solution": "重新选取运动点位或在奇异点附近采用关节插补指令"
-    }
-  },
-  {
-    "id": 29,
-    "level": 5,
-    "en": {
-      "description": "Speed parameter is wrong",
-      "cause": "",
-      "solution": "Check speed parameters"
-    },
-    "zh_CN": {
-      "description": "速度输入参数错误",
-      "cause": "",
-      "solution": "检查速度参数"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "速度入力パラメータエラー",
-      "cause": "",
-      "solution": "速度パラメータを検査"
-    },
-    "de": {
-      "description": "Falsche Eingabeparameter der Geschwindigkeit",
-      "cause": "",
-      "solution": "Geschwindigkeitsparameter prüfen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El parámetro de velocidad es incorrecto",
-      "cause": "",
-      "solution": "Comprobar parámetros de velocidad"
-    },
-    "ru": {
-      "description": "Неправильный параметр скорости",
-      "cause": "",
-      "solution": "Проверьте параметры скорости"
-    },
-    "ko": {
-      "description": "속도 입력 파라미터 오류",
-      "cause": "",
-      "solution": "속도 파라미터를 확인하십시오"
-    },
-    "fr": {
-      "description": "速度输入参数错误",
-      "cause": "",
-      "solution": "检查速度参数"
-    }
-  },
-  {
-    "id": 30,
-    "level": 5,
-    "en": {
-      "description": "The full parameter inverse solution fails to be solved ",
-      "cause": "",
-      "solution": "Restart controller,If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "全参逆解求解失败",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师或接近关节奇异点附近，离开即可"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "全パラメータの逆計算の解を求めるのに失敗",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Vollparametrische inversen Lösung fehlgeschlagen",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La solución inversa de parámetros completos no se puede resolver",
-      "cause": "",
-      "solution": "Reinicie el controlador. Si el fallo persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Обратное решение с полным параметром не может быть решено.",
-      "cause": "",
-      "solution": "Перезапустите контроллер. Если проблема сохраняется, обратитесь в техническую поддержку."
-    },
-    "ko": {
-      "description": "전체 파라미터 역연산 실패",
-      "cause": "",
-      "solution": "리부팅하고, 여전히 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "全参逆解求解失败",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师 或 接近关节奇异点附近，离开即可"
-    }
-  },
-  {
-    "id": 48,
-    "level": 5,
-    "en": {
-      "description": "Joint1 is overspeed",
-      "cause": "",
-      "solution": "Reduce the joint velocity or Cartesian velocity setting, or reselect the moving point position away from the singular point"
-    },
-    "zh_CN": {
-      "description": "关节1超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節1超過速度",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げる、あるいは移動点位置を再度選択し、特異点から離します"
-    },
-    "de": {
-      "description": "Gelenk 1 Geschwindigkeitsüberschreitung",
-      "cause": "",
-      "solution": "Verringern Sie die Gelenksgeschwindigkeit oder die kartesische Geschwindigkeit, oder wählen Sie den Bewegungspunkt fern von  der Singularität neu aus."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La articulación 1 tiene exceso de velocidad",
-      "cause": "",
-      "solution": "Reduzca la velocidad de articulación o la configuración de velocidad cartesiana, o vuelva a seleccionar la posición del punto móvil alejada del punto singular"
-    },
-    "ru": {
-      "description": "Превышена скорость шарнира 1",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости соединения или декартовой скорости, или повторно выберите положение движущейся точки вдали от особой точки."
-    },
-    "ko": {
-      "description": "조인트1 과속",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 감소하거나, 운동 포인트 위치를 다시 선택하여 특이점을 멀리하십시오"
-    },
-    "fr": {
-      "description": "关节1超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    }
-  },
-  {
-    "id": 49,
-    "level": 5,
-    "en": {
-      "description": "Joint2 overspeed",
-      "cause": "",
-      "solution": "Reduce the joint velocity or Cartesian velocity setting, or reselect the moving point position away from the singular point"
-    },
-    "zh_CN": {
-      "description": "关节2超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節2超過速度",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げる、あるいは移動点位置を再度選択し、特異点から離します"
-    },
-    "de": {
-      "description": "Gelenk 2 Geschwindigkeitsüberschreitungen",
-      "cause": "",
-      "solution": "Verringern Sie die Gelenksgeschwindigkeit oder die kartesische Geschwindigkeit, oder wählen Sie den Bewegungspunkt fern von  der Singularität neu aus."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La articulación 2 tiene exceso de velocidad",
-      "cause": "",
-      "solution": "Reduzca la velocidad de articulación o la configuración de velocidad cartesiana, o vuelva a seleccionar la posición del punto móvil alejada del punto singular"
-    },
-    "ru": {
-      "description": "Превышена скорость шарнира 2",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости соединения или декартовой скорости, или повторно выберите положение движущейся точки вдали от особой точки."
-    },
-    "ko": {
-      "description": "조인트2 과속",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 감소하거나, 운동 포인트 위치를 다시 선택하여 특이점을 멀리하십시오"
-    },
-    "fr": {
-      "description": "关节2超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    }
-  },
-  {
-    "id": 50,
-    "level": 5,
-    "en": {
-      "description": "Joint3 overspeed",
-      "cause": "",
-      "solution": "Reduce the joint velocity or Cartesian velocity setting, or reselect the moving point position away from the singular point"
-    },
-    "zh_CN": {
-      "description": "关节3超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節3超過速度",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げる、あるいは移動点位置を再度選択し、特異点から離します"
-    },
-    "de": {
-      "description": "Gelenk 3 Geschwindigkeitsüberschreitung",
-      "cause": "",
-      "solution": "Verringern Sie die Gelenksgeschwindigkeit oder die kartesische Geschwindigkeit, oder wählen Sie den Bewegungspunkt fern von  der Singularität neu aus."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La articulación 3 tiene exceso de velocidad",
-      "cause": "",
-      "solution": "Reduzca la velocidad de articulación o la configuración de velocidad cartesiana, o vuelva a seleccionar la posición del punto móvil alejada del punto singular"
-    },
-    "ru": {
-      "description": "Превышена скорость шарнира 3",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости соединения или декартовой скорости, или повторно выберите положение движущейся точки вдали от особой точки."
-    },
-    "ko": {
-      "description": "조인트3 과속",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 감소하거나, 운동 포인트 위치를 다시 선택하여 특이점을 멀리하십시오"
-    },
-    "fr": {
-      "description": "关节3超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    }
-  },
-  {
-    "id": 51,
-    "level": 5,
-    "en": {
-      "description": "Joint4 overspeed",
-      "cause": "",
-      "solution": "Reduce the joint velocity or Cartesian velocity setting, or reselect the moving point position away from the singular point"
-    },
-    "zh_CN": {
-      "description": "关节4超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節4超過速度",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げる、あるいは移動点位置を再度選択し、特異点から離します"
-    },
-    "de": {
-      "description": "Gelenk 4 Geschwindigkeitsüberschreitung",
-      "cause": "",
-      "solution": "Verringern Sie die Gelenksgeschwindigkeit oder die kartesische Geschwindigkeit, oder wählen Sie den Bewegungspunkt fern von  der Singularität neu aus."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La articulación 4 tiene exceso de velocidad",
-      "cause": "",
-      "solution": "Reduzca la velocidad de articulación o la configuración de velocidad cartesiana, o vuelva a seleccionar la posición del punto móvil alejada del punto singular"
-    },
-    "ru": {
-      "description": "Превышена скорость шарнира 4",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости соединения или декартовой скорости, или повторно выберите положение движущейся точки вдали от особой точки."
-    },
-    "ko": {
-      "description": "조인트4 과속",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 감소하거나, 운동 포인트 위치를 다시 선택하여 특이점을 멀리하십시오"
-    },
-    "fr": {
-      "description": "关节4超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    }
-  },
-  {
-    "id": 52,
-    "level": 5,
-    "en": {
-      "description": "Joint5 overspeed",
-      "cause": "",
-      "solution": "Reduce the joint velocity or Cartesian velocity setting, or reselect the moving point position away from the singular point"
-    },
-    "zh_CN": {
-      "description": "关节5超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節5超過速度",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げる、あるいは移動点位置を再度選択し、特異点から離します"
-    },
-    "de": {
-      "description": "Gelenk 5 Geschwindigkeitsüberschreitung",
-      "cause": "",
-      "solution": "Verringern Sie die Gelenksgeschwindigkeit oder die kartesische Geschwindigkeit, oder wählen Sie den Bewegungspunkt fern von  der Singularität neu aus."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La articulación 5 tiene exceso de velocidad",
-      "cause": "",
-      "solution": "Reduzca la velocidad de articulación o la configuración de velocidad cartesiana, o vuelva a seleccionar la posición del punto móvil alejada del punto singular"
-    },
-    "ru": {
-      "description": "Превышена скорость шарнира 5",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости соединения или декартовой скорости, или повторно выберите положение движущейся точки вдали от особой точки."
-    },
-    "ko": {
-      "description": "조인트5 과속",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 감소하거나, 운동 포인트 위치를 다시 선택하여 특이점을 멀리하십시오"
-    },
-    "fr": {
-      "description": "关节5超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    }
-  },
-  {
-    "id": 53,
-    "level": 5,
-    "en": {
-      "description": "Joint6 overspeed",
-      "cause": "",
-      "solution": "Reduce the joint velocity or Cartesian velocity setting, or reselect the moving point position away from the singular point"
-    },
-    "zh_CN": {
-      "description": "关节6超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節6超過速度",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げる、あるいは移動点位置を再度選択し、特異点から離します"
-    },
-    "de": {
-      "description": "Gelenk 6 Geschwindigkeitsüberschreitung",
-      "cause": "",
-      "solution": "Verringern Sie die Gelenksgeschwindigkeit oder die kartesische Geschwindigkeit, oder wählen Sie den Bewegungspunkt fern von  der Singularität neu aus."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La articulación 6 tiene exceso de velocidad",
-      "cause": "",
-      "solution": "Reduzca la velocidad de articulación o la configuración de velocidad cartesiana, o vuelva a seleccionar la posición del punto móvil alejada del punto singular"
-    },
-    "ru": {
-      "description": "Превышена скорость шарнира 6",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости соединения или декартовой скорости, или повторно выберите положение движущейся точки вдали от особой точки."
-    },
-    "ko": {
-      "description": "조인트6 과속",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 감소하거나, 운동 포인트 위치를 다시 선택하여 특이점을 멀리하십시오"
-    },
-    "fr": {
-      "description": "关节6超速",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置，或重新选取运动点位，远离奇异点"
-    }
-  },
-  {
-    "id": 54,
-    "level": 5,
-    "en": {
-      "description": "Joint1 position lag error",
-      "cause": "",
-      "solution": "Restart controller,If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节1位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節1位置公差超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 1 Positionsdifferenz überschritten",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de retraso de posición de la articulación 1",
-      "cause": "",
-      "solution": "Reinicie el controlador. Si el fallo persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка задержки положения шарнира 1",
-      "cause": "",
-      "solution": "Перезапустите контроллер. Если проблема сохраняется, обратитесь в техническую поддержку."
-    },
-    "ko": {
-      "description": "조인트1 위치가 공차를 초과하였습니다",
-      "cause": "",
-      "solution": "리부팅하고, 여전히 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节1位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 55,
-    "level": 5,
-    "en": {
-      "description": "Joint2 position lag error",
-      "cause": "",
-      "solution": "Restart controller,If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节2位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節2位置公差超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 2 Positionsdifferenz überschritten",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de retraso de posición de la articulación 2",
-      "cause": "",
-      "solution": "Reinicie el controlador. Si el fallo persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка задержки положения шарнира 2",
-      "cause": "",
-      "solution": "Перезапустите контроллер. Если проблема сохраняется, обратитесь в техническую поддержку."
-    },
-    "ko": {
-      "description": "조인트2 위치가 공차를 초과하였습니다",
-      "cause": "",
-      "solution": "리부팅하고, 여전히 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节2位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 56,
-    "level": 5,
-    "en": {
-      "description": "Joint3 position lag error",
-      "cause": "",
-      "solution": "Restart controller,If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节3位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節3位置公差超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 3 Positionsdifferenz überschritten",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de retraso de posición de la articulación 3",
-      "cause": "",
-      "solution": "Reinicie el controlador. Si el fallo persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка задержки положения шарнира 3",
-      "cause": "",
-      "solution": "Перезапустите контроллер. Если проблема сохраняется, обратитесь в техническую поддержку."
-    },
-    "ko": {
-      "description": "조인트3 위치가 공차를 초과하였습니다",
-      "cause": "",
-      "solution": "리부팅하고, 여전히 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节3位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 57,
-    "level": 5,
-    "en": {
-      "description": "Joint4 position lag error",
-      "cause": "",
-      "solution": "Restart controller,If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节4位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節4位置公差超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 4 Positionsdifferenz überschritten",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de retraso de posición de la articulación 4",
-      "cause": "",
-      "solution": "Reinicie el controlador. Si el fallo persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка задержки положения шарнира 4",
-      "cause": "",
-      "solution": "Перезапустите контроллер. Если проблема сохраняется, обратитесь в техническую поддержку."
-    },
-    "ko": {
-      "description": "조인트4 위치가 공차를 초과하였습니다",
-      "cause": "",
-      "solution": "리부팅하고, 여전히 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节4位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 58,
-    "level": 5,
-    "en": {
-      "description": "Joint5 position lag error",
-      "cause": "",
-      "solution": "Restart controller,If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节5位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節5位置公差超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 5 Positionsdifferenz überschritten",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de retraso de posición de la articulación 5",
-      "cause": "",
-      "solution": "Reinicie el controlador. Si el fallo persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка задержки положения шарнира 5",
-      "cause": "",
-      "solution": "Перезапустите контроллер. Если проблема сохраняется, обратитесь в техническую поддержку."
-    },
-    "ko": {
-      "description": "조인트5 위치가 공차를 초과하였습니다",
-      "cause": "",
-      "solution": "리부팅하고, 여전히 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节5位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 59,
-    "level": 5,
-    "en": {
-      "description": "Joint6 position lag error",
-      "cause": "",
-      "solution": "Restart controller,If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节6位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節6位置公差超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 6 Positionsdifferenz überschritten",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de retraso de posición de la articulación 6",
-      "cause": "",
-      "solution": "Reinicie el controlador. Si el fallo persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка задержки положения шарнира 6",
-      "cause": "",
-      "solution": "Перезапустите контроллер. Если проблема сохраняется, обратитесь в техническую поддержку."
-    },
-    "ko": {
-      "description": "조인트6 위치가 공차를 초과하였습니다",
-      "cause": "",
-      "solution": "리부팅하고, 여전히 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节6位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 64,
-    "level": 5,
-    "en": {
-      "description": "Positive limit alarm of Joint1",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节1正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節1正方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 1 positive Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite positivo de la articulación 1",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация положительного предела шарнира 1",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트1 순방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节1正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 65,
-    "level": 5,
-    "en": {
-      "description": "Negative limit alarm of Joint1",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节1负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節1負方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 1 negative Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite negativo de la articulación 1",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация отрицательного предела шарнира 1",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트1 역방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节1负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 66,
-    "level": 5,
-    "en": {
-      "description": "Positive limit alarm of Joint2",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节2正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節2正方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 2 positive Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite positivo de la articulación 2",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация положительного предела шарнира 2",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트2 순방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节2正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 67,
-    "level": 5,
-    "en": {
-      "description": "Negative limit alarm of Joint2",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节2负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節2負方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 2 negative Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite negativo de la articulación 2",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация отрицательного предела шарнира 2",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트2 역방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节2负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 68,
-    "level": 5,
-    "en": {
-      "description": "Positive limit alarm of Joint3",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节3正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節3正方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 3 positive Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite positivo de la articulación 3",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация положительного предела шарнира 3",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트3 순방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节3正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 69,
-    "level": 5,
-    "en": {
-      "description": "Negative limit alarm of Joint3",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节3负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節3負方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 3 negative Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite negativo de la articulación 3",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация отрицательного предела шарнира 3",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트3 역방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节3负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 70,
-    "level": 5,
-    "en": {
-      "description": "Positive limit alarm of Joint4",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节4正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節4正方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 4 positive Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite positivo de la articulación 4",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация положительного предела шарнира 4",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트4 순방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节4正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 71,
-    "level": 5,
-    "en": {
-      "description": "Negative limit alarm of Joint4",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节4负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節4負方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 4 negative Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite negativo de la articulación 4",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация отрицательного предела шарнира 4",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트4 역방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节4负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 72,
-    "level": 5,
-    "en": {
-      "description": "Positive limit alarm of Joint5",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节5正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節5正方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 5 positive Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite positivo de la articulación 5",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация положительного предела шарнира 5",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트5 순방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节5正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 73,
-    "level": 5,
-    "en": {
-      "description": "Negative limit alarm of Joint5",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节5负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節5負方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 5 negative Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite negativo de la articulación 5",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация отрицательного предела шарнира 5",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트5 역방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节5负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 74,
-    "level": 5,
-    "en": {
-      "description": "Positive limit alarm of Joint6",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节6正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節6正方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 6 positive Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite positivo de la articulación 6",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация положительного предела шарнира 6",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트6 순방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节6正向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 75,
-    "level": 5,
-    "en": {
-      "description": "Negative limit alarm of Joint6",
-      "cause": "",
-      "solution": "Confirm the current joint Angle and soft limit setting, and move out of the limit in reverse motion or modify the soft limit setting"
-    },
-    "zh_CN": {
-      "description": "关节6负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節6負方向位置制限",
-      "cause": "",
-      "solution": "現在の関節角度とソフトウェア位置制限設定を確認し、反対方向にジョグで制限位置から離すか、ソフトウェア制限位置設定を修正します"
-    },
-    "de": {
-      "description": "Gelenk 6 negative Begrenzung",
-      "cause": "",
-      "solution": "Bestätigen Sie den aktuellen Gelenkwinkel und die Weichbegrenzungseinstellungen, heben Sie die Begrenzungen auf oder ändern Sie die Weichbegrenzungseinstellungen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de límite negativo de la articulación 6",
-      "cause": "",
-      "solution": "Confirme el ángulo de articulación actual y la configuración del límite suave, y salga del límite en movimiento inverso o modifique la configuración del límite suave"
-    },
-    "ru": {
-      "description": "Сигнализация отрицательного предела шарнира 6",
-      "cause": "",
-      "solution": "Подтвердите текущий угол шарнира и настройку мягкого ограничения, и выйдите за пределы ограничения в обратном направлении или измените настройку мягкого ограничения."
-    },
-    "ko": {
-      "description": "조인트6 역방향 위치 제한",
-      "cause": "",
-      "solution": "현재 조인트 각도와 소프트 위치 제한 설정을 확인하고, 역방향으로 조그 이동하여 위치 제한을 벗어나거나 소프트 위치 제한 설정을 수정하십시오"
-    },
-    "fr": {
-      "description": "关节6负向限位",
-      "cause": "",
-      "solution": "确认当前关节角度和软限位设置，反向点动脱离限位或修改软限位设置"
-    }
-  },
-  {
-    "id": 76,
-    "level": 5,
-    "en": {
-      "description": "The end key interferes with the robot body",
-      "cause": "",
-      "solution": "Check the end state of the robot and select the moving point position again"
-    },
-    "zh_CN": {
-      "description": "末端按键与机器人本体发生自干涉",
-      "cause": "",
-      "solution": "检查机器人末端状态，重新选取运动点位"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツールボタンがロボット本体と自己干渉している",
-      "cause": "",
-      "solution": "ロボットのツール状態を検査し、目標移動点位置を再度選択します"
-    },
-    "de": {
-      "description": "Selbstbeeinflussung zwischen dem Endknopf und dem Robotergrundkörper",
-      "cause": "",
-      "solution": "Überprüfen des Endstatus des Roboters und erneute Auswahl der Bewegungspunkte"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La tecla de extremo interfiere con el cuerpo del robot",
-      "cause": "",
-      "solution": "Compruebe el estado de extremo del robot y seleccione de nuevo la posición del punto móvil"
-    },
-    "ru": {
-      "description": "Шпонка упирается в корпус робота",
-      "cause": "",
-      "solution": "Проверьте конечное состояние робота и снова выберите положение движущейся точки."
-    },
-    "ko": {
-      "description": "끝단 버튼과 로봇 본체 자체 간섭 발생",
-      "cause": "",
-      "solution": "로봇 끝단 상태를 확인하고 운동 포인트 위치를 다시 선택하십시오"
-    },
-    "fr": {
-      "description": "末端按键与机器人本体发生自干涉",
-      "cause": "",
-      "solution": "检查机器人末端状态，重新选取运动点位"
-    }
-  },
-  {
-    "id": 77,
-    "level": 5,
-    "en": {
-      "description": "The end flanges interfere with the robot body",
-      "cause": "",
-      "solution": "Check the end state of the robot and select the moving point position again"
-    },
-    "zh_CN": {
-      "description": "末端法兰盘与机器人本体发生自干涉",
-      "cause": "",
-      "solution": "检查机器人末端状态，重新选取运动点位"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツールフランジがロボット本体と自己干渉している",
-      "cause": "",
-      "solution": "ロボットのツール状態を検査し、目標移動点位置を再度選択します"
-    },
-    "de": {
-      "description": "Selbstinterferenz des Endflansches mit dem Robotergrundkörper",
-      "cause": "",
-      "solution": "Überprüfen des Endstatus des Roboters und erneute Auswahl der Bewegungspunkte"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Las bridas de extremo interfieren con el cuerpo del robot",
-      "cause": "",
-      "solution": "Compruebe el estado de extremo del robot y seleccione de nuevo la posición del punto móvil"
-    },
-    "ru": {
-      "description": "Торцевые фланцы соприкасаются с корпусом робота.",
-      "cause": "",
-      "solution": "Проверьте конечное состояние робота и снова выберите положение движущейся точки."
-    },
-    "ko": {
-      "description": "끝단 플랜지와 로봇 본체 자체 간섭 발생",
-      "cause": "",
-      "solution": "로봇 끝단 상태를 확인하고 운동 포인트 위치를 다시 선택하십시오"
-    },
-    "fr": {
-      "description": "末端法兰盘与机器人本体发生自干涉",
-      "cause": "",
-      "solution": "检查机器人末端状态，重新选取运动点位"
-    }
-  },
-  {
-    "id": 114,
-    "level": 5,
-    "en": {
-      "description": "The robot failed to calibrate zero",
-      "cause": "",
-      "solution": "Restart the robot and calibrate it again. If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "机器人标定零点失败",
-      "cause": "",
-      "solution": "重启机器人再次标定，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのゼロ点校正失敗",
-      "cause": "",
-      "solution": "ロボットを再起動して校正し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Nullpunktkalibrierung des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu und kalibrieren Sie ihn erneut. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El robot no ha podido calibrar el cero",
-      "cause": "",
-      "solution": "Reinicie el robot y calíbrelo de nuevo. Si el fallo persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Роботу не удалось откалибровать ноль",
-      "cause": "",
-      "solution": "Перезапустите робота и откалибруйте его еще раз. Если проблема сохраняется, обратитесь в техническую поддержку."
-    },
-    "ko": {
-      "description": "로봇의 원점 보정이 실패했습니다",
-      "cause": "",
-      "solution": "로봇을 리부팅하고 다시 보정하십시오. 여전히 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "机器人标定零点失败",
-      "cause": "",
-      "solution": "重启机器人再次标定，若仍无法解决请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 115,
-    "level": 5,
-    "en": {
-      "description": "The robot failed to enable",
-      "cause": "",
-      "solution": "Restart the robot and enable it again. If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "机器人使能失败",
-      "cause": "",
-      "solution": "重启机器人再次使能，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットを有効にできない",
-      "cause": "",
-      "solution": "ロボットを再起動して有効にし、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Ausfall der Roboteraktivierung",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu und aktivieren Sie ihn erneut. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El robot no se ha podido activar",
-      "cause": "",
-      "solution": "Reinicie el robot y actívelo de nuevo. Si el fallo persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Роботу не удалось включиться",
-      "cause": "",
-      "solution": "Перезапустите робота и включите его снова. Если проблема сохраняется, обратитесь в техническую поддержку."
-    },
-    "ko": {
-      "description": "로봇 활성화 실패",
-      "cause": "",
-      "solution": "로봇을 리부팅하고 다시 활성화하십시오. 여전히 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "机器人使能失败",
-      "cause": "",
-      "solution": "重启机器人再次使能，若仍无法解决请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 116,
-    "level": 1,
-    "en": {
-      "description": "The emergency stop button is captured",
-      "cause": "",
-      "solution": "After releasing the emergency stop button, normal operation can be resumed according to the program"
-    },
-    "zh_CN": {
-      "description": "硬件急停按钮被拍下",
-      "cause": "",
-      "solution": "松开急停按钮后依程序可恢复正常操作"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ハードの非常停止ボタンが押されている",
-      "cause": "",
-      "solution": "非常停止ボタンを解除した後、手順に従って正常操作に戻すことができます"
-    },
-    "de": {
-      "description": "Not-Aus-Taste der Hardware gedrückt",
-      "cause": "",
-      "solution": "Der Normalbetrieb kann nach dem Loslassen der Not-Aus-Taste programmgemäß wieder aufgenommen werden"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Se captura el botón de parada de emergencia",
-      "cause": "",
-      "solution": "Después de soltar el botón de parada de emergencia, se puede reanudar el funcionamiento normal"
-    },
-    "ru": {
-      "description": "Сработала кнопка аварийного останова",
-      "cause": "",
-      "solution": "После отпускания кнопки аварийного останова можно возобновить нормальную работу."
-    },
-    "ko": {
-      "description": "하드웨어 긴급 정지 버튼 눌림",
-      "cause": "",
-      "solution": "긴급 정지 버튼 누름을 해제한 후 프로그램에 따라 정상 작업을 복구할 수 있습니다"
-    },
-    "fr": {
-      "description": "硬件急停按钮被拍下",
-      "cause": "",
-      "solution": "松开急停按钮后依程序可恢复正常操作"
-    }
-  },
-  {
-    "id": 132,
-    "level": 1,
-    "en": {
-      "description": "The software emergency stop signal is triggered",
-      "cause": "",
-      "solution": "After the reset software emergency stop signal, normal operation can be resumed according to the program"
-    },
-    "zh_CN": {
-      "description": "软件急停信号被触发",
-      "cause": "",
-      "solution": "复位软件急停信号后依程序可恢复正常操作"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ソフト非常停止信号がトリガされる",
-      "cause": "",
-      "solution": "非常停止ボタンをリセットした後、手順に従って正常操作に戻すことができます"
-    },
-    "de": {
-      "description": "Not-Aus-Signal der Software ausgelöst",
-      "cause": "",
-      "solution": "Der Normalbetrieb kann nach dem Rücksetzen des Not-Aus-Signals der Software programmgemäß wieder aufgenommen werden"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Se activa la señal de parada de emergencia del software",
-      "cause": "",
-      "solution": "Después de restablecer la señal de parada de emergencia del software, se puede reanudar el funcionamiento normal"
-    },
-    "ru": {
-      "description": "Срабатывает программный сигнал аварийного останова.",
-      "cause": "",
-      "solution": "После сброса сигнала аварийного останова программного обеспечения можно возобновить нормальную работу."
-    },
-    "ko": {
-      "description": "소프트웨어 긴급 정지 신호가 트리거되었습니다",
-      "cause": "",
-      "solution": "소프트웨어 긴급 정지 신호를 리셋한 후 프로그램에 따라 정상 작업을 회복할 수 있습니다"
-    },
-    "fr": {
-      "description": "软件急停信号被触发",
-      "cause": "",
-      "solution": "复位软件急停信号后依程序可恢复正常操作"
-    }
-  },
-  {
-    "id": 133,
-    "level": 1,
-    "en": {
-      "description": "The user emergency stop signal is triggered",
-      "cause": "",
-      "solution": "After resetting the user emergency stop signal, normal operation can be resumed according to the program"
-    },
-    "zh_CN": {
-      "description": "用户急停信号被触发",
-      "cause": "",
-      "solution": "复位用户急停信号后依程序可恢复正常操作"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ユーザ非常停止信号がトリガされる",
-      "cause": "",
-      "solution": "ユーザ非常停止ボタンをリセットした後、手順に従って正常操作に戻すことができます"
-    },
-    "de": {
-      "description": "Not-Aus-Signal des Benutzers ausgelöst",
-      "cause": "",
-      "solution": "Durch das Zurücksetzen des Not-Aus-Signals des Benutzers wird der Normalbetrieb programmgemäß wieder aufgenommen"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Se activa la señal de parada de emergencia del usuario",
-      "cause": "",
-      "solution": "Después de restablecer la señal de parada de emergencia del usuario, se puede reanudar el funcionamiento normal"
-    },
-    "ru": {
-      "description": "Срабатывает пользовательский сигнал аварийного останова.",
-      "cause": "",
-      "solution": "После сброса пользовательского сигнала аварийного останова можно возобновить нормальную работу."
-    },
-    "ko": {
-      "description": "사용자 긴급 정지 신호가 트리거되었습니다",
-      "cause": "",
-      "solution": "사용자 긴급 정지 신호를 리셋한 후 프로그램에 따라 정상 작업을 회복할 수 있습니다"
-    },
-    "fr": {
-      "description": "用户急停信号被触发",
-      "cause": "",
-      "solution": "复位用户急停信号后依程序可恢复正常操作"
-    }
-  },
-  {
-    "id": 134,
-    "level": 1,
-    "en": {
-      "description": "The robot cannot remain stationary",
-      "cause": "",
-      "solution": "Check that the load is set correctly"
-    },
-    "zh_CN": {
-      "description": "机器人无法保持静止",
-      "cause": "",
-      "solution": "检查负载是否设置正确或错误安装角度设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "de": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El robot no puede permanecer parado",
-      "cause": "",
-      "solution": "Compruebe que la carga esté configurada correctamente"
-    },
-    "ru": {
-      "description": "Робот не может оставаться неподвижным",
-      "cause": "",
-      "solution": "Проверьте правильность установки нагрузки"
-    },
-    "ko": {
-      "description": "로봇이 정지 상태를 유지할 수 없습니다",
-      "cause": "",
-      "solution": "부하 설정이 정확한지 확인하십시오"
-    },
-    "fr": {
-      "description": "机器人无法保持静止",
-      "cause": "",
-      "solution": "检查负载是否设置正确或错误安装角度设置"
-    }
-  },
-  {
-    "id": 146,
-    "level": 5,
-    "en": {
-      "description": "The target point is out range of workspace when inching robot",
-      "cause": "",
-      "solution": "Restart the robot. If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "点动/寸动规划失败",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョグ/インチング計画失敗",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Planung des Tipp-/Inchbetriebs fehlgeschlagen",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El punto de destino está fuera del alcance del espacio de trabajo cuando el robot se desplaza lento",
-      "cause": "",
-      "solution": "Reinicie el controlador. Si el fallo persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Целевая точка находится за пределами рабочего пространства при дотягивании импульсами.",
-      "cause": "",
-      "solution": "Перезапустите контроллер. Если проблема сохраняется, обратитесь в техническую поддержку."
-    },
-    "ko": {
-      "description": "조그/인치인 계획 실패",
-      "cause": "",
-      "solution": "리부팅하고, 여전히 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "点动/寸动规划失败",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 147,
-    "level": 5,
-    "en": {
-      "description": "Trajectory of repetition or a given point of a small line segment is less than 4",
-      "cause": "",
-      "solution": "Check the trajectory file to ensure that the number of internal points is sufficient"
-    },
-    "zh_CN": {
-      "description": "轨迹复现或小线段给定点位小于4",
-      "cause": "",
-      "solution": "检查轨迹文件，确保内部点位数量足够"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "軌跡の再現または小さな線分の指定数が4未満です",
-      "cause": "",
-      "solution": "軌跡ファイルを確認、内部の点位置の数が十分になるようにしてください"
-    },
-    "de": {
-      "description": "Wiederholung der Flugbahn oder kleine Liniensegmente mit weniger als 4 Punkten",
-      "cause": "",
-      "solution": "Überprüfen Sie die Spurdatei, um sicherzustellen, dass die Anzahl der internen Punkte ausreichend ist."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La reproducción de trayectoria o un punto dado de un segmento de línea pequeño es menor que 4",
-      "cause": "",
-      "solution": "Compruebe el archivo de trayectoria para asegurarse de que la cantidad de puntos internos sea suficiente"
-    },
-    "ru": {
-      "description": "Воспроизведение траектории или заданная точка малого отрезка меньше 4",
-      "cause": "",
-      "solution": "Проверьте файл траектории, чтобы убедиться, что количество внутренних точек достаточно."
-    },
-    "ko": {
-      "description": "트랙 재현 또는 소선분 지정 포인트 위치가 4보다 작습니다",
-      "cause": "",
-      "solution": "트랙 파일을 확인하여 내부 포인트 위치 수가 충분하도록 하십시오"
-    },
-    "fr": {
-      "description": "轨迹复现或小线段给定点位小于4",
-      "cause": "",
-      "solution": "检查轨迹文件，确保内部点位数量足够"
-    }
-  },
-  {
-    "id": 148,
-    "level": 5,
-    "en": {
-      "description": "Failed to reproduce the trajectory according to the given constraints",
-      "cause": "",
-      "solution": "Check whether the track file is correct or proper parameters are set"
-    },
-    "zh_CN": {
-      "description": "轨迹复现按给定约束复现失败",
-      "cause": "",
-      "solution": "检查轨迹文件是否正确或设置合理的参数"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "軌跡の再現は定められた制限に従って再現できない",
-      "cause": "",
-      "solution": "軌跡ファイルが正しいか、合理的なパラメータが設定されているかを確認します"
-    },
-    "de": {
-      "description": "Die Spurwiedergabe konnte nicht mit der gegebenen Einschränkung durchgeführt werden",
-      "cause": "",
-      "solution": "Überprüfen Sie, ob die Spurdatei korrekt ist oder ob die Parameter angemessen sind."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido reproducir la trayectoria de acuerdo con las restricciones dadas",
-      "cause": "",
-      "solution": "Compruebe si el archivo de seguimiento es correcto o si están configurados los parámetros adecuados"
-    },
-    "ru": {
-      "description": "Не удалось воспроизвести траекторию в соответствии с заданными ограничениями.",
-      "cause": "",
-      "solution": "Проверьте правильность файла траектории или правильность заданных параметров."
-    },
-    "ko": {
-      "description": "트랙 재현이 주어진 제약 조건에 따라 재현에 실패했습니다",
-      "cause": "",
-      "solution": "트랙 파일 정확 여부를 확인하거나 합리적인 파라미터를 설정하십시오"
-    },
-    "fr": {
-      "description": "轨迹复现按给定约束复现失败",
-      "cause": "",
-      "solution": "检查轨迹文件是否正确或设置合理的参数"
-    }
-  },
-  {
-    "id": 160,
-    "level": 5,
-    "en": {
-      "description": "The current command does not support pausing. The robot has been stopped",
-      "cause": "",
-      "solution": "Restart the robot"
-    },
-    "zh_CN": {
-      "description": "当前指令不支持暂停，机器人已停止",
-      "cause": "",
-      "solution": "重新启动程序"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "現在のコマンドは一時停止をサポートしていません。ロボットは既に停止しています",
-      "cause": "",
-      "solution": "プログラムを再起動します"
-    },
-    "de": {
-      "description": "Der aktuelle Befehl unterstützt keine Pause, der Roboter wurde schon angehalten",
-      "cause": "",
-      "solution": "Programm neustarten"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El comando actual no admite la pausa. El robot se ha detenido",
-      "cause": "",
-      "solution": "Reiniciar el robot"
-    },
-    "ru": {
-      "description": "Текущая команда не поддерживает паузу. Робот был остановлен",
-      "cause": "",
-      "solution": "Перезапустите робота"
-    },
-    "ko": {
-      "description": "현재 지령은 일시 정지를 지원하지 않으며, 로봇은 이미 정지했습니다",
-      "cause": "",
-      "solution": "프로그램을 리부팅하십시오"
-    },
-    "fr": {
-      "description": "当前指令不支持暂停，机器人已停止",
-      "cause": "",
-      "solution": "重新启动程序"
-    }
-  },
-  {
-    "id": 224,
-    "level": 5,
-    "en": {
-      "description": "Robot approaching safe working area",
-      "cause": "",
-      "solution": "Clear the alarm and jog the robot back into the safe working area."
-    },
-    "zh_CN": {
-      "description": "机器人接近安全工作区域",
-      "cause": "",
-      "solution": "清除报警，并点动机器人回到安全工作区域内。"
-    },
-    "zh_hant": {
-      "description": "機器人接近安全工作區域",
-      "cause": "",
-      "solution": "清除報警，並點動機器人回到安全工作區域內。"
-    },
-    "kr": {
-      "description": "로봇이 안전 작업 영역에 접근 중입니다.",
-      "cause": "",
-      "solution": "경고를 해제하고 로봇을 안전 작업 영역으로 이동하세요."
-    },
-    "ja": {
-      "description": "ロボットが安全作業エリアに接近しています",
-      "cause": "",
-      "solution": "警告を解除し、ロボットを安全作業エリアに移動させてください。"
-    },
-    "de": {
-      "description": "Roboter nähert sich dem sicheren Arbeitsbereich",
-      "cause": "",
-      "solution": "Alarm zurücksetzen und Roboter vorsichtig in den sicheren Arbeitsbereich bewegen."
-    },
-    "vi": {
-      "description": "Robot tiếp cận khu vực làm việc an toàn",
-      "cause": "",
-      "solution": "Hủy báo động và di chuyển robot về khu vực làm việc an toàn."
-    },
-    "es": {
-      "description": "Robot aproximándose al área de trabajo seguro",
-      "cause": "",
-      "solution": "Eliminar la alarma y mover el robot hacia el área de trabajo seguro."
-    },
-    "ru": {
-      "description": "Робот приближается к безопасной рабочей зоне",
-      "cause": "",
-      "solution": "Снять тревогу и аккуратно переместить робота в безопасную рабочую зону."
-    },
-    "ko": {
-      "description": "로봇이 안전 작업 영역에 접근 중입니다.",
-      "cause": "",
-      "solution": "경고를 해제하고 로봇을 안전 작업 영역으로 이동하세요."
-    },
-    "fr": {
-      "description": "Robot s'approchant de la zone de travail sécurisée",
-      "cause": "",
-      "solution": "Désactivez l'alarme et déplacez prudemment le robot vers la zone de travail sécurisée."
-    }
-  },
-  {
-    "id": 1280,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot load parameters",
-      "cause": "",
-      "solution": "Check and update the function/loadParams.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人负载参数失败",
-      "cause": "",
-      "solution": "检查并更新function/loadParams.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの負荷パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/loadParams.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Roboterlastparameter fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/loadParams.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de carga del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/loadParams.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры загрузки робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/loadParams.json."
-    },
-    "ko": {
-      "description": "로봇 부하 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/loadParams.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人负载参数失败",
-      "cause": "",
-      "solution": "检查并更新function/loadParams.json文件"
-    }
-  },
-  {
-    "id": 1281,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot identification parameters",
-      "cause": "",
-      "solution": "Check and update the properties/dynamicsParams.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人辨识参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/dynamicsParams.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの識別パラメータのロードに失敗",
-      "cause": "",
-      "solution": "properties/dynamicsParams.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Robotererkennungsparameter fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/dynamicsParams.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de identificación del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/dynamicsParams.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры идентификации робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл properties/dynamicsParams.json."
-    },
-    "ko": {
-      "description": "로봇 인식 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/dynamicsParams.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人辨识参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/dynamicsParams.json文件"
-    }
-  },
-  {
-    "id": 1282,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot structural parameters",
-      "cause": "",
-      "solution": "Check and update the properties/structure.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人结构参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/structure.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの構造パラメータのロードに失敗",
-      "cause": "",
-      "solution": "properties/structure.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Roboterstruktursparameter fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/structure.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros estructurales del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/structure.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить структурные параметры робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл Properties/structure.json."
-    },
-    "ko": {
-      "description": "로봇 구조 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/structure.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人结构参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/structure.json文件"
-    }
-  },
-  {
-    "id": 1283,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the moving parameters of the robot teaching coordinate params",
-      "cause": "",
-      "solution": "Check and update the teach/coordinate.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人示教坐标系点动参数失败",
-      "cause": "",
-      "solution": "检查并更新teach/coordinate.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのティーチング座標系ジョグパラメータのロードに失敗",
-      "cause": "",
-      "solution": "teach/coordinate.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Punktbewegungsparameter des Teach-Koordinatensystems des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei teach/coordinate.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de movimiento del robot que enseña los parámetros de coordenadas",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo teach/coordinate.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры перемещения из параметров координат обучения робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл Teach/Coordinate.json."
-    },
-    "ko": {
-      "description": "로봇 티칭 좌표계 조그 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "teach/coordinate.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人示教坐标系点动参数失败",
-      "cause": "",
-      "solution": "检查并更新teach/coordinate.json文件"
-    }
-  },
-  {
-    "id": 1284,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the moving parameters of the robot teaching joint params",
-      "cause": "",
-      "solution": "Check and update the teach/joint.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人示教关节点动参数失败",
-      "cause": "",
-      "solution": "检查并更新teach/joint.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのティーチング関節ジョグパラメータのロードに失敗",
-      "cause": "",
-      "solution": "teach/joint.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Gelenk-Tippbetriebsparameter beim Teachen des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei teach/joint.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de movimiento del robot que enseña los parámetros de articulación",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo teach/joint.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры обучающего движения шарниров робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл Teach/joint.json."
-    },
-    "ko": {
-      "description": "로봇 티칭 조인트 조그 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "teach/joint.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人示教关节点动参数失败",
-      "cause": "",
-      "solution": "检查并更新teach/joint.json文件"
-    }
-  },
-  {
-    "id": 1285,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the moving parameters of the robot teaching inch params",
-      "cause": "",
-      "solution": "Check and update the teach/inch.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人示教寸动参数失败",
-      "cause": "",
-      "solution": "检查并更新teach/inch.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのティーチングインチングパラメータのロードに失敗",
-      "cause": "",
-      "solution": "teach/inch.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Gelenk-Inchbetriebsparameter beim Teachen des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei teach/inch.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de movimiento del robot que enseña los parámetros de desplazamiento lento",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo teach/inch.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры движения робота при обучении дотягиванию импульсами.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл Teach/inch.json."
-    },
-    "ko": {
-      "description": "로봇 티칭 인치인 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "teach/inch.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人示教寸动参数失败",
-      "cause": "",
-      "solution": "检查并更新teach/inch.json文件"
-    }
-  },
-  {
-    "id": 1286,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot playback joint parameters",
-      "cause": "",
-      "solution": "Check and update the playback/joint.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人关节空间规划参数失败",
-      "cause": "",
-      "solution": "检查并更新playback/joint.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの関節空間計画パラメータのロードに失敗",
-      "cause": "",
-      "solution": "playback/joint.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Parameter zur Raumplanung des Robotergelenks fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei playback/joint.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de articulación de reproducción del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo playback/joint.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры шарнира воспроизведения робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл playback/joint.json."
-    },
-    "ko": {
-      "description": "로봇 조인트 공간 계획 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "playback/joint.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人关节空间规划参数失败",
-      "cause": "",
-      "solution": "检查并更新playback/joint.json文件"
-    }
-  },
-  {
-    "id": 1287,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot playback coordinate parameters",
-      "cause": "",
-      "solution": "Check and update the playback/coordinate.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人笛卡尔空间规划参数失败",
-      "cause": "",
-      "solution": "检查并更新playback/coordinate.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのデカルト空間計画パラメータのロードに失敗",
-      "cause": "",
-      "solution": "playback/coordinate.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der kartesischen Raumplanungsparameter des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei playback/coordinate.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de coordenadas de reproducción del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo playback/coordinate.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры координат воспроизведения робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл playback/coordinate.json."
-    },
-    "ko": {
-      "description": "로봇 데카르트 공간 계획 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "playback/coordinate.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人笛卡尔空间规划参数失败",
-      "cause": "",
-      "solution": "检查并更新playback/coordinate.json文件"
-    }
-  },
-  {
-    "id": 1288,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot playback arch parameters",
-      "cause": "",
-      "solution": "Check and update the playback/arch.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人门型参数失败",
-      "cause": "",
-      "solution": "检查并更新playback/arch.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの門型パラメータのロードに失敗",
-      "cause": "",
-      "solution": "playback/arch.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Typparameter des Roboterportals fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei playback/arch.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de arco de reproducción del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo playback/arch.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры арки воспроизведения робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл playback/arch.json."
-    },
-    "ko": {
-      "description": "로봇 게이트 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "playback/arch.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人门型参数失败",
-      "cause": "",
-      "solution": "检查并更新playback/arch.json文件"
-    }
-  },
-  {
-    "id": 1289,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot global rate parameter",
-      "cause": "",
-      "solution": "Check and update the settings/common.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人全局速率参数失败",
-      "cause": "",
-      "solution": "检查并更新settings/common,json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのグローバル速度パラメータのロードに失敗",
-      "cause": "",
-      "solution": "settings/common,jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der globale Geschwindigkeitsparameter des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei settings/common,json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de tasa global del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo settings/common.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить глобальный параметр скорости робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл settings/common.json."
-    },
-    "ko": {
-      "description": "로봇 전역 속도 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "settings/common,json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人全局速率参数失败",
-      "cause": "",
-      "solution": "检查并更新settings/common,json文件"
-    }
-  },
-  {
-    "id": 1290,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot motion coordinate system index parameter",
-      "cause": "",
-      "solution": "Check and update the datasvr/config.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人点动坐标系索引参数失败",
-      "cause": "",
-      "solution": "检查并更新datasvr/config.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのジョグ座標系索引パラメータのロードに失敗",
-      "cause": "",
-      "solution": "datasvr/config.json文ファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Indexparameter fürs Tippbetriebskoordinatensystem des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei datasvr/config.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de índice del sistema de coordenadas de movimiento del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo datasvr/config.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр индекса системы координат движения робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл datasvr/config.json."
-    },
-    "ko": {
-      "description": "로봇 조그 좌표계 인덱스 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "datasvr/config.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人点动坐标系索引参数失败",
-      "cause": "",
-      "solution": "检查并更新datasvr/config.json文件"
-    }
-  },
-  {
-    "id": 1291,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot user coordinate system parameters",
-      "cause": "",
-      "solution": "Check and update the coordinate/user.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人用户坐标系参数失败",
-      "cause": "",
-      "solution": "检查并更新coordinate/user.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのユーザ座標系パラメータのロードに失敗",
-      "cause": "",
-      "solution": "coordinate/user.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Koordinatensystemparameter des Roboterbenutzers fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei coordinate/user.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros del sistema de coordenadas del usuario del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo coordinate/user.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры пользовательской системы координат робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл координаты/user.json."
-    },
-    "ko": {
-      "description": "로봇 사용자 좌표계 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "coordinate/user.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人用户坐标系参数失败",
-      "cause": "",
-      "solution": "检查并更新coordinate/user.json文件"
-    }
-  },
-  {
-    "id": 1292,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot tool coordinate system parameters",
-      "cause": "",
-      "solution": "Check and update the coordinate/tool.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人工具坐标系参数失败",
-      "cause": "",
-      "solution": "检查并更新coordinate/tool.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのツール座標系パラメータのロードに失敗",
-      "cause": "",
-      "solution": "coordinate/tool.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Koordinatensystemparameter des Roboterwerkzeugs fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei coordinate/tool.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros del sistema de coordenadas de la herramienta del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo coordinate/tool.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры системы координат инструмента робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл coordinate/tool.json."
-    },
-    "ko": {
-      "description": "로봇 도구 좌표계 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "coordinate/tool.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人工具坐标系参数失败",
-      "cause": "",
-      "solution": "检查并更新coordinate/tool.json文件"
-    }
-  },
-  {
-    "id": 1293,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot advanced function parameters",
-      "cause": "",
-      "solution": "Check and update the properties/advancedFunction.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人高级功能参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/advancedFunction.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの高度機能パラメータのロードに失敗",
-      "cause": "",
-      "solution": "properties/advancedFunction.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Parameter für erweiterte Roboterfunktionen fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/advancedFunction.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de funciones avanzadas del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/advancedFunction.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры расширенных функций робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл properties/advancedFunction.json."
-    },
-    "ko": {
-      "description": "로봇 고급 기능 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/advancedFunction.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人高级功能参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/advancedFunction.json文件"
-    }
-  },
-  {
-    "id": 1294,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the safety signal configuration parameters for the robot",
-      "cause": "",
-      "solution": "Check and update the function/CC161/safeSignal.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人的安全信号配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/CC161/safeSignal.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの安全信号設定パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/CC161/safeSignal.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationsparameter des Sicherheitssignals des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/CC161/safeSignal.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de configuración de señales de seguridad del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/CC161/safeSignal.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры конфигурации сигнала безопасности для робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/CC161/safeSignal.json."
-    },
-    "ko": {
-      "description": "로봇의 안전 신호 설정 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/CC161/safeSignal.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人的安全信号配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/CC161/safeSignal.json文件"
-    }
-  },
-  {
-    "id": 1295,
-    "level": 5,
-    "en": {
-      "description": "Failed to load system I/O control configuration parameters",
-      "cause": "",
-      "solution": "Check and update the function/ioCtrl.json file"
-    },
-    "zh_CN": {
-      "description": "加载系统IO控制配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/ioCtrl.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "システムIO制御設定パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/ioCtrl.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationsparameter der System-IO-Steuerung fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/ioCtrl.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de configuración de control de E/S del sistema",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/ioCtrl.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры конфигурации управления вводом-выводом системы.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/ioCtrl.json."
-    },
-    "ko": {
-      "description": "시스템 IO 제어 설정 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/ioCtrl.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载系统IO控制配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/ioCtrl.json文件"
-    }
-  },
-  {
-    "id": 1296,
-    "level": 5,
-    "en": {
-      "description": "Failed to load system Modbus configuration parameters",
-      "cause": "",
-      "solution": "Check and update the function/modbusConf.json file"
-    },
-    "zh_CN": {
-      "description": "加载系统Modbus配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/modbusConf.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "Modbus設定パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/modbusConf.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Modbus-Konfigurationsparameter des Systems fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/modbusConf.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de configuración de Modbus del sistema",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/modbusConf.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры конфигурации системы Modbus.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/modbusConf.json."
-    },
-    "ko": {
-      "description": "시스템 Modbus 설정 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/modbusConf.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载系统Modbus配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/modbusConf.json文件"
-    }
-  },
-  {
-    "id": 1297,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot remote control mode parameters",
-      "cause": "",
-      "solution": "Check and update the function/remoteControl.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人远程控制模式参数失败",
-      "cause": "",
-      "solution": "检查并更新function/remoteControl.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのリモート制御モードパラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/remoteControl.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Fernsteuerungsmodusparameter des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/remoteControl.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de modo de control remoto del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/remoteControl.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры режима дистанционного управления роботом.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/remoteControl.json."
-    },
-    "ko": {
-      "description": "로봇 원격 제어 모드 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/remoteControl.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人远程控制模式参数失败",
-      "cause": "",
-      "solution": "检查并更新function/remoteControl.json文件"
-    }
-  },
-  {
-    "id": 1298,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot shaft number parameter",
-      "cause": "",
-      "solution": "Check and update the properties/axis.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人轴数量参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/axis.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの軸数パラメータのロードに失敗",
-      "cause": "",
-      "solution": "properties/axis.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Parameter für die Roboterachsennummer fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/axis.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de número de eje del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/axis.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр номера вала робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл properties/axis.json."
-    },
-    "ko": {
-      "description": "로봇 축 수 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/axis.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人轴数量参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/axis.json文件"
-    }
-  },
-  {
-    "id": 1299,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot bussiness type parameter",
-      "cause": "",
-      "solution": "Check and update the properties/bussinessType.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人产品类型参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/bussinessType.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの製品タイプパラメータのロードに失敗",
-      "cause": "",
-      "solution": "properties/bussinessType.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Produkttypsparameter des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/bussinessType.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de tipo de negocio del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/bussinessType.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр типа работы робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл properties/bussinessType.json."
-    },
-    "ko": {
-      "description": "로봇 제품 유형 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/bussinessType.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人产品类型参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/bussinessType.json文件"
-    }
-  },
-  {
-    "id": 1300,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot type parameter",
-      "cause": "",
-      "solution": "Check and update the properties/controllerType.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人类型参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/controllerType.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットタイプパラメータのロードに失敗",
-      "cause": "",
-      "solution": "properties/controllerType.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Robotertypparameter fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/controllerType.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de tipo de robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/controllerType.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр типа робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл properties/controllerType.json."
-    },
-    "ko": {
-      "description": "로봇 유형 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/controllerType.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人类型参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/controllerType.json文件"
-    }
-  },
-  {
-    "id": 1301,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the controller type parameter",
-      "cause": "",
-      "solution": "Check and update the properties/controlCabType.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人控制器类型参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/controlCabType.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのコントローラタイプパラメータのロードに失敗",
-      "cause": "",
-      "solution": "properties/controlCabType.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Parameter für den Robotersteuerungstyp fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/controlCabType.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de tipo de controlador",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/controlCabType.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр типа контроллера.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл properties/controlCabType.json."
-    },
-    "ko": {
-      "description": "로봇 컨트롤러 유형 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/controlCabType.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人控制器类型参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/controlCabType.json文件"
-    }
-  },
-  {
-    "id": 1302,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot\u0027s self-interference parameters",
-      "cause": "",
-      "solution": "Check and update the properties/poseSelfInterference.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人的自干涉参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/poseSelfInterference.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの自己干渉パラメータのロードに失敗",
-      "cause": "",
-      "solution": "properties/poseSelfInterference.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Selbstinterferenzparameter des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/poseSelfInterference.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de autointerferencia del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/poseSelfInterference.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры самоинтерференции робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл properties/poseSelfInterference.json."
-    },
-    "ko": {
-      "description": "로봇의 자체 간섭 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/poseSelfInterference.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人的自干涉参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/poseSelfInterference.json文件"
-    }
-  },
-  {
-    "id": 1303,
-    "level": 5,
-    "en": {
-      "description": "Failed to load parameters such as acceleration of the robot",
-      "cause": "",
-      "solution": "Check and update the function/accFactor.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人的加速度等参数失败",
-      "cause": "",
-      "solution": "检查并更新function/accFactor.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの加速度等パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/accFactor.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Parameter wie Beschleunigung des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/accFactor.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar parámetros como el de la aceleración del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/accFactor.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить такие параметры, как ускорение робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/accFactor.json."
-    },
-    "ko": {
-      "description": "로봇의 가속도 등 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/accFactor.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人的加速度等参数失败",
-      "cause": "",
-      "solution": "检查并更新function/accFactor.json文件"
-    }
-  },
-  {
-    "id": 1304,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the torque constraint information parameters of the robot",
-      "cause": "",
-      "solution": "Check and update the function/torqueLimit.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人的力矩约束信息参数失败",
-      "cause": "",
-      "solution": "检查并更新function/torqueLimit.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのトルク制限パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/torqueLimit.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Drehmomentbeschränkungsparameter des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/torqueLimit.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de información de restricción de par del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/torqueLimit.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры информации об ограничении крутящего момента робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/torqueLimit.json."
-    },
-    "ko": {
-      "description": "로봇의 토크 제약 정보 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/torqueLimit.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人的力矩约束信息参数失败",
-      "cause": "",
-      "solution": "检查并更新function/torqueLimit.json文件"
-    }
-  },
-  {
-    "id": 1305,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the real-time feedback data format configuration parameters",
-      "cause": "",
-      "solution": "Check and update the function/tcp30006Feedback.json file"
-    },
-    "zh_CN": {
-      "description": "加载实时反馈数据格式配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/tcp30006Feedback.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "リアルタイムフィードバックデータ形式設定パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/tcp30006Feedback.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationsparameter für Echtzeit-Rückmeldedatenformat fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/tcp30006Feedback.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de configuración del formato de datos de retroalimentación en tiempo real",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/tcp30006Feedback.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры конфигурации формата данных обратной связи в реальном времени.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/tcp30006Feedback.json."
-    },
-    "ko": {
-      "description": "실시간 피드백 데이터 형식 설정 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/tcp30006Feedback.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载实时反馈数据格式配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/tcp30006Feedback.json文件"
-    }
-  },
-  {
-    "id": 1306,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot limit parameter",
-      "cause": "",
-      "solution": "Check and update the function/securityConstraint.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人限值参数失败",
-      "cause": "",
-      "solution": "检查并更新function/securityConstraint.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット制限値パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/securityConstraint.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Begrenzungsparameter des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/securityConstraint.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de límite del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/securityConstraint.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр ограничения робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/securityConstraint.json."
-    },
-    "ko": {
-      "description": "로봇 제한 값 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/securityConstraint.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人限值参数失败",
-      "cause": "",
-      "solution": "检查并更新function/securityConstraint.json文件"
-    }
-  },
-  {
-    "id": 1307,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot joint restriction parameter",
-      "cause": "",
-      "solution": "Check and update the properties/jointLimits.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人关节限制参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/jointLimits.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの関節制限パラメータのロードに失敗",
-      "cause": "",
-      "solution": "properties/jointLimits.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Begrenzungsparameter des Robotergelenks fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/jointLimits.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de restricción de articulación del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/jointLimits.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр ограничения шарнира робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл properties/jointLimits.json."
-    },
-    "ko": {
-      "description": "로봇 조인트 제한 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/jointLimits.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人关节限制参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/jointLimits.json文件"
-    }
-  },
-  {
-    "id": 1308,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot virtualWall parameters",
-      "cause": "",
-      "solution": "Check and update the function/virtualWall.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人安全墙参数失败",
-      "cause": "",
-      "solution": "检查并更新function/virtualWall.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの安全壁パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/virtualWall.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Parameter der Robotersicherheitswand fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/virtualWall.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de pared de seguridad del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/virtualWall.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры защитной стены робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/virtualWall.json."
-    },
-    "ko": {
-      "description": "로봇 방호벽 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/virtualWall.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人安全墙参数失败",
-      "cause": "",
-      "solution": "检查并更新function/virtualWall.json文件"
-    }
-  },
-  {
-    "id": 1309,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot installation status parameters",
-      "cause": "",
-      "solution": "Check and update the function/install.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人安装状态参数失败",
-      "cause": "",
-      "solution": "检查并更新function/install.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット設置状態パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/install.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Installationsstatusparameter des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/install.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de estado de instalación del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/install.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры состояния установки робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/install.json."
-    },
-    "ko": {
-      "description": "로봇 설치 상태 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/install.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人安装状态参数失败",
-      "cause": "",
-      "solution": "检查并更新function/install.json文件"
-    }
-  },
-  {
-    "id": 1310,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the parameters of the total system running time",
-      "cause": "",
-      "solution": "Check and update the settings/workTimeRec.json file"
-    },
-    "zh_CN": {
-      "description": "加载系统累计运行时间参数失败",
-      "cause": "",
-      "solution": "检查并更新settings/workTimeRec.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "システム累計運転時間パラメータのロードに失敗",
-      "cause": "",
-      "solution": "settings/workTimeRec.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Parameter kumulativer Systemlaufzeit fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei settings/workTimeRec.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros del tiempo de ejecución total del sistema",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo settings/workTimeRec.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры общего времени работы системы.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл settings/workTimeRec.json."
-    },
-    "ko": {
-      "description": "시스템 누적 실행 시간 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "settings/workTimeRec.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载系统累计运行时间参数失败",
-      "cause": "",
-      "solution": "检查并更新settings/workTimeRec.json文件"
-    }
-  },
-  {
-    "id": 1311,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot simulation mode parameters",
-      "cause": "",
-      "solution": "Check and update the function/analogMode.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人模拟模式参数失败",
-      "cause": "",
-      "solution": "检查并更新function/analogMode.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのシミュレーションモードパラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/analogMode.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Parameter des Robotersimulationsmodus fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/analogMode.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de modo de simulación del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/analogMode.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры режима моделирования робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/analogMode.json."
-    },
-    "ko": {
-      "description": "로봇 아날로그 모드 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/analogMode.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人模拟模式参数失败",
-      "cause": "",
-      "solution": "检查并更新function/analogMode.json文件"
-    }
-  },
-  {
-    "id": 1312,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot drag sensitivity parameter",
-      "cause": "",
-      "solution": "Check and update the function/dragSensivity.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人拖拽灵敏度参数失败",
-      "cause": "",
-      "solution": "检查并更新function/dragSensivity.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットドラッグ感度パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/dragSensivity.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Parameter für Roboterwiderstandsempfindlichkeit fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/dragSensivity.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de sensibilidad de arrastre del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/dragSensivity.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр чувствительности робота к перетаскиванию.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/dragSensivity.json."
-    },
-    "ko": {
-      "description": "로봇 드래그 감도 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/dragSensivity.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人拖拽灵敏度参数失败",
-      "cause": "",
-      "solution": "检查并更新function/dragSensivity.json文件"
-    }
-  },
-  {
-    "id": 1313,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot recurrence parameter",
-      "cause": "",
-      "solution": "Check and update the function/reTraceParams.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人复现参数失败",
-      "cause": "",
-      "solution": "检查并更新function/reTraceParams.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット再現パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/reTraceParams.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Wiedergabeparameter des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/reTraceParams.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de reproducción del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/reTraceParams.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр воспроизведения робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/reTraceParams.json."
-    },
-    "ko": {
-      "description": "로봇 재현 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/reTraceParams.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人复现参数失败",
-      "cause": "",
-      "solution": "检查并更新function/reTraceParams.json文件"
-    }
-  },
-  {
-    "id": 1314,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot packing attitude parameters",
-      "cause": "",
-      "solution": "Check and update the function/packPoint.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人打包姿态参数失败",
-      "cause": "",
-      "solution": "检查并更新function/packPoint.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットパッケージ姿勢パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/packPoint.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Parameter der Roboterpackungsgesten fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/packPoint.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de postura compacta del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/packPoint.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры позы упаковки робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/packPoint.json."
-    },
-    "ko": {
-      "description": "로봇 패키지 자세 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/packPoint.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人打包姿态参数失败",
-      "cause": "",
-      "solution": "检查并更新function/packPoint.json文件"
-    }
-  },
-  {
-    "id": 1315,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot\u0027s custom attitude parameters",
-      "cause": "",
-      "solution": "Check and update the function/customPoint.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人自定义姿态参数失败",
-      "cause": "",
-      "solution": "检查并更新function/customPoint.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットセルフ定義姿勢パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/customPoint.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der benutzerdefinierten Gesteparameter des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/customPoint.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de postura personalizada del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/customPoint.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить пользовательские параметры позы робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/customPoint.json."
-    },
-    "ko": {
-      "description": "로봇 자체 정의 자세 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/customPoint.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人自定义姿态参数失败",
-      "cause": "",
-      "solution": "检查并更新function/customPoint.json文件"
-    }
-  },
-  {
-    "id": 1316,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot switch safety crash configuration parameters",
-      "cause": "",
-      "solution": "Check and update the function/collisionDect.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人开关安全碰撞配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/collisionDect.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのスイッチ安全衝突設定パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/collisionDect.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationsparameter für Sicherheitskollision des Roboterschalters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/collisionDect.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de configuración de colisión de seguridad del conmutador del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/collisionDect.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры конфигурации безопасности переключателя робота при столкновении.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/collisionDect.json."
-    },
-    "ko": {
-      "description": "로봇 스위치 안전 충돌 설정 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/collisionDect.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人开关安全碰撞配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/collisionDect.json文件"
-    }
-  },
-  {
-    "id": 1317,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot collision error threshold configuration parameter",
-      "cause": "",
-      "solution": "Check and update the function/collision_error_threshold.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人碰撞误差阈值配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/collision_error_threshold.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット衝突エラー閾値設定パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/collision_error_threshold.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationsparameter für die Kollisionsfehlerschwelle des Roboters fehlgeschlagen.",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/collision_error_threshold.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de configuración del umbral de error de colisión del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/collision_error_threshold.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр конфигурации порога ошибки столкновения робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/collision_error_threshold.json."
-    },
-    "ko": {
-      "description": "로봇 충돌 오차 임계치 설정 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/collision_error_threshold.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人碰撞误差阈值配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/collision_error_threshold.json文件"
-    }
-  },
-  {
-    "id": 1318,
-    "level": 5,
-    "en": {
-      "description": "Failed to load robot common signal configuration parameter failed",
-      "cause": "",
-      "solution": "Check and update the function/commonSignal.json file"
-    },
-    "zh_CN": {
-      "description": "加载器机器人通用信号配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/commonSignal.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの一般信号設定パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/commonSignal.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationsparameter für generisches Signal des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/commonSignal.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de configuración de señal común del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/commonSignal.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр конфигурации общего сигнала робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/commonSignal.json."
-    },
-    "ko": {
-      "description": "로봇 범용 신호 구성 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/commonSignal.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载器机器人通用信号配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/commonSignal.json文件"
-    }
-  },
-  {
-    "id": 1319,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the robot language configuration item",
-      "cause": "",
-      "solution": "Check and update the language/language.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人语言配置项失败",
-      "cause": "",
-      "solution": "检查并更新language/language.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット言語設定パラメータのロードに失敗",
-      "cause": "",
-      "solution": "language/language.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationselement der Robotersprache fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei language/language.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el elemento de configuración de idioma del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/language.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить элемент конфигурации языка робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/language.json."
-    },
-    "ko": {
-      "description": "로봇 언어 설정 항 로딩 실패",
-      "cause": "",
-      "solution": "language/language.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人语言配置项失败",
-      "cause": "",
-      "solution": "检查并更新language/language.json文件"
-    }
-  },
-  {
-    "id": 1320,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the Chinese configuration table",
-      "cause": "",
-      "solution": "Check and update the language/zh_cn.json file"
-    },
-    "zh_CN": {
-      "description": "加载中文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/zh_cn.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "中国語設定表のロードに失敗",
-      "cause": "",
-      "solution": "language/zh_cn.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationstabelle auf Chinesisch fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei language/zh_cn.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la tabla de configuración de chino",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/zh_cn.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить таблицу конфигурации на китайском языке.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/zh_cn.json."
-    },
-    "ko": {
-      "description": "중국어 설정 표 로딩 실패",
-      "cause": "",
-      "solution": "language/zh_cn.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载中文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/zh_cn.json文件"
-    }
-  },
-  {
-    "id": 1321,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the English configuration table",
-      "cause": "",
-      "solution": "Check and update the language/en.json file"
-    },
-    "zh_CN": {
-      "description": "加载英文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/en.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "英語設定表のロードに失敗",
-      "cause": "",
-      "solution": "language/en.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationstabelle auf Englisch fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei language/de.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la tabla de configuración de inglés",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/en.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить таблицу конфигурации на английском языке.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/en.json."
-    },
-    "ko": {
-      "description": "영어 설정 표 로딩 실패",
-      "cause": "",
-      "solution": "language/en.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载英文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/en.json文件"
-    }
-  },
-  {
-    "id": 1322,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the default motion speed parameter",
-      "cause": "",
-      "solution": "Check and update the properties/default.json file"
-    },
-    "zh_CN": {
-      "description": "加载默认运动速度参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/default.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "デフォルト移動速度パラメータのロードに失敗",
-      "cause": "",
-      "solution": "properties/default.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Standardparameter für die Bewegungsgeschwindigkeit fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/default.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de velocidad de movimiento por defecto",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/default.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр скорости движения по умолчанию.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл properties/default.json."
-    },
-    "ko": {
-      "description": "기본 운동 속도 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/default.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载默认运动速度参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/default.json文件"
-    }
-  },
-  {
-    "id": 1323,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the payloadLimit parameter",
-      "cause": "",
-      "solution": "Check and update the function/payloadLimit.json file"
-    },
-    "zh_CN": {
-      "description": "加载负载范围参数失败",
-      "cause": "",
-      "solution": "检查并更新function/payloadLimit.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "負荷範囲パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/payloadLimit.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Lastbereichparameter fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/payloadLimit.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro payloadLimit",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/payloadLimit.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр payloadLimit.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/payloadLimit.json."
-    },
-    "ko": {
-      "description": "부하 범위 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/payloadLimit.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载负载范围参数失败",
-      "cause": "",
-      "solution": "检查并更新function/payloadLimit.json文件"
-    }
-  },
-  {
-    "id": 1325,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the Traditional Chinese configuration table",
-      "cause": "",
-      "solution": "Check and update the language/zh_hand.json file"
-    },
-    "zh_CN": {
-      "description": "加载繁体中文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/zh_hand.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "繁体中国語設定表のロードに失敗",
-      "cause": "",
-      "solution": "language/zh_hand.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationstabelle auf traditionellem Chinesisch fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei language/zh_hand.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la tabla de configuración de chino tradicional",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/zh_hand.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить таблицу конфигурации для традиционного китайского языка.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/zh_hand.json."
-    },
-    "ko": {
-      "description": "중국어 번체 설정 표 로딩 실패",
-      "cause": "",
-      "solution": "language/zh_hand.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载繁体中文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/zh_hand.json文件"
-    }
-  },
-  {
-    "id": 1326,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the Korean configuration table",
-      "cause": "",
-      "solution": "Check and update the language/kr.json file"
-    },
-    "zh_CN": {
-      "description": "加载韩文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/kr.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "韓国語設定表のロードに失敗",
-      "cause": "",
-      "solution": "language/kr.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationstabelle auf Südkoreanisch fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei language/kr.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la tabla de configuración de coreano",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/kr.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить таблицу конфигурации для корейского языка.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/kr.json."
-    },
-    "ko": {
-      "description": "한국어 설정 표 로딩 실패",
-      "cause": "",
-      "solution": "language/kr.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载韩文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/kr.json文件"
-    }
-  },
-  {
-    "id": 1327,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the Japanese configuration table",
-      "cause": "",
-      "solution": "Check and update the language/ja.json file"
-    },
-    "zh_CN": {
-      "description": "加载日文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/ja.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "日本語設定表のロードに失敗",
-      "cause": "",
-      "solution": "language/ja.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationstabelle auf Japanisch fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei language/ja.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la tabla de configuración de japonés",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/ja.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить таблицу конфигурации на японском языке.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/ja.json."
-    },
-    "ko": {
-      "description": "일본어 설정 표 로딩 실패",
-      "cause": "",
-      "solution": "language/ja.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载日文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/ja.json文件"
-    }
-  },
-  {
-    "id": 1328,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the German configuration table",
-      "cause": "",
-      "solution": "Check and update the language/de.json file"
-    },
-    "zh_CN": {
-      "description": "加载德文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/de.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ドイツ語設定表のロードに失敗",
-      "cause": "",
-      "solution": "language/de.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationstabelle auf Deutsch fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei language/de.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la tabla de configuración de alemán",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/de.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить таблицу конфигурации для немецкого языка.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/de.json."
-    },
-    "ko": {
-      "description": "독일어 설정 표 로딩 실패",
-      "cause": "",
-      "solution": "language/de.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载德文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/de.json文件"
-    }
-  },
-  {
-    "id": 1329,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the end-mode configuration",
-      "cause": "",
-      "solution": "Check and update the function/toolMode.json file"
-    },
-    "zh_CN": {
-      "description": "加载末端模式配置失败",
-      "cause": "",
-      "solution": "检查并更新function/toolMode.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツールモード設定のロードに失敗",
-      "cause": "",
-      "solution": "function/toolMode.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Endmoduskonfiguration fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/toolMode.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la configuración de modo de extremo",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/toolMode.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить конфигурацию конечного режима.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/toolMode.json."
-    },
-    "ko": {
-      "description": "끝단 모드 설정 로딩 실패",
-      "cause": "",
-      "solution": "function/toolMode.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载末端模式配置失败",
-      "cause": "",
-      "solution": "检查并更新function/toolMode.json文件"
-    }
-  },
-  {
-    "id": 1330,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the configuration of electronic skin switch",
-      "cause": "",
-      "solution": "Check and update the elecSkin/switch.json file"
-    },
-    "zh_CN": {
-      "description": "加载电子皮肤开关配置失败",
-      "cause": "",
-      "solution": "检查并更新elecSkin/switch.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "電子スキンスイッチ設定のロードに失敗",
-      "cause": "",
-      "solution": "elecSkin/switch.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Schalterkonfiguration der E-Haut fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei elecSkin/switch.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la configuración del conmutador de piel electrónica",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo elecSkin/switch.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить конфигурацию реле электронной кожи.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл elecSkin/switch.json."
-    },
-    "ko": {
-      "description": "전자 스킨 스위치 설정 로딩 실패",
-      "cause": "",
-      "solution": "elecSkin/switch.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载电子皮肤开关配置失败",
-      "cause": "",
-      "solution": "检查并更新elecSkin/switch.json文件"
-    }
-  },
-  {
-    "id": 1331,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the electronic skin sensitivity parameter",
-      "cause": "",
-      "solution": "Check and update the elecSkin/sensitivity.json file"
-    },
-    "zh_CN": {
-      "description": "加载电子皮肤灵敏度参数失败",
-      "cause": "",
-      "solution": "检查并更新elecSkin/sensitivity.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "電子スキン感度パラメータのロードに失敗",
-      "cause": "",
-      "solution": "elecSkin/sensitivity.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Empfindlichkeitsparameter der E-Haut fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei elecSkin/sensitivity.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de sensibilidad de piel electrónica",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo elecSkin/sensitivity.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр чувствительности электронной кожи.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл elecSkin/sensitivity.json."
-    },
-    "ko": {
-      "description": "전자 스킨 감도 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "elecSkin/sensitivity.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载电子皮肤灵敏度参数失败",
-      "cause": "",
-      "solution": "检查并更新elecSkin/sensitivity.json文件"
-    }
-  },
-  {
-    "id": 1332,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the load parameter list",
-      "cause": "",
-      "solution": "Check and update the function/loadConfig.json file"
-    },
-    "zh_CN": {
-      "description": "加载负载参数列表失败",
-      "cause": "",
-      "solution": "检查并更新function/loadConfig.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "負荷パラメータ表のロードに失敗",
-      "cause": "",
-      "solution": "function/loadConfig.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Lastparameterliste fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/loadConfig.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la lista de parámetros de carga",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/loadConfig.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить список параметров загрузки.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/loadConfig.json."
-    },
-    "ko": {
-      "description": "부하 파라미터 리스트 로딩 실패",
-      "cause": "",
-      "solution": "function/loadConfig.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载负载参数列表失败",
-      "cause": "",
-      "solution": "检查并更新function/loadConfig.json文件"
-    }
-  },
-  {
-    "id": 1333,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the safety signal configuration parameters for the robot",
-      "cause": "",
-      "solution": "Check and update the function/CC162/safeSignal.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人的安全信号配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/CC162/safeSignal.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの安全信号設定パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/CC162/safeSignal.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationsparameter des Sicherheitssignals des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/CC162/safeSignal.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de configuración de señales de seguridad del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/CC162/safeSignal.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры конфигурации сигнала безопасности для робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/CC162/safeSignal.json."
-    },
-    "ko": {
-      "description": "로봇의 안전 신호 설정 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/CC162/safeSignal.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人的安全信号配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/CC162/safeSignal.json文件"
-    }
-  },
-  {
-    "id": 1334,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the safety signal configuration parameters for the robot",
-      "cause": "",
-      "solution": "Check and update the function/CCBOX/safeSignal.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人的安全信号配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/CCBOX/safeSignal.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの安全信号設定パラメータのロードに失敗",
-      "cause": "",
-      "solution": "function/CCBOX/safeSignal.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationsparameter des Sicherheitssignals des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/CCBOX/safeSignal.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de configuración de señales de seguridad del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/CCBOX/safeSignal.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры конфигурации сигнала безопасности для робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/CCBOX/safeSignal.json."
-    },
-    "ko": {
-      "description": "로봇의 안전 신호 설정 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/CCBOX/safeSignal.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人的安全信号配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/CCBOX/safeSignal.json文件"
-    }
-  },
-  {
-    "id": 1335,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the Vietnamese configuration table",
-      "cause": "",
-      "solution": "Check and update the language/vi.json file"
-    },
-    "zh_CN": {
-      "description": "加载越南文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/vi.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ベトナム語設定表のロードに失敗",
-      "cause": "",
-      "solution": "language/vi.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Konfigurationstabelle auf Vietnamesisch fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei language/vi.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la tabla de configuración de vietnamita",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/vi.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить таблицу конфигурации на вьетнамском языке.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/vi.json."
-    },
-    "ko": {
-      "description": "베트남어 설정 표 로딩 실패",
-      "cause": "",
-      "solution": "language/vi.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载越南文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/vi.json文件"
-    }
-  },
-  {
-    "id": 1336,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the json file of the voltage range of the small control cabinet",
-      "cause": "",
-      "solution": "Check and update the function/ccboxVoltage.json file"
-    },
-    "zh_CN": {
-      "description": "加载小型控制柜电压值范围文件失败",
-      "cause": "",
-      "solution": "检查并更新function/ccboxVoltage.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "小型制御キャビネット電圧範囲ファイルのロードに失敗",
-      "cause": "",
-      "solution": "function/ccboxVoltage.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Datei des Spannungswertebereichs für kleinen Schaltschrank fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/ccboxVoltage.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el archivo json del rango de voltaje del armario de control pequeño",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/ccboxVoltage.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить json-файл диапазона напряжений небольшого шкафа управления.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/ccboxVoltage.json."
-    },
-    "ko": {
-      "description": "소형 제어 캐비닛 전압값 범위 파일 로딩 실패",
-      "cause": "",
-      "solution": "function/ccboxVoltage.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载小型控制柜电压值范围文件失败",
-      "cause": "",
-      "solution": "检查并更新function/ccboxVoltage.json文件"
-    }
-  },
-  {
-    "id": 1337,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the remote io/modbus control switch file.",
-      "cause": "",
-      "solution": "Check and update the function/remoteSwitch.json file"
-    },
-    "zh_CN": {
-      "description": "加载远程io/modbus控制开关文件失败",
-      "cause": "",
-      "solution": "检查并更新function/remoteSwitch.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "リモートio/modbus制御スイッチファイルのロードに失敗",
-      "cause": "",
-      "solution": "function/remoteSwitch.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Datei für den Fernsteuerungsschalter io/modbus fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei functions/remoteSwitch.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el archivo de conmutador de control remoto de ES/Modbus",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/remoteSwitch.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить файл переключателя удаленного управления io/modbus.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/remoteSwitch.json."
-    },
-    "ko": {
-      "description": "원격 io/modbus 제어 스위치 파일 로딩 실패",
-      "cause": "",
-      "solution": "function/remoteSwitch.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载远程io/modbus控制开关文件失败",
-      "cause": "",
-      "solution": "检查并更新function/remoteSwitch.json文件"
-    }
-  },
-  {
-    "id": 1338,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the safe skin joint limit parameter of the robot",
-      "cause": "",
-      "solution": "Check and update the elecSkin/jointLimit.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人的安全皮肤关节限制参数失败",
-      "cause": "",
-      "solution": "检查并更新elecSkin/jointLimit.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの安全スキン関節制限パラメータのロードに失敗",
-      "cause": "",
-      "solution": "elecSkin/jointLimit.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Gelenkbegrenzungsparameter für die Sicherheitshaut des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei elecSkin/jointLimit.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el parámetro de límite de articulación de piel segura del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo elecSkin/jointLimit.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметр ограничения защитной оболочки шарнира робота.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл elecSkin/jointLimit.json."
-    },
-    "ko": {
-      "description": "로봇의 안전 스킨 조인트 제한 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "elecSkin/jointLimit.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人的安全皮肤关节限制参数失败",
-      "cause": "",
-      "solution": "检查并更新elecSkin/jointLimit.json文件"
-    }
-  },
-  {
-    "id": 1339,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the safe skin obstacle avoidParams parameters of the robot",
-      "cause": "",
-      "solution": "Check and update the elecSkin/avoidParams.json file"
-    },
-    "zh_CN": {
-      "description": "加载机器人的安全皮肤避障参数失败",
-      "cause": "",
-      "solution": "检查并更新elecSkin/avoidParams.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットの安全スキン障害回避パラメータのロードに失敗",
-      "cause": "",
-      "solution": "elecSkin/avoidParams.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Hindernisausweichungsparameter für die Sicherheitshaut des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei elecSkin/avoidParams.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros avoidParams de obstáculos de piel segura del robot",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo elecSkin/avoidParams.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры препятствий защитной оболочки avoidParams.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл elecSkin/avoidParams.json."
-    },
-    "ko": {
-      "description": "로봇의 안전 스킨 장애물 회피 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "elecSkin/avoidParams.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载机器人的安全皮肤避障参数失败",
-      "cause": "",
-      "solution": "检查并更新elecSkin/avoidParams.json文件"
-    }
-  },
-  {
-    "id": 1340,
-    "level": 5,
-    "en": {
-      "description": "Failed to load jitter suppression parameters",
-      "cause": "",
-      "solution": "Check and update the properties/suppressionConfig.json file"
-    },
-    "zh_CN": {
-      "description": "加载抖动抑制参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/suppressionConfig.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジッタ抑制パラメータのロードに失敗",
-      "cause": "",
-      "solution": "properties/suppressionConfig.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laden der Parameter zur Jitterunterdrückung fehlgeschlagen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/suppressionConfig.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de supresión de vibración",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/suppressionConfig.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры подавления дрожания.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл properties/suppressionConfig.json."
-    },
-    "ko": {
-      "description": "떨림 억제 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/suppressionConfig.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载抖动抑制参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/suppressionConfig.json文件"
-    }
-  },
-  {
-    "id": 1341,
-    "level": 5,
-    "en": {
-      "description": "Failed to load vibration detection parameters",
-      "cause": "",
-      "solution": "Check and update the properties/vibrationDetection.json file"
-    },
-    "zh_CN": {
-      "description": "加载加速度计测量参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/vibrationDetection.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ローディング加速度計のパラメータ測定に失敗しました",
-      "cause": "",
-      "solution": "properties/vibrationDetection.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Laminiert das schweremaß nicht",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei properties/vibrationDetection.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de detección del medidor de aceleración",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo properties/vibrationDetection.json"
-    },
-    "ru": {
-      "description": "Не удалось определить параметры измерения ускорения.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл properties/vibrationDetection.json."
-    },
-    "ko": {
-      "description": "가속도계 측정 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "properties/vibrationDetection.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载加速度计测量参数失败",
-      "cause": "",
-      "solution": "检查并更新properties/vibrationDetection.json文件"
-    }
-  },
-  {
-    "id": 1342,
-    "level": 5,
-    "en": {
-      "description": "Failed to load vibration detection parameters",
-      "cause": "",
-      "solution": "Check and update the function/workZone.json file"
-    },
-    "zh_CN": {
-      "description": "加载六面体配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/workZone.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "六面体のパラメータを載せるのに失敗しました",
-      "cause": "",
-      "solution": "function/workZone.jsonファイルを確認し、更新"
-    },
-    "de": {
-      "description": "Geladen, um die fettwerte des oktopus einzustellen",
-      "cause": "",
-      "solution": "Prüfen und aktualisieren Sie die Datei function/workZone.json"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido cargar los parámetros de configuración del hexaedro",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo function/workZone.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить параметры конфигурации шестигранника.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл function/workZone.json."
-    },
-    "ko": {
-      "description": "육면체 설정 파라미터 로딩 실패",
-      "cause": "",
-      "solution": "function/workZone.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载六面体配置参数失败",
-      "cause": "",
-      "solution": "检查并更新function/workZone.json文件"
-    }
-  },
-  {
-    "id": 1343,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the Spanish configuration table",
-      "cause": "",
-      "solution": "Check and update the language/es.json file"
-    },
-    "zh_CN": {
-      "description": "加载西班牙文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/es.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "de": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la tabla de configuración de español",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/es.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить таблицу конфигурации на испанском языке.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/es.json."
-    },
-    "ko": {
-      "description": "스페인어 설정 표 로딩 실패",
-      "cause": "",
-      "solution": "language/es.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载西班牙文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/es.json文件"
-    }
-  },
-  {
-    "id": 1344,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the French configuration table",
-      "cause": "",
-      "solution": "Check and update the language/fr.json file"
-    },
-    "zh_CN": {
-      "description": "加载法文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/fr.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "de": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la tabla de configuración de francés",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/fr.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить таблицу конфигурации на французском языке.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/fr.json."
-    },
-    "ko": {
-      "description": "프랑스어 설정 표 로딩 실패",
-      "cause": "",
-      "solution": "language/fr.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载法文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/fr.json文件"
-    }
-  },
-  {
-    "id": 1345,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the Korean configuration table",
-      "cause": "",
-      "solution": "Check and update the language/ko.json file"
-    },
-    "zh_CN": {
-      "description": "加载韩文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/ko.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "de": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la tabla de configuración de coreano",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/ko.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить таблицу конфигурации для корейского языка.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/ko.json."
-    },
-    "ko": {
-      "description": "한국어 설정 표 로딩 실패",
-      "cause": "",
-      "solution": "language/ko.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载韩文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/ko.json文件"
-    }
-  },
-  {
-    "id": 1346,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the Russian configuration table",
-      "cause": "",
-      "solution": "Check and update the language/ru.json file"
-    },
-    "zh_CN": {
-      "description": "加载俄文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/ru.json文件"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "de": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar la tabla de configuración de ruso",
-      "cause": "",
-      "solution": "Compruebe y actualice el archivo language/ru.json"
-    },
-    "ru": {
-      "description": "Не удалось загрузить таблицу русской конфигурации.",
-      "cause": "",
-      "solution": "Проверьте и обновите файл language/ru.json."
-    },
-    "ko": {
-      "description": "러시아어 설정 표 로딩 실패",
-      "cause": "",
-      "solution": "language/ru.json 파일을 확인하고 업데이트하십시오"
-    },
-    "fr": {
-      "description": "加载俄文配置表失败",
-      "cause": "",
-      "solution": "检查并更新language/ru.json文件"
-    }
-  },
-  {
-    "id": 1359,
-    "level": 5,
-    "en": {
-      "description": "Failed to load the startup file",
-      "cause": "",
-      "solution": "Update the corresponding file and restart the system"
-    },
-    "zh_CN": {
-      "description": "开机文件加载失败",
-      "cause": "",
-      "solution": "更新对应文件后，并重新启动"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "起動ファイルロード失敗",
-      "cause": "",
-      "solution": "対応するファイルを更新後、再起動します"
-    },
-    "de": {
-      "description": "Laden der Bootdatei fehlgeschlagen",
-      "cause": "",
-      "solution": "Neustarten nach der Aktualisierung der entsprechenden Datei"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cargar el archivo de inicio",
-      "cause": "",
-      "solution": "Actualice el archivo correspondiente y reinicie el sistema"
-    },
-    "ru": {
-      "description": "Не удалось загрузить файл запуска",
-      "cause": "",
-      "solution": "Обновите соответствующий файл и перезагрузите систему."
-    },
-    "ko": {
-      "description": "부팅 파일 로딩 실패",
-      "cause": "",
-      "solution": "해당 파일을 업데이트하고 리부팅하십시오"
-    },
-    "fr": {
-      "description": "开机文件加载失败",
-      "cause": "",
-      "solution": "更新对应文件后，并重新启动"
-    }
-  },
-  {
-    "id": 1360,
-    "level": 5,
-    "en": {
-      "description": "Failed to diabble the robot",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "机器人下使能失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットを有効にできない",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Roboteraktivierung unten fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido desactivar el robot",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось отключить робота.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "로봇 비활성화 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "机器人下使能失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1361,
-    "level": 5,
-    "en": {
-      "description": "Failed to open the robot brake",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "机器人开抱闸失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのブレーキ開に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Öffnen der Haltebremse des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido abrir el freno del robot",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось выключить тормоз робота",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "로봇의 브레이크 홀딩 열기 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "机器人开抱闸失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1362,
-    "level": 5,
-    "en": {
-      "description": "Failed to close the robot brake",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "机器人关抱闸失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボットのブレーキ閉に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Schließen der Haltebremse des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido cerrar el freno del robot",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось включить тормоз робота",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "로봇의 브레이크 홀딩 닫기 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "机器人关抱闸失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1363,
-    "level": 1,
-    "en": {
-      "description": "Failed to power on",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "上电失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "電源オンに失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einschalten fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido encender",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось включить питание",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "전원 공급 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "上电失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1364,
-    "level": 5,
-    "en": {
-      "description": "Failed to start autoIdentify",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "启动自动辨识失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "自動識別の起動に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Automatische Erkennung kann nicht gestartet werden",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido iniciar la identificación automática",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось запустить автоматическую идентификацию.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "자동 인식 시작 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "启动自动辨识失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1365,
-    "level": 5,
-    "en": {
-      "description": "Failed to stop autoIdentify",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "停止自动辨识失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "自動識別の停止に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Automatische Erkennung kann nicht gestoppt werden",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido detener la identificación automática",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось остановить автоматическую идентификацию.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "자동 인식 정지 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "停止自动辨识失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1366,
-    "level": 5,
-    "en": {
-      "description": "Failed to enter drag mode",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "进入拖拽模式失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ドラッグモード開始に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Der Schleppmodus konnte nicht aktiviert werden",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido entrar en el modo de arrastre",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось войти в режим перетаскивания",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "드래그 모드 진입 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "进入拖拽模式失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1367,
-    "level": 5,
-    "en": {
-      "description": "Failed to exit  drag mode",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "退出拖拽模式失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ドラッグモード終了に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Der Schleppmodus konnte nicht beendet werden",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido salir del modo de arrastre",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось выйти из режима перетаскивания",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "드래그 모드 종료 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "退出拖拽模式失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1368,
-    "level": 5,
-    "en": {
-      "description": "Failed to set the global rate",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "全局速率设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "グローバルレート設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Globale Geschwindigkeitseinstellung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer la tasa de velocidad global",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить глобальную скорость.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "전역 속도 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "全局速率设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1369,
-    "level": 5,
-    "en": {
-      "description": "Failed to set load parameters",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "负载参数设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "負荷パラメータ設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einstellung der Lastparameter fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido establecer los parámetros de carga",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить параметры загрузки.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "부하 파라미터 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "负载参数设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1370,
-    "level": 5,
-    "en": {
-      "description": "Failed to installation attitude calibration ",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "安装姿态标定失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "設置姿勢校正に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Kalibrierung der Installationsgesten fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido realizar la calibración de la postura de instalación",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить калибровку позы.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "설치 자세 보정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "安装姿态标定失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1371,
-    "level": 5,
-    "en": {
-      "description": "Failed to coordinate system calibration",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "坐标系标定失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "座標系校正に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Kalibrierung des Koordinatensystems fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido realizar la calibración del sistema de coordenadas",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось выполнить калибровку системы координат.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "좌표계 보정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "坐标系标定失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1372,
-    "level": 5,
-    "en": {
-      "description": "Failed to set the installation posture",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "设置安装姿态失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "設置姿勢設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einstellung der Installationsgesten fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer la postura de instalación",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить позу установки.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "설치 자세 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "设置安装姿态失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1373,
-    "level": 5,
-    "en": {
-      "description": "Failed to set network",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "网络设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ネットワーク設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Netzwerkeinstellung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer la red",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось настроить сеть",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "네트워크 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "网络设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1374,
-    "level": 5,
-    "en": {
-      "description": "Failed to set wifi",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "wifi设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "wifi設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Wifi-Einstellung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer la wifi",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось настроить Wi-Fi.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "wifi 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "wifi设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1375,
-    "level": 5,
-    "en": {
-      "description": "Failed to set the tool coordinate system",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "工具坐标系设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツール座標系の設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einstellung des Werkzeugkoordinatensystems fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer el sistema de coordenadas de la herramienta",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить систему координат инструмента.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "도구 좌표계 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "工具坐标系设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1376,
-    "level": 5,
-    "en": {
-      "description": "Failed to set the user coordinate system",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "用户坐标系设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ユーザー座標系の設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einstellung des Benutzerkoordinatensystems fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer el sistema de coordenadas del usuario",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить пользовательскую систему координат.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "사용자 좌표계 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "用户坐标系设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1377,
-    "level": 5,
-    "en": {
-      "description": "Failed to set the end DO",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "末端DO设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツールDO設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Ende DO-Einstellung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer la DO de extremo",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить конечный DO.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "끝단 DO 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "末端DO设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1378,
-    "level": 5,
-    "en": {
-      "description": "Failed to set the DO",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "DO设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "DO設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "DO-Einstellung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer la DO",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить DO.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "DO 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "DO设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1379,
-    "level": 5,
-    "en": {
-      "description": "Failed to set the AO",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "AO设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "AO設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "AO-Einstellung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer la AO",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить АО.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "AO 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "AO设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1380,
-    "level": 5,
-    "en": {
-      "description": "Failed to set terminal 485",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "末端485设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツール485設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Ende 485 Einstellung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer el terminal 485",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить терминал 485.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "끝단 485 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "末端485设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1381,
-    "level": 5,
-    "en": {
-      "description": "Failed to set the drag mode",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "拖拽模式设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ドラッグモード設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einstellung des Schleppmodus fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer el modo de arrastre",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить режим перетаскивания.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "드래그 모드 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "拖拽模式设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1382,
-    "level": 5,
-    "en": {
-      "description": "Failed to enable the safety collision function",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "开安全碰撞功能失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "安全衝突機能起動に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Sicherheitskollisionsfunktion EIN fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido activar la función de colisión de seguridad",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось включить функцию безопасности при столкновении.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "안전 충돌 기능 활성화 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "开安全碰撞功能失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1383,
-    "level": 5,
-    "en": {
-      "description": "Failed to disable the safety collision function",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关安全碰撞功能失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "安全衝突機能終了に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Sicherheitskollisionsfunktion AUS fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido desactivar la función de colisión de seguridad",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось отключить функцию безопасности при столкновении.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "안전 충돌 기능 비활성화 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关安全碰撞功能失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1385,
-    "level": 1,
-    "en": {
-      "description": "Failed to power off",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "本体下电失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "本体電源オフに失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Grundkörperabschaltung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido apagar",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось выключить",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "본체 전원 끄기 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "本体下电失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1386,
-    "level": 5,
-    "en": {
-      "description": "Failed to set the joint limit parameter",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "设置关节限制参数失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節制限パラメータの設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einstellung der Gelenkbegrenzungsparameter fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer el parámetro de límite de la articulación",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить параметр ограничения шарнира.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "조인트 제한 파라미터 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "设置关节限制参数失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1387,
-    "level": 5,
-    "en": {
-      "description": "Failed to set the robot limit parameter",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "设置机器人限值参数失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット制限値パラメータの設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einstellung der Grenzwertparameter des Roboters fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer el parámetro de límite del robot",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить параметр ограничения робота.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "로봇 제한 값 파라미터 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "设置机器人限值参数失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1388,
-    "level": 5,
-    "en": {
-      "description": "Failed to set advanced function ",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "高级功能设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "高度機能設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einstellung der erweiterten Funktion fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido establecer funciones avanzadas",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить расширенные функции.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "고급 기능 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "高级功能设置失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1389,
-    "level": 5,
-    "en": {
-      "description": "Failed to update virtuall wall parameters",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "更新安全墙参数失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "安全壁パラメータの更新に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Aktualisierung der Sicherheitswandparameter fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido actualizar los parámetros de la pared de seguridad",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось обновить параметры защитной стены.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "방호벽 파라미터 업데이트 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "更新安全墙参数失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1390,
-    "level": 5,
-    "en": {
-      "description": "Failed to joint motion",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節移動に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenkbewegung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo del movimiento de articulación",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Движение шарнира не удалось",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "조인트 운동 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1391,
-    "level": 5,
-    "en": {
-      "description": "Failed to linear motion",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "直线运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "直線移動に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Lineare Bewegung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo del movimiento lineal",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Линейное движение не удалось",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "직선 운동 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "直线运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1392,
-    "level": 5,
-    "en": {
-      "description": "Description Execution of the positive solution failed",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "正解执行失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "正演算の実行に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Positive Lösungsausführung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo de la ejecución de la cinemática directa",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось выполнить прямую кинематику",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "정연산 실행 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "正解执行失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1393,
-    "level": 5,
-    "en": {
-      "description": "The inverse solution failed to execute",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "逆解执行失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "逆演算の実行に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Inverse Lösungsausführung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo de la ejecución de la cinemática inversa",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось выполнить инверсную кинематику.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "역연산 실행 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "逆解执行失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1394,
-    "level": 5,
-    "en": {
-      "description": "Failed to arc motion ",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "圆弧运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "円弧移動に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Kreisbewegung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo del movimiento del arco",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось переместить дугу",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "호 운동 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "圆弧运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1395,
-    "level": 5,
-    "en": {
-      "description": "Failed to full circle motion",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "整圆运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "円移動に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Kreis schließende Bewegung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo del movimiento circular completo",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось выполнить полное движение по кругу",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "원 운동 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "整圆运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1396,
-    "level": 5,
-    "en": {
-      "description": "Failed to move relative joint using tool coordinate system",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "沿工具坐标系相对关节运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツール座標系に沿った相対関節移動に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Relative Gelenkbewegung entlang des Werkzeugkoordinatensystems fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido realizar el movimiento de articulación relativo usando el sistema de coordenadas de la herramienta",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось выполнить относительное движение шарнира с использованием системы координат инструмента.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "도구 좌표계를 따른 상대적 조인트 운동 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "沿工具坐标系相对关节运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1397,
-    "level": 5,
-    "en": {
-      "description": "Failed to move relative linear using tool coordinate system",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "沿工具坐标系相对直线运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツール座標系に沿った相対直線移動に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Relative lineare Bewegung entlang des Werkzeugkoordinatensystems fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido realizar el movimiento lineal relativo usando el sistema de coordenadas de la herramienta",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось переместить относительно линейно с использованием системы координат инструмента.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "도구 좌표계를 따른 상대적 직선 운동 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "沿工具坐标系相对直线运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1398,
-    "level": 5,
-    "en": {
-      "description": "Failed to move relative joint using user coordinate system",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "沿用户坐标系相对关节运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ユーザ座標系に沿った相対関節移動に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Relative Gelenkbewegung entlang des Benutzerkoordinatensystems fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido mover la articulación relativa usando el sistema de coordenadas del usuario",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось выполнить относительное движение шарнира с использованием пользовательской системы координат.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "사용자 좌표계를 따른 상대적 조인트 운동 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "沿用户坐标系相对关节运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1399,
-    "level": 5,
-    "en": {
-      "description": "Failed to move relative linear using user coordinate system",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "沿用户坐标系相对直线运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ユーザ座標系に沿った相対直線移動に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Relative lineare Bewegung entlang des Benutzerkoordinatensystems fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo del movimiento lineal relativo usando el sistema de coordenadas del usuario",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось выполнить относительное линейное движение с использованием пользовательской системы координат.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "사용자 좌표계를 따른 상대적 직선 운동 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "沿用户坐标系相对直线运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1400,
-    "level": 5,
-    "en": {
-      "description": "Failed to Relative joint motion using joint coordinate system of each axis",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "沿各轴关节坐标系相对关节运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "各軸の関節座標系に沿った相対関節移動に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Relative Gelenkbewegung entlang jeder Achse des Gelenkkoordinatensystems fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo del movimiento de articulación relativo usando el sistema de coordenadas de articulación de cada eje",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось использовать относительное движение шарнира в системе координат всех осей шарнира.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "각 축 조인트 좌표계를 따른 상대적 조인트 운동 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "沿各轴关节坐标系相对关节运动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1401,
-    "level": 5,
-    "en": {
-      "description": "Failed to Cartesian point offset using user coordinate system",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "沿用户坐标系笛卡尔点位偏移失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ユーザー座標系に沿ったデカルト点位置の偏移に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Kartesische Punktverschiebung entlang des Benutzerkoordinatensystems fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo de desplazamiento del punto cartesiano usando el sistema de coordenadas del usuario",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка смещения декартовой точки при использовании пользовательской системы координат.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "사용자 좌표계를 따른 데카르트 포인트 위치 오프셋 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "沿用户坐标系笛卡尔点位偏移失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1402,
-    "level": 5,
-    "en": {
-      "description": "Failed to Cartesian point offset using tool coordinate system",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "沿工具坐标系笛卡尔点位偏移失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツール座標系に沿ったデカルト点位置の偏移に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Kartesische Punktverschiebung entlang des Werkzeugkoordinatensystems fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo de desplazamiento del punto cartesiano usando el sistema de coordenadas de la herramienta",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Смещение декартовой точки не удалось использовать в системе координат инструмента.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "도구 좌표계에 따른 데카르트 포인트 위치 오프셋 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "沿工具坐标系笛卡尔点位偏移失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1403,
-    "level": 5,
-    "en": {
-      "description": "Failed to detect whether the motion reaches the line position",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "检测是否运动到直线点位失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "直線点位置まで移動したかの確認に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Erkennung der Bewegung zu einem geraden Punkt fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido detectar si el movimiento alcanza la posición de línea",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось определить, достигает ли движение линейного положения.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "직선  포인트 위치까지의 이동 여부 감지 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "检测是否运动到直线点位失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1404,
-    "level": 5,
-    "en": {
-      "description": "Failed to detect whether the motion reaches the descartes position",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "检测是否运动到笛卡尔点位失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "デカルト点位置まで移動したかの確認に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Erkennung der Bewegung zur kartesischen Punktposition fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido detectar si el movimiento alcanza la posición cartesiana",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось определить, достигает ли движение декартовой позиции.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "디카르트 포인트 위치까지의 이동 여부 감지 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "检测是否运动到笛卡尔点位失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1406,
-    "level": 5,
-    "en": {
-      "description": "Algorithm startup timeout",
-      "cause": "",
-      "solution": "Check whether codesys starts abnormally"
-    },
-    "zh_CN": {
-      "description": "算法启动超时",
-      "cause": "",
-      "solution": "检查codesys启动是否异常"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "アルゴリズム起動タイムアウト",
-      "cause": "",
-      "solution": "codesys起動が異常かを確認"
-    },
-    "de": {
-      "description": "Zeitüberschreitung beim Start des Algorithmus",
-      "cause": "",
-      "solution": "Prüfung auf anormalen Start von codesys"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Tiempo de espera de inicio del algoritmo",
-      "cause": "",
-      "solution": "Compruebe si codesys se inicia de forma anómala"
-    },
-    "ru": {
-      "description": "Время ожидания запуска алгоритма",
-      "cause": "",
-      "solution": "Проверьте, не запускается ли codesys ненормально"
-    },
-    "ko": {
-      "description": "알고리즘 시작 시간 초과",
-      "cause": "",
-      "solution": "codesys 시작 이상 여부 확인"
-    },
-    "fr": {
-      "description": "算法启动超时",
-      "cause": "",
-      "solution": "检查codesys启动是否异常"
-    }
-  },
-  {
-    "id": 1407,
-    "level": 5,
-    "en": {
-      "description": "Algorithm communication abnormal",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "算法通讯异常",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "アルゴリズム通信異常",
-      "cause": "",
-      "solution": "ロボットを再起動し、そのエラーがなお出現する場合、システムエラーである可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Algorithmuskommunikation n.i.O.",
-      "cause": "",
-      "solution": "Starten Sie den Roboter erneut. Wenn der Fehler immer noch auftritt, kann es sich um einen Systemfehler handeln; wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de comunicación del algoritmo",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, puede ser un error del sistema; comuníquese con el ingeniero de soporte técnico."
-    },
-    "ru": {
-      "description": "Ошибка связи алгоритма",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, это системная ошибка. Обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "알고리즘 통신 이상",
-      "cause": "",
-      "solution": "로봇을 리부팅하고, 여전히 해당 오류가 발생하면 시스템 오류일 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "算法通讯异常",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1408,
-    "level": 1,
-    "en": {
-      "description": "The online status of axis 1 is abnormal",
-      "cause": "",
-      "solution": "Check whether the hardware is working properly, and restart the controller， or contact technical support engineer"
-    },
-    "zh_CN": {
-      "description": "轴1在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "軸1オンライン状態異常",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Online-Status von Achse 1 n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado en línea del eje 1 es anómalo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальный онлайн-статус оси 1",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "축1 온라인 상태 이상",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "轴1在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1409,
-    "level": 1,
-    "en": {
-      "description": "The online status of axis 2 is abnormal",
-      "cause": "",
-      "solution": "Check whether the hardware is working properly, and restart the controller， or contact technical support engineer"
-    },
-    "zh_CN": {
-      "description": "轴2在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "軸2オンライン状態異常",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Online-Status von Achse 2 n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado en línea del eje 2 es anómalo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальный онлайн-статус оси 2",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "축2 온라인 상태 이상",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "轴2在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1410,
-    "level": 1,
-    "en": {
-      "description": "The online status of axis 3 is abnormal",
-      "cause": "",
-      "solution": "Check whether the hardware is working properly, and restart the controller， or contact technical support engineer"
-    },
-    "zh_CN": {
-      "description": "轴3在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "軸3オンライン状態異常",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Online-Status von Achse 3 n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado en línea del eje 3 es anómalo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальный онлайн-статус оси 3",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "축3 온라인 상태 이상",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "轴3在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1411,
-    "level": 1,
-    "en": {
-      "description": "The online status of axis 4 is abnormal",
-      "cause": "",
-      "solution": "Check whether the hardware is working properly, and restart the controller， or contact technical support engineer"
-    },
-    "zh_CN": {
-      "description": "轴4在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "軸4オンライン状態異常",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Online-Status von Achse 4 n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado en línea del eje 4 es anómalo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальный онлайн-статус оси 4",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "축4 온라인 상태 이상",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "轴4在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1412,
-    "level": 1,
-    "en": {
-      "description": "The online status of axis 5 is abnormal",
-      "cause": "",
-      "solution": "Check whether the hardware is working properly, and restart the controller， or contact technical support engineer"
-    },
-    "zh_CN": {
-      "description": "轴5在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "軸5オンライン状態異常",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Online-Status von Achse 5 n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado en línea del eje 5 es anómalo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальный онлайн-статус оси 5",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "축5 온라인 상태 이상",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "轴5在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1413,
-    "level": 1,
-    "en": {
-      "description": "The online status of axis 6 is abnormal.",
-      "cause": "",
-      "solution": "Check whether the hardware is working properly, and restart the controller， or contact technical support engineer"
-    },
-    "zh_CN": {
-      "description": "轴6在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "軸6オンライン状態異常",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Online-Status von Achse 6 n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado en línea del eje 6 es anómalo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальный онлайн-статус оси 6",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "축6 온라인 상태 이상",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "轴6在线状态异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1414,
-    "level": 1,
-    "en": {
-      "description": "The online status of security I/O  is abnormal",
-      "cause": "",
-      "solution": "Check whether the hardware is working properly, and restart the controller， or contact technical support engineer"
-    },
-    "zh_CN": {
-      "description": "安全IO在线异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "安全IOオンライン異常",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Sicherheit IO Online n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado en línea de la E/S de seguridad es anómalo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальный онлайн-статус ввода-вывода безопасности",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "안전 IO 온라인 이상",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "安全IO在线异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1415,
-    "level": 1,
-    "en": {
-      "description": "The online status of universal I/O  is abnormal",
-      "cause": "",
-      "solution": "Check whether the hardware is working properly, and restart the controller， or contact technical support engineer"
-    },
-    "zh_CN": {
-      "description": "通用IO在线异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "一般IOオンライン異常",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Allgemeines IO Online n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado en línea de la E/S universal es anómalo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальный онлайн-статус универсального ввода-вывода",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "일반 IO 온라인 이상",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "通用IO在线异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1416,
-    "level": 1,
-    "en": {
-      "description": "The online status of energy feeder plate  is abnormal",
-      "cause": "",
-      "solution": "Check whether the hardware is working properly, and restart the controller， or contact technical support engineer"
-    },
-    "zh_CN": {
-      "description": "馈能板在线异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "エネルギー供給ボードのオンライン異常",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einspeisetafel Online n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado en línea de la placa de alimentación de energía es anómalo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальный онлайн-статус пластины подачи энергии",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "에너지 피더 보드 온라인 이상",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "馈能板在线异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1417,
-    "level": 1,
-    "en": {
-      "description": "The online status of end I/O  is abnormal",
-      "cause": "",
-      "solution": "Check whether the hardware is working properly, and restart the controller， or contact technical support engineer"
-    },
-    "zh_CN": {
-      "description": "末端IO在线异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツールIOオンライン異常",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Ende IO Online n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado en línea de la E/S de extremo es anómalo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальный онлайн-статус конечного ввода-вывода",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "끝단 IO 온라인 이상",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "末端IO在线异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1418,
-    "level": 5,
-    "en": {
-      "description": "Project file does not exist",
-      "cause": "",
-      "solution": "Check whether the project document is damaged or does not exist"
-    },
-    "zh_CN": {
-      "description": "工程文件不存在",
-      "cause": "",
-      "solution": "检查工程文件是否损毁或文件不存在"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "プロジェクトファイルが存在しません",
-      "cause": "",
-      "solution": "プロジェクトファイルが壊れているか、ファイルが存在しないかを確認します"
-    },
-    "de": {
-      "description": "Die Projektdatei existiert nicht",
-      "cause": "",
-      "solution": "Prüfung auf beschädigte oder nicht vorhandene Projektdateien"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El archivo de proyecto no existe",
-      "cause": "",
-      "solution": "Compruebe si el documento del proyecto está dañado o no existe"
-    },
-    "ru": {
-      "description": "Файл проекта не существует",
-      "cause": "",
-      "solution": "Проверьте: возможно, проектный документ поврежден или не существует."
-    },
-    "ko": {
-      "description": "프로젝트 파일이 존재하지 않음",
-      "cause": "",
-      "solution": "프로젝트 파일이 손상되었거나 존재하지 않는지 확인"
-    },
-    "fr": {
-      "description": "工程文件不存在",
-      "cause": "",
-      "solution": "检查工程文件是否损毁或文件不存在"
-    }
-  },
-  {
-    "id": 1419,
-    "level": 1,
-    "en": {
-      "description": "Robot Power off",
-      "cause": "",
-      "solution": "After the error is cleared and the device is powered on again, the normal operation can be resumed according to the program"
-    },
-    "zh_CN": {
-      "description": "机器人下电",
-      "cause": "",
-      "solution": "清除错误并重新上电后依程序可恢复正常操作"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット電源オフ",
-      "cause": "",
-      "solution": "エラーを消して、再度電源を入れた後、手順に従って正常操作に戻すことができます"
-    },
-    "de": {
-      "description": "Roboter abschalten",
-      "cause": "",
-      "solution": "Nach dem Löschen des Fehlers und dem erneuten Einschalten des Geräts kann der normale Betrieb gemäß dem Verfahren wieder aufgenommen werden."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El robot está apagado",
-      "cause": "",
-      "solution": "Una vez resuelto el error y encendido de nuevo el robot, se puede reanudar el funcionamiento normal"
-    },
-    "ru": {
-      "description": "Робот выключен",
-      "cause": "",
-      "solution": "После устранения ошибки и повторного включения робота может быть возобновлена нормальная работа."
-    },
-    "ko": {
-      "description": "로봇 전원 끄기",
-      "cause": "",
-      "solution": "오류를 처리하고 다시 전원을 켠 후 프로그램에 따라 정상 작업을 회복할 수 있습니다"
-    },
-    "fr": {
-      "description": "机器人下电",
-      "cause": "",
-      "solution": "清除错误并重新上电后依程序可恢复正常操作"
-    }
-  },
-  {
-    "id": 1420,
-    "level": 5,
-    "en": {
-      "description": "Jog Move Failed",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "点动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョグ失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Tippbetrieb fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo del desplazamiento por impulsos",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Толчковое перемещение не удалось",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "조그 이동 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "点动失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1421,
-    "level": 5,
-    "en": {
-      "description": "Failed to set drag sensitivity",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "设置拖拽灵敏度失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ドラッグ感度設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einstellung der Schleppempfindlichkeit fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer la sensibilidad de arrastre",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить чувствительность перетаскивания.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "드래그 감도 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "设置拖拽灵敏度失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1422,
-    "level": 5,
-    "en": {
-      "description": "The script running status is abnormal",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "脚本运行状态异常",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "スクリプトの実行状態異常",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Skriptlaufstatus n.i.O.",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado de ejecución de script es anómalo",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальный статус выполнения сценария",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "스크립트 실행 상태 이상",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "脚本运行状态异常",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1423,
-    "level": 5,
-    "en": {
-      "description": "The script running status is abnormal",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "开/关安全皮肤失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "安全スキン開/閉に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Sicherheitshaut EIN/AUS fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido activar/desactivar la piel de seguridad",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось активировать/деактивировать защитную оболочку.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "안전 스킨 ON/OFF 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "开/关安全皮肤失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1424,
-    "level": 5,
-    "en": {
-      "description": "The script running status is abnormal",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "设置安全皮肤灵敏度失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "安全スキン感度設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einstellung der Sicherheitshautsempfindlichkeit fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido establecer la sensibilidad de la piel de seguridad",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось установить чувствительность защитной оболочки.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "안전 스킨 감도 설정 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "设置安全皮肤灵敏度失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1425,
-    "level": 5,
-    "en": {
-      "description": "The script running status is abnormal",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "复位安全皮肤失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "安全スキンリセットに失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Zurücksetzen der Sicherheitshaut fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido restablecer la piel de seguridad",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось сбросить защитную оболочку.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "안전 스킨 리셋 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "复位安全皮肤失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1426,
-    "level": 5,
-    "en": {
-      "description": "The script running status is abnormal",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "安全皮肤硬复位失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "安全スキンハードリセットに失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Hartes Zurücksetzen der Sicherheitshaut fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se ha podido restablecer por completo la piel de seguridad",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Не удалось выполнить полный сброс защитной оболочки.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "안전 스킨 하드 리셋 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "安全皮肤硬复位失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1427,
-    "level": 5,
-    "en": {
-      "description": "Automatic load identification failed",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "负载自动辨识失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "負荷自動識別に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Automatische Lasterkennung fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo de la identificación automática de la carga",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Автоматическая идентификация нагрузки не удалась",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "부하 자동 인식 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "负载自动辨识失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1428,
-    "level": 5,
-    "en": {
-      "description": "Load check failure",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "负载检查失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "負荷検査に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Lastinspektion fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo de la comprobación de carga",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Проверка загрузки не удалась",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "부하 검사 실패",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "负载检查失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1429,
-    "level": 5,
-    "en": {
-      "description": "Wait for the run to stop timeout",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "等待运行停止超时",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "移動待機停止のタイムアウト",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Zeitüberschreitung beim Warten auf Laufstopp",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Tiempo de espera para que se detenga la ejecución",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Время ожидания остановки выполнения",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "실행 정지 대기 시간 초과",
-      "cause": "",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "等待运行停止超时",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1430,
-    "level": 0,
-    "en": {
-      "description": "Power off after emergency stop",
-      "cause": "After the emergency stop is triggered, the robot is powered off if it does not stop moving for 500ms",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "急停后下电",
-      "cause": "急停触发后500ms未停止运动，机器人下电",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "非常停止後に電源オフ",
-      "cause": "非常停止起動後500msで移動が停止せず、ロボットは電源オフ",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Abschalten nach Not-Aus",
-      "cause": "Der Roboter wird 500 ms nach Auslösen des Not-Aus-Zustands abgeschaltet, ohne die Bewegung zu stoppen.",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Apagado después de parada de emergencia",
-      "cause": "Una vez que se activa la parada de emergencia, el robot se apaga si no deja de moverse durante 500 ms.",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Отключение питания после аварийного останова",
-      "cause": "После срабатывания аварийного останова робот отключается, если он не прекращает движение в течение 500 мс.",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "긴급 정지 후 전원 끄기",
-      "cause": "긴급 정지 트리거 후 500ms 이내에 움직임이 멈추지 않으면 로봇 전원 꺼짐",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "急停后下电",
-      "cause": "急停触发后500ms未停止运动，机器人下电",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1431,
-    "level": 5,
-    "en": {
-      "description": "",
-      "cause": "Failed to compute the user coordinate system",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "",
-      "cause": "计算用户坐标系失败",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "ユーザー座標系の計算に失敗",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "",
-      "cause": "Berechnung des Benutzerkoordinatensystems fehlgeschlagen",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "",
-      "cause": "No se ha podido calcular el sistema de coordenadas del usuario",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "",
-      "cause": "Не удалось вычислить пользовательскую систему координат.",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "",
-      "cause": "사용자 좌표계 산출 실패",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "",
-      "cause": "计算用户坐标系失败",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1432,
-    "level": 5,
-    "en": {
-      "description": "Failed to compute the tool coordinate system",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "",
-      "cause": "计算工具坐标系失败",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "ツール座標系の計算に失敗",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "",
-      "cause": "Berechnung des Werkzeugkoordinatensystems fehlgeschlagen",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "",
-      "cause": "No se ha podido calcular el sistema de coordenadas de la herramienta",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "",
-      "cause": "Не удалось вычислить систему координат инструмента.",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "",
-      "cause": "도구 좌표계 산출 실패",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "",
-      "cause": "计算工具坐标系失败",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1433,
-    "level": 5,
-    "en": {
-      "description": "Safety skin obstacle avoidance function failed to open/close",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "",
-      "cause": "安全皮肤避障功能开启/关闭失败",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "安全スキン生涯回避機能起動/終了に失敗",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "",
-      "cause": "Hindernisausweichungsfunktion der  Sicherheitshaut EIN/AUS fehlgeschlagen",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "",
-      "cause": "No se ha podido activar/desactivar la función para evitar obstáculos de la piel de seguridad",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "",
-      "cause": "Не удалось включить/отключить функцию предотвращения препятствий на защитной оболочке.",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "",
-      "cause": "안전 스킨 장애물 회피 기능 활성화/비활성화 실패",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "",
-      "cause": "安全皮肤避障功能开启/关闭失败",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1434,
-    "level": 5,
-    "en": {
-      "description": "Safety skin obstacle avoidance parameters failed to be set",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "",
-      "cause": "安全皮肤避障参数设置失败",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "安全スキン障害回避パラメータの設定に失敗",
-      "solution": "再度試し、そのエラーがなお出現する場合、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "",
-      "cause": "Einstellung von Parametern zur Hindernisausweichung der Sicherheitshaut fehlgeschlagen",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "",
-      "cause": "No se han podido establecer los parámetros para evitar obstáculos de la piel de seguridad",
-      "solution": "Inténtelo de nuevo. Si el error persiste, comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "",
-      "cause": "Не удалось установить параметры обхода препятствий на защитной оболочке.",
-      "solution": "Повторите попытку. Если ошибка повторится, обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "",
-      "cause": "안전 스킨 장애물 회피 파라미터 설정 실패",
-      "solution": "다시 시도해 보고, 여전히 해당 오류가 발생하면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "",
-      "cause": "安全皮肤避障参数设置失败",
-      "solution": "重新尝试，如仍然出现该错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1435,
-    "level": 5,
-    "en": {
-      "description": "IPv4 address format error",
-      "cause": "",
-      "solution": "Fill in the correct IPv4 address"
-    },
-    "zh_CN": {
-      "description": "IPv4地址格式错误",
-      "cause": "IPv4地址格式错误",
-      "solution": "填写正确IPv4地址"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "IPv4アドレス形式エラー",
-      "cause": "IPv4アドレス形式エラー",
-      "solution": "正しいIPv4アドレスを入力します"
-    },
-    "de": {
-      "description": "IPv4-Adressformatfehler",
-      "cause": "IPv4-Adressformatfehler",
-      "solution": "Geben Sie die richtige IPv4-Adresse ein"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de formato de dirección IPv4",
-      "cause": "Error de formato de dirección IPv4",
-      "solution": "Rellene la dirección IPv4 correcta"
-    },
-    "ru": {
-      "description": "Ошибка формата адреса IPv4",
-      "cause": "Ошибка формата адреса IPv4",
-      "solution": "Введите правильный IPv4-адрес."
-    },
-    "ko": {
-      "description": "IPv4 주소 형식 오류",
-      "cause": "IPv4 주소 형식 오류",
-      "solution": "정확한 IPv4 주소를 입력하십시오"
-    },
-    "fr": {
-      "description": "IPv4地址格式错误",
-      "cause": "IPv4地址格式错误",
-      "solution": "填写正确IPv4地址"
-    }
-  },
-  {
-    "id": 1436,
-    "level": 5,
-    "en": {
-      "description": "IPv4 mask format error",
-      "cause": "",
-      "solution": "Fill in the correct IPv4 mask address"
-    },
-    "zh_CN": {
-      "description": "IPv4子网掩码格式错误",
-      "cause": "IPv4子网掩码格式错误",
-      "solution": "填写正确IPv4子网掩码地址"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "IPv4サブネットマスク形式エラー",
-      "cause": "IPv4サブネットマスク形式エラー",
-      "solution": "正しいIPv4サブネットマスクを入力します"
-    },
-    "de": {
-      "description": "IPv4-Subnetzmaskenformatfehler",
-      "cause": "IPv4-Subnetzmaskenformatfehler",
-      "solution": "Geben Sie die richtige IPv4-Subnetzmaskenadresse ein"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de formato de máscara IPv4",
-      "cause": "Error de formato de máscara IPv4",
-      "solution": "Rellene la dirección de máscara IPv4 correcta"
-    },
-    "ru": {
-      "description": "Ошибка формата маски IPv4",
-      "cause": "Ошибка формата маски IPv4",
-      "solution": "Введите правильный адрес маски IPv4."
-    },
-    "ko": {
-      "description": "IPv4 서브넷 마스크 형식 오류",
-      "cause": "IPv4 서브넷 마스크 형식 오류",
-      "solution": "정확한 IPv4 서브넷 마스크 주소를 입력하십시오"
-    },
-    "fr": {
-      "description": "IPv4子网掩码格式错误",
-      "cause": "IPv4子网掩码格式错误",
-      "solution": "填写正确IPv4子网掩码地址"
-    }
-  },
-  {
-    "id": 1437,
-    "level": 5,
-    "en": {
-      "description": "IPv4 default gateway format error",
-      "cause": "",
-      "solution": "Fill in the correct IPv4 gateway address"
-    },
-    "zh_CN": {
-      "description": "IPv4默认网关格式错误",
-      "cause": "IPv4默认网关格式错误",
-      "solution": "填写正确IPv4默认网关地址"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "IPv4デフォルトネットワーク形式エラー",
-      "cause": "IPv4デフォルトネットワーク形式エラー",
-      "solution": "正しいIPv4デフォルトネットワークを入力します"
-    },
-    "de": {
-      "description": "IPv4-Standard-Gateway-Formatfehler",
-      "cause": "IPv4-Standard-Gateway-Formatfehler",
-      "solution": "Geben Sie die korrekte IPv4-Standard-Gateway-Adresse ein"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de formato de puerta de enlace IPv4 por defecto",
-      "cause": "Error de formato de puerta de enlace IPv4 por defecto",
-      "solution": "Rellene la dirección de puerta de enlace IPv4 por defecto correcta"
-    },
-    "ru": {
-      "description": "Ошибка формата шлюза IPv4 по умолчанию",
-      "cause": "Ошибка формата шлюза IPv4 по умолчанию",
-      "solution": "Введите правильный адрес шлюза IPv4 по умолчанию."
-    },
-    "ko": {
-      "description": "IPv4 기본 게이트웨이 형식 오류",
-      "cause": "IPv4 기본 게이트웨이 형식 오류",
-      "solution": "정확한 IPv4 기본 게이트웨이 주소를 입력하십시오"
-    },
-    "fr": {
-      "description": "IPv4默认网关格式错误",
-      "cause": "IPv4默认网关格式错误",
-      "solution": "填写正确IPv4默认网关地址"
-    }
-  },
-  {
-    "id": 1438,
-    "level": 5,
-    "en": {
-      "description": "The system does not support profinet",
-      "cause": "",
-      "solution": "Flash the latest controller system"
-    },
-    "zh_CN": {
-      "description": "系统不支持profinet",
-      "cause": "系统不支持profinet",
-      "solution": "刷最新的控制器系统"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "システムはprofinetをサポートしていません",
-      "cause": "システムはprofinetをサポートしていません",
-      "solution": "最新のコントローラシステムを読み取ります"
-    },
-    "de": {
-      "description": "Das System unterstützt kein Profinet",
-      "cause": "Das System unterstützt kein Profinet",
-      "solution": "Mit dem neuesten Controller-System aktualisieren"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La Profinet no es compatible",
-      "cause": "La Profinet no es compatible",
-      "solution": "Actualice el sistema del controlador a la última versión"
-    },
-    "ru": {
-      "description": "Протокол Profinet не поддерживается",
-      "cause": "Протокол Profinet не поддерживается",
-      "solution": "Обновите систему контроллера до последней версии."
-    },
-    "ko": {
-      "description": "시스템은 profinet을 지원하지 않습니다",
-      "cause": "시스템은 profinet을 지원하지 않습니다",
-      "solution": "최신 컨트롤러 시스템으로 업데이트하십시오"
-    },
-    "fr": {
-      "description": "系统不支持profinet",
-      "cause": "系统不支持profinet",
-      "solution": "刷最新的控制器系统"
-    }
-  },
-  {
-    "id": 1439,
-    "level": 5,
-    "en": {
-      "description": "The trajectory reproduction movement to the first point does not support pause, the robot has stopped",
-      "cause": "collision or safeskin collision ",
-      "solution": "handle the exception and rerun"
-    },
-    "zh_CN": {
-      "description": "轨迹复现运动到第一个点不支持暂停，机器人已停止",
-      "cause": "可能是碰撞、皮肤碰撞",
-      "solution": "处理异常，重新运行"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "軌跡再現で第1点までの移動は一時停止をサポートしていません。ロボットは既に停止しています",
-      "cause": "衝突、スキン衝突の可能性があります",
-      "solution": "処理が異常です。再度移動します"
-    },
-    "de": {
-      "description": "Die Bewegung zur Spurwiedergabe zum ersten Punkt unterstützt keine Pause, der Roboter hat angehalten",
-      "cause": "Kann eine Kollision, eine Hautkollision sein",
-      "solution": "Behandlung von Anormalien und erneute Ausführung"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se admite la pausa para el movimiento de reproducción de trayectoria hasta el primer punto. El robot se ha detenido.",
-      "cause": "Colisión o colisión de la piel",
-      "solution": "Resuelva la excepción y vuelva a ejecutar"
-    },
-    "ru": {
-      "description": "При воспроизведении траектории движения до первой точки пауза не поддерживается. Робот остановился.",
-      "cause": "Столкновение с препятствием или с кожей",
-      "solution": "Устраните исключение и повторите запуск"
-    },
-    "ko": {
-      "description": "트랙 재현이 제1 포인트로 이동하는 것은 일시 정지가 지원되지 않으며, 로봇이 정지되었습니다",
-      "cause": "충돌이나 스킨 충돌이 있을 수 있습니다",
-      "solution": "이상 처리, 재실행"
-    },
-    "fr": {
-      "description": "轨迹复现运动到第一个点不支持暂停，机器人已停止",
-      "cause": "可能是碰撞、皮肤碰撞",
-      "solution": "处理异常，重新运行"
-    }
-  },
-  {
-    "id": 1440,
-    "level": 5,
-    "en": {
-      "description": "The temperature is too high, or the temperature control system cannot effectively control the temperature",
-      "cause": "Excessive ambient temperature or temperature control system malfunction",
-      "solution": "Reduce the working environment temperature or contact the manufacturer for technical support"
-    },
-    "zh_CN": {
-      "description": "温度过高，或温控系统无法有效控制温度",
-      "cause": "环境温度过高或温控系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "de": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La temperatura es demasiado alta o el sistema de control de temperatura no puede controlar eficazmente la temperatura",
-      "cause": "La temperatura ambiente es demasiado alta o el sistema de control de temperatura es anómalo",
-      "solution": "Reduzca la temperatura del entorno de trabajo o comuníquese con el fabricante para obtener soporte técnico"
-    },
-    "ru": {
-      "description": "Температура слишком высока или система контроля температуры не может эффективно контролировать температуру.",
-      "cause": "Температура окружающей среды слишком высокая или система контроля температуры неисправна.",
-      "solution": "Уменьшите температуру рабочей среды или обратитесь к производителю за технической поддержкой."
-    },
-    "ko": {
-      "description": "온도가 너무 높거나 온도 제어 시스템이 온도를 효과적으로 제어할 수 없습니다",
-      "cause": "환경의 온도가 너무 높거나 온도 제어 시스템에 오류가 있습니다",
-      "solution": "작업 환경의 온도를 낮추거나 제조업체에 기술 지원을 요청하십시오"
-    },
-    "fr": {
-      "description": "温度过高，或温控系统无法有效控制温度",
-      "cause": "环境温度过高或温控系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    }
-  },
-  {
-    "id": 1441,
-    "level": 5,
-    "en": {
-      "description": "Zero calibration failure",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "零点标定失败",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "de": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Fallo de la calibración cero",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, puede ser un error del sistema; comuníquese con el ingeniero de soporte técnico."
-    },
-    "ru": {
-      "description": "Калибровка нуля не удалась",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, это системная ошибка. Обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "영점 보정 실패",
-      "cause": "",
-      "solution": "로봇을 리부팅하고, 여전히 해당 오류가 발생하면 시스템 오류일 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "零点标定失败",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1442,
-    "level": 5,
-    "en": {
-      "description": "Failed to set jitter suppression parameters",
-      "cause": "The jitter suppression ratio parameter is not an int",
-      "solution": "Check the properties/suppressionConfig.json file format parameters are correct"
-    },
-    "zh_CN": {
-      "description": "设置抖动抑制参数失败",
-      "cause": "抖动抑制比例参数不为int值",
-      "solution": "检查properties/suppressionConfig.json文件参数格式是否正确"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジッタ抑制パラメータの設定に失敗",
-      "cause": "ジッダ抑制比例パラメータがint値ではありません",
-      "solution": "properties/suppressionConfig.jsonファイルパラメータ形式が正しいかを確認します"
-    },
-    "de": {
-      "description": "Einstellung der Parameter zur Jitterunterdrückung fehlgeschlagen",
-      "cause": "Der Parameter zum Jitterunterdrückungsverhältnis ist kein int-Wert",
-      "solution": "Überprüfen Sie, ob die Parameterformate der Datei properties/suppressionConfig.json richtig sind"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido establecer los parámetros de supresión de vibración",
-      "cause": "El parámetro de relación de supresión de vibración no es un int",
-      "solution": "Compruebe el formato del parámetro del archivo properties/suppressionConfig.json"
-    },
-    "ru": {
-      "description": "Не удалось установить параметры подавления дрожания.",
-      "cause": "Параметр коэффициента подавления дрожания не является целым числом.",
-      "solution": "Проверьте формат параметров файла properties/suppressionConfig.json."
-    },
-    "ko": {
-      "description": "떨림 억제 파라미터 설정 실패",
-      "cause": "떨림 억제 비율 파라미터가 int 값이 아닙니다",
-      "solution": "properties/suppressionConfig.json 파일 파라미터 형식이 올바른지 확인하십시오"
-    },
-    "fr": {
-      "description": "设置抖动抑制参数失败",
-      "cause": "抖动抑制比例参数不为int值",
-      "solution": "检查properties/suppressionConfig.json文件参数格式是否正确"
-    }
-  },
-  {
-    "id": 1443,
-    "level": 5,
-    "en": {
-      "description": "Failed to set vibration detection parameters",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "设置抖动测试参数失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジッタ測定パラメータの設定に失敗",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、システムエラーである可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Einstellung der Jitter-Testparameter fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, handelt es sich möglicherweise um einen Systemfehler. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido establecer los parámetros de prueba de vibración",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, puede ser un error del sistema; comuníquese con el ingeniero de soporte técnico."
-    },
-    "ru": {
-      "description": "Не удалось установить параметры теста дрожания.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка не устранена, возможно, это системная ошибка. Обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "떨림 테스트 파라미터 설정 실패",
-      "cause": "",
-      "solution": "다시 시도하십시오. 만약 여전히 해당 오류가 발생하면 시스템 오류일 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "设置抖动测试参数失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1444,
-    "level": 5,
-    "en": {
-      "description": "Description Failed to update security zone parameters",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "更新安全区域参数失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "セキュリティ領域パラメータの更新失敗です",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、システムエラーである可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Aktualisierung der parameter des sicherheitsbereichs fehlgeschlagen",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, handelt es sich möglicherweise um einen Systemfehler. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "No se han podido actualizar los parámetros de la zona de seguridad",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, puede ser un error del sistema; comuníquese con el ingeniero de soporte técnico."
-    },
-    "ru": {
-      "description": "Не удалось обновить параметры безопасной зоны.",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка не устранена, возможно, это системная ошибка. Обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "안전 영역 파라미터 업데이트 실패",
-      "cause": "",
-      "solution": "다시 시도하십시오. 만약 여전히 해당 오류가 발생하면 시스템 오류일 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "更新安全区域参数失败",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1445,
-    "level": 1,
-    "en": {
-      "description": "Joint 1 fieldbus lost synchronicity",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节1现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント1のフィールドバスの同期喪失",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、システムエラーである可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Synchronitätsverlust des Feldbusses bei Joint 1",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, handelt es sich möglicherweise um einen Systemfehler. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Se ha perdido la sincronización del bus de campo de la articulación 1",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, puede ser un error del sistema; comuníquese con el ingeniero de soporte técnico."
-    },
-    "ru": {
-      "description": "Потеряна синхронизация шарнира 1 с шиной управления",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка не устранена, возможно, это системная ошибка. Обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "조인트 1 필드 버스 동기화 손실",
-      "cause": "",
-      "solution": "다시 시도하십시오. 만약 여전히 해당 오류가 발생하면 시스템 오류일 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节1现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1446,
-    "level": 1,
-    "en": {
-      "description": "Joint 2 fieldbus lost synchronicity",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节2现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント2のフィールドバスの同期喪失",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、システムエラーである可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Synchronitätsverlust des Feldbusses bei Joint 2",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, handelt es sich möglicherweise um einen Systemfehler. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Se ha perdido la sincronización del bus de campo de la articulación 2",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, puede ser un error del sistema; comuníquese con el ingeniero de soporte técnico."
-    },
-    "ru": {
-      "description": "Потеряна синхронизация шарнира 2 с шиной управления",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка не устранена, возможно, это системная ошибка. Обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "조인트 2 필드 버스 동기화 손실",
-      "cause": "",
-      "solution": "다시 시도하십시오. 만약 여전히 해당 오류가 발생하면 시스템 오류일 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节2现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1447,
-    "level": 1,
-    "en": {
-      "description": "Joint 3 fieldbus lost synchronicity",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节3现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント3のフィールドバスの同期喪失",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、システムエラーである可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Synchronitätsverlust des Feldbusses bei Joint 3",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, handelt es sich möglicherweise um einen Systemfehler. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Se ha perdido la sincronización del bus de campo de la articulación 3",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, puede ser un error del sistema; comuníquese con el ingeniero de soporte técnico."
-    },
-    "ru": {
-      "description": "Потеряна синхронизация шарнира 3 с шиной управления",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка не устранена, возможно, это системная ошибка. Обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "조인트 3 필드 버스 동기화 손실",
-      "cause": "",
-      "solution": "다시 시도하십시오. 만약 여전히 해당 오류가 발생하면 시스템 오류일 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节3现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1448,
-    "level": 1,
-    "en": {
-      "description": "Joint 4 fieldbus lost synchronicity",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节4现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント4のフィールドバスの同期喪失",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、システムエラーである可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Synchronitätsverlust des Feldbusses bei Joint 4",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, handelt es sich möglicherweise um einen Systemfehler. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Se ha perdido la sincronización del bus de campo de la articulación 4",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, puede ser un error del sistema; comuníquese con el ingeniero de soporte técnico."
-    },
-    "ru": {
-      "description": "Потеряна синхронизация шарнира 4 с шиной управления",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка не устранена, возможно, это системная ошибка. Обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "조인트 4 필드 버스 동기화 손실",
-      "cause": "",
-      "solution": "다시 시도하십시오. 만약 여전히 해당 오류가 발생하면 시스템 오류일 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节4现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1449,
-    "level": 1,
-    "en": {
-      "description": "Joint 5 fieldbus lost synchronicity",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节5现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント5のフィールドバスの同期喪失",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、システムエラーである可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Synchronitätsverlust des Feldbusses bei Joint 5",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, handelt es sich möglicherweise um einen Systemfehler. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Se ha perdido la sincronización del bus de campo de la articulación 5",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, puede ser un error del sistema; comuníquese con el ingeniero de soporte técnico."
-    },
-    "ru": {
-      "description": "Потеряна синхронизация шарнира 5 с шиной управления",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка не устранена, возможно, это системная ошибка. Обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "조인트 5 필드 버스 동기화 손실",
-      "cause": "",
-      "solution": "다시 시도하십시오. 만약 여전히 해당 오류가 발생하면 시스템 오류일 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节5现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1450,
-    "level": 1,
-    "en": {
-      "description": "Joint 6 fieldbus lost synchronicity",
-      "cause": "",
-      "solution": "Try again. If the error persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节6现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント6のフィールドバスの同期喪失",
-      "cause": "",
-      "solution": "再度試し、そのエラーがなお出現する場合、システムエラーである可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Synchronitätsverlust des Feldbusses bei Joint 6",
-      "cause": "",
-      "solution": "Versuchen Sie es erneut. Wenn der Fehler weiterhin auftritt, handelt es sich möglicherweise um einen Systemfehler. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Se ha perdido la sincronización del bus de campo de la articulación 6",
-      "cause": "",
-      "solution": "Inténtelo de nuevo. Si el error persiste, puede ser un error del sistema; comuníquese con el ingeniero de soporte técnico."
-    },
-    "ru": {
-      "description": "Потеряна синхронизация шарнира 6 с шиной управления",
-      "cause": "",
-      "solution": "Повторите попытку. Если ошибка не устранена, возможно, это системная ошибка. Обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "조인트 6 필드 버스 동기화 손실",
-      "cause": "",
-      "solution": "다시 시도하십시오. 만약 여전히 해당 오류가 발생하면 시스템 오류일 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节6现场总线同步性丢失",
-      "cause": "",
-      "solution": "重新尝试，如仍然出现该错误，则可能是系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1451,
-    "level": 5,
-    "en": {
-      "description": "Joint 1 temperature is too high",
-      "cause": "The ambient temperature is too high or there is a system failure",
-      "solution": "Reduce the working environment temperature or contact the manufacturer for technical support"
-    },
-    "zh_CN": {
-      "description": "关节1温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント1の温度が高すぎます",
-      "cause": "周囲温度が高すぎるか、システムに障害があります",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "de": {
-      "description": "Die Temperatur von Gelenk 1 ist zu hoch",
-      "cause": "Die Umgebungstemperatur ist zu hoch oder es liegt ein Systemfehler vor",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La temperatura de la articulación 1 es demasiado alta",
-      "cause": "La temperatura ambiente es demasiado alta o el sistema es anómalo",
-      "solution": "Reduzca la temperatura del entorno de trabajo o comuníquese con el fabricante para obtener soporte técnico"
-    },
-    "ru": {
-      "description": "Слишком высокая температура шарнира 1",
-      "cause": "Слишком высокая температура окружающей среды или система неисправна.",
-      "solution": "Уменьшите температуру рабочей среды или обратитесь к производителю за технической поддержкой."
-    },
-    "ko": {
-      "description": "조인트1의 온도가 너무 높습니다",
-      "cause": "환경 온도가 너무 높거나 시스템 오류가 있습니다",
-      "solution": "작업 환경의 온도를 낮추거나 제조업체에 기술 지원을 요청하십시오"
-    },
-    "fr": {
-      "description": "关节1温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    }
-  },
-  {
-    "id": 1452,
-    "level": 5,
-    "en": {
-      "description": "Joint 2 temperature is too high",
-      "cause": "The ambient temperature is too high or there is a system failure",
-      "solution": "Reduce the working environment temperature or contact the manufacturer for technical support"
-    },
-    "zh_CN": {
-      "description": "关节2温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント2の温度が高すぎます",
-      "cause": "周囲温度が高すぎるか、システムに障害があります",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "de": {
-      "description": "Die Temperatur von Gelenk 2 ist zu hoch",
-      "cause": "Die Umgebungstemperatur ist zu hoch oder es liegt ein Systemfehler vor",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La temperatura de la articulación 2 es demasiado alta",
-      "cause": "La temperatura ambiente es demasiado alta o el sistema es anómalo",
-      "solution": "Reduzca la temperatura del entorno de trabajo o comuníquese con el fabricante para obtener soporte técnico"
-    },
-    "ru": {
-      "description": "Слишком высокая температура шарнира 2",
-      "cause": "Слишком высокая температура окружающей среды или система неисправна.",
-      "solution": "Уменьшите температуру рабочей среды или обратитесь к производителю за технической поддержкой."
-    },
-    "ko": {
-      "description": "조인트2의 온도가 너무 높습니다",
-      "cause": "환경 온도가 너무 높거나 시스템 오류가 있습니다",
-      "solution": "작업 환경의 온도를 낮추거나 제조업체에 기술 지원을 요청하십시오"
-    },
-    "fr": {
-      "description": "关节2温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    }
-  },
-  {
-    "id": 1453,
-    "level": 5,
-    "en": {
-      "description": "Joint 3 temperature is too high",
-      "cause": "The ambient temperature is too high or there is a system failure",
-      "solution": "Reduce the working environment temperature or contact the manufacturer for technical support"
-    },
-    "zh_CN": {
-      "description": "关节3温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント3の温度が高すぎます",
-      "cause": "周囲温度が高すぎるか、システムに障害があります",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "de": {
-      "description": "Die Temperatur von Gelenk 3 ist zu hoch",
-      "cause": "Die Umgebungstemperatur ist zu hoch oder es liegt ein Systemfehler vor",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La temperatura de la articulación 3 es demasiado alta",
-      "cause": "La temperatura ambiente es demasiado alta o el sistema es anómalo",
-      "solution": "Reduzca la temperatura del entorno de trabajo o comuníquese con el fabricante para obtener soporte técnico"
-    },
-    "ru": {
-      "description": "Слишком высокая температура шарнира 3",
-      "cause": "Слишком высокая температура окружающей среды или система неисправна.",
-      "solution": "Уменьшите температуру рабочей среды или обратитесь к производителю за технической поддержкой."
-    },
-    "ko": {
-      "description": "조인트3의 온도가 너무 높습니다",
-      "cause": "환경 온도가 너무 높거나 시스템 오류가 있습니다",
-      "solution": "작업 환경의 온도를 낮추거나 제조업체에 기술 지원을 요청하십시오"
-    },
-    "fr": {
-      "description": "关节3温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    }
-  },
-  {
-    "id": 1454,
-    "level": 5,
-    "en": {
-      "description": "Joint 4 temperature is too high",
-      "cause": "The ambient temperature is too high or there is a system failure",
-      "solution": "Reduce the working environment temperature or contact the manufacturer for technical support"
-    },
-    "zh_CN": {
-      "description": "关节4温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント4の温度が高すぎます",
-      "cause": "周囲温度が高すぎるか、システムに障害があります",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "de": {
-      "description": "Die Temperatur von Gelenk 4 ist zu hoch",
-      "cause": "Die Umgebungstemperatur ist zu hoch oder es liegt ein Systemfehler vor",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La temperatura de la articulación 4 es demasiado alta",
-      "cause": "La temperatura ambiente es demasiado alta o el sistema es anómalo",
-      "solution": "Reduzca la temperatura del entorno de trabajo o comuníquese con el fabricante para obtener soporte técnico"
-    },
-    "ru": {
-      "description": "Слишком высокая температура шарнира 4",
-      "cause": "Слишком высокая температура окружающей среды или система неисправна.",
-      "solution": "Уменьшите температуру рабочей среды или обратитесь к производителю за технической поддержкой."
-    },
-    "ko": {
-      "description": "조인트4의 온도가 너무 높습니다",
-      "cause": "환경 온도가 너무 높거나 시스템 오류가 있습니다",
-      "solution": "작업 환경의 온도를 낮추거나 제조업체에 기술 지원을 요청하십시오"
-    },
-    "fr": {
-      "description": "关节4温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    }
-  },
-  {
-    "id": 1455,
-    "level": 5,
-    "en": {
-      "description": "Joint 5 temperature is too high",
-      "cause": "The ambient temperature is too high or there is a system failure",
-      "solution": "Reduce the working environment temperature or contact the manufacturer for technical support"
-    },
-    "zh_CN": {
-      "description": "关节5温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント5の温度が高すぎます",
-      "cause": "周囲温度が高すぎるか、システムに障害があります",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "de": {
-      "description": "Die Temperatur von Gelenk 5 ist zu hoch",
-      "cause": "Die Umgebungstemperatur ist zu hoch oder es liegt ein Systemfehler vor",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La temperatura de la articulación 5 es demasiado alta",
-      "cause": "La temperatura ambiente es demasiado alta o el sistema es anómalo",
-      "solution": "Reduzca la temperatura del entorno de trabajo o comuníquese con el fabricante para obtener soporte técnico"
-    },
-    "ru": {
-      "description": "Слишком высокая температура шарнира 5",
-      "cause": "Слишком высокая температура окружающей среды или система неисправна.",
-      "solution": "Уменьшите температуру рабочей среды или обратитесь к производителю за технической поддержкой."
-    },
-    "ko": {
-      "description": "조인트5의 온도가 너무 높습니다",
-      "cause": "환경 온도가 너무 높거나 시스템 오류가 있습니다",
-      "solution": "작업 환경의 온도를 낮추거나 제조업체에 기술 지원을 요청하십시오"
-    },
-    "fr": {
-      "description": "关节5温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    }
-  },
-  {
-    "id": 1456,
-    "level": 5,
-    "en": {
-      "description": "Joint 6 temperature is too high",
-      "cause": "The ambient temperature is too high or there is a system failure.",
-      "solution": "Reduce the working environment temperature or contact the manufacturer for technical support."
-    },
-    "zh_CN": {
-      "description": "关节6温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ジョイント6の温度が高すぎます",
-      "cause": "周囲温度が高すぎるか、システムに障害があります",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "de": {
-      "description": "Die Temperatur von Gelenk 6 ist zu hoch",
-      "cause": "Die Umgebungstemperatur ist zu hoch oder es liegt ein Systemfehler vor",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La temperatura de la articulación 6 es demasiado alta",
-      "cause": "La temperatura ambiente es demasiado alta o el sistema es anómalo",
-      "solution": "Reduzca la temperatura del entorno de trabajo o comuníquese con el fabricante para obtener soporte técnico"
-    },
-    "ru": {
-      "description": "Слишком высокая температура шарнира 6",
-      "cause": "Слишком высокая температура окружающей среды или система неисправна.",
-      "solution": "Уменьшите температуру рабочей среды или обратитесь к производителю за технической поддержкой."
-    },
-    "ko": {
-      "description": "조인트6의 온도가 너무 높습니다",
-      "cause": "환경 온도가 너무 높거나 시스템 오류가 있습니다",
-      "solution": "작업 환경의 온도를 낮추거나 제조업체에 기술 지원을 요청하십시오"
-    },
-    "fr": {
-      "description": "关节6温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    }
-  },
-  {
-    "id": 1457,
-    "level": 5,
-    "en": {
-      "description": "The temperature of the main control chip is too high",
-      "cause": "The ambient temperature is too high or there is a system failure",
-      "solution": "Reduce the working environment temperature or contact the manufacturer for technical support"
-    },
-    "zh_CN": {
-      "description": "主控芯片温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "メインコントロールチップの温度が高すぎます",
-      "cause": "周囲温度が高すぎるか、システムに障害があります",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "de": {
-      "description": "Die Temperatur des Hauptsteuerungschips ist zu hoch",
-      "cause": "Die Umgebungstemperatur ist zu hoch oder es liegt ein Systemfehler vor",
-      "solution": "作業環境の温度を下げるか、メーカーに技術サポートを依頼してください"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La temperatura del chip de control principal es demasiado alta",
-      "cause": "La temperatura ambiente es demasiado alta o el sistema es anómalo",
-      "solution": "Reduzca la temperatura del entorno de trabajo o comuníquese con el fabricante para obtener soporte técnico"
-    },
-    "ru": {
-      "description": "Слишком высокая температура основного чипа управления",
-      "cause": "Слишком высокая температура окружающей среды или система неисправна.",
-      "solution": "Уменьшите температуру рабочей среды или обратитесь к производителю за технической поддержкой."
-    },
-    "ko": {
-      "description": "주 제어 칩 온도가 너무 높습니다",
-      "cause": "환경 온도가 너무 높거나 시스템 오류가 있습니다",
-      "solution": "작업 환경의 온도를 낮추거나 제조업체에 기술 지원을 요청하십시오"
-    },
-    "fr": {
-      "description": "主控芯片温度过高",
-      "cause": "环境温度过高或系统故障",
-      "solution": "降低工作环境温度或联系厂商提供技术支持"
-    }
-  },
-  {
-    "id": 1458,
-    "level": 5,
-    "en": {
-      "description": "User coordinate system not enabled",
-      "cause": "The designated user coordinate system is not enabled",
-      "solution": "Use the correct coordinate system index or add and set a new user coordinate system"
-    },
-    "zh_CN": {
-      "description": "用户坐标系未启用",
-      "cause": "设定的用户坐标系未启用",
-      "solution": "使用正确的坐标系索引或新增加设定用户坐标系"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ユーザー座標系は有効化されていません",
-      "cause": "指定されたユーザー座標系は有効化されていません",
-      "solution": "正しい座標系インデックスを使用するか、新しいユーザー座標系を追加して設定してください"
-    },
-    "de": {
-      "description": "Benutzerkoordinatensystem nicht aktiviert",
-      "cause": "Das festgelegte Benutzerkoordinatensystem ist nicht aktiviert",
-      "solution": "Verwenden Sie den richtigen Koordinatensystemindex oder fügen Sie ein neues Benutzerkoordinatensystem hinzu und setzen Sie es"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Sistema de coordenadas del usuario no activado",
-      "cause": "El sistema de coordenadas del usuario designado no está activado",
-      "solution": "Utilice el índice del sistema de coordenadas correcto o añada y establezca un nuevo sistema de coordenadas del usuario"
-    },
-    "ru": {
-      "description": "Пользовательская система координат не включена",
-      "cause": "Назначенная пользовательская система координат не включена.",
-      "solution": "Используйте правильный индекс системы координат или добавьте и установите новую пользовательскую систему координат."
-    },
-    "ko": {
-      "description": "사용자 좌표계가 활성화되지 않았습니다",
-      "cause": "설정된 사용자 좌표계가 활성화되지 않았습니다",
-      "solution": "올바른 좌표계 인덱스를 사용하거나 사용자 좌표계를 새로 추가 설정하십시오"
-    },
-    "fr": {
-      "description": "用户坐标系未启用",
-      "cause": "设定的用户坐标系未启用",
-      "solution": "使用正确的坐标系索引或新增加设定用户坐标系"
-    }
-  },
-  {
-    "id": 1459,
-    "level": 5,
-    "en": {
-      "description": "Tool coordinate system not enabled",
-      "cause": "The designated tool coordinate system is not enabled",
-      "solution": "Use the correct coordinate system index or add and set a new tool coordinate system"
-    },
-    "zh_CN": {
-      "description": "工具坐标系未启用",
-      "cause": "设定的工具坐标系未启用",
-      "solution": "使用正确的坐标系索引或新增加设定工具坐标系"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "工具座標系は有効化されていません",
-      "cause": "指定された工具座標系は有効化されていません",
-      "solution": "正しい座標系インデックスを使用するか、新しい工具座標系を追加して設定してください"
-    },
-    "de": {
-      "description": "Werkzeugkoordinatensystem nicht aktivier",
-      "cause": "Das festgelegte Werkzeugkoordinatensystem ist nicht aktiviert",
-      "solution": "Verwenden Sie den richtigen Koordinatensystemindex oder fügen Sie ein neues Werkzeugkoordinatensystem hinzu und setzen Sie es"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Sistema de coordenadas de la herramienta no activado",
-      "cause": "El sistema de coordenadas de la herramienta designada no está activado",
-      "solution": "Utilice el índice del sistema de coordenadas correcto o añada y establezca un nuevo sistema de coordenadas de la herramienta"
-    },
-    "ru": {
-      "description": "Система координат инструмента не включена",
-      "cause": "Назначенная система координат инструмента не включена",
-      "solution": "Используйте правильный индекс системы координат или добавьте и установите новую систему координат инструмента."
-    },
-    "ko": {
-      "description": "도구 좌표계가 활성화되지 않았습니다",
-      "cause": "설정된 도구 좌표계가 활성화되지 않았습니다",
-      "solution": "올바른 좌표계 인덱스를 사용하거나 도구 좌표계를 새로 추가 설정하십시오"
-    },
-    "fr": {
-      "description": "工具坐标系未启用",
-      "cause": "设定的工具坐标系未启用",
-      "solution": "使用正确的坐标系索引或新增加设定工具坐标系"
-    }
-  },
-  {
-    "id": 1538,
-    "level": 1,
-    "en": {
-      "description": "The AC contactor was not closed as required for 2 consecutive seconds",
-      "cause": "",
-      "solution": "Restart the robot. If the error persists, the hardware may be damaged. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "交流接触器连续2s没有按要求闭合",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "交流接触器が連続2s要求に従って閉じない",
-      "cause": "",
-      "solution": "ロボットを再起動し、そのエラーがなお出現する場合、ハードが損傷している可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "AC-Schütz schließt nicht wie erforderlich für 2Sek. ununterbrochen",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu. Wenn der Fehler weiterhin auftritt, ist möglicherweise die Hardware beschädigt. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El contactor de CA no se cerró como se necesitaba durante 2 segundos consecutivos",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, es posible que el hardware resulte dañado. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Контактор переменного тока не был замкнут должным образом в течение 2 секунд подряд.",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, оборудование повреждено. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "AC 접촉기가 연속으로 2초 동안 요구 사항에 따라 닫히지 않음",
-      "cause": "",
-      "solution": "로봇을 재부팅하십시오. 만약 여전히 해당 오류가 발생한다면 하드웨어가 손상되었을 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "交流接触器连续2s没有按要求闭合",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1540,
-    "level": 1,
-    "en": {
-      "description": "Data of the feedback board is not updated",
-      "cause": "",
-      "solution": "Restart the robot. If the error persists, the hardware may be damaged. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "上电5分钟后，online数据持续1min没更新",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "電源オンから5分後、onlineデータが1min連続で更新されない",
-      "cause": "",
-      "solution": "ロボットを再起動し、そのエラーがなお出現する場合、ハードが損傷している可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Nach 5 Minuten nach dem Einschalten werden die Online-Daten für 1 Minute nicht aktualisiert.",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu. Wenn der Fehler weiterhin auftritt, ist möglicherweise die Hardware beschädigt. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Los datos en línea no se actualizan durante 1 minuto después de 5 minutos de encendido",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, es posible que el hardware resulte dañado. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Онлайн-данные не обновляются в течение 1 минуты после подачи питания в течение 5 минут.",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, оборудование повреждено. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "전원 공급 5분 후, 온라인 데이터가 1분 동안 업데이트되지 않음",
-      "cause": "",
-      "solution": "로봇을 재부팅하십시오. 만약 여전히 해당 오류가 발생한다면 하드웨어가 손상되었을 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "上电5分钟后，online数据持续1min没更新",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1541,
-    "level": 1,
-    "en": {
-      "description": "The AC status detection is incorrect",
-      "cause": "",
-      "solution": "Restart the robot. If the error persists, the hardware may be damaged. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "AC状态检测错误",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "AC状態検査エラー",
-      "cause": "",
-      "solution": "ロボットを再起動し、そのエラーがなお出現する場合、ハードが損傷している可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Fehler bei der Erkennung des AC-Status",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu. Wenn der Fehler weiterhin auftritt, ist möglicherweise die Hardware beschädigt. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La detección del estado de CA es incorrecta",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, es posible que el hardware resulte dañado. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Определение состояния переменного тока неверно",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, оборудование повреждено. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "AC 상태 오류 감지",
-      "cause": "",
-      "solution": "로봇을 재부팅하십시오. 만약 여전히 해당 오류가 발생한다면 하드웨어가 손상되었을 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "AC状态检测错误",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1543,
-    "level": 0,
-    "en": {
-      "description": "The panel switch is pushed down",
-      "cause": "",
-      "solution": "Clear the alarm and power on the device"
-    },
-    "zh_CN": {
-      "description": "面板开关被按下",
-      "cause": "",
-      "solution": "清除报警，并重新上电"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "パネルスイッチが押されています",
-      "cause": "",
-      "solution": "アラームを消して、再度電源をオンにします"
-    },
-    "de": {
-      "description": "Bedienfeldschalter wird gedrückt",
-      "cause": "",
-      "solution": "Quittieren Sie den Alarm und schalten Sie die Stromversorgung wieder ein."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El conmutador del panel está presionado hacia abajo",
-      "cause": "",
-      "solution": "Borre la alarma y vuelva a encender"
-    },
-    "ru": {
-      "description": "Переключатель панели нажат",
-      "cause": "",
-      "solution": "Сбросьте сигнал тревоги и снова включите питание."
-    },
-    "ko": {
-      "description": "패널 스위치 눌림",
-      "cause": "",
-      "solution": "경보를 처리하고 다시 전원을 켜십시오"
-    },
-    "fr": {
-      "description": "面板开关被按下",
-      "cause": "",
-      "solution": "清除报警，并重新上电"
-    }
-  },
-  {
-    "id": 1544,
-    "level": 1,
-    "en": {
-      "description": "The energy feeder is offline",
-      "cause": "",
-      "solution": "Restart the robot. If the error persists, the hardware may be damaged. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "馈能板掉线",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "エネルギー供給ボードが切断されました",
-      "cause": "",
-      "solution": "ロボットを再起動し、そのエラーがなお出現する場合、ハードが損傷している可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Ausfall der Einspeisetafel",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu. Wenn der Fehler weiterhin auftritt, ist möglicherweise die Hardware beschädigt. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La placa de alimentación de energía está fuera de línea",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, es posible que el hardware resulte dañado. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Пластина подачи энергии отключена",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, оборудование повреждено. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "피드 보드 오프라인",
-      "cause": "",
-      "solution": "로봇을 재부팅하십시오. 만약 여전히 해당 오류가 발생한다면 하드웨어가 손상되었을 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "馈能板掉线",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1548,
-    "level": 0,
-    "en": {
-      "description": "The status of the 24V supercapacitor is abnormal",
-      "cause": "",
-      "solution": "Restart the robot. If the error persists, the hardware may be damaged. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "24V超级电容状态检测异常",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "24Vスーパーキャパシタの状態検査異常",
-      "cause": "",
-      "solution": "ロボットを再起動し、そのエラーがなお出現する場合、ハードが損傷している可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Statuserkennung des 24V-Superkondensators n.i.O.",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu. Wenn der Fehler weiterhin auftritt, ist möglicherweise die Hardware beschädigt. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado del supercondensador de 24 V es anómalo",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, es posible que el hardware resulte dañado. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальное состояние ионистора 24 В.",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, оборудование повреждено. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "24V 슈퍼 커패시터 상태 이상 감지",
-      "cause": "",
-      "solution": "로봇을 재부팅하십시오. 만약 여전히 해당 오류가 발생한다면 하드웨어가 손상되었을 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "24V超级电容状态检测异常",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1549,
-    "level": 0,
-    "en": {
-      "description": "The status of the 48V supercapacitor is abnormal",
-      "cause": "",
-      "solution": "Restart the robot. If the error persists, the hardware may be damaged. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "48V超级电容状态检测异常",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "48Vスーパーキャパシタの状態検査異常",
-      "cause": "",
-      "solution": "ロボットを再起動し、そのエラーがなお出現する場合、ハードが損傷している可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Statuserkennung des 48V-Superkondensators n.i.O.",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu. Wenn der Fehler weiterhin auftritt, ist möglicherweise die Hardware beschädigt. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El estado del supercondensador de 48 V es anómalo",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, es posible que el hardware resulte dañado. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальное состояние ионистора 48 В.",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, оборудование повреждено. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "48V 슈퍼 커패시터 상태 이상 감지",
-      "cause": "",
-      "solution": "로봇을 재부팅하십시오. 만약 여전히 해당 오류가 발생한다면 하드웨어가 손상되었을 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "48V超级电容状态检测异常",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1792,
-    "level": 1,
-    "en": {
-      "description": "Input voltage monitoring overvoltage alarm",
-      "cause": "",
-      "solution": "Restart the robot. If the error persists, the hardware may be damaged. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "输入电压监测过压报警",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "入力電圧監視過電圧アラーム",
-      "cause": "",
-      "solution": "ロボットを再起動し、そのエラーがなお出現する場合、ハードが損傷している可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überspannungsalarm der Eingangsspannungsüberwachung",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu. Wenn der Fehler weiterhin auftritt, ist möglicherweise die Hardware beschädigt. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobretensión de supervisión del voltaje de entrada",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, es posible que el hardware resulte dañado. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Контроль входного напряжения, сигнализация о перенапряжении",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, оборудование повреждено. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "입력 전압 과전압 경보 모니터링",
-      "cause": "",
-      "solution": "로봇을 재부팅하십시오. 만약 여전히 해당 오류가 발생한다면 하드웨어가 손상되었을 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "输入电压监测过压报警",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1793,
-    "level": 1,
-    "en": {
-      "description": "Input voltage monitoring undervoltage alarm",
-      "cause": "",
-      "solution": "Restart the robot. If the error persists, the hardware may be damaged. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "输入电压监测欠压报警",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "入力電圧監視電圧不足アラーム",
-      "cause": "",
-      "solution": "ロボットを再起動し、そのエラーがなお出現する場合、ハードが損傷している可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Unterspannungsalarm der Eingangsspannungsüberwachung",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu. Wenn der Fehler weiterhin auftritt, ist möglicherweise die Hardware beschädigt. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de subtensión de supervisión del voltaje de entrada",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, es posible que el hardware resulte dañado. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Контроль входного напряжения, сигнализация пониженного напряжения",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, оборудование повреждено. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "입력 전압 저전압 경보 모니터링",
-      "cause": "",
-      "solution": "로봇을 재부팅하십시오. 만약 여전히 해당 오류가 발생한다면 하드웨어가 손상되었을 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "输入电压监测欠压报警",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1794,
-    "level": 1,
-    "en": {
-      "description": "The power current limiting chip detects an abnormal alarm",
-      "cause": "",
-      "solution": "Restart the robot. If the error persists, the hardware may be damaged. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "电源限流芯片检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "電源制限チップ検査異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Erkennung des Strombegrenzung-Chips n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por detección anómala en el chip limitador de corriente de alimentación",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнал тревоги сработал из-за аномального обнаружения в микросхеме ограничения тока мощности.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "전원 전류 제한 칩 이상 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "电源限流芯片检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1795,
-    "level": 1,
-    "en": {
-      "description": "Output voltage detection overvoltage alarm",
-      "cause": "",
-      "solution": "Restart the robot. If the error persists, the hardware may be damaged. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "输出电压检测过压报警",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "出力電圧監視過電圧アラーム",
-      "cause": "",
-      "solution": "ロボットを再起動し、そのエラーがなお出現する場合、ハードが損傷している可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überspannungsalarm der Ausgangsspannungserkennung",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu. Wenn der Fehler weiterhin auftritt, ist möglicherweise die Hardware beschädigt. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobretensión de detección del voltaje de salida",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, es posible que el hardware resulte dañado. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Обнаружение выходного напряжения, сигнализация о перенапряжении",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, оборудование повреждено. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "출력 전압 과전압 경보 감지",
-      "cause": "",
-      "solution": "로봇을 재부팅하십시오. 만약 여전히 해당 오류가 발생한다면 하드웨어가 손상되었을 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "输出电压检测过压报警",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1796,
-    "level": 1,
-    "en": {
-      "description": "Output voltage detection undervoltage alarm",
-      "cause": "",
-      "solution": "Restart the robot. If the error persists, the hardware may be damaged. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "输出电压检测欠压报警",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "出力電圧監視電圧不足アラーム",
-      "cause": "",
-      "solution": "ロボットを再起動し、そのエラーがなお出現する場合、ハードが損傷している可能性があるので、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Unterspannungsalarm der Ausgangsspannungserkennung",
-      "cause": "",
-      "solution": "Starten Sie den Roboter neu. Wenn der Fehler weiterhin auftritt, ist möglicherweise die Hardware beschädigt. Bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de subtensión de detección del voltaje de salida",
-      "cause": "",
-      "solution": "Reinicie el robot. Si el error persiste, es posible que el hardware resulte dañado. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация пониженного напряжения при обнаружении выходного напряжения",
-      "cause": "",
-      "solution": "Перезапустите робота. Если ошибка не устранена, возможно, оборудование повреждено. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "출력 전압 저전압 경보 감지",
-      "cause": "",
-      "solution": "로봇을 재부팅하십시오. 만약 여전히 해당 오류가 발생한다면 하드웨어가 손상되었을 수 있으므로 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "输出电压检测欠压报警",
-      "cause": "",
-      "solution": "重启机器人，如仍然出现该错误，则可能是硬件损坏，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1797,
-    "level": 1,
-    "en": {
-      "description": "Internal first line voltage regulator abnormal alarm",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "内部第一路稳压值异常报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "内部第1安定電圧値の異常アラーム",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Spannungsstabilisierungswert des ersten internen Kanals n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por un valor anómalo del regulador de voltaje del primer circuito interno",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнал тревоги сработал из-за аномального значения внутреннего регулятора напряжения первого контура.",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "내부 제1 로드 안정값 이상 경보",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "内部第一路稳压值异常报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1798,
-    "level": 1,
-    "en": {
-      "description": "Internal second voltage regulator abnormal alarm",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "内部第二路稳压值异常报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "内部第2安定電圧値の異常アラーム",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Spannungsstabilisierungswert des zweiten internen Kanals n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por un valor anómalo del regulador de voltaje del segundo circuito interno",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация сработала из-за аномального значения внутреннего регулятора напряжения второго контура.",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "내부 제2 로드 안정값 이상 경보",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "内部第二路稳压值异常报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1799,
-    "level": 0,
-    "en": {
-      "description": "The output voltage is abnormal before slow start on the body",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "本体上电缓启动前输出电压异常报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "本体の電源をオンにして起動前の出力電圧異常アラーム",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Ausgangsspannung vor dem langsamen Start des Grundkörpers n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por voltaje de salida anómalo antes del inicio lento del encendido principal",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги из-за аномального выходного напряжения перед медленным запуском при включении основного питания.",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "본체 전원 소프트 스타트 전 출력 전압 이상 경보",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "本体上电缓启动前输出电压异常报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1800,
-    "level": 1,
-    "en": {
-      "description": "Regenerative current detection over limit alarm",
-      "cause": "",
-      "solution": "The feed current is too large, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "馈能电流检测超限报警",
-      "cause": "",
-      "solution": "馈电电流过大，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "エネルギー供給電流検査制限超過アラーム",
-      "cause": "",
-      "solution": "供給電力が大きすぎます。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm bei der Überschreitung des Stromgrenzwerts bei der Energieeinspeisungserkennung",
-      "cause": "",
-      "solution": "Übermäßiger Speisestrom in der Zuleitung, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Sobrecorriente detectada en la corriente de alimentación de energía",
-      "cause": "",
-      "solution": "La corriente de alimentación es demasiado grande. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Обнаружена перегрузка по току подачи энергии",
-      "cause": "",
-      "solution": "Ток питания слишком велик. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "피드 전류 제한 초과 경보 감지",
-      "cause": "",
-      "solution": "피드 전류가 너무 크면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "馈能电流检测超限报警",
-      "cause": "",
-      "solution": "馈电电流过大，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1801,
-    "level": 1,
-    "en": {
-      "description": "Cement resistance overpower protection alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "水泥电阻超功率保护报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "セメント抵抗過電力保護アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überlastungsschutzalarm des Zementwiderstands",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por protección de sobrepotencia de resistencia del cemento",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработала сигнализация защиты от превышения сопротивления цемента",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "시멘트 저항 전력 초과 보호 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "水泥电阻超功率保护报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1802,
-    "level": 1,
-    "en": {
-      "description": "Bus current detection out of limit alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "母线电流检测超限报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "バスバー電流検査制限超過アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm bei der Überschreitung der Busstromgrenze",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por la corriente de bus que excede el límite",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнал тревоги срабатывает, если ток шины превышает предельное значение",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "버스 전류 제한 초과 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "母线电流检测超限报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1803,
-    "level": 1,
-    "en": {
-      "description": "An energy feed alarm occurs when the ontology power-on cache is started",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "本体上电缓存启动时发生馈能报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "本体の電源をオンにして起動時にエネルギー供給発生アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Energiezufuhralarm beim Einschalten des Cache-Starts des Grundkörpers",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por alimentación de energía durante el inicio lento del encendido principal",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Срабатывает сигнализация подачи энергии во время медленного запуска при включении основного питания.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "본체 전원 소프트 스타트 시 피드 경보 발생",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "本体上电缓存启动时发生馈能报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1804,
-    "level": 1,
-    "en": {
-      "description": "The output voltage control MOS tube is abnormal",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "48V输出控制MOS管状态检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "48V出力制御MOSトランジスタ状態検査異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm 48V-Ausgangskontrolle MOS-Röhrenstatuserkennung n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por detección anómala del estado del tubo MOS de control de salida de 48 V.",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнал тревоги срабатывает при ненормальном обнаружении состояния MOS-трубки управления выходом 48 В.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "48V 출력 MOS 튜브 제어 상태 이상 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "48V输出控制MOS管状态检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1805,
-    "level": 1,
-    "en": {
-      "description": "The body is powered on and slow start fails",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "本体上电缓启动失败报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "本体電源オン起動失敗エラー",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm langsamer Start des Grundkörpers beim Einschalten n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por fallo de inicio lento del encendido principal.",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал аварийный сигнал при сбое медленного запуска при включении основного питания.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "본체 전원 소프트 스타트 실패 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "本体上电缓启动失败报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1808,
-    "level": 0,
-    "en": {
-      "description": "Input voltage monitoring overvoltage alarm",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "输入电压监测过压报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "入力電圧監視過電圧アラーム",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überspannungsalarm der Eingangsspannungsüberwachung",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobretensión de supervisión del voltaje de entrada",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Контроль входного напряжения, сигнализация о перенапряжении",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "입력 전압 과전압 경보 모니터링",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "输入电压监测过压报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1809,
-    "level": 0,
-    "en": {
-      "description": "Input voltage monitoring undervoltage alarm",
-      "cause": "",
-      "solution": "The feed current is too large, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "输入电压监测欠压报警",
-      "cause": "",
-      "solution": "馈电电流过大，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "入力電圧監視電圧不足アラーム",
-      "cause": "",
-      "solution": "供給電力が大きすぎます。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Unterspannungsalarm der Eingangsspannungsüberwachung",
-      "cause": "",
-      "solution": "Übermäßiger Speisestrom in der Zuleitung, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de subtensión de supervisión del voltaje de entrada",
-      "cause": "",
-      "solution": "La corriente de alimentación es demasiado grande. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Контроль входного напряжения, сигнализация пониженного напряжения",
-      "cause": "",
-      "solution": "Ток питания слишком велик. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "입력 전압 저전압 경보 모니터링",
-      "cause": "",
-      "solution": "피드 전류가 너무 크면 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "输入电压监测欠压报警",
-      "cause": "",
-      "solution": "馈电电流过大，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1810,
-    "level": 0,
-    "en": {
-      "description": "The power current limiting chip detects an abnormal alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "电源限流芯片检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "電源制限チップ検査異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Erkennung des Strombegrenzung-Chips n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por detección anómala en el chip limitador de corriente de alimentación",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнал тревоги сработал из-за аномального обнаружения в микросхеме ограничения тока мощности.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "전원 전류 제한 칩 이상 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "电源限流芯片检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1811,
-    "level": 0,
-    "en": {
-      "description": "Output voltage detection overvoltage alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "输出电压检测过压报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "出力電圧監視過電圧アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überspannungsalarm der Ausgangsspannungserkennung",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobretensión de detección del voltaje de salida",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Обнаружение выходного напряжения, сигнализация о перенапряжении",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "출력 전압 과전압 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "输出电压检测过压报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1812,
-    "level": 0,
-    "en": {
-      "description": "Output voltage detection undervoltage alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "输出电压检测欠压报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "出力電圧監視電圧不足アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Unterspannungsalarm der Ausgangsspannungserkennung",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de subtensión de detección del voltaje de salida",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация пониженного напряжения при обнаружении выходного напряжения",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "출력 전압 저전압 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "输出电压检测欠压报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1813,
-    "level": 1,
-    "en": {
-      "description": "Body precharge abnormal alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "本体预充电异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "本体予備充電異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Vorladung des Grundkörpers n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por precarga anómala del cuerpo principal",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги из-за ненормальной предварительной зарядки основного корпуса.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "본체 사전 충전 이상 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "本体预充电异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1814,
-    "level": 1,
-    "en": {
-      "description": "48V supercapacitor charging chip overcurrent fault alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "48V超级电容充电芯片过流故障报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "48Vスーパーキャパシタ充電チップ過電流故障アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überstromfehleralarm vom Ladechip des 48V Superkondensators",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por falla de sobrecorriente en el chip de carga del supercondensador de 48V",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги из-за перегрузки по току в микросхеме зарядки ионистора 48 В.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "48V 슈퍼 커패시터 충전 칩 과전류 오류 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "48V超级电容充电芯片过流故障报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1815,
-    "level": 0,
-    "en": {
-      "description": "48V output control MOS tube temperature is too high alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "48V输出控制MOS管温度过高报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "48V出力制御MOSトランジスタ管理温度高温アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Übertemperaturalarm für MOS-Röhren der 48V-Ausgangssteuerung",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por alta temperatura en el tubo MOS de control de salida de 48 V.",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги из-за высокой температуры в MOS-трубке управления выходом 48 В.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "48V 출력 MOS 튜브 제어 과열 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "48V输出控制MOS管温度过高报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1816,
-    "level": 1,
-    "en": {
-      "description": "Regenerative current detection over limit alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "馈能电流检测超限报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "エネルギー供給電流検査制限超過アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm bei der Überschreitung des Stromgrenzwerts bei der Energieeinspeisungserkennung",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Sobrecorriente detectada en la corriente de alimentación de energía",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Обнаружена перегрузка по току подачи энергии",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "피드 전류 제한 초과 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "馈能电流检测超限报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1817,
-    "level": 1,
-    "en": {
-      "description": "Cement resistance overpower protection alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "水泥电阻超功率保护报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "セメント抵抗過電力保護アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überlastungsschutzalarm des Zementwiderstands",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por protección de sobrepotencia de resistencia del cemento",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработала сигнализация защиты от превышения сопротивления цемента",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "시멘트 저항 전력 초과 보호 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "水泥电阻超功率保护报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1818,
-    "level": 1,
-    "en": {
-      "description": "Bus current detection out of limit alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "母线电流检测超限报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "バスバー電流検査制限超過アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm bei der Überschreitung der Busstromgrenze",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por la corriente de bus que excede el límite",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнал тревоги срабатывает, если ток шины превышает предельное значение",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "버스 전류 제한 초과 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "母线电流检测超限报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1819,
-    "level": 1,
-    "en": {
-      "description": "Energy regenerative circuit drive voltage abnormal alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "馈能电路驱动电压异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "エネルギー供給回路ドライブ電圧異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Antriebsspannung für den Energieversorgungskreis n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por voltaje de transmisión anómalo del circuito de alimentación de energía",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги из-за аномального напряжения привода цепи подачи энергии.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "피드 회로 구동 전압 이상 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "馈能电路驱动电压异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1820,
-    "level": 1,
-    "en": {
-      "description": "48V output control MOS tube status detection abnormal alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "48V输出控制MOS管状态检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "48V出力制御MOSトランジスタ状態検査異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm 48V-Ausgangskontrolle MOS-Röhrenstatuserkennung n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por detección anómala del estado del tubo MOS de control de salida de 48 V.",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнал тревоги срабатывает при ненормальном обнаружении состояния MOS-трубки управления выходом 48 В.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "48V 출력 MOS 튜브 제어 상태 이상 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "48V输出控制MOS管状态检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1821,
-    "level": 1,
-    "en": {
-      "description": "The fan status detection is abnormal",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "风扇状态检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ファン状態検査異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Erkennung des Lüfterstatus n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La detección del estado del ventilador es anómala",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Обнаружение состояния вентилятора является ненормальным",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "팬 상태 이상 감지 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "风扇状态检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1824,
-    "level": 1,
-    "en": {
-      "description": "48V ultracapacitor comparison circuit reference voltage monitoring abnormal alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "48V超级电容比较电路参考电压监测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "48Vスーパーキャパシタ比較回路参考電圧監視異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Referenzspannungsüberwachung der Vergleichsschaltung des 48V-Superkondensators n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por supervisión de voltaje de referencia anómalo en el circuito comparador del supercondensador de 48 V",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги при контроле аномального опорного напряжения в цепи компаратора ионистора 48 В.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "48V 슈퍼 커패시터 비교 회로 참조 전압 이상 경보 모니터링",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "48V超级电容比较电路参考电压监测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1825,
-    "level": 1,
-    "en": {
-      "description": "24V ultracapacitor circuit abnormal alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "24V超级电容电路异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "24Vスーパーキャパシタ回路異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Stromkreis des 24V-Superkondensators n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por circuito anómalo del supercondensador de 24 V",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги из-за аномальной цепи ионистора 24 В.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "24V 슈퍼 커패시터 회로 이상 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "24V超级电容电路异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1826,
-    "level": 1,
-    "en": {
-      "description": "The maximum input voltage is set to an abnormal alarm",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "输入电压最大值设置异常报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "入力電圧最大値設定異常アラーム",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Einstellung der maximalen Eingangsspannung n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por configuración anómala del voltaje máximo de entrada",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги из-за ненормальной настройки максимального входного напряжения.",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "입력 전압 최대치 설정 이상 경보",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "输入电压最大值设置异常报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1827,
-    "level": 1,
-    "en": {
-      "description": "Input voltage minimum setting abnormal alarm",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "输入电压最小值设置异常报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "入力電圧最小値設定異常アラーム",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Einstellung der minimalen Eingangsspannung n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por configuración anómala del voltaje mínimo de entrada",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги из-за ненормальной настройки минимального входного напряжения.",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "입력 전압 최소치 설정 이상 경보",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "输入电压最小值设置异常报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1828,
-    "level": 0,
-    "en": {
-      "description": "Energy regenerative time detection abnormal alarm",
-      "cause": "",
-      "solution": "Check whether the input power supply and load are normal, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "馈能时间检测异常报警",
-      "cause": "",
-      "solution": "检查输入电源和负载是否规范，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "エネルギー供給時間検査異常アラーム",
-      "cause": "",
-      "solution": "入力電源と負荷が規定どおりかを確認するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Erkennung der Einspeisezeit n.i.O.",
-      "cause": "",
-      "solution": "Überprüfen Sie die Spezifikationen für die Eingangsleistung und die Last oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por detección de tiempo de alimentación de energía anómala",
-      "cause": "",
-      "solution": "Compruebe si la fuente de alimentación de entrada y la carga son normales o comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги при обнаружении ненормального времени подачи энергии",
-      "cause": "",
-      "solution": "Проверьте, в норме ли входное питание и нагрузка, или обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "피드 시간 이상 경보 감지",
-      "cause": "",
-      "solution": "입력 전원 및 부하가 규격에 맞는지 확인하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "馈能时间检测异常报警",
-      "cause": "",
-      "solution": "检查输入电源和负载是否规范，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 1829,
-    "level": 0,
-    "en": {
-      "description": "Energy regenerative circuit control signal detection abnormal alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart it, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "馈能电路控制信号检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "エネルギー供給回路制御信号検査異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Erkennung von Steuersignalen des Energieversorgungskreises n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por detección anómala de la señal de control del circuito de alimentación de energía",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Срабатывает сигнал тревоги при ненормальном обнаружении управляющего сигнала цепи подачи энергии.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "피드 회로 제어 신호 이상 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "馈能电路控制信号检测异常报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2050,
-    "level": 0,
-    "en": {
-      "description": "Protective stop timeout alarm",
-      "cause": "",
-      "solution": "Clear the error and power on again"
-    },
-    "zh_CN": {
-      "description": "防护性停止超时告警",
-      "cause": "",
-      "solution": "清除错误,重新上电"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "保護性能停止タイムアウトアラーム",
-      "cause": "",
-      "solution": "エラーを消して、再度電源をオンにします"
-    },
-    "de": {
-      "description": "Alarm bei Zeitüberschreitung des Schutzstopps",
-      "cause": "",
-      "solution": "Fehler quittieren und die Stromversorgung wieder einschalten."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de tiempo de espera de parada de protección",
-      "cause": "",
-      "solution": "Borre el error y vuelva a encender"
-    },
-    "ru": {
-      "description": "Сигнализация времени ожидания защитной остановки",
-      "cause": "",
-      "solution": "Сбросьте ошибку и снова включите питание."
-    },
-    "ko": {
-      "description": "방호성 정지 시간 초과 경보",
-      "cause": "",
-      "solution": "오류를 처리하고 다시 전원을 켜십시오"
-    },
-    "fr": {
-      "description": "防护性停止超时告警",
-      "cause": "",
-      "solution": "清除错误,重新上电"
-    }
-  },
-  {
-    "id": 2051,
-    "level": 1,
-    "en": {
-      "description": "Joint 1 inner encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节1内圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節1內圈位置超限",
-      "cause": "",
-      "solution": "重新啟動。如果故障仍然存在，请聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 1 위치 초과",
-      "cause": "",
-      "solution": "재시작합니다. 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節1内輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Innenringposition von Gelenk 1 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Vị trí khớp 1 vượt quá giới hạn",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật"
-    },
-    "es": {
-      "description": "La posición del anillo interior de la articulación 1 excede el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение внутренней обоймы шарнира 1 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트1 이너 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Dépassement de position de l'articulation 1",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2052,
-    "level": 1,
-    "en": {
-      "description": "Joint 2 inner encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节2内圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節2內圈位置超限",
-      "cause": "",
-      "solution": "重新啟動。如果故障仍然存在，请聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 2 위치 초과",
-      "cause": "",
-      "solution": "재시작합니다. 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節2内輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Innenringposition von Gelenk 2 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Vị trí khớp 2 vượt quá giới hạn",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật"
-    },
-    "es": {
-      "description": "La posición del anillo interior de la articulación 2 excede el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение внутренней обоймы шарнира 2 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트2 이너 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Dépassement de position de l'articulation 2",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2053,
-    "level": 1,
-    "en": {
-      "description": "Joint 3 inner encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节3内圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節3內圈位置超限",
-      "cause": "",
-      "solution": "重新啟動。如果故障仍然存在，请聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 3 위치 초과",
-      "cause": "",
-      "solution": "재시작합니다. 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節3内輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Innenringposition von Gelenk 3 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Vị trí khớp 3 vượt quá giới hạn",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật"
-    },
-    "es": {
-      "description": "La posición del anillo interior de la articulación 3 excede el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение внутренней обоймы шарнира 3 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트3 이너 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Dépassement de position de l'articulation 3",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2054,
-    "level": 1,
-    "en": {
-      "description": "Joint 4 inner encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节4内圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節4內圈位置超限",
-      "cause": "",
-      "solution": "重新啟動。如果故障仍然存在，请聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 4 위치 초과",
-      "cause": "",
-      "solution": "재시작합니다. 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節4内輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Innenringposition von Gelenk 4 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Vị trí khớp 4 vượt quá giới hạn",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật"
-    },
-    "es": {
-      "description": "La posición del anillo interior de la articulación 4 excede el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение внутренней обоймы шарнира 4 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트4 이너 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Dépassement de position de l'articulation 4",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2055,
-    "level": 1,
-    "en": {
-      "description": "Joint 5 inner encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节5内圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節5內圈位置超限",
-      "cause": "",
-      "solution": "重新啟動。如果故障仍然存在，请聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 5 위치 초과",
-      "cause": "",
-      "solution": "재시작합니다. 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節5内輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Innenringposition von Gelenk 5 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Vị trí khớp 5 vượt quá giới hạn",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật"
-    },
-    "es": {
-      "description": "La posición del anillo interior de la articulación 5 excede el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение внутренней обоймы шарнира 5 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트5 이너 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Dépassement de position de l'articulation 5",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2056,
-    "level": 1,
-    "en": {
-      "description": "Joint 6 inner encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节6内圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節6內圈位置超限",
-      "cause": "",
-      "solution": "重新啟動。如果故障仍然存在，请聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 6 위치 초과",
-      "cause": "",
-      "solution": "재시작합니다. 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節6内輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Innenringposition von Gelenk 6 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Vị trí khớp 6 vượt quá giới hạn",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật"
-    },
-    "es": {
-      "description": "La posición del anillo interior de la articulación 6 excede el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение внутренней обоймы шарнира 6 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트6 이너 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Dépassement de position de l'articulation 6",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2057,
-    "level": 1,
-    "en": {
-      "description": "Joint 1 inner encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings"
-    },
-    "zh_CN": {
-      "description": "关节1内圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置"
-    },
-    "zh_hant": {
-      "description": "關節1內圈速率超限",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設置"
-    },
-    "kr": {
-      "description": "조인트 1 속도 초과",
-      "cause": "",
-      "solution": "조인트 속도나 카르테시안 속도 설정을 낮추십시오"
-    },
-    "ja": {
-      "description": "関節1内輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます"
-    },
-    "de": {
-      "description": "Die Innenringgeschwindigkeit von Gelenk 1 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Vượt quá tốc độ khớp 1",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes"
-    },
-    "es": {
-      "description": "La velocidad del anillo interior de la articulación 1 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость внутренней обоймы шарнира 1 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 1 이너 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Dépassement de vitesse de l'articulation 1",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne"
-    }
-  },
-  {
-    "id": 2058,
-    "level": 1,
-    "en": {
-      "description": "Joint 2 inner encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings"
-    },
-    "zh_CN": {
-      "description": "关节2内圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置"
-    },
-    "zh_hant": {
-      "description": "關節2內圈速率超限",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設置"
-    },
-    "kr": {
-      "description": "조인트 2 속도 초과",
-      "cause": "",
-      "solution": "조인트 속도나 카르테시안 속도 설정을 낮추십시오"
-    },
-    "ja": {
-      "description": "関節2内輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます"
-    },
-    "de": {
-      "description": "Die Innenringgeschwindigkeit von Gelenk 2 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Vượt quá tốc độ khớp 2",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes"
-    },
-    "es": {
-      "description": "La velocidad del anillo interior de la articulación 2 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость внутренней обоймы шарнира 2 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 2 이너 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Dépassement de vitesse de l'articulation 2",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne"
-    }
-  },
-  {
-    "id": 2059,
-    "level": 1,
-    "en": {
-      "description": "Joint 3 inner encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings"
-    },
-    "zh_CN": {
-      "description": "关节3内圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置"
-    },
-    "zh_hant": {
-      "description": "關節3內圈速率超限",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設置"
-    },
-    "kr": {
-      "description": "조인트 3 속도 초과",
-      "cause": "",
-      "solution": "조인트 속도나 카르테시안 속도 설정을 낮추십시오"
-    },
-    "ja": {
-      "description": "関節3内輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます"
-    },
-    "de": {
-      "description": "Die Innenringgeschwindigkeit von Gelenk 3 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Vượt quá tốc độ khớp 3",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes"
-    },
-    "es": {
-      "description": "La velocidad del anillo interior de la articulación 3 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость внутренней обоймы шарнира 3 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 3 이너 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Dépassement de vitesse de l'articulation 3",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne"
-    }
-  },
-  {
-    "id": 2060,
-    "level": 1,
-    "en": {
-      "description": "Joint 4 inner encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings"
-    },
-    "zh_CN": {
-      "description": "关节4内圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置"
-    },
-    "zh_hant": {
-      "description": "關節4內圈速率超限",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設置"
-    },
-    "kr": {
-      "description": "조인트 4 속도 초과",
-      "cause": "",
-      "solution": "조인트 속도나 카르테시안 속도 설정을 낮추십시오"
-    },
-    "ja": {
-      "description": "関節4内輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます"
-    },
-    "de": {
-      "description": "Die Innenringgeschwindigkeit von Gelenk 4 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Vượt quá tốc độ khớp 4",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes"
-    },
-    "es": {
-      "description": "La velocidad del anillo interior de la articulación 4 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость внутренней обоймы шарнира 4 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 4 이너 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Dépassement de vitesse de l'articulation 4",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne"
-    }
-  },
-  {
-    "id": 2061,
-    "level": 1,
-    "en": {
-      "description": "Joint 5 inner encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings"
-    },
-    "zh_CN": {
-      "description": "关节5内圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置"
-    },
-    "zh_hant": {
-      "description": "關節5內圈速率超限",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設置"
-    },
-    "kr": {
-      "description": "조인트 5 속도 초과",
-      "cause": "",
-      "solution": "조인트 속도나 카르테시안 속도 설정을 낮추십시오"
-    },
-    "ja": {
-      "description": "関節5内輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます"
-    },
-    "de": {
-      "description": "Die Innenringgeschwindigkeit von Gelenk 5 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Vượt quá tốc độ khớp 5",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes"
-    },
-    "es": {
-      "description": "La velocidad del anillo interior de la articulación 5 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость внутренней обоймы шарнира 5 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 5 이너 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Dépassement de vitesse de l'articulation 5",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne"
-    }
-  },
-  {
-    "id": 2062,
-    "level": 1,
-    "en": {
-      "description": "Joint 6 inner encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings"
-    },
-    "zh_CN": {
-      "description": "关节6内圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置"
-    },
-    "zh_hant": {
-      "description": "關節6內圈速率超限",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設置"
-    },
-    "kr": {
-      "description": "조인트 6 속도 초과",
-      "cause": "",
-      "solution": "조인트 속도나 카르테시안 속도 설정을 낮추십시오"
-    },
-    "ja": {
-      "description": "関節6内輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます"
-    },
-    "de": {
-      "description": "Die Innenringgeschwindigkeit von Gelenk 6 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Vượt quá tốc độ khớp 6",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes"
-    },
-    "es": {
-      "description": "La velocidad del anillo interior de la articulación 6 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость внутренней обоймы шарнира 6 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 6 이너 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Dépassement de vitesse de l'articulation 6",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne"
-    }
-  },
-  {
-    "id": 2063,
-    "level": 1,
-    "en": {
-      "description": "Joint 1 torque exceeds the limit",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节1转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節1トルク制限超過",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 1 Drehmomentüberschreitung",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El par de articulación 1 excede el límite",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Превышение допустимого предела крутящего момента шарнира 1",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "조인트 1 토크 제한 초과",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节1转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2064,
-    "level": 1,
-    "en": {
-      "description": "Joint 2 torque exceeds the limit",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节2转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節2トルク制限超過",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 2 Drehmomentüberschreitung",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El par de articulación 2 excede el límite",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Превышение допустимого предела крутящего момента шарнира 2",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "조인트 2 토크 제한 초과",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节2转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2065,
-    "level": 1,
-    "en": {
-      "description": "Joint 3 torque exceeds the limit",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节3转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節3トルク制限超過",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 3 Drehmomentüberschreitung",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El par de articulación 3 excede el límite",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Превышение допустимого предела крутящего момента шарнира 3",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "조인트 3 토크 제한 초과",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节3转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2066,
-    "level": 1,
-    "en": {
-      "description": "Joint 4 torque exceeds the limit",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节4转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節4トルク制限超過",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 4 Drehmomentüberschreitung",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El par de articulación 4 excede el límite",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Превышение допустимого предела крутящего момента шарнира 4",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "조인트 4 토크 제한 초과",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节4转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2067,
-    "level": 1,
-    "en": {
-      "description": "Joint 5 torque exceeds the limit",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节5转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節5トルク制限超過",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 5 Drehmomentüberschreitung",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El par de articulación 5 excede el límite",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Превышение допустимого предела крутящего момента шарнира 5",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "조인트 5 토크 제한 초과",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节5转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2068,
-    "level": 1,
-    "en": {
-      "description": "Joint 6 torque exceeds the limit",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关节6转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "関節6トルク制限超過",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Gelenk 6 Drehmomentüberschreitung",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El par de articulación 6 excede el límite",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Превышение допустимого предела крутящего момента шарнира 6",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "조인트 6 토크 제한 초과",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关节6转矩超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2069,
-    "level": 1,
-    "en": {
-      "description": "The TCP position exceeded the limit",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "TCP位置超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "TCP位置制限超過",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "TCP-Positionsüberschreitung",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La posición de TCP excede el límite",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Превышен предел позиции TCP",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "TCP 위치 제한 초과",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "TCP位置超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2070,
-    "level": 1,
-    "en": {
-      "description": "The TCP rate exceeds the upper limit",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed Settings"
-    },
-    "zh_CN": {
-      "description": "TCP速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "TCPレート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます"
-    },
-    "de": {
-      "description": "TCP-Geschwindigkeitsüberschreitung",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeit oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La tasa de TCP excede el límite",
-      "cause": "",
-      "solution": "Reducir ajustes de velocidad de articulación o de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Превышение предела скорости TCP",
-      "cause": "",
-      "solution": "Уменьшите уставки скорости шарнира или декартовой скорости."
-    },
-    "ko": {
-      "description": "TCP 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "TCP速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置"
-    }
-  },
-  {
-    "id": 2071,
-    "level": 1,
-    "en": {
-      "description": "Safety controller A and B version mismatch",
-      "cause": "",
-      "solution": "If the safety controller A and B versions are different, please update the firmware to ensure compatibility between the two versions. Contact technical support if you need further assistance."
-    },
-    "zh_CN": {
-      "description": "安全控制器A板和B板版本不一致",
-      "cause": "",
-      "solution": "如果安全控制器A板和B板版本不一致，请更新固件以确保两个版本之间的兼容性。如需进一步帮助，请联系技术支持。"
-    },
-    "zh_hant": {
-      "description": "安全控制器A板和B板版本不一致",
-      "cause": "",
-      "solution": "如果安全控制器A板和B板版本不一致，請更新固件以確保兩個版本之間的兼容性。如需進一步幫助，請聯繫技術支援。"
-    },
-    "kr": {
-      "description": "안전 컨트롤러 A와 B 버전이 일치하지 않습니다.",
-      "cause": "",
-      "solution": "안전 컨트롤러 A와 B 버전이 다른 경우 펌웨어를 업데이트하여 두 버전 간의 호환성을 확보하십시오. 추가 지원이 필요한 경우 기술 지원에 문의하십시오."
-    },
-    "ja": {
-      "description": "セーフティコントローラAとBのバージョンが一致しません",
-      "cause": "",
-      "solution": "セーフティコントローラAとBのバージョンが異なる場合は、互換性を確保するためにファームウェアを更新してください。追加のサポートが必要な場合は、技術サポートにお問い合わせください。"
-    },
-    "de": {
-      "description": "Sicherheitscontroller A und B Versionen sind nicht kompatibel",
-      "cause": "",
-      "solution": "Wenn die Sicherheitscontroller A und B Versionen unterschiedlich sind, aktualisieren Sie bitte die Firmware, um die Kompatibilität zwischen den beiden Versionen sicherzustellen. Kontaktieren Sie den technischen Support, falls weitere Unterstützung benötigt wird."
-    },
-    "vi": {
-      "description": "Lỗi không tương thích giữa bảng điều khiển an toàn A và B",
-      "cause": "",
-      "solution": "Nếu bảng điều khiển an toàn A và B có phiên bản khác nhau, vui lòng cập nhật firmware để đảm bảo tính tương thích giữa hai phiên bản. Liên hệ với bộ phận hỗ trợ kỹ thuật nếu bạn cần được hỗ trợ thêm."
-    },
-    "es": {
-      "description": "Incompatibilidad de versiones en los controladores de seguridad A y B",
-      "cause": "",
-      "solution": "Si las versiones de los controladores de seguridad A y B son diferentes, actualice el firmware para asegurar la compatibilidad entre las dos versiones. Si necesita ayuda adicional, comuníquese con el soporte técnico."
-    },
-    "fr": {
-      "description": "Incompatibilité des versions des contrôleurs de sécurité A et B",
-      "cause": "",
-      "solution": "Si les versions des contrôleurs de sécurité A et B sont différentes, veuillez mettre à jour le firmware pour assurer la compatibilité entre les deux versions. Contactez le support technique si vous avez besoin d'aide supplémentaire."
-    },
-    "ko": {
-      "description": "안전 컨트롤러 A와 B의 버전 불일치",
-      "cause": "",
-      "solution": "안전 컨트롤러 A와 B의 버전이 다른 경우, 두 버전 간의 호환성을 위해 펌웨어를 업데이트하십시오. 추가 지원이 필요한 경우 기술 지원에 문의하십시오."
-    },
-    "ru": {
-      "description": "Несоответствие версий контроллеров безопасности A и B",
-      "cause": "",
-      "solution": "Если версии контроллеров безопасности A и B различаются, обновите прошивку, чтобы обеспечить совместимость между двумя версиями. При необходимости обратитесь в техническую поддержку для дополнительной помощи."
-    }
-  },
-  {
-    "id": 2072,
-    "level": 1,
-    "en": {
-      "description": "TCP force limit exceeds the limit",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "TCP力限制超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "TCP力の制限超過",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "TCP-Kraftbegrenzung überschritten",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "El límite de fuerza de TCP excede el límite",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Принудительный предел TCP превышает предел",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "TCP 힘 제한 초과",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "TCP力限制超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2073,
-    "level": 1,
-    "en": {
-      "description": "Exceeded safety plane limits",
-      "cause": "",
-      "solution": "Clear the alarm, re-enable and jog the robot back into the safety area"
-    },
-    "zh_CN": {
-      "description": "超出安全平面限制",
-      "cause": "",
-      "solution": "清除报警，重新上使能并点动机器人回到安全区域内"
-    },
-    "zh_hant": {
-      "description": "超出安全平面限制",
-      "cause": "",
-      "solution": "清除警報，重新啟用並點動機器人回到安全區域內"
-    },
-    "kr": {
-      "description": "안전 평면 제한을 초과했습니다",
-      "cause": "",
-      "solution": "경고를 해제하고 로봇을 안전 영역으로 다시 이동하세요"
-    },
-    "ja": {
-      "description": "安全平面の制限を超えました",
-      "cause": "",
-      "solution": "警告を解除し、ロボットを安全エリアに戻してください"
-    },
-    "de": {
-      "description": "Sicherheitsebene überschritten",
-      "cause": "",
-      "solution": "Alarm zurücksetzen und den Roboter zurück in den Sicherheitsbereich bewegen"
-    },
-    "vi": {
-      "description": "Vượt quá giới hạn mặt phẳng an toàn",
-      "cause": "",
-      "solution": "Xóa cảnh báo, kích hoạt lại và di chuyển robot trở lại khu vực an toàn"
-    },
-    "es": {
-      "description": "Límites del plano de seguridad excedidos",
-      "cause": "",
-      "solution": "Eliminar la alarma, volver a habilitar y mover el robot de regreso al área de seguridad"
-    },
-    "ru": {
-      "description": "Превышены пределы безопасной плоскости",
-      "cause": "",
-      "solution": "Снять тревогу, включить и аккуратно переместить робота обратно в зону безопасности"
-    },
-    "ko": {
-      "description": "안전 평면 제한 초과",
-      "cause": "",
-      "solution": "경고를 해제하고 로봇을 안전 영역으로 다시 이동하세요"
-    },
-    "fr": {
-      "description": "Limites du plan de sécurité dépassées",
-      "cause": "",
-      "solution": "Désactivez l'alarme et déplacez prudemment le robot vers la zone de sécurité"
-    }
-  },
-  {
-    "id": 2074,
-    "level": 1,
-    "en": {
-      "description": "The speed exceeds the threshold after the virtual wall is triggered",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "安全墙虚墙触发后速率超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "安全壁と仮想壁起動後の位置制限超過",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Geschwindigkeitsüberschreitung nach der virtuellen Auslösung der Sicherheitswand-Attrappe",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La velocidad excede el límite una vez que se activa la pared de seguridad virtual",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Скорость превышает предел после срабатывания виртуальной защитной стены",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "방호벽 가상 벽 트리거 후 속도 제한 초과",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "安全墙虚墙触发后速率超限",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2075,
-    "level": 1,
-    "en": {
-      "description": "Contactor status detection is abnormal. Procedure",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "接触器状态检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "接触器状態検査異常アラーム",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Erkennung des Schützstatus n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La detección del estado del contactor es anómala",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальное обнаружение состояния контактора",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "접촉기 상태 이상 감지",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "接触器状态检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2076,
-    "level": 1,
-    "en": {
-      "description": "The energy feeder detects anomalies online",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "馈能板在线检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "エネルギー供給ボードのオンライン異常",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Online-Erkennung von Anomalien in Energieeinspeisetafeln",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La detección en línea de la placa de alimentación de energía es anómala",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ненормальное онлайн-обнаружение пластины подачи энергии",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "피드 보드 온라인 이상 감지",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "馈能板在线检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2077,
-    "level": 0,
-    "en": {
-      "description": "Joint 2 torque exceeds the limit",
-      "cause": "",
-      "solution": "After loosening the panel switch, normal operation can be resumed according to the program"
-    },
-    "zh_CN": {
-      "description": "前面板开关被按下",
-      "cause": "",
-      "solution": "松开面板开关后依程序可恢复正常操作"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "前部パネルスイッチが押されています",
-      "cause": "",
-      "solution": "パネルスイッチを解除した後、手順に従って正常操作に戻すことができます"
-    },
-    "de": {
-      "description": "Schalter auf der Vorderseite wird gedrückt",
-      "cause": "",
-      "solution": "Nach dem Loslassen des Schalters kann der Normalbetrieb programmgemäß fortgesetzt werden"
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Se ha presionado el conmutador del panel frontal",
-      "cause": "",
-      "solution": "Después de aflojar el conmutador del panel, se puede reanudar el funcionamiento normal"
-    },
-    "ru": {
-      "description": "Нажат переключатель на передней панели",
-      "cause": "",
-      "solution": "После отпускания переключателя панели можно возобновить нормальную работу."
-    },
-    "ko": {
-      "description": "전면 패널 스위치 눌림",
-      "cause": "",
-      "solution": "패널 스위치 누름 해제 후 프로그램에 따라 정상 작업을 회복할 수 있습니다"
-    },
-    "fr": {
-      "description": "前面板开关被按下",
-      "cause": "",
-      "solution": "松开面板开关后依程序可恢复正常操作"
-    }
-  },
-  {
-    "id": 2078,
-    "level": 1,
-    "en": {
-      "description": "AC detection error",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "AC检测错误",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "AC検査エラー",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "AC-Erkennungsfehler",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de detección de CA",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка обнаружения переменного тока",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "AC 오류 감지",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "AC检测错误",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2080,
-    "level": 1,
-    "en": {
-      "description": "Robot joint 1 transmission system position or speed error",
-      "cause": "",
-      "solution": "System error, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "机器人关节1传动系统位置或速度超差",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット関節1伝達系の位置または速度が許容範囲外です",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Position oder Geschwindigkeit des Übertragungssystems von Robotergelenk 1 liegt außerhalb der Toleranz",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La posición o velocidad del sistema de transmisión de la articulación 1 del robot está fuera de tolerancia",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Положение или скорость системы передачи шарнира 1 робота выходят за пределы допуска",
-      "cause": "",
-      "solution": "Системная ошибка, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "로봇 조인트 1 드라이브 시스템 위치 또는 속도가 허용 오차를 벗어났습니다.",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "机器人关节1传动系统位置或速度超差报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2081,
-    "level": 1,
-    "en": {
-      "description": "Robot joint 2 transmission system position or speed error",
-      "cause": "",
-      "solution": "System error, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "机器人关节2传动系统位置或速度超差",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット関節2伝達系の位置または速度が許容範囲外です",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Position oder Geschwindigkeit des Übertragungssystems von Robotergelenk 2 liegt außerhalb der Toleranz",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La posición o velocidad del sistema de transmisión de la articulación 2 del robot está fuera de tolerancia.",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Положение или скорость системы передачи шарнира 2 робота выходят за пределы допуска",
-      "cause": "",
-      "solution": "Системная ошибка, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "로봇 조인트 2 드라이브 시스템 위치 또는 속도가 허용 오차를 벗어났습니다.",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "机器人关节2传动系统位置或速度超差报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2082,
-    "level": 1,
-    "en": {
-      "description": "Robot joint 3 transmission system position or speed error",
-      "cause": "",
-      "solution": "System error, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "机器人关节3传动系统位置或速度超差",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット関節3伝達系の位置または速度が許容範囲外です",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Position oder Geschwindigkeit des Übertragungssystems von Robotergelenk 3 liegt außerhalb der Toleranz",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La posición o velocidad del sistema de transmisión de la articulación 3 del robot está fuera de tolerancia",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Положение или скорость системы передачи шарнира 3 робота выходят за пределы допуска",
-      "cause": "",
-      "solution": "Системная ошибка, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "로봇 조인트 3 드라이브 시스템 위치 또는 속도가 허용 오차를 벗어났습니다.",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "机器人关节3传动系统位置或速度超差报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2083,
-    "level": 1,
-    "en": {
-      "description": "Robot joint 4 transmission system position or speed error",
-      "cause": "",
-      "solution": "System error, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "机器人关节4传动系统位置或速度超差",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット関節4伝達系の位置または速度が許容範囲外です",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Position oder Geschwindigkeit des Übertragungssystems von Robotergelenk 4 liegt außerhalb der Toleranz",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La posición o velocidad del sistema de transmisión de la articulación 4 del robot está fuera de tolerancia",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Положение или скорость системы передачи шарнира 4 робота выходят за пределы допуска",
-      "cause": "",
-      "solution": "Системная ошибка, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "로봇 조인트 4 드라이브 시스템 위치 또는 속도가 허용 오차를 벗어났습니다.",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "机器人关节4传动系统位置或速度超差报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2084,
-    "level": 1,
-    "en": {
-      "description": "Robot joint 5 transmission system position or speed error",
-      "cause": "",
-      "solution": "System error, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "机器人关节5传动系统位置或速度超差",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット関節5伝達系の位置または速度が許容範囲外です",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Position oder Geschwindigkeit des Übertragungssystems von Robotergelenk 5 liegt außerhalb der Toleranz",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La posición o velocidad del sistema de transmisión de la articulación 5 del robot está fuera de tolerancia",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Положение или скорость системы передачи шарнира 5 робота выходят за пределы допуска",
-      "cause": "",
-      "solution": "Системная ошибка, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "로봇 조인트 5 드라이브 시스템 위치 또는 속도가 허용 오차를 벗어났습니다.",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "机器人关节5传动系统位置或速度超差报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2085,
-    "level": 1,
-    "en": {
-      "description": "Robot joint 6 transmission system position or speed error",
-      "cause": "",
-      "solution": "System error, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "机器人关节6传动系统位置或速度超差",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ロボット関節6伝達系の位置または速度が許容範囲外です",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Position oder Geschwindigkeit des Übertragungssystems von Robotergelenk 6 liegt außerhalb der Toleranz",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La posición o velocidad del sistema de transmisión de la articulación 6 del robot está fuera de tolerancia.",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Положение или скорость системы передачи шарнира 6 робота выходят за пределы допуска",
-      "cause": "",
-      "solution": "Системная ошибка, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "로봇 조인트 6 드라이브 시스템 위치 또는 속도가 허용 오차를 벗어났습니다.",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "机器人关节6传动系统位置或速度超差报警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2087,
-    "level": 1,
-    "en": {
-      "description": "Security limit parameter verification error alarm",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "安全限值参数校验错误",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "安全制限値のパラメータチェックエラー",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Fehler bei der Überprüfung der Sicherheitsgrenzwerte",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de verificación del parámetro de límite de seguridad",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка проверки параметра предельного значения безопасности",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "안전 제한값 파라미터 검증 오류",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "安全限值参数校验错误",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2088,
-    "level": 1,
-    "en": {
-      "description": "The security limit parameter matches an incorrect alarm",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "安全限值参数匹配错误",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "安全制限値のパラメータ一致エラー",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Fehler bei der Anpassung der Sicherheitsgrenzwerte",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de coincidencia del parámetro de límite de seguridad",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка сопоставления параметров предела безопасности",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "안전 제한값 파라미터 일치 오류",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "安全限值参数匹配错误",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2089,
-    "level": 1,
-    "en": {
-      "description": "I/O input port detection exception alarm",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "IO输入口检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "IO入力ポート検査異常",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Erkennung von IO-Eingangsanschlüssen n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de detección del puerto de entrada de E/S",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка обнаружения входного порта ввода-вывода",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "IO 입력 포트 이상 감지",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "IO输入口检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2090,
-    "level": 1,
-    "en": {
-      "description": "Abnormal I/O output detection alarm",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "IO输出口检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "IO出力ポート検査異常",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Erkennung von IO-Ausgangsanschlüssen n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de detección del puerto de salida de E/S",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка обнаружения выходного порта ввода-вывода",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "IO 출력 포트 이상 감지",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "IO输出口检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2091,
-    "level": 1,
-    "en": {
-      "description": "3.3V Voltage Detection Exception Alarm",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "3.3V电压检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "3.3V電圧検査異常",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "3,3V-Spannungserkennung n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de detección de voltaje de 3,3 V",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка определения напряжения 3,3 В",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "3.3V 전압 이상 감지",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "3.3V电压检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2092,
-    "level": 1,
-    "en": {
-      "description": "The 5V voltage detection is abnormal",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "5V电压检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "5V電圧検査異常",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "5V-Spannungserkennung n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de detección de voltaje de 5 V",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка определения напряжения 5 В",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "5V 전압 이상 감지",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "5V电压检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2093,
-    "level": 1,
-    "en": {
-      "description": "24V voltage detection exception alarm",
-      "cause": "",
-      "solution": "the system is faulty, contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "24V电压检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "24V電圧検査異常",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "24V-Spannungserkennung n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de detección de voltaje de 24 V",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка определения напряжения 24 В",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "24V 전압 이상 감지",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "24V电压检测异常",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2096,
-    "level": 1,
-    "en": {
-      "description": "SCBB online status detection exception alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "SCBB在线状态检测异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "SCBBオンライン状態異常",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Erkennung des SCBB-Online-Status n.i.O.",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de detección de estado en línea de SCBB",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка определения онлайн-статуса SCBB",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "SCBB 온라인 상태 이상 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "SCBB在线状态检测异常",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2097,
-    "level": 1,
-    "en": {
-      "description": "Robot joint transmission system position deviation",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers."
-    },
-    "zh_CN": {
-      "description": "机器人关节传动系统位置超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "機器人關節傳動系統位置超差警報",
-      "cause": "",
-      "solution": "重新啟動。如果問題持續存在，請聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "로봇 조인트 드라이브 시스템 위치 편차 경보",
-      "cause": "",
-      "solution": "다시 시작하세요. 여전히 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "ロボット関節伝達系の位置が許容範囲外です",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Position des Gelenkübertragungssystems des Roboters liegt außerhalb der Toleranz",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Cảnh báo sai lệch vị trí hệ thống truyền động khớp robot",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật."
-    },
-    "es": {
-      "description": "La posición del sistema de transmisión de la articulación del robot está fuera de tolerancia.",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение системы передачи шарнира робота выходит за пределы допуска",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "로봇 조인트 드라이브 시스템의 위치가 허용 오차를 벗어났습니다.",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Alarme de déviation de position du système d'entraînement des articulations du robot",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2098,
-    "level": 1,
-    "en": {
-      "description": "Robot joint transmission system speed deviation",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers."
-    },
-    "zh_CN": {
-      "description": "机器人关节传动系统速度超差",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "機器人關節傳動系統速度超差警報",
-      "cause": "",
-      "solution": "重新啟動。如果問題持續存在，請聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "로봇 조인트 드라이브 시스템 속도 이탈 경보",
-      "cause": "",
-      "solution": "다시 시작하세요. 여전히 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "ロボット関節伝達系の速度が許容範囲外です",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Geschwindigkeit des Gelenkübertragungssystems des Roboters liegt außerhalb der Toleranz",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Cảnh báo sai lệch tốc độ hệ thống truyền động khớp robot",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật."
-    },
-    "es": {
-      "description": "La velocidad del sistema de transmisión de la articulación del robot está fuera de tolerancia.",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Скорость системы передачи шарнира робота выходит за пределы допуска",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "로봇 조인트 드라이브 시스템의 속도가 허용 오차를 벗어났습니다.",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Alarme de déviation de vitesse du système d'entraînement des articulations du robot",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2099,
-    "level": 1,
-    "en": {
-      "description": "Joint 1 outer encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers."
-    },
-    "zh_CN": {
-      "description": "关节1外圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節1外圈位置超限",
-      "cause": "",
-      "solution": "重新啟動。如果問題持續存在，請聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 1 외부 위치 초과 경보",
-      "cause": "",
-      "solution": "다시 시작하세요. 여전히 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節1外輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Außenringposition von Gelenk 1 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá vị trí ngoài khớp 1",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật."
-    },
-    "es": {
-      "description": "La posición del anillo exterior de la articulación 1 excede el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение наружной обоймы шарнира 1 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트1 아웃 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Alarme de dépassement de position externe de l'articulation 1",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2100,
-    "level": 1,
-    "en": {
-      "description": "Joint 2 outer encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers."
-    },
-    "zh_CN": {
-      "description": "关节2外圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節2外圈位置超限",
-      "cause": "",
-      "solution": "重新啟動。如果問題持續存在，請聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 2 외부 위치 초과 경보",
-      "cause": "",
-      "solution": "다시 시작하세요. 여전히 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節2外輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Außenringposition von Gelenk 2 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá vị trí ngoài khớp 2",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật."
-    },
-    "es": {
-      "description": "La posición del anillo exterior de la articulación 2 excede el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение наружной обоймы шарнира 2 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트2 아웃 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Alarme de dépassement de position externe de l'articulation 2",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2101,
-    "level": 1,
-    "en": {
-      "description": "Joint 3 outer encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers."
-    },
-    "zh_CN": {
-      "description": "关节3外圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節3外圈位置超限警報",
-      "cause": "",
-      "solution": "重新啟動。如果問題持續存在，請聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 3 외부 위치 초과 경보",
-      "cause": "",
-      "solution": "다시 시작하세요. 여전히 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節3外輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Außenringposition von Gelenk 3 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá vị trí ngoài khớp 3",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật."
-    },
-    "es": {
-      "description": "La posición del anillo exterior de la articulación 3 supera el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение наружной обоймы шарнира 3 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트3 아웃 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Alarme de dépassement de position externe de l'articulation 3",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2102,
-    "level": 1,
-    "en": {
-      "description": "Joint 4 outer encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers."
-    },
-    "zh_CN": {
-      "description": "关节4外圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節4外圈位置超限警報",
-      "cause": "",
-      "solution": "重新啟動。如果問題持續存在，請聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 4 외부 위치 초과 경보",
-      "cause": "",
-      "solution": "다시 시작하세요. 여전히 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節4外輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Außenringposition von Gelenk 4 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá vị trí ngoài khớp 4",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật."
-    },
-    "es": {
-      "description": "La posición del anillo exterior de la articulación 4 supera el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение наружной обоймы шарнира 4 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트4 아웃 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Alarme de dépassement de position externe de l'articulation 4",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2103,
-    "level": 1,
-    "en": {
-      "description": "Joint 5 outer encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers."
-    },
-    "zh_CN": {
-      "description": "关节5外圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節5外圈位置超限",
-      "cause": "",
-      "solution": "重新啟動。如果問題持續存在，請聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 5 외부 위치 초과 경보",
-      "cause": "",
-      "solution": "다시 시작하세요. 여전히 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節5外輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Außenringposition von Gelenk 5 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá vị trí ngoài khớp 5",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật."
-    },
-    "es": {
-      "description": "La posición del anillo exterior de la articulación 5 excede el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение наружной обоймы шарнира 5 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트5 아웃 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Alarme de dépassement de position externe de l'articulation 5",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2104,
-    "level": 1,
-    "en": {
-      "description": "Joint 6 outer encoder position overrun",
-      "cause": "",
-      "solution": "Restart. If the fault persists, contact technical support engineers."
-    },
-    "zh_CN": {
-      "description": "关节6外圈位置超限",
-      "cause": "",
-      "solution": "重新启动，若仍无法解决请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "關節6外圈位置超限警報",
-      "cause": "",
-      "solution": "重新啟動。如果問題持續存在，請聯繫技術支援工程師。"
-    },
-    "kr": {
-      "description": "조인트 6 외부 위치 초과 경보",
-      "cause": "",
-      "solution": "다시 시작하세요. 여전히 문제가 지속되면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "ja": {
-      "description": "関節6外輪位置制限超過",
-      "cause": "",
-      "solution": "再起動し、解決できない場合には、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Die Außenringposition von Gelenk 6 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Neustarten. Wenn das Problem immer noch nicht gelöst werden können, wenden Sie sich bitte an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá vị trí ngoài khớp 6",
-      "cause": "",
-      "solution": "Khởi động lại. Nếu lỗi vẫn tiếp tục, hãy liên hệ với kỹ sư hỗ trợ kỹ thuật."
-    },
-    "es": {
-      "description": "La posición del anillo exterior de la articulación 6 supera el límite",
-      "cause": "",
-      "solution": "Reinicie. Si el problema aún no se puede resolver, comuníquese con los ingenieros de soporte técnico."
-    },
-    "ru": {
-      "description": "Положение наружной обоймы шарнира 6 превышает предельное значение",
-      "cause": "",
-      "solution": "Перезагрузите, если проблема не устранена, обратитесь к инженерам технической поддержки"
-    },
-    "ko": {
-      "description": "조인트6 아웃 링 위치 제한 초과",
-      "cause": "",
-      "solution": "재시작하고, 여전히 문제가 해결되지 않으면 기술 지원 엔지니어에게 문의하십시오."
-    },
-    "fr": {
-      "description": "Alarme de dépassement de position externe de l'articulation 6",
-      "cause": "",
-      "solution": "Redémarrez. Si le défaut persiste, contactez les ingénieurs du support technique."
-    }
-  },
-  {
-    "id": 2105,
-    "level": 1,
-    "en": {
-      "description": "Joint 1 outer encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings."
-    },
-    "zh_CN": {
-      "description": "关节1外圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置。"
-    },
-    "zh_hant": {
-      "description": "關節1外圈速率超限",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設定。"
-    },
-    "kr": {
-      "description": "조인트 1 외부 속도 초과 경보",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄입니다."
-    },
-    "ja": {
-      "description": "関節1外輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます。"
-    },
-    "de": {
-      "description": "Die Außenringgeschwindigkeit von Gelenk 1 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá tốc độ ngoài của khớp 1",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes."
-    },
-    "es": {
-      "description": "La velocidad del anillo exterior de la articulación 1 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость наружной обоймы шарнира 1 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 1 아웃 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Alarme de dépassement de vitesse externe de l'articulation 1",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne."
-    }
-  },
-  {
-    "id": 2106,
-    "level": 1,
-    "en": {
-      "description": "Joint 2 outer encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings."
-    },
-    "zh_CN": {
-      "description": "关节2外圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置。"
-    },
-    "zh_hant": {
-      "description": "關節2外圈速率超限",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設定。"
-    },
-    "kr": {
-      "description": "조인트 2 외부 속도 초과 경보",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄입니다."
-    },
-    "ja": {
-      "description": "関節2外輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます。"
-    },
-    "de": {
-      "description": "Die Außenringgeschwindigkeit von Gelenk 2 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá tốc độ ngoài của khớp 2",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes."
-    },
-    "es": {
-      "description": "La velocidad del anillo exterior de la articulación 2 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость наружной обоймы шарнира 2 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 2 아웃 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Alarme de dépassement de vitesse externe de l'articulation 2",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne."
-    }
-  },
-  {
-    "id": 2107,
-    "level": 1,
-    "en": {
-      "description": "Joint 3 outer encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings."
-    },
-    "zh_CN": {
-      "description": "关节3外圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置。"
-    },
-    "zh_hant": {
-      "description": "關節3外圈速率超限",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設定。"
-    },
-    "kr": {
-      "description": "조인트 3 외부 속도 초과 경보",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄입니다."
-    },
-    "ja": {
-      "description": "関節3外輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます。"
-    },
-    "de": {
-      "description": "Die Außenringgeschwindigkeit von Gelenk 3 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá tốc độ ngoài của khớp 3",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes."
-    },
-    "es": {
-      "description": "La velocidad del anillo exterior de la articulación 3 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость наружной обоймы шарнира 3 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 3 아웃 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Alarme de dépassement de vitesse externe de l'articulation 3",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne."
-    }
-  },
-  {
-    "id": 2108,
-    "level": 1,
-    "en": {
-      "description": "Joint 4 outer encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings."
-    },
-    "zh_CN": {
-      "description": "关节4外圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置。"
-    },
-    "zh_hant": {
-      "description": "關節4外圈速率超限",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設定。"
-    },
-    "kr": {
-      "description": "조인트 4 외부 속도 초과 경보",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄입니다."
-    },
-    "ja": {
-      "description": "関節4外輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます。"
-    },
-    "de": {
-      "description": "Die Außenringgeschwindigkeit von Gelenk 4 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá tốc độ ngoài của khớp 4",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes."
-    },
-    "es": {
-      "description": "La velocidad del anillo exterior de la articulación 4 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость наружной обоймы шарнира 4 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 4 아웃 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Alarme de dépassement de vitesse externe de l'articulation 4",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne."
-    }
-  },
-  {
-    "id": 2109,
-    "level": 1,
-    "en": {
-      "description": "Joint 5 outer encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings."
-    },
-    "zh_CN": {
-      "description": "关节5外圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置。"
-    },
-    "zh_hant": {
-      "description": "關節5外圈速率超限",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設定。"
-    },
-    "kr": {
-      "description": "조인트 5 외부 속도 초과 경보",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄입니다."
-    },
-    "ja": {
-      "description": "関節5外輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます。"
-    },
-    "de": {
-      "description": "Die Außenringgeschwindigkeit von Gelenk 5 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá tốc độ ngoài của khớp 5",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes."
-    },
-    "es": {
-      "description": "La velocidad del anillo exterior de la articulación 5 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость наружной обоймы шарнира 5 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 5 아웃 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Alarme de dépassement de vitesse externe de l'articulation 5",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne."
-    }
-  },
-  {
-    "id": 2110,
-    "level": 1,
-    "en": {
-      "description": "Joint 6 outer encoder speed overrun",
-      "cause": "",
-      "solution": "Reduce joint speed or Cartesian speed settings."
-    },
-    "zh_CN": {
-      "description": "关节6外圈速率超限",
-      "cause": "",
-      "solution": "减小关节速度或笛卡尔速度设置。"
-    },
-    "zh_hant": {
-      "description": "關節6外圈速率超限警報",
-      "cause": "",
-      "solution": "降低關節速度或笛卡爾速度設定。"
-    },
-    "kr": {
-      "description": "조인트 6 외부 속도 초과 경보",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄입니다."
-    },
-    "ja": {
-      "description": "関節6外輪レート制限超過",
-      "cause": "",
-      "solution": "関節速度またはデカルト速度設定を下げます。"
-    },
-    "de": {
-      "description": "Die Außenringgeschwindigkeit von Gelenk 6 überschreitet den Grenzwert",
-      "cause": "",
-      "solution": "Verringerung der Gelenkgeschwindigkeits- oder der kartesischen Geschwindigkeitseinstellung"
-    },
-    "vi": {
-      "description": "Cảnh báo vượt quá tốc độ ngoài của khớp 6",
-      "cause": "",
-      "solution": "Giảm tốc độ khớp hoặc cài đặt tốc độ Descartes."
-    },
-    "es": {
-      "description": "La velocidad del anillo exterior de la articulación 6 excede el límite",
-      "cause": "",
-      "solution": "Disminuir la velocidad de las articulaciones o los ajustes de velocidad cartesiana"
-    },
-    "ru": {
-      "description": "Скорость наружной обоймы шарнира 6 превышает предельное значение",
-      "cause": "",
-      "solution": "Уменьшите настройку скорости шарнира или декартовой скорости"
-    },
-    "ko": {
-      "description": "조인트 6 아웃 링 속도 제한 초과",
-      "cause": "",
-      "solution": "조인트 속도 또는 데카르트 속도 설정을 줄이십시오"
-    },
-    "fr": {
-      "description": "Alarme de dépassement de vitesse externe de l'articulation 6",
-      "cause": "",
-      "solution": "Réduisez la vitesse de l'articulation ou les paramètres de vitesse cartésienne."
-    }
-  },
-  {
-    "id": 2112,
-    "level": 1,
-    "en": {
-      "description": "DO chip error",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "DO芯片错误",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "DOチップエラー",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "DO Chip-Fehler",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error de chip de DO",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка чипа DO",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "DO 칩 오류",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "DO芯片错误",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2113,
-    "level": 1,
-    "en": {
-      "description": "DO overcurrent alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "DO过流",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "DO過電流",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "DO Überstrom",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Sobrecorriente de DO",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Превышение номинального тока DO",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "DO 과전류",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "DO过流",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2114,
-    "level": 1,
-    "en": {
-      "description": "24V Generates alarms",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "24V输出告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "24V出力警報",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "24V-Ausgangsalarm",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de salida de 24 V",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Выходной сигнал тревоги 24 В",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "24V 출력 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "24V输出告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2128,
-    "level": 1,
-    "en": {
-      "description": "Power supply voltage detection An undervoltage alarm is generated",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "电源电压检测欠压告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "電源電圧検査電圧不足アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Unterspannungsalarm zur Erkennung der Versorgungsspannung",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de subtensión para detección de voltaje de alimentación",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация пониженного напряжения для обнаружения напряжения источника питания",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "전원 전압 저전압 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "电源电压检测欠压告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2129,
-    "level": 1,
-    "en": {
-      "description": "Power supply voltage detection overvoltage alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "电源电压检测过压告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "電源電圧検査過電圧アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überspannungsalarm zur Erkennung der Versorgungsspannung",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobretensión para detección de voltaje de alimentación",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация перенапряжения для обнаружения напряжения источника питания",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "전원 전압 과전압 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "电源电压检测过压告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2130,
-    "level": 1,
-    "en": {
-      "description": "The energy regenerative circuit detects an abnormal alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "馈能电路检测异常告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "エネルギー供給回路検査異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Erkennung von abnormalen Energie einspeisen Stromkreisen",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma anómala para detección del circuito de alimentación de energía",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Аномальный сигнал тревоги при обнаружении цепи подачи энергии",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "피드 회로 이상 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "馈能电路检测异常告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2132,
-    "level": 1,
-    "en": {
-      "description": "Emergency stop line detection exception alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "急停线路检测异常告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "非常停止回路検査異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Erkennung einer abnormalen Not-Aus-Linie",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma anómala para detección del circuito de parada de emergencia",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Аномальный сигнал тревоги для обнаружения цепи аварийного останова",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "긴급 정지 회로 이상 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "急停线路检测异常告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2133,
-    "level": 0,
-    "en": {
-      "description": "The body circuit detects a short circuit alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "本体电路检测短路告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "本体回路検査異常アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Erkennung von Kurzschluss im Körperstromkreis",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de cortocircuito para detección del circuito del cuerpo principal",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация короткого замыкания для обнаружения основной цепи корпуса",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "본체 회로 단락 경보 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "本体电路检测短路告警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2134,
-    "level": 1,
-    "en": {
-      "description": "The minimum input voltage is incorrectly set",
-      "cause": "",
-      "solution": "A system error occurs. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "电源输入电压最小值设置错误",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "電源入力電圧最小値設定異常エラー",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Falsche Einstellung des Mindestwertes der Eingangsspannung der Stromversorgung",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error al establecer el voltaje mínimo de entrada",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка установки минимального входного напряжения",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "전원 입력 전압 최소치 설정 오류",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "电源输入电压最小值设置错误",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2135,
-    "level": 1,
-    "en": {
-      "description": "24V Output overcurrent alarm",
-      "cause": "",
-      "solution": "A system error occurs. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "电源输入电压最大值设置错误",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "電源入力電圧最大値設定異常エラー",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Falsche Einstellung des Höchstwertes der Eingangsspannung der Stromversorgung",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Error al establecer el voltaje máximo de entrada",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Ошибка установки максимального входного напряжения",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "전원 입력 전압 최대치 설정 오류",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "电源输入电压最大值设置错误",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2136,
-    "level": 1,
-    "en": {
-      "description": "The MCU chip temperature is too high",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "MCU芯片温度检测过高",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "MCUチップ温度検査高温",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "MCU-Chiptemperatur zu hoch erkannt",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "La temperatura del chip MCU es demasiado alta",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Слишком высокая температура чипа MCU",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "MCU 칩 과열 감지",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "MCU芯片温度检测过高",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2137,
-    "level": 1,
-    "en": {
-      "description": "DI Type PNP setting detection error alarm",
-      "cause": "",
-      "solution": "A system error occurs. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "DI类型PNP设置检测错误告警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "DIタイプPNP設定検査エラー警報",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm DI-Typ PNP-Einstellung Erkennungsfehler",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por error de detección en configuración de tipo PNP de DI",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги из-за ошибки обнаружения в настройке типа DI PNP.",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "DI 유형 PNP 설정 오류 경보 감지",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "DI类型PNP设置检测错误告警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2138,
-    "level": 1,
-    "en": {
-      "description": "DI Type NPN Setting detection error alarm",
-      "cause": "",
-      "solution": "A system error occurs. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "DI类型NPN设置检测错误告警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "DIタイプNPN設定検査エラー警報",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm DI-Typ NPN-Einstellung Erkennungsfehler",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por error de detección en configuración de tipo NPN de DI",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Сработал сигнал тревоги из-за ошибки обнаружения в настройке типа DI NPN.",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "DI 유형 NPN 설정 오류 경보 감지",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "DI类型NPN设置检测错误告警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2139,
-    "level": 1,
-    "en": {
-      "description": "Shutdown check abnormal alarms",
-      "cause": "",
-      "solution": "A system error occurs. Contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "关机执行检测异常告警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "電源オフ実行検査異常アラーム",
-      "cause": "",
-      "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarme Erkennung bei der Abschaltungsausführung n.i.O.",
-      "cause": "",
-      "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma activada por detección anómala en ejecución de apagado",
-      "cause": "",
-      "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация срабатывает при обнаружении аномалий при выполнении отключения.",
-      "cause": "",
-      "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-    },
-    "ko": {
-      "description": "전원 끄기 실행 이상 경보 감지",
-      "cause": "",
-      "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "关机执行检测异常告警",
-      "cause": "",
-      "solution": "系统错误，请联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2140,
-    "level": 0,
-    "en": {
-      "description": "The energy regenerative time is detected abnormally",
-      "cause": "",
-      "solution": "Check whether the input power supply and load are normal, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "馈能时间检测异常",
-      "cause": "",
-      "solution": "检查输入电源和负载是否规范，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "エネルギー供給時間検査異常",
-      "cause": "",
-      "solution": "入力電源と負荷が規定どおりかを確認するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Erkennung der Energieeinspeisezeit n.i.O.",
-      "cause": "",
-      "solution": "Überprüfen Sie die Spezifikationen für die Eingangsleistung und die Last oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Detección anómala en el tiempo de alimentación de energía",
-      "cause": "",
-      "solution": "Compruebe si la fuente de alimentación de entrada y la carga son normales o comuníquese con los ingenieros de soporte técnico"
-    },
-    "ru": {
-      "description": "Аномальное обнаружение во время подачи энергии",
-      "cause": "",
-      "solution": "Проверьте, в норме ли входное питание и нагрузка, или обратитесь к инженерам технической поддержки."
-    },
-    "ko": {
-      "description": "피드 시간 이상 감지",
-      "cause": "",
-      "solution": "입력 전원 및 부하가 규격에 맞는지 확인하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "馈能时间检测异常",
-      "cause": "",
-      "solution": "检查输入电源和负载是否规范，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2144,
-    "level": 1,
-    "en": {
-      "description": "End drop alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "末端掉线报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツール切断アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Alarm Endunterbrechung",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de fuera de línea de extremo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Выключить будильник в автономном режиме",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "끝단 오프라인 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "末端掉线报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2145,
-    "level": 1,
-    "en": {
-      "description": "DO1 output overcurrent alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "DO1输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "DO1出力過電流アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "DO1-Ausgang Überstromalarm",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobrecorriente de salida DO1",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация перегрузки по току на выходе DO1",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "DO1 출력 과전류 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "DO1输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2146,
-    "level": 1,
-    "en": {
-      "description": "DO2 output overcurrent alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "DO2输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "DO2出力過電流アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "DO2-Ausgang Überstromalarm",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobrecorriente de salida DO2",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация перегрузки по току на выходе DO2",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "DO2 출력 과전류 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "DO2输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2147,
-    "level": 1,
-    "en": {
-      "description": "DO3 output overcurrent alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "DO3输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "DO3出力過電流アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "DO3-Ausgang Überstromalarm",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobrecorriente de salida DO3",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация перегрузки по току на выходе DO3",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "DO3 출력 과전류 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "DO3输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2148,
-    "level": 1,
-    "en": {
-      "description": "DO4 output overcurrent alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "DO4输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "DO4出力過電流アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "DO4-Ausgang Überstromalarm",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobrecorriente de salida DO4",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация перегрузки по току на выходе DO4",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "DO4 출력 과전류 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "DO4输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2149,
-    "level": 1,
-    "en": {
-      "description": "24V output overcurrent alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "24V输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "24V出力過電流警アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überstromalarm am 24V-Ausgang",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobrecorriente de salida de 24 V",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Сигнализация перегрузки по току на выходе 24 В",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "24V 출력 과전류 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "24V输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2160,
-    "level": 1,
-    "en": {
-      "description": "Terminal DO1 output overcurrent alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "末端DO1输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツールDO1出力過電流アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überstromalarm am DO1-Endausgang",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobrecorriente de salida DO1 de extremo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Конец сигнала перегрузки по току на выходе DO1",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "끝단 DO1 출력 과전류 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "末端DO1输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2161,
-    "level": 1,
-    "en": {
-      "description": "Terminal DO2 output overcurrent alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "末端DO2输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツールDO2出力過電流アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überstromalarm am DO2-Endausgang",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobrecorriente de salida DO2 de extremo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Конец сигнала перегрузки по току на выходе DO2",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "끝단 DO2 출력 과전류 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "末端DO2输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 2162,
-    "level": 1,
-    "en": {
-      "description": "Terminal 24V output overcurrent alarm",
-      "cause": "",
-      "solution": "Check whether the hardware is normal and restart, or contact technical support engineers"
-    },
-    "zh_CN": {
-      "description": "末端24V输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "ツール24V出力過電流警アラーム",
-      "cause": "",
-      "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-    },
-    "de": {
-      "description": "Überstromalarm am 24V-Endausgang",
-      "cause": "",
-      "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "Alarma de sobrecorriente de salida de 24 V de extremo",
-      "cause": "",
-      "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-    },
-    "ru": {
-      "description": "Конец сигнала перегрузки по току на выходе 24 В.",
-      "cause": "",
-      "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-    },
-    "ko": {
-      "description": "끝단 24V 출력 과전류 경보",
-      "cause": "",
-      "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-    },
-    "fr": {
-      "description": "末端24V输出过流报警",
-      "cause": "",
-      "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-    }
-  },
-  {
-    "id": 4096,
-    "level": 5,
-    "en": {
-      "description": "Track replay file does not exist",
-      "cause": "",
-      "solution": "Please check if the track replay file exists in the correct path."
-    },
-    "zh_CN": {
-      "description": "轨迹复现文件不存在",
-      "cause": "",
-      "solution": "请检查轨迹复现文件是否存在于正确的路径中。"
-    },
-    "zh_hant": {
-      "description": "軌跡複現文件不存在",
-      "cause": "",
-      "solution": "請檢查軌跡複現文件是否存在於正確的路徑中。"
-    },
-    "kr": {
-      "description": "트랙 재생 파일이 존재하지 않습니다",
-      "cause": "",
-      "solution": "트랙 재생 파일이 올바른 경로에 있는지 확인하십시오."
-    },
-    "ja": {
-      "description": "トラックリプレイファイルが存在しません",
-      "cause": "",
-      "solution": "トラックリプレイファイルが正しいパスに存在するか確認してください。"
-    },
-    "de": {
-      "description": "Die Wiedergabedatei der Strecke existiert nicht",
-      "cause": "",
-      "solution": "Bitte überprüfen Sie, ob die Wiedergabedatei der Strecke im richtigen Pfad vorhanden ist."
-    },
-    "vi": {
-      "description": "Tập tin phát lại theo dõi không tồn tại",
-      "cause": "",
-      "solution": "Vui lòng kiểm tra xem tập tin phát lại theo dõi có tồn tại trong đường dẫn đúng không."
-    },
-    "es": {
-      "description": "Archivo de repetición de trayectoria no existe",
-      "cause": "",
-      "solution": "Por favor, verifique si el archivo de repetición de trayectoria existe en la ruta correcta."
-    },
-    "fr": {
-      "description": "Le fichier de rejeu de trajectoire n'existe pas",
-      "cause": "",
-      "solution": "Veuillez vérifier si le fichier de rejeu de trajectoire existe dans le bon chemin."
-    },
-    "ko": {
-      "description": "트랙 재생 파일이 존재하지 않습니다",
-      "cause": "",
-      "solution": "트랙 재생 파일이 올바른 경로에 있는지 확인하십시오."
-    },
-    "ru": {
-      "description": "Файл воспроизведения трека не существует",
-      "cause": "",
-      "solution": "Пожалуйста, проверьте, существует ли файл воспроизведения трека по правильному пути."
-    }
-  },
-  {
-    "id": 4097,
-    "level": 5,
-    "en": {
-      "description": "Track replay file content error",
-      "cause": "",
-      "solution": "Please verify the content of the track replay file for any errors or inconsistencies."
-    },
-    "zh_CN": {
-      "description": "轨迹复现文件内容错误",
-      "cause": "",
-      "solution": "请验证轨迹复现文件的内容是否存在错误或不一致之处。"
-    },
-    "zh_hant": {
-      "description": "軌跡複現文件內容錯誤",
-      "cause": "",
-      "solution": "請驗證軌跡複現文件的內容是否存在錯誤或不一致之處。"
-    },
-    "kr": {
-      "description": "트랙 재생 파일 내용 오류",
-      "cause": "",
-      "solution": "트랙 재생 파일의 내용에 오류 또는 불일치 사항이 있는지 확인하십시오."
-    },
-    "ja": {
-      "description": "トラックリプレイファイルの内容エラー",
-      "cause": "",
-      "solution": "トラックリプレイファイルの内容にエラーまたは矛盾がないか確認してください。"
-    },
-    "de": {
-      "description": "Fehler im Inhalt der Wiedergabedatei der Strecke",
-      "cause": "",
-      "solution": "Bitte überprüfen Sie den Inhalt der Wiedergabedatei der Strecke auf Fehler oder Inkonsistenzen."
-    },
-    "vi": {
-      "description": "Lỗi nội dung tập tin phát lại theo dõi",
-      "cause": "",
-      "solution": "Vui lòng kiểm tra nội dung của tập tin phát lại theo dõi để tìm lỗi hoặc không nhất quán."
-    },
-    "es": {
-      "description": "Error de contenido en el archivo de repetición de trayectoria",
-      "cause": "",
-      "solution": "Por favor, verifique el contenido del archivo de repetición de trayectoria en busca de errores o inconsistencias."
-    },
-    "fr": {
-      "description": "Erreur de contenu du fichier de rejeu de trajectoire",
-      "cause": "",
-      "solution": "Veuillez vérifier le contenu du fichier de rejeu de trajectoire pour toute erreur ou incohérence."
-    },
-    "ko": {
-      "description": "트랙 재생 파일 내용 오류",
-      "cause": "",
-      "solution": "트랙 재생 파일의 내용에 오류 또는 불일치 사항이 있는지 확인하십시오."
-    },
-    "ru": {
-      "description": "Ошибка содержимого файла воспроизведения трека",
-      "cause": "",
-      "solution": "Пожалуйста, проверьте содержимое файла воспроизведения трека на наличие ошибок или несоответствий."
-    }
-  },
-  {
-    "id": 4098,
-    "level": 5,
-    "en": {
-      "description": "Track replay file name error",
-      "cause": "",
-      "solution": "Please ensure the track replay file has the correct and valid file name."
-    },
-    "zh_CN": {
-      "description": "轨迹复现文件名字错误",
-      "cause": "",
-      "solution": "请确保轨迹复现文件具有正确且有效的文件名。"
-    },
-    "zh_hant": {
-      "description": "軌跡複現文件名字錯誤",
-      "cause": "",
-      "solution": "請確保軌跡複現文件具有正確且有效的文件名。"
-    },
-    "kr": {
-      "description": "트랙 재생 파일 이름 오류",
-      "cause": "",
-      "solution": "트랙 재생 파일의 이름이 올바르고 유효한지 확인하십시오."
-    },
-    "ja": {
-      "description": "トラックリプレイファイル名エラー",
-      "cause": "",
-      "solution": "トラックリプレイファイルのファイル名が正確かつ有効であることを確認してください。"
-    },
-    "de": {
-      "description": "Fehlerhafter Name der Wiedergabedatei der Strecke",
-      "cause": "",
-      "solution": "Bitte stellen Sie sicher, dass die Wiedergabedatei der Strecke den richtigen und gültigen Dateinamen hat."
-    },
-    "vi": {
-      "description": "Lỗi tên tập tin phát lại theo dõi",
-      "cause": "",
-      "solution": "Vui lòng đảm bảo tập tin phát lại theo dõi có tên tệp đúng và hợp lệ."
-    },
-    "es": {
-      "description": "Error de nombre del archivo de repetición de trayectoria",
-      "cause": "",
-      "solution": "Por favor, asegúrese de que el archivo de repetición de trayectoria tenga el nombre correcto y válido."
-    },
-    "fr": {
-      "description": "Erreur de nom du fichier de rejeu de trajectoire",
-      "cause": "",
-      "solution": "Veuillez vous assurer que le fichier de rejeu de trajectoire a le nom correct et valide."
-    },
-    "ko": {
-      "description": "트랙 재생 파일 이름 오류",
-      "cause": "",
-      "solution": "트랙 재생 파일의 이름이 올바르고 유효한지 확인하십시오."
-    },
-    "ru": {
-      "description": "Ошибка имени файла воспроизведения трека",
-      "cause": "",
-      "solution": "Пожалуйста, убедитесь, что имя файла воспроизведения трека правильное и действительное."
-    }
-  },
-  {
-    "id": 4099,
-    "level": 5,
-    "en": {
-      "description": "Track replay running error",
-      "cause": "",
-      "solution": "If the track replay is encountering errors during execution, please review the log files and identify the root cause. If necessary, consult technical support for further assistance."
-    },
-    "zh_CN": {
-      "description": "轨迹复现运行中报错",
-      "cause": "",
-      "solution": "如果轨迹复现在运行过程中遇到错误，请查阅日志文件并找出根本原因。必要时，请咨询技术支持以获得进一步帮助。"
-    },
-    "zh_hant": {
-      "description": "軌跡複現運行中報錯",
-      "cause": "",
-      "solution": "如果軌跡複現在運行過程中遇到錯誤，請查閱日誌文件並找出根本原因。必要時，請諮詢技術支援以獲得進一步幫助。"
-    },
-    "kr": {
-      "description": "트랙 재생 실행 오류",
-      "cause": "",
-      "solution": "트랙 재생이 실행 중 오류가 발생하는 경우 로그 파일을 검토하고 원인을 확인하십시오. 필요한 경우 기술 지원을 상담하여 추가 도움을 받으십시오."
-    },
-    "ja": {
-      "description": "トラックリプレイ実行エラー",
-      "cause": "",
-      "solution": "トラックリプレイが実行中にエラーが発生している場合は、ログファイルを確認し、原因を特定してください。必要に応じて、さらなるサポートのために技術サポートに相談してください。"
-    },
-    "de": {
-      "description": "Fehler bei der Wiedergabe der Strecke",
-      "cause": "",
-      "solution": "Wenn bei der Wiedergabe der Strecke Fehler auftreten, überprüfen Sie bitte die Protokolldateien und identifizieren Sie die Ursache. Bei Bedarf konsultieren Sie den technischen Support für weitere Unterstützung."
-    },
-    "vi": {
-      "description": "Lỗi chạy tập tin phát lại theo dõi",
-      "cause": "",
-      "solution": "Nếu tập tin phát lại theo dõi gặp lỗi trong quá trình thực thi, vui lòng xem lại các tệp nhật ký và xác định nguyên nhân gốc. Nếu cần thiết, hãy tham vấn hỗ trợ kỹ thuật để được giúp đỡ thêm."
-    },
-    "es": {
-      "description": "Error en la ejecución de la repetición de la trayectoria",
-      "cause": "",
-      "solution": "Si la repetición de la trayectoria encuentra errores durante la ejecución, por favor revise los archivos de registro e identifique la causa raíz. Si es necesario, consulte el soporte técnico para obtener ayuda adicional."
-    },
-    "fr": {
-      "description": "Erreur d'exécution de la rejeu de trajectoire",
-      "cause": "",
-      "solution": "Si le rejeu de trajectoire rencontre des erreurs pendant l'exécution, veuillez vérifier les fichiers journaux et identifier la cause principale. Si nécessaire, consultez le support technique pour obtenir de l'aide supplémentaire."
-    },
-    "ko": {
-      "description": "트랙 재생 실행 오류",
-      "cause": "",
-      "solution": "트랙 재생이 실행 중 오류가 발생하는 경우 로그 파일을 검토하고 원인을 확인하십시오. 필요한 경우 기술 지원을 상담하여 추가 도움을 받으십시오."
-    },
-    "ru": {
-      "description": "Ошибка при выполнении воспроизведения трека",
-      "cause": "",
-      "solution": "Если воспроизведение трека в процессе выполнения сталкивается с ошибками, пожалуйста, просмотрите файлы журналов и определите корневую причину. При необходимости обратитесь за дополнительной помощью в службу технической поддержки."
-    }
-  },
-  {
-    "id": 4100,
-    "level": 5,
-    "en": {
-      "description": "The current trajectory recurrence does not support pausing.",
-      "cause": "",
-      "solution": "Rerun the trajectory to reproduce"
-    },
-    "zh_CN": {
-      "description": "当前轨迹复现不支持暂停",
-      "cause": "",
-      "solution": "重新进行轨迹复现"
-    },
-    "zh_hant": {
-      "description": "當前軌跡復現不支援暫停",
-      "cause": "",
-      "solution": "重新運行 軌跡復現"
-    },
-    "kr": {
-      "description": "현재 궤적 반복은 일시정지를 지원하지 않습니다.",
-      "cause": "",
-      "solution": "궤적을 다시 실행하여 재현"
-    },
-    "ja": {
-      "description": "現在の軌道の再帰は一時停止をサポートしていません。",
-      "cause": "",
-      "solution": "軌道を再実行して再現します"
-    },
-    "de": {
-      "description": "Die aktuelle Trajektorienwiederholung unterstützt keine Pause.",
-      "cause": "",
-      "solution": "Führen Sie die Flugbahn erneut aus, um sie zu reproduzieren"
-    },
-    "vi": {
-      "description": "Sự lặp lại quỹ đạo hiện tại không hỗ trợ việc tạm dừng.",
-      "cause": "",
-      "solution": "Перезапустите траекторию для воспроизведения."
-    },
-    "es": {
-      "description": "Vuelva a ejecutar la trayectoria para reproducir.",
-      "cause": "",
-      "solution": "Vuelva a ejecutar la trayectoria para reproducir."
-    },
-    "fr": {
-      "description": "La récurrence de la trajectoire actuelle ne prend pas en charge la pause.",
-      "cause": "",
-      "solution": "Réexécutez la trajectoire pour reproduire"
-    },
-    "ko": {
-      "description": "현재 궤적 반복은 일시정지를 지원하지 않습니다.",
-      "cause": "",
-      "solution": "궤적을 다시 실행하여 재현"
-    },
-    "ru": {
-      "description": "Текущая повторяемость траектории не поддерживает приостановку.",
-      "cause": "",
-      "solution": "Перезапустите траекторию для воспроизведения."
-    }
-  },
-  {
-    "id": 4112,
-    "level": 5,
-    "en": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "zh_CN": {
-      "description": "机器人本体SN和控制器匹配的SN不一致",
-      "cause": "",
-      "solution": "检查本体和控制器的匹配关系，联系技术支持。"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "de": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "fr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ko": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ru": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    }
-  },
-  {
-    "id": 4128,
-    "level": 5,
-    "en": {
-      "description": "The CODESYS engineering version of the controller does not match the board version",
-      "cause": "",
-      "solution": "Matching results file/dobot/userdata/SlaveLog, matching relation between file/dobot/userdata/codesys/codesys json, check the controller codesys project and the board, the matching relation between contact technical support. "
-    },
-    "zh_CN": {
-      "description": "控制器CODESYS工程版本与板卡版本不匹配",
-      "cause": "",
-      "solution": "匹配结果文件/dobot/userdata/SlaveLog，匹配关系文件/dobot/userdata/codesys/codesys.json，检查控制器CODESYS工程与板卡的匹配关系，联系技术支持。"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "de": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "fr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ko": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ru": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    }
-  },
-  {
-    "id": 4192,
-    "level": 5,
-    "en": {
-      "description": "dobot+ error",
-      "cause": "",
-      "solution": "Check dobot+ logs for detailed information"
-    },
-    "zh_CN": {
-      "description": "dobot+ 错误",
-      "cause": "",
-      "solution": "检查dobot+日志获取详细信息"
-    },
-    "zh_hant": {
-      "description": "dobot+ 錯誤",
-      "cause": "",
-      "solution": "檢查dobot+日誌獲取詳細資訊"
-    },
-    "kr": {
-      "description": "dobot+ 오류",
-      "cause": "",
-      "solution": "자세한 내용은 dobot+ 로그를 확인하십시오."
-    },
-    "ja": {
-      "description": "dobot+エラー",
-      "cause": "",
-      "solution": "詳細を取得するためのdobot+ログのチェック"
-    },
-    "de": {
-      "description": "Dobot+ Fehler",
-      "cause": "",
-      "solution": "Überprüfen Sie dobot+logs für detaillierte Informationen"
-    },
-    "vi": {
-      "description": "dobot+lỗi",
-      "cause": "",
-      "solution": "Kiểm tra nhật ký dobot+để biết chi tiết"
-    },
-    "es": {
-      "description": "dobot+ error",
-      "cause": "",
-      "solution": "Check user logs for more detailed information"
-    },
-    "fr": {
-      "description": "Erreur dobot +",
-      "cause": "",
-      "solution": "Vérifiez les journaux dobot + pour plus de détails"
-    },
-    "ko": {
-      "description": "dobot+ 오류",
-      "cause": "",
-      "solution": "자세한 내용은 dobot+로그를 확인하십시오."
-    },
-    "ru": {
-      "description": "Dobot + Ошибка",
-      "cause": "",
-      "solution": "Проверьте журнал dobot + для получения подробной информации"
-    }
-  },
-  {
-    "id": 4193,
-    "level": 5,
-    "en": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "zh_CN": {
-      "description": "用户脚本启动时，加载生态插件接口报错",
-      "cause": "",
-      "solution": "检查用户日志以及生态日志以获取详细的错误信息,或者联系技术支持获取更多帮助"
-    },
-    "zh_hant": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "kr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ja": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "de": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "vi": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "es": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "fr": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ko": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    },
-    "ru": {
-      "description": "",
-      "cause": "",
-      "solution": ""
-    }
-  }
-]
\ No newline at end of file
@@ -1,2834 +0,0 @@
-alarm_servo_list=[
-    {
-        "id": 8752,
-        "level": 1,
-        "en": {
-            "description": "Hardware overcurrent protection",
-            "cause": "",
-            "solution": "If the actual current collected by the servo is greater than 90% of the maximum hardware sampling current, check whether the hardware is normal, or contact technical support engineers"
-        },
-        "zh_CN": {
-            "description": "硬件过流保护",
-            "cause": "",
-            "solution": "伺服采集的电流实际值大于硬件最大采样电流的90%，检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "ハード過電流保護",
-            "cause": "",
-            "solution": "サーボが収集した電流の実際の値が、ハードの最大サンプリング電流の90%より大きく、ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Überstromschutz der Hardware",
-            "cause": "",
-            "solution": "Der tatsächliche Wert des vom Servo erfassten Stroms ist größer als 90 % des maximalen Abtaststroms der Hardware. Prüfen Sie, ob die Hardware i.O. ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Protección contra sobrecorriente de hardware",
-            "cause": "",
-            "solution": "Si la corriente real recogida por el servo es superior al 90 % de la corriente máxima de muestreo del hardware, compruebe si el hardware es normal o comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Аппаратная защита от перегрузки по току",
-            "cause": "",
-            "solution": "Если фактический ток, собираемый сервоприводом, превышает 90 % от максимального тока выборки оборудования, проверьте исправность оборудования или обратитесь к инженерам службы технической поддержки."
-        },
-        "ko": {
-            "description": "하드웨어 과전류 보호",
-            "cause": "",
-            "solution": "서보가 수집한 전류 실제 값이 하드웨어 최대 샘플링 전류의 90%보다 크면, 하드웨어 정상 여부를 확인하거나 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "硬件过流保护",
-            "cause": "",
-            "solution": "伺服采集的电流实际值大于硬件最大采样电流的90%，检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 8992,
-        "level": 1,
-        "en": {
-            "description": "Software over-current",
-            "cause": "",
-            "solution": "Power off and restart controller, or please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "软件过流保护",
-            "cause": "",
-            "solution": "断电重新启动，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "ソフト過電流保護",
-            "cause": "",
-            "solution": "切断して再起動するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Überstromschutz der Software",
-            "cause": "",
-            "solution": "Stromausfall und Neustart, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Protección contra sobrecorriente de software",
-            "cause": "",
-            "solution": "Apague y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Программная защита от перегрузки по току",
-            "cause": "",
-            "solution": "Выключите и перезапустите контроллер или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "소프트웨어 과전류 보호",
-            "cause": "",
-            "solution": "전원을 끄고 리부팅하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "软件过流保护",
-            "cause": "",
-            "solution": "断电重新启动，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 9040,
-        "level": 1,
-        "en": {
-            "description": "Module in overload status",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "模块过载保护",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "モジュール過負荷保護",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Überlastungsschutz des Moduls",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Módulo en estado de sobrecarga",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Модуль в состоянии перегрузки",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "모듈 과부하 보호",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "模块过载保护",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 9088,
-        "level": 1,
-        "en": {
-            "description": "The current offset of homing point is too high",
-            "cause": "",
-            "solution": "Reset the Zero point current offset"
-        },
-        "zh_CN": {
-            "description": "零点电流偏置过大保护",
-            "cause": "",
-            "solution": "重新设置零点电流偏置"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "ゼロ点電流オフセット過大保護",
-            "cause": "",
-            "solution": "ゼロ点電流オフセットを再設定します"
-        },
-        "de": {
-            "description": "Überlastungsschutz der Nullstromvorspannung",
-            "cause": "",
-            "solution": "Nullpunkt-Stromvorspannung zurücksetzen"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El desplazamiento actual del punto cero es demasiado alto",
-            "cause": "",
-            "solution": "Restablezca el desplazamiento actual del punto cero"
-        },
-        "ru": {
-            "description": "Текущее смещение нулевой точки слишком велико",
-            "cause": "",
-            "solution": "Сброс текущего смещения нулевой точки"
-        },
-        "ko": {
-            "description": "영점 전류 바이어스 과대 보호",
-            "cause": "",
-            "solution": "영점 전류 바이어스를 다시 설정하십시오"
-        },
-        "fr": {
-            "description": "零点电流偏置过大保护",
-            "cause": "",
-            "solution": "重新设置零点电流偏置"
-        }
-    },
-    {
-        "id": 12592,
-        "level": 1,
-        "en": {
-            "description": "Driver input phase is lost",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "驱动器输入缺相保护",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "ドライバ入力欠相保護",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Schutz gegen Phasenausfall am Antriebseingang",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Se ha perdido la fase de entrada del controlador",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Потеряна входная фаза привода",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "드라이버 입력 결상 보호",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "驱动器输入缺相保护",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 12816,
-        "level": 1,
-        "en": {
-            "description": "Voltage between PN is too high",
-            "cause": "",
-            "solution": "The server detects that the bus voltage is greater than the preset threshold. Check whether the hardware is normal, or contact technical support engineers"
-        },
-        "zh_CN": {
-            "description": "PN间过电压保护",
-            "cause": "",
-            "solution": "伺服检测母线电压值大于设定的阈值，检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "PN間過電流保護",
-            "cause": "",
-            "solution": "バスバー電圧値が設定した閾値より大きいとサーボが検出し、ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Überspannungsschutz zwischen PNs",
-            "cause": "",
-            "solution": "Der Servo erkennt einen Busspannungswert, der größer als der eingestellte Schwellenwert ist; überprüfen Sie, ob die Hardware korrekt ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El voltaje entre PN es demasiado alto",
-            "cause": "",
-            "solution": "El servidor detecta que el voltaje de bus es mayor que el umbral preestablecido. Compruebe si el hardware es normal o comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Напряжение между PN слишком высокое",
-            "cause": "",
-            "solution": "Сервер обнаружил, что напряжение на шине превышает заданный порог. Проверьте исправность оборудования или обратитесь к инженерам технической поддержки."
-        },
-        "ko": {
-            "description": "PN 간 과전압 보호",
-            "cause": "",
-            "solution": "서보가 감지한 버스 전압값이 설정된 임계값보다 큽니다. 하드웨어가 정상인지 확인하거나 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "PN间过电压保护",
-            "cause": "",
-            "solution": "伺服检测母线电压值大于设定的阈值，检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 12832,
-        "level": 1,
-        "en": {
-            "description": "Voltage between PN is too low",
-            "cause": "",
-            "solution": "The server detects that the bus voltage is less than the preset threshold. Check whether the hardware is normal, or contact technical support engineers"
-        },
-        "zh_CN": {
-            "description": "PN间电压不足保护",
-            "cause": "",
-            "solution": "伺服检测母线电压值小于设定的阈值，检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "PN間電圧不足保護",
-            "cause": "",
-            "solution": "バスバー電圧値が設定した閾値より小さいとサーボが検出し、ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Unterspannungsschutz zwischen PNs",
-            "cause": "",
-            "solution": "Der Servo erkennt einen Busspannungswert, der unter dem eingestellten Schwellenwert liegt, prüfen Sie, ob die Hardware i.O. ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El voltaje entre PN es demasiado bajo",
-            "cause": "",
-            "solution": "El servidor detecta que el voltaje de bus es menor que el umbral preestablecido. Compruebe si el hardware es normal o comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Напряжение между PN слишком низкое",
-            "cause": "",
-            "solution": "Сервер обнаружил, что напряжение на шине ниже заданного порога. Проверьте исправность оборудования или обратитесь к инженерам технической поддержки."
-        },
-        "ko": {
-            "description": "PN 간 전압 부족 보호",
-            "cause": "",
-            "solution": "서보가 감지한 버스 전압값이 설정된 임계값보다 작습니다. 하드웨어가 정상인지 확인하거나 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "PN间电压不足保护",
-            "cause": "",
-            "solution": "伺服检测母线电压值小于设定的阈值，检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 12816,
-        "level": 1,
-        "en": {
-            "description": "Voltage between PN is too high",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "PN间过电压保护",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "PN間過電流保護",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Überspannungsschutz zwischen PNs",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El voltaje entre PN es demasiado alto",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Напряжение между PN слишком высокое",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "PN 간 과전압 보호",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "PN间过电压保护",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 12832,
-        "level": 1,
-        "en": {
-            "description": "Voltage between PN is too low",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "PN间电压不足保护",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "PN間電圧不足保護",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Unterspannungsschutz zwischen PNs",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El voltaje entre PN es demasiado bajo",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Напряжение между PN слишком низкое",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "PN 간 전압 부족 보호",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "PN间电压不足保护",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 12928,
-        "level": 1,
-        "en": {
-            "description": "Servo and motor power matching failure",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "伺服和电机功率匹配故障",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "サーボとモータ電力の一致故障",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Fehler bei der Leistungsanpassung von Servo und Motor",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Fallo de coincidencia de potencia del servo y del motor",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Ошибка согласования мощности сервопривода и двигателя",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "서보 및 모터 전력 일치 오류",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "伺服和电机功率匹配故障",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 13184,
-        "level": 1,
-        "en": {
-            "description": "Driver output phase is wrong",
-            "cause": "",
-            "solution": "Wire as the correct phase sequence"
-        },
-        "zh_CN": {
-            "description": "驱动器输出相序错误保护",
-            "cause": "",
-            "solution": "按正确相序接线"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "ドライバ出力相順エラー保護",
-            "cause": "",
-            "solution": "正しい相順で接続してください"
-        },
-        "de": {
-            "description": "Schutz gegen Fehler in der Phasenfolge des Antriebsausgangs",
-            "cause": "",
-            "solution": "Verdrahtung in korrekter Phasenfolge"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La fase de salida del controlador es incorrecta",
-            "cause": "",
-            "solution": "Realice el cableado como la secuencia de fase correcta"
-        },
-        "ru": {
-            "description": "Неправильная выходная фаза привода",
-            "cause": "",
-            "solution": "Подключайте провода с соблюдением правильной последовательности фаз."
-        },
-        "ko": {
-            "description": "드라이버 출력 위상 순서 오류 보호",
-            "cause": "",
-            "solution": "올바른 위상 순서로 배선하십시오"
-        },
-        "fr": {
-            "description": "驱动器输出相序错误保护",
-            "cause": "",
-            "solution": "按正确相序接线"
-        }
-    },
-    {
-        "id": 17168,
-        "level": 1,
-        "en": {
-            "description": "Driver temperature is too high",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "驱动器过热保护",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "ドライバ過熱保護",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Überhitzungsschutz des Treibers",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La temperatura del controlador es demasiado alta",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Слишком высокая температура привода",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "드라이버 과열 보호",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "驱动器过热保护",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 17169,
-        "level": 1,
-        "en": {
-            "description": "The temperature measuring resistance is damaged or not installed",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "测温电阻损坏或未安装",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "温度測定抵抗の損傷または設置されていない",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Temperaturmesswiderstand beschädigt oder nicht installiert",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La resistencia de medición de temperatura está dañada o no se ha instalado",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Сопротивление для измерения температуры повреждено или не установлено.",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "온도 측정 저항이 파손되었거나 설치되지 않음",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "测温电阻损坏或未安装",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 21008,
-        "level": 1,
-        "en": {
-            "description": "Driver recognition is abnormal",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "驱动板辨识异常保护",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "ドライバボード識別異常保護",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Schutz vor Erkennungsfehlern der Treiberplatte",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La identificación del controlador es anómala",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Ненормальная идентификация привода",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "구동 보드 인식 이상 보호",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "驱动板辨识异常保护",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 21120,
-        "level": 1,
-        "en": {
-            "description": "FPGA configuration is wrong",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "FPGA配置错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "FPGA設定エラー",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "FPGA-Konfigurationsfehler",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La configuración de FPGA es incorrecta",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Неверная конфигурация FPGA",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "FPGA 설정 오류",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "FPGA配置错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 21121,
-        "level": 1,
-        "en": {
-            "description": "System error",
-            "cause": "",
-            "solution": "Please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "内部错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "内部エラー",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Interner Fehler",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Error interno",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Внутренняя ошибка",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "내부 오류",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "内部错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 21122,
-        "level": 1,
-        "en": {
-            "description": "STO safety wiring is fault",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "STO安全接线故障保护",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "STO安全接続故障保護",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Schutz gegen STO-Sicherheitsverdrahtungsfehler",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El cableado de seguridad de STO es anómalo",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Неисправность защитной проводки STO",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "STO 안전 배선 오류 보호",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "STO安全接线故障保护",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 21569,
-        "level": 1,
-        "en": {
-            "description": "Dirver connection is abnormal",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "驱动板连接异常保护",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "ドライバボード接続異常保護",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Schutz vor Anschlussfehlern der Antriebsplatine",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La conexión del controlador es anómala",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Ненормальное подключение привода",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "구동 보드 연결 이상 보호",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "驱动板连接异常保护",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 25378,
-        "level": 1,
-        "en": {
-            "description": "The DI function is repeatedly assigned",
-            "cause": "",
-            "solution": "Check DI group parameters to see whether the same function is assigned to different DI\u0027s"
-        },
-        "zh_CN": {
-            "description": "DI功能重复分配",
-            "cause": "",
-            "solution": "检查DI组参数，是否有同一个功能分配在不同的DI上"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "DI機能重複分配",
-            "cause": "",
-            "solution": "DIグループパラメータを検査し、同一機能が異なるDIに分配されているかどうか"
-        },
-        "de": {
-            "description": "Doppelte Zuweisung von DI-Funktionen",
-            "cause": "",
-            "solution": "Überprüfung der DI-Gruppenparameter für dieselbe Funktion, die verschiedenen DIs zugewiesen ist"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La función de DI se asigna repetidamente",
-            "cause": "",
-            "solution": "Compruebe los parámetros del grupo de DI para ver si la misma función está asignada a diferentes DI"
-        },
-        "ru": {
-            "description": "Функция DI назначается повторно",
-            "cause": "",
-            "solution": "Проверьте параметры группы DI, чтобы увидеть, не назначена ли одна и та же функция разным DI."
-        },
-        "ko": {
-            "description": "DI 기능 중복 할당",
-            "cause": "",
-            "solution": "DI 그룹 파라미터를 확인하고, 동일한 기능이 상이한 DI에 할당되어 있는지 확인하십시오"
-        },
-        "fr": {
-            "description": "DI功能重复分配",
-            "cause": "",
-            "solution": "检查DI组参数，是否有同一个功能分配在不同的DI上"
-        }
-    },
-    {
-        "id": 25379,
-        "level": 1,
-        "en": {
-            "description": "The DO function allocation exceeds the limit",
-            "cause": "",
-            "solution": "Check whether communication cables are reliably connected"
-        },
-        "zh_CN": {
-            "description": "DO功能分配超限",
-            "cause": "",
-            "solution": "检查通讯线缆是否可靠连接"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "DO機能分配制限超過",
-            "cause": "",
-            "solution": "通信ケーブルが確実に接続されているかを検査します"
-        },
-        "de": {
-            "description": "Überschreitung der DO-Funktionszuweisung",
-            "cause": "",
-            "solution": "Prüfen Sie, ob das Kommunikationskabel zuverlässig angeschlossen ist"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La asignación de la función de DO excede el límite",
-            "cause": "",
-            "solution": "Compruebe si los cables de comunicación están conectados de forma fiable"
-        },
-        "ru": {
-            "description": "Превышение предела распределения функции DO",
-            "cause": "",
-            "solution": "Проверьте надежность подключения кабелей связи."
-        },
-        "ko": {
-            "description": "DO 기능 할당 한계 초과",
-            "cause": "",
-            "solution": "통신 케이블이 안전하게 연결되었는지 확인하십시오"
-        },
-        "fr": {
-            "description": "DO功能分配超限",
-            "cause": "",
-            "solution": "检查通讯线缆是否可靠连接"
-        }
-    },
-    {
-        "id": 25382,
-        "level": 1,
-        "en": {
-            "description": "The upper and lower limits of the software location are incorrectly set",
-            "cause": "",
-            "solution": "Check whether communication cables are reliably connected"
-        },
-        "zh_CN": {
-            "description": "软件位置上下限设置错误",
-            "cause": "",
-            "solution": "正确的设置0x607D-01h，0x607D-02h的值"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "ソフトウェア位置の上下限設定エラー",
-            "cause": "",
-            "solution": "0x607D-01hと0x607D-02hの値を正しく設定します"
-        },
-        "de": {
-            "description": "Positionsober- und -untergrenzen der Software falsch eingestellt",
-            "cause": "",
-            "solution": "Werte 0x607D-01h, 0x607D-02h korrekt einstellen"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Los límites superior e inferior de la ubicación de software se han establecido de forma incorrecta",
-            "cause": "",
-            "solution": "Establezca los valores correctos de 0x607D-01h y 0x607D-02h"
-        },
-        "ru": {
-            "description": "Неправильно установлены верхняя и нижняя границы расположения ПО",
-            "cause": "",
-            "solution": "Установите правильные значения 0x607D-01h и 0x607D-02h."
-        },
-        "ko": {
-            "description": "소프트웨어 위치 상한/하한 설정 오류",
-            "cause": "",
-            "solution": "0x607D-01h, 0x607D-02h 값을 정확하게 설정하십시오"
-        },
-        "fr": {
-            "description": "软件位置上下限设置错误",
-            "cause": "",
-            "solution": "正确的设置0x607D-01h，0x607D-02h的值"
-        }
-    },
-    {
-        "id": 25383,
-        "level": 1,
-        "en": {
-            "description": "The origin bias setting is incorrect",
-            "cause": "",
-            "solution": "Set the values of 0x607D-01h and 0x607D-02h correctly and ensure that the origin offset of 0x607C is between them"
-        },
-        "zh_CN": {
-            "description": "原点偏置设置错误",
-            "cause": "",
-            "solution": "正确的设置0x607D-01h，0x607D-02h的值，保证原点偏置值0x607C介于二者之间"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "原点オフセット設定エラー",
-            "cause": "",
-            "solution": "0x607D-01hと0x607D-02hの値を正しく設定し、原点オフセット値0x607Cが2つの間にあることを保証します"
-        },
-        "de": {
-            "description": "Ursprungversatz falsch eingestellt",
-            "cause": "",
-            "solution": "Stellen Sie die Werte von 0x607D-01h, 0x607D-02h korrekt ein und stellen Sie sicher, dass der Ursprungversatzswert 0x607C zwischen den beiden Werten liegt"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La configuración de desplazamiento de origen es incorrecta",
-            "cause": "",
-            "solution": "Establezca los valores correctos de 0x607D-01h y 0x607D-02h y asegúrese de que el desplazamiento de origen de 0x607C esté entre ellos"
-        },
-        "ru": {
-            "description": "Неверная настройка смещения начала координат.",
-            "cause": "",
-            "solution": "Установите правильные значения 0x607D-01h и 0x607D-02h и убедитесь, что смещение начала координат 0x607C находится между ними."
-        },
-        "ko": {
-            "description": "원점 바이어스 설정 오류",
-            "cause": "",
-            "solution": "0x607D-01h, 0x607D-02h 값을 정확하게 설정하고, 원점 바이어스 값 0x607C이 두 값 사이에 있도록 하십시오"
-        },
-        "fr": {
-            "description": "原点偏置设置错误",
-            "cause": "",
-            "solution": "正确的设置0x607D-01h，0x607D-02h的值，保证原点偏置值0x607C介于二者之间"
-        }
-    },
-    {
-        "id": 28961,
-        "level": 1,
-        "en": {
-            "description": "Blocking motor overheating protection",
-            "cause": "",
-            "solution": "Check whether the lock gate opens normally or whether the motor is stuck due to mechanical failure"
-        },
-        "zh_CN": {
-            "description": "堵转电机过热保护",
-            "cause": "",
-            "solution": "检查抱闸是否正常打开或电机是否由于机械故障被卡住"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "モータ詰まり過熱保護",
-            "cause": "",
-            "solution": "ブレーキが正常に開いているか、あるいはモータが機械故障で詰まっているかを検査します"
-        },
-        "de": {
-            "description": "Überhitzungsschutz für blockierten Motor",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Haltebremse ordnungsgemäß öffnet oder ob der Motor nicht aufgrund eines mechanischen Fehlers blockiert ist"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Bloqueo de protección contra sobrecalentamiento del motor.",
-            "cause": "",
-            "solution": "Compruebe si el freno se abre normalmente o si el motor está atascado debido a un fallo mecánico"
-        },
-        "ru": {
-            "description": "Блокировка защиты двигателя от перегрева",
-            "cause": "",
-            "solution": "Проверьте, нормально ли отключается тормоз или не заклинил ли двигатель из-за механической неисправности."
-        },
-        "ko": {
-            "description": "블로킹 모터 과열 보호",
-            "cause": "",
-            "solution": "브레이크 홀딩이 정상적으로 열렸는지 또는 기계적 결함으로 인해 모터에 걸림이 있는지 확인하십시오"
-        },
-        "fr": {
-            "description": "堵转电机过热保护",
-            "cause": "",
-            "solution": "检查抱闸是否正常打开或电机是否由于机械故障被卡住"
-        }
-    },
-    {
-        "id": 29056,
-        "level": 1,
-        "en": {
-            "description": "Motor is in overload status",
-            "cause": "",
-            "solution": "Check whether the end load of the robot exceeds the nominal load of the robot or contact the relevant technical personnel to replace the motor"
-        },
-        "zh_CN": {
-            "description": "电机过载保护",
-            "cause": "",
-            "solution": "检查机器人末端负载是否超过机器人标称负载或联系相关技术人员更换电机"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "モータ過負荷保護",
-            "cause": "",
-            "solution": "ロボットのツール負荷がロボットの定格負荷を超過しているかを検査する、あるいは関連の技術スタッフに連絡してモータを交換します"
-        },
-        "de": {
-            "description": "Überlastungsschutz des Motors",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Endlast des Roboters die Nennlast des Roboters nicht überschreitet, oder wenden Sie sich an den zuständigen Techniker, um den Motor auszutauschen."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El motor está en estado de sobrecarga",
-            "cause": "",
-            "solution": "Compruebe si la carga de extremo del robot excede la carga nominal del robot o comuníquese con el personal técnico correspondiente para reemplazar el motor"
-        },
-        "ru": {
-            "description": "Перегрузка двигателя",
-            "cause": "",
-            "solution": "Проверьте, превышает ли конечная нагрузка на робота номинальную нагрузку, или обратитесь к соответствующему техническому персоналу для замены двигателя."
-        },
-        "ko": {
-            "description": "모터 과부하 보호",
-            "cause": "",
-            "solution": "로봇의 끝단 부하가 공칭하중을 초과하는지 확인하거나 관련 기술자에게 문의하여 모터를 교체하십시오"
-        },
-        "fr": {
-            "description": "电机过载保护",
-            "cause": "",
-            "solution": "检查机器人末端负载是否超过机器人标称负载或联系相关技术人员更换电机"
-        }
-    },
-    {
-        "id": 29568,
-        "level": 1,
-        "en": {
-            "description": "Encoder communication is abnormal",
-            "cause": "",
-            "solution": "Check the encoder connection or replace the maintenance encoder"
-        },
-        "zh_CN": {
-            "description": "编码器通信断线异常保护",
-            "cause": "",
-            "solution": "检查编码器接线或更换维修编码器"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "エンコーダ通信遮断異常保護",
-            "cause": "",
-            "solution": "エンコーダの接続を検査するか、エンコーダを交換修理します"
-        },
-        "de": {
-            "description": "Schutz vor Unterbrechung der Encoder-Kommunikation bei abnormalen Bedingungen",
-            "cause": "",
-            "solution": "Überprüfen Sie die Verdrahtung des Encoders oder tauschen Sie den Encoder aus."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La comunicación del codificador es anómala",
-            "cause": "",
-            "solution": "Compruebe la conexión del codificador o reemplace el codificador de mantenimiento"
-        },
-        "ru": {
-            "description": "Неполадки связи с устройством кодирования",
-            "cause": "",
-            "solution": "Проверьте подключение устройства кодирования или замените его."
-        },
-        "ko": {
-            "description": "인코더 통신 끊김 이상 보호",
-            "cause": "",
-            "solution": "인코더 배선을 확인하거나 인코더를 교체 또는 보수하십시오"
-        },
-        "fr": {
-            "description": "编码器通信断线异常保护",
-            "cause": "",
-            "solution": "检查编码器接线或更换维修编码器"
-        }
-    },
-    {
-        "id": 29569,
-        "level": 1,
-        "en": {
-            "description": "Encoder is abnormal",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "编码器异常故障",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "エンコーダ異常故障",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Encoder n.i.O.",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El codificador es anómalo",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Ненормальная работа устройства кодирования",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "인코더 이상 오류",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "编码器异常故障",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 29570,
-        "level": 1,
-        "en": {
-            "description": "Encoder battery is abnormal",
-            "cause": "",
-            "solution": "Please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "编码器电池异常保护",
-            "cause": "",
-            "solution": "请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "エンコーダ電池異常保護",
-            "cause": "",
-            "solution": "テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Batterieschutz des Encoders n.i.O.",
-            "cause": "",
-            "solution": "Wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La batería del codificador es anómala",
-            "cause": "",
-            "solution": "Comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Неисправность батареи устройства кодирования",
-            "cause": "",
-            "solution": "Свяжитесь с инженером технической поддержки"
-        },
-        "ko": {
-            "description": "인코더 배터리 이상 보호",
-            "cause": "",
-            "solution": "기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "编码器电池异常保护",
-            "cause": "",
-            "solution": "请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 29571,
-        "level": 1,
-        "en": {
-            "description": "Encoder internal error",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "主编码器内部错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "メインエンコーダ内部エラー",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Interner Fehler im Hauptencoder",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Error interno del codificador principal",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Внутренняя ошибка главного устройства кодирования",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "메인 인코더 내부 오류",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "主编码器内部错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 29572,
-        "level": 1,
-        "en": {
-            "description": "Encoder CRC check error",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "主编码器CRC校验错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "メインエンコーダCRC校正エラー",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "CRC-Prüfsummenfehler des Hauptencoders",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Error de verificación de CRC del codificador principal",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Ошибка CRC-проверки главного устройства кодирования",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "메인 인코더 CRC 검증 오류",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "主编码器CRC校验错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 29573,
-        "level": 1,
-        "en": {
-            "description": "Auxiliary Encoder is disconnected",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "辅助编码器断线错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "補助エンコーダ断線エラー",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Trennungsfehler im Hilfsencoder (Drahtbruch)",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El codificador auxiliar está desconectado",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Вспомогательное устройство кодирования отключено.",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "보조 인코더 끊김 오류",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "辅助编码器断线错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 29574,
-        "level": 1,
-        "en": {
-            "description": "Auxiliary Encoder internal error",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "辅助编码器内部错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "補助エンコーダ内部エラー",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Interner Fehler im Hilfsencoder",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Error interno del codificador auxiliar",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Внутренняя ошибка вспомогательного устройства кодирования",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "보조 인코더 내부 오류",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "辅助编码器内部错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 29575,
-        "level": 1,
-        "en": {
-            "description": "Auxiliary Encoder CRC check error",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "辅助编码器CRC校验错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "補助エンコーダCRC校正エラー",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "CRC-Prüfsummenfehler des Hilfsencoders",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Error de verificación de CRC del codificador auxiliar",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Ошибка CRC-проверки вспомогательного устройства кодирования",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "보조 인코더 CRC 검증 오류",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "辅助编码器CRC校验错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 29576,
-        "level": 1,
-        "en": {
-            "description": "The pwm output buffer is abnormal",
-            "cause": "",
-            "solution": "Replace driver"
-        },
-        "zh_CN": {
-            "description": "pwm输出buffer异常",
-            "cause": "",
-            "solution": "更换驱动器"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "pwm出力buffer異常",
-            "cause": "",
-            "solution": "ドライバを交換"
-        },
-        "de": {
-            "description": "Ausnahme im Pwm-Ausgangspuffer",
-            "cause": "",
-            "solution": "Austausch des Treibers"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El búfer de salida de pwm es anómalo",
-            "cause": "",
-            "solution": "Reemplace el controlador"
-        },
-        "ru": {
-            "description": "Выходной буфер ШИМ неисправен",
-            "cause": "",
-            "solution": "Замените привод"
-        },
-        "ko": {
-            "description": "pwm buffer 출력 이상",
-            "cause": "",
-            "solution": "드라이버 교체"
-        },
-        "fr": {
-            "description": "pwm输出buffer异常",
-            "cause": "",
-            "solution": "更换驱动器"
-        }
-    },
-    {
-        "id": 29577,
-        "level": 1,
-        "en": {
-            "description": "The lock power supply is abnormal",
-            "cause": "",
-            "solution": "Check whether the lock is connected or damaged"
-        },
-        "zh_CN": {
-            "description": "抱闸电源异常",
-            "cause": "",
-            "solution": "检查抱闸是否连接或是否损坏"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "ブレーキ電源異常",
-            "cause": "",
-            "solution": "ブレーキが接続されているか、あるいは損傷しているかを検査します"
-        },
-        "de": {
-            "description": "Bremsenleistung n.i.O.",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Bremse angeschlossen oder beschädigt ist"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La fuente de alimentación del freno es anómala",
-            "cause": "",
-            "solution": "Compruebe si el freno está conectado o dañado"
-        },
-        "ru": {
-            "description": "Неисправность питания тормозов",
-            "cause": "",
-            "solution": "Проверьте, подключен ли тормоз и не поврежден ли он"
-        },
-        "ko": {
-            "description": "브레이크 홀딩 전원 이상",
-            "cause": "",
-            "solution": "브레이크 홀딩 연결 여부 또는 손상 여부를 확인하십시오"
-        },
-        "fr": {
-            "description": "抱闸电源异常",
-            "cause": "",
-            "solution": "检查抱闸是否连接或是否损坏"
-        }
-    },
-    {
-        "id": 29584,
-        "level": 1,
-        "en": {
-            "description": "Large deviation of joint position",
-            "cause": "",
-            "solution": "1. Check production parameters; 2. Check encoder installation; 3. Check transmission structure"
-        },
-        "zh_CN": {
-            "description": "关节位置偏差大",
-            "cause": "",
-            "solution": "1.检查生产参数 2.检查编码器安装 3.检查传动结构"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "関節位置の大きなずれ",
-            "cause": "",
-            "solution": "1. 製造パラメータを確認する  2. エンコーダの設置を確認する  3. 伝送構造を確認する"
-        },
-        "de": {
-            "description": "Große Positionsabweichung des Gelenks",
-            "cause": "",
-            "solution": "1. Produktionsparameter überprüfen  2. Encoder-Installation überprüfen  3. Übertragungsstruktur überprüfen"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Gran desviación en la posición de la articulación.",
-            "cause": "",
-            "solution": "1. Verificar los parámetros de producción  2. Verificar la instalación del codificador  3. Verificar la estructura de transmisión"
-        },
-        "ru": {
-            "description": "Большое отклонение в положении шарнира",
-            "cause": "",
-            "solution": "1. Проверьте производственные параметры  2. Проверьте установку энкодера  3. Проверьте структуру передачи"
-        },
-        "ko": {
-            "description": "조인트 위치의 편차가 큼",
-            "cause": "",
-            "solution": "1. 생산 매개변수 확인  2. 엔코더 설치 확인  3. 드라이브 구조 확인"
-        },
-        "fr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        }
-    },
-    {
-        "id": 30080,
-        "level": 1,
-        "en": {
-            "description": "EtherCAT communication is abnormal",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "EtherCAT通讯异常保护",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "EtherCAT通信異常保護",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Schutz vor EtherCAT-Kommunikationsausfall",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La comunicación EtherCAT es anómala",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Связь EtherCAT ненормальна",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "EtherCAT 통신 이상 보호",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "EtherCAT通讯异常保护",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 30081,
-        "level": 1,
-        "en": {
-            "description": "The XML configuration file was not burned",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "未烧录XML配置文件",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "XML設定ファイルが書き込まれていません",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "XML-Konfigurationsdatei nicht gebrannt",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El archivo de configuración XML no se ha grabado",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Файл конфигурации XML не был записан.",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "XML 설정 파일을 굽지 않음",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "未烧录XML配置文件",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 30082,
-        "level": 1,
-        "en": {
-            "description": "The synchronization period is incorrectly configured",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "同步周期配置错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "同期サイクル設定エラー",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Falsche Konfiguration der Synchronisationsperiode",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El periodo de sincronización se ha configurado de forma incorrecta",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Неправильно настроен период синхронизации",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "주기 동기화 설정 오류",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "同步周期配置错误",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 30083,
-        "level": 1,
-        "en": {
-            "description": "During synchronous communication, the synchronization signal of the master station is lost",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "同步通信时，主站同步信号丢失",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "同期通信時にマスター同期信号が失われた",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Master-Synchronisationssignal während der Synchronisationskommunikation verloren",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Durante la comunicación síncrona, se ha perdido la señal de sincronización de la estación maestra",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "При синхронной связи теряется сигнал синхронизации ведущей станции.",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "통신 동기화 시, 일차국 동기화 신호 손실",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "同步通信时，主站同步信号丢失",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 30084,
-        "level": 1,
-        "en": {
-            "description": "The synchronization period error is too large",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "同步周期误差过大",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "同期サイクル誤差が過大",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Synchronisationszyklusfehler zu groß",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El error del periodo de sincronización es demasiado grande",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Ошибка периода синхронизации слишком велика",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "주기 동기화 오차가 지나치게 큼",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "同步周期误差过大",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 33920,
-        "level": 1,
-        "en": {
-            "description": "Output speed is higher than the expected speed",
-            "cause": "",
-            "solution": "Check whether the linear connection of the motor is normal"
-        },
-        "zh_CN": {
-            "description": "超过最大转速保护",
-            "cause": "",
-            "solution": "检测电机线序连接是否正常"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "最大回転数超過保護",
-            "cause": "",
-            "solution": "モータ配線接続が正常であるかを検査します"
-        },
-        "de": {
-            "description": "Schutz vor Überschreitung der maximalen Drehzahl",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Motordrahtfolge richtig angeschlossen ist."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La velocidad de salida es mayor que la velocidad esperada",
-            "cause": "",
-            "solution": "Compruebe si la conexión lineal del motor es normal"
-        },
-        "ru": {
-            "description": "Выходная скорость выше ожидаемой скорости",
-            "cause": "",
-            "solution": "Проверьте, нормально ли линейное соединение двигателя."
-        },
-        "ko": {
-            "description": "최대 회전 속도 초과 보호",
-            "cause": "",
-            "solution": "모터 배선 순서가 정상적으로 연결되었는지 확인하십시오"
-        },
-        "fr": {
-            "description": "超过最大转速保护",
-            "cause": "",
-            "solution": "检测电机线序连接是否正常"
-        }
-    },
-    {
-        "id": 33921,
-        "level": 1,
-        "en": {
-            "description": "Difference between the set speed and current speed exceeds the range",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, restart the controller, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "速度偏差过大保护",
-            "cause": "",
-            "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "速度偏差過大保護",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認し、再起動するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Schutz vor übermäßiger Drehzahlabweichung",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, und starten Sie es erneut, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La diferencia entre la velocidad establecida y la velocidad actual excede el rango",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente y reinicie el controlador, o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Разница между заданной скоростью и текущей скоростью выходит за пределы допустимого диапазона",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования и перезагрузите контроллер или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "속도 편차 과대 보호",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하고 리부팅하거나 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "速度偏差过大保护",
-            "cause": "",
-            "solution": "检查硬件是否正常并重新启动，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 33922,
-        "level": 1,
-        "en": {
-            "description": "Motor is stalled ",
-            "cause": "",
-            "solution": "Check whether the electrical Angle is normal or whether the motor is damaged"
-        },
-        "zh_CN": {
-            "description": "电机失速保护",
-            "cause": "",
-            "solution": "检查电机电角度是否正常或电机是否损坏"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "モータ失速保護",
-            "cause": "",
-            "solution": "モータ電気角度が正常である、あるいはモータが損傷しているかを検査します"
-        },
-        "de": {
-            "description": "Motorschutz für Überziehgeschwindigkeit",
-            "cause": "",
-            "solution": "Prüfen Sie, ob der Motorwinkel i.O. ist oder ob der Motor beschädigt ist"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "El motor se ha calado",
-            "cause": "",
-            "solution": "Compruebe si el ángulo eléctrico es normal o si el motor está dañado"
-        },
-        "ru": {
-            "description": "Нештатная остановка двигателя",
-            "cause": "",
-            "solution": "Проверьте, нормальный ли электрический угол и не поврежден ли двигатель."
-        },
-        "ko": {
-            "description": "모터 스톨 보호",
-            "cause": "",
-            "solution": "모터 전기 각도 정상 여부 또는 모터 손상 여부를 확인하십시오"
-        },
-        "fr": {
-            "description": "电机失速保护",
-            "cause": "",
-            "solution": "检查电机电角度是否正常或电机是否损坏"
-        }
-    },
-    {
-        "id": 34321,
-        "level": 1,
-        "en": {
-            "description": "Difference between the set positon and current position exceeds the range",
-            "cause": "",
-            "solution": "System error, please contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "位置偏差过大保护",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "位置偏差過大保護",
-            "cause": "",
-            "solution": "システムエラー。テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Schutz vor übermäßiger Positionsabweichung",
-            "cause": "",
-            "solution": "Systemfehler, bitte wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La diferencia entre la posición establecida y la posición actual excede el rango",
-            "cause": "",
-            "solution": "Error del sistema. Comuníquese con los ingenieros de soporte técnico"
-        },
-        "ru": {
-            "description": "Разница между заданным и текущим положением выходит за пределы допустимого диапазона",
-            "cause": "",
-            "solution": "Системная ошибка. Свяжитесь с инженерами технической поддержки"
-        },
-        "ko": {
-            "description": "위치 편차 과대 보호",
-            "cause": "",
-            "solution": "시스템 오류가 발생했습니다. 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "位置偏差过大保护",
-            "cause": "",
-            "solution": "系统错误，请联系技术支持工程师"
-        }
-    },
-    {
-        "id": 34322,
-        "level": 1,
-        "en": {
-            "description": "Postion is out of range",
-            "cause": "",
-            "solution": "Enter the correct parameters"
-        },
-        "zh_CN": {
-            "description": "位置给定超限保护",
-            "cause": "",
-            "solution": "请输入正确参数"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "位置指令制限超過保護",
-            "cause": "",
-            "solution": "正しいパラメータを入力してください"
-        },
-        "de": {
-            "description": "Schutz vor Überschreitung der Positionsvorgabe",
-            "cause": "",
-            "solution": "Bitte geben Sie die richtigen Parameter ein"
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La posición está fuera de rango",
-            "cause": "",
-            "solution": "Introduzca los parámetros correctos"
-        },
-        "ru": {
-            "description": "Позиция вне диапазона",
-            "cause": "",
-            "solution": "Введите правильные параметры"
-        },
-        "ko": {
-            "description": "위치 지정 한계 초과 보호",
-            "cause": "",
-            "solution": "정확한 파라미터를 입력하십시오"
-        },
-        "fr": {
-            "description": "位置给定超限保护",
-            "cause": "",
-            "solution": "请输入正确参数"
-        }
-    },
-    {
-        "id": 34323,
-        "level": 1,
-        "en": {
-            "description": "The full closed-loop position deviation is too large",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, restart the controller, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "全闭环位置偏差过大",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "全閉ループの位置偏差過大",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Übermäßige Positionsabweichung von vollständig geschlossenen Schleifen",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "La desviación de posición de bucle cerrado total es demasiado grande",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Полное отклонение положения замкнутого контура слишком велико.",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "전체 폐쇄 루프 위치 편차 과대",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "全闭环位置偏差过大",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 65282,
-        "level": 1,
-        "en": {
-            "description": "Angle recognition failure",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, restart the controller, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "角度辨识失败",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "角度識別に失敗",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Fehler bei der Winkelerkennung",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Fallo de identificación del ángulo",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Ошибка идентификации угла",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "각도 인식 실패",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "角度辨识失败",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        }
-    },
-    {
-        "id": 65344,
-        "level": 1,
-        "en": {
-            "description": "Parameter identification failure",
-            "cause": "",
-            "solution": "Check whether the hardware is working properly, restart the controller, or contact technical support engineer"
-        },
-        "zh_CN": {
-            "description": "参数辨识失败",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        },
-        "zh_hant": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "kr": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "ja": {
-            "description": "パラメータ識別に失敗",
-            "cause": "",
-            "solution": "ハードが正常であるかを確認するか、テクニカルサポートエンジニアに連絡してください"
-        },
-        "de": {
-            "description": "Fehler bei der Parametererkennung",
-            "cause": "",
-            "solution": "Prüfen Sie, ob die Hardware in Ordnung ist, oder wenden Sie sich an einen Ingenieur des technischen Kundendienstes."
-        },
-        "vi": {
-            "description": "",
-            "cause": "",
-            "solution": ""
-        },
-        "es": {
-            "description": "Fallo de identificación del parámetro",
-            "cause": "",
-            "solution": "Compruebe si el hardware funciona correctamente o comuníquese con el ingeniero de soporte técnico"
-        },
-        "ru": {
-            "description": "Ошибка идентификации параметра",
-            "cause": "",
-            "solution": "Проверьте правильность работы оборудования или обратитесь к инженеру технической поддержки."
-        },
-        "ko": {
-            "description": "파라미터 인식 실패",
-            "cause": "",
-            "solution": "하드웨어가 정상인지 확인하거나, 기술 지원 엔지니어에게 문의하십시오"
-        },
-        "fr": {
-            "description": "参数辨识失败",
-            "cause": "",
-            "solution": "检查硬件是否正常，或联系技术支持工程师"
-        }
-    }
-]
\ No newline at end of file
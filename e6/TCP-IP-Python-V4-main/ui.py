@@ -1,13 +1,11 @@
 # -*- coding: utf-8 -*-
-from threading import Thread
 import time
 from tkinter import *
 from tkinter import ttk, messagebox
 from tkinter.scrolledtext import ScrolledText
 from dobot_api import *
-import json
-from files.alarmController import alarm_controller_list
-from files.alarmServo import alarm_servo_list
+from dobot_events import FeedbackChangeDetector
+from dobot_alarms import AlarmCatalog
 
 LABEL_JOINT = [["J1-", "J2-", "J3-", "J4-", "J5-", "J6-"],
                ["J1:", "J2:", "J3:", "J4:", "J5:", "J6:"],
@@ -31,6 +29,9 @@ LABEL_ROBOT_MODE = {
     11:	"ROBOT_MODE_JOG"
 }
 
+# 界面刷新周期(毫秒), 反馈为8ms一帧, 界面只显示最新一帧 the panel shows the newest frame at 25 Hz
+RENDER_INTERVAL_MS = 40
+
 
 class RobotUI(object):
 
@@ -225,22 +226,13 @@ class RobotUI(object):
         # initial client
         self.client_dash = None
         self.client_feed = None
+        self.render_job = None
+        self.render_seq = None
+        self.render_changes = None
+        self.label_text = {}
 
-        self.alarm_controller_dict = self.convert_dict(alarm_controller_list)
-        self.alarm_servo_dict = self.convert_dict(alarm_servo_list)
-
-    def convert_dict(self, alarm_list):
-        alarm_dict = {}
-        for i in alarm_list:
-            alarm_dict[i["id"]] = i
-        return alarm_dict
-
-    def read_file(self, path):
-        # 读json文件耗时大，选择维护两个变量alarm_controller_list alarm_servo_list
-        # self.read_file("files/alarm_controller.json")
-        with open(path, "r", encoding="utf8") as fp:
-            json_data = json.load(fp)
-        return json_data
+        # 告警码在第一次报警时才加载 alarm texts are loaded on the first error
+        self.alarm_catalog = AlarmCatalog()
 
     def mainloop(self):
         self.root.mainloop()
@@ -301,7 +293,7 @@ class RobotUI(object):
         if self.global_state["connect"]:
             print("断开成功")
             self.client_dash.close()
-            self.client_feed.close()
+            self.client_feed.stop()
             self.client_dash = None
             self.client_feed = None
 
@@ -313,8 +305,11 @@ class RobotUI(object):
                 print("连接成功")
                 self.client_dash = DobotApiDashboard(
                     self.entry_ip.get(), int(self.entry_dash.get()), self.text_log)
-                self.client_feed = DobotApiFeedBack(
+                feed = DobotApiFeedBack(
                     self.entry_ip.get(), int(self.entry_feed.get()), self.text_log)
+                self.client_feed = FeedBackHub(feed.ip, feed.port, feed)
+                self.client_feed.start()
+                self.client_dash.use_feedback(self.client_feed)
             except Exception as e:
                 messagebox.showerror("Attention!", f"Connection Error:{e}")
                 return
@@ -326,10 +321,15 @@ class RobotUI(object):
         self.set_feed_back()
 
     def set_feed_back(self):
+        # 在主线程中用 after() 定时刷新, 不在反馈线程中操作界面 Tk widgets are only touched from the main loop
+        if self.render_job is not None:
+            self.root.after_cancel(self.render_job)
+            self.render_job = None
         if self.global_state["connect"]:
-            thread = Thread(target=self.feed_back)
-            thread.setDaemon(True)
-            thread.start()
+            self.render_seq = None
+            self.render_changes = FeedbackChangeDetector(fields=("RobotMode",))
+            self.label_text.clear()
+            self.render_job = self.root.after(RENDER_INTERVAL_MS, self.feed_back)
 
     def enable(self):
         if self.global_state["enable"]:
@@ -417,67 +417,71 @@ class RobotUI(object):
             self.frame_feed, text_list[2][5], rely=0.7, x=x4, command=lambda: self.move_jog(text_list[2][0]))
 
     def feed_back(self):
-        while True:
-            print("self.global_state(connect)", self.global_state["connect"])
-            if not self.global_state["connect"]:
-                break
-
-            self.client_feed.socket_dobot.setblocking(True)  # 设置为阻塞模式
-            data = bytes()
-            temp = self.client_feed.socket_dobot.recv(144000)
-            if len(temp) > 1440:
-                temp = self.client_feed.socket_dobot.recv(144000)
-            data = temp[0:1440]
-        
-
-            a = np.frombuffer(data, dtype=MyType)
-            print("robot_mode:", a["robot_mode"][0])
-            print("test_value:", hex((a['test_value'][0])))
-            if hex((a['test_value'][0])) == '0x123456789abcdef':
-                # print('tool_vector_actual',
-                #       np.around(a['tool_vector_actual'], decimals=4))
-                # print('q_actual', np.around(a['q_actual'], decimals=4))
-
-                # Refresh Properties
-                self.label_feed_speed["text"] = a["speed_scaling"][0]
-                self.label_robot_mode["text"] = LABEL_ROBOT_MODE[a["robot_mode"][0]]
-                self.label_di_input["text"] = bin(a["digital_input_bits"][0])[
-                    2:].rjust(64, '0')
-                self.label_di_output["text"] = bin(a["digital_output_bits"][0])[
-                    2:].rjust(64, '0')
-
-                # Refresh coordinate points
-                self.set_feed_joint(LABEL_JOINT, a["q_actual"])
-                self.set_feed_joint(LABEL_COORD, a["tool_vector_actual"])
-
-                # check alarms
-                if a["robot_mode"] == 9:
-                    self.display_error_info()
-
+        if not self.global_state["connect"]:
+            self.render_job = None
+            return
+        self.render_job = self.root.after(RENDER_INTERVAL_MS, self.feed_back)
+
+        # 只取最新一帧, 期间的帧合并 frames received since the last refresh are coalesced
+        snapshot = self.client_feed.latest
+        if snapshot is None or snapshot.seq == self.render_seq:
+            return
+        self.render_seq = snapshot.seq
+        a = snapshot.data
+        # 帧已由 FeedBackHub 按 TestValue 校验 frames are checked by FeedBackHub
+
+        # 只在变化时刷新状态和IO only refresh mode and IO labels when they change
+        changes = self.render_changes
+        first = changes.state is None
+        changed = {event.field for event in changes.update(a)}
+
+        # Refresh Properties
+        self.set_label_text(self.label_feed_speed, a["SpeedScaling"][0])
+        if first or "RobotMode" in changed:
+            self.set_label_text(self.label_robot_mode, LABEL_ROBOT_MODE.get(a["RobotMode"][0], ""))
+        if first or "DigitalInputs" in changed:
+            self.set_label_text(self.label_di_input, bin(a["DigitalInputs"][0])[2:].rjust(64, '0'))
+        if first or "DigitalOutputs" in changed:
+            self.set_label_text(self.label_di_output, bin(a["DigitalOutputs"][0])[2:].rjust(64, '0'))
+
+        # Refresh coordinate points
+        self.set_feed_joint(LABEL_JOINT, a["QActual"])
+        self.set_feed_joint(LABEL_COORD, a["ToolVectorActual"])
+
+        # check alarms, 进入报警状态时查询一次 once when the robot enters error mode
+        if (first or "RobotMode" in changed) and a["RobotMode"][0] == 9:
+            self.display_error_info()
+
+    def set_label_text(self, label, text):
+        # 文本未变化时不重绘 unchanged labels are not redrawn
+        text = str(text)
+        if self.label_text.get(label) != text:
+            self.label_text[label] = text
+            label["text"] = text
 
     def display_error_info(self):
-        error_list = self.client_dash.GetErrorID().split("{")[1].split("}")[0]
-
-        error_list = json.loads(error_list)
+        error_list = parse_reply(self.client_dash.GetErrorID()).value
+        if not error_list:
+            return
         print("error_list:", error_list)
         if error_list[0]:
             for i in error_list[0]:
-                self.form_error(i, self.alarm_controller_dict,
-                                "Controller Error")
+                self.form_error(i, "controller", "Controller Error")
 
         for m in range(1, len(error_list)):
             if error_list[m]:
-                for n in range(len(error_list[m])):
-                    self.form_error(n, self.alarm_servo_dict, "Servo Error")
+                for n in error_list[m]:
+                    self.form_error(n, "servo", "Servo Error")
 
-    def form_error(self, index, alarm_dict: dict, type_text):
-        if index in alarm_dict.keys():
+    def form_error(self, index, source, type_text):
+        alarm = self.alarm_catalog.lookup(source, index, "en")
+        if alarm is not None:
             date = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
             error_info = f"Time Stamp:{date}\n"
             error_info = error_info + f"ID:{index}\n"
             error_info = error_info + \
-                f"Type:{type_text}\nLevel:{alarm_dict[index]['level']}\n" + \
-                f"Solution:{alarm_dict[index]['en']['solution']}\n"
+                f"Type:{type_text}\nLevel:{alarm.level}\n" + \
+                f"Solution:{alarm.solution}\n"
 
             self.text_err.insert(END, error_info)
 
@@ -485,10 +489,6 @@ class RobotUI(object):
         self.text_err.delete("1.0", "end")
 
     def set_feed_joint(self, label, value):
-        array_value = np.around(value, decimals=4)
-        self.label_feed_dict[label[1][0]]["text"] = array_value[0][0]
-        self.label_feed_dict[label[1][1]]["text"] = array_value[0][1]
-        self.label_feed_dict[label[1][2]]["text"] = array_value[0][2]
-        self.label_feed_dict[label[1][3]]["text"] = array_value[0][3]
-        self.label_feed_dict[label[1][4]]["text"] = array_value[0][4]
-        self.label_feed_dict[label[1][5]]["text"] = array_value[0][5]
+        array_value = np.around(value, decimals=4).reshape(-1).tolist()
+        for i in range(6):
+            self.set_label_text(self.label_feed_dict[label[1][i]], array_value[i])
@@ -22,128 +22,92 @@ class RobotModeEnum(Enum):
     ROBOT_MODE_COLLISION = 11
 
 # Port Feedback
-MyType = np.dtype([(
-    'MessageSize',
-    np.uint16,
-), (
-    'save1',
-    np.uint16,
-), (
-    'save2',
-    np.uint16,
-), (
-    'save3',
-    np.uint16,
-), (
-    'digital_input_bits',
-    np.uint64,
-), (
-    'digital_output_bits',
-    np.uint64,
-), (
-    'robot_mode',
-    np.uint64,
-), (
-    'time_stamp',
-    np.uint64,
-), (
-    'run_time',
-    np.uint64,
-), (
-    'test_value',
-    np.uint64,
-), (
-    'test_value_1',
-    np.float64,
-), (
-    'speed_scaling',
-    np.float64,
-), (
-    'linear_momentum_norm',
-    np.float64,
-), (
-    'v_main',
-    np.float64,
-), (
-    'v_robot',
-    np.float64,
-), (
-    'i_robot',
-    np.float64,
-), (
-    'ProgramState',
-    np.float64,
-), (
-    'SafetyStatus',
-    np.float64,
-), ('ToolAcceleroMeter', np.float64, (3,)),
-    ('elbow_position', np.float64, (3,)),
-    ('elbow_velocity', np.float64, (3,)),
-    ('q_target', np.float64, (6,)),
-    ('qd_target', np.float64, (6,)),
-    ('qdd_target', np.float64, (6,)),
-    ('i_target', np.float64, (6,)),
-    ('m_target', np.float64, (6,)),
-    ('q_actual', np.float64, (6,)),
-    ('qd_actual', np.float64, (6,)),
-    ('i_actual', np.float64, (6,)),
-    ('actual_TCP_force', np.float64, (6,)),
-    ('tool_vector_actual', np.float64, (6,)),
-    ('TCP_speed_actual', np.float64, (6,)),
-    ('TCP_force', np.float64, (6,)),
-    ('Tool_vector_target', np.float64, (6,)),
-    ('TCP_speed_target', np.float64, (6,)),
-    ('motor_temperatures', np.float64, (6,)),
-    ('joint_modes', np.float64, (6,)),
-    ('v_actual', np.float64, (6,)),
-    # ('dummy', np.float64, (9, 6))])
-    ('hand_type', np.byte, (4,)),
-    ('user', np.byte,),
-    ('tool', np.byte,),
-    ('run_queued_cmd', np.byte,),
-    ('pause_cmd_flag', np.byte,),
-    ('velocity_ratio', np.byte,),
-    ('acceleration_ratio', np.byte,),
-    ('jerk_ratio', np.byte,),
-    ('xyz_velocity_ratio', np.byte,),
-    ('r_velocity_ratio', np.byte,),
-    ('xyz_acceleration_ratio', np.byte,),
-    ('r_acceleration_ratio', np.byte,),
-    ('xyz_jerk_ratio', np.byte,),
-    ('r_jerk_ratio', np.byte,),
-    ('brake_status', np.byte,),
-    ('enable_status', np.byte,),
-    ('drag_status', np.byte,),
-    ('running_status', np.byte,),
-    ('error_status', np.byte,),
-    ('JogStatusCR', np.byte,),
-    ('CRRobotType', np.byte,),
-    ('drag_button_signal', np.byte,),
-    ('enable_button_signal', np.byte,),
-    ('record_button_signal', np.byte,),
-    ('reappear_button_signal', np.byte,),
-    ('jaw_button_signal', np.byte,),
-    ('six_force_online', np.byte,),
-    ('CollisionState', np.byte,),
-    ('ArmApproachState', np.byte,),
-    ('J4ApproachState', np.byte,),
-    ('J5ApproachState', np.byte,),
-    ('J6ApproachState', np.byte,),
-    ('reserve2', np.byte, (77,)),
-    ('m_actual', np.float64, (6,)),
-    ('load', np.float64,),
-    ('center_x', np.float64,),
-    ('center_y', np.float64,),
-    ('center_z', np.float64,),
-    ('user[6]', np.float64, (6,)),
-    ('tool[6]', np.float64, (6,)),
-    ('trace_index', np.float64,),
-    ('six_force_value', np.float64, (6,)),
-    ('target_quaternion', np.float64, (4,)),
-    ('actual_quaternion', np.float64, (4,)),
-    ('AutoManualMode', np.byte,),
-    ('VibrationDisZ', np.float64,),
-    ('reserve3', np.byte, (15,))])
+# 字段名与 dobot_api.py 中 FEEDBACK_LAYOUTS['V4-legacy'] 相同
+# Same layout and field names as FEEDBACK_LAYOUTS['V4-legacy'] in dobot_api.py
+MyType = np.dtype([('len', np.uint16,),
+                   ('reserve', np.byte, (6, )),
+                   ('DigitalInputs', np.uint64,),
+                   ('DigitalOutputs', np.uint64,),
+                   ('RobotMode', np.uint64,),
+                   ('TimeStamp', np.uint64,),
+                   ('RunTime', np.uint64,),
+                   ('TestValue', np.uint64,),
+                   ('reserve2', np.byte, (8, )),
+                   ('SpeedScaling', np.float64,),
+                   ('LinearMomentumNorm', np.float64,),
+                   ('VMain', np.float64,),
+                   ('VRobot', np.float64,),
+                   ('IRobot', np.float64,),
+                   ('ProgramState', np.float64,),
+                   ('SafetyStatus', np.float64,),
+                   ('ToolAcceleroMeter', np.float64, (3, )),
+                   ('ElbowPosition', np.float64, (3, )),
+                   ('ElbowVelocity', np.float64, (3, )),
+                   ('QTarget', np.float64, (6, )),
+                   ('QDTarget', np.float64, (6, )),
+                   ('QDDTarget', np.float64, (6, )),
+                   ('ITarget', np.float64, (6, )),
+                   ('MTarget', np.float64, (6, )),
+                   ('QActual', np.float64, (6, )),
+                   ('QDActual', np.float64, (6, )),
+                   ('IActual', np.float64, (6, )),
+                   ('ActualTCPForce', np.float64, (6, )),
+                   ('ToolVectorActual', np.float64, (6, )),
+                   ('TCPSpeedActual', np.float64, (6, )),
+                   ('TCPForce', np.float64, (6, )),
+                   ('ToolVectorTarget', np.float64, (6, )),
+                   ('TCPSpeedTarget', np.float64, (6, )),
+                   ('MotorTemperatures', np.float64, (6, )),
+                   ('JointModes', np.float64, (6, )),
+                   ('VActual', np.float64, (6, )),
+                   ('HandType', np.byte, (4, )),
+                   ('User', np.byte,),
+                   ('Tool', np.byte,),
+                   ('RunQueuedCmd', np.byte,),
+                   ('PauseCmdFlag', np.byte,),
+                   ('VelocityRatio', np.byte,),
+                   ('AccelerationRatio', np.byte,),
+                   ('JerkRatio', np.byte,),
+                   ('XYZVelocityRatio', np.byte,),
+                   ('RVelocityRatio', np.byte,),
+                   ('XYZAccelerationRatio', np.byte,),
+                   ('RAccelerationRatio', np.byte,),
+                   ('XYZJerkRatio', np.byte,),
+                   ('RJerkRatio', np.byte,),
+                   ('BrakeStatus', np.byte,),
+                   ('EnableStatus', np.byte,),
+                   ('DragStatus', np.byte,),
+                   ('RunningStatus', np.byte,),
+                   ('ErrorStatus', np.byte,),
+                   ('JogStatusCR', np.byte,),
+                   ('CRRobotType', np.byte,),
+                   ('DragButtonSignal', np.byte,),
+                   ('EnableButtonSignal', np.byte,),
+                   ('RecordButtonSignal', np.byte,),
+                   ('ReappearButtonSignal', np.byte,),
+                   ('JawButtonSignal', np.byte,),
+                   ('SixForceOnline', np.byte,),
+                   ('CollisionState', np.byte,),
+                   ('ArmApproachState', np.byte,),
+                   ('J4ApproachState', np.byte,),
+                   ('J5ApproachState', np.byte,),
+                   ('J6ApproachState', np.byte,),
+                   ('reserve7', np.byte, (77, )),
+                   ('MActual', np.float64, (6, )),
+                   ('Load', np.float64,),
+                   ('CenterX', np.float64,),
+                   ('CenterY', np.float64,),
+                   ('CenterZ', np.float64,),
+                   ('UserValue[6]', np.float64, (6, )),
+                   ('ToolValue[6]', np.float64, (6, )),
+                   ('TraceIndex', np.float64,),
+                   ('SixForceValue', np.float64, (6, )),
+                   ('TargetQuaternion', np.float64, (4, )),
+                   ('ActualQuaternion', np.float64, (4, )),
+                   ('AutoManualMode', np.byte,),
+                   ('VibrationDisZ', np.float64,),
+                   ('reserve9', np.byte, (15, ))
+                   ])
 
 
 class FeedbackV4Instance:
@@ -830,171 +794,131 @@ class registeringCallbacks(object):
                 fun()
 
 
-instance30004 = FeedbackV4Instance()
-def GetFeedback30004():
-    a = np.frombuffer(feedback30004.feed_back(), dtype=MyType)
-    instance30004.MessageSize = a["MessageSize"][0]
-    instance30004.DigitalInputs = a["digital_input_bits"][0]
-    instance30004.DigitalOutputs = a["digital_output_bits"][0]
-    instance30004.RobotMode = a["robot_mode"][0]
-    instance30004.TimeStamp = a["time_stamp"][0]
-    instance30004.RunTime = a["run_time"][0]
-    instance30004.TestValue = a["test_value"][0]
-    instance30004.SpeedScaling = a["speed_scaling"][0]
-    instance30004.LinearMomentumNorm = a["linear_momentum_norm"][0]
-    instance30004.VMain = a["v_main"][0]
-    instance30004.VRobot = a["v_robot"][0]
-    instance30004.IRobot = a["i_robot"][0]
-    instance30004.ProgramState = a["ProgramState"][0]
-    instance30004.SafetyStatus = a["SafetyStatus"][0]
-    instance30004.ToolAcceleroMeter = a["ToolAcceleroMeter"][0]
-    instance30004.ElbowPosition = a["elbow_position"][0]
-    instance30004.ElbowVelocity = a["elbow_velocity"][0]
-    instance30004.QTarget = a["q_target"][0]
-    instance30004.QDTarget = a["qd_target"][0]
-    instance30004.QDDTarget = a["qdd_target"][0]
-    instance30004.ITarget = a["i_target"][0]
-    instance30004.MTarget = a["m_target"][0]
-    instance30004.QActual = a["q_actual"][0]
-    instance30004.QDActual = a["qd_actual"][0]
-    instance30004.IActual = a["i_actual"][0]
-    instance30004.ActualTCPForce = a["actual_TCP_force"][0]
-    instance30004.ToolVectorActual = a["tool_vector_actual"][0]
-    instance30004.TCPSpeedActual = a["TCP_speed_actual"][0]
-    instance30004.TCPForce = a["TCP_force"][0]
-    instance30004.ToolVectorTarget = a["Tool_vector_target"][0]
-    instance30004.TCPSpeedTarget = a["TCP_speed_target"][0]
-    instance30004.MotorTemperatures = a["motor_temperatures"][0]
-    instance30004.JointModes = a["joint_modes"][0]
-    instance30004.VActual = a["v_actual"][0]
-    instance30004.HandType = a["hand_type"][0]
-    instance30004.User = a["user"][0]
-    instance30004.Tool = a["tool"][0]
-    instance30004.RunQueuedCmd = a["run_queued_cmd"][0]
-    instance30004.PauseCmdFlag = a["pause_cmd_flag"][0]
-    instance30004.VelocityRatio = a["velocity_ratio"][0]
-    instance30004.AccelerationRatio = a["acceleration_ratio"][0]
-    instance30004.JerkRatio = a["jerk_ratio"][0]
-    instance30004.XYZVelocityRatio = a["xyz_velocity_ratio"][0]
-    instance30004.RVelocityRatio = a["r_velocity_ratio"][0]
-    instance30004.XYZAccelerationRatio = a["xyz_acceleration_ratio"][0]
-    instance30004.RAccelerationRatio = a["r_acceleration_ratio"][0]
-    instance30004.XYZJerkRatio = a["xyz_jerk_ratio"][0]
-    instance30004.RJerkRatio = a["r_jerk_ratio"][0]
-    instance30004.BrakeStatus = a["brake_status"][0]
-    instance30004.EnableStatus = a["enable_status"][0]
-    instance30004.DragStatus = a["drag_status"][0]
-    instance30004.RunningStatus = a["running_status"][0]
-    instance30004.ErrorStatus = a["error_status"][0]
-    instance30004.JogStatusCR = a["JogStatusCR"][0]
-    instance30004.CRRobotType = a["CRRobotType"][0]
-    instance30004.DragButtonSignal = a["drag_button_signal"][0]
-    instance30004.EnableButtonSignal = a["enable_button_signal"][0]
-    instance30004.RecordButtonSignal = a["record_button_signal"][0]
-    instance30004.ReappearButtonSignal = a["reappear_button_signal"][0]
-    instance30004.JawButtonSignal = a["jaw_button_signal"][0]
-    instance30004.SixForceOnline = a["six_force_online"][0]
-    instance30004.CollisionState = a["CollisionState"][0]
-    instance30004.ArmApproachState = a["ArmApproachState"][0]
-    instance30004.J4ApproachState = a["J4ApproachState"][0]
-    instance30004.J5ApproachState = a["J5ApproachState"][0]
-    instance30004.J6ApproachState = a["J6ApproachState"][0]
-    instance30004.MActual = a["m_actual"][0]
-    instance30004.Load = a["load"][0]
-    instance30004.CenterX = a["center_x"][0]
-    instance30004.CenterY = a["center_y"][0]
-    instance30004.CenterZ = a["center_z"][0]
-    instance30004.Users = a["user[6]"][0]
-    instance30004.Tools = a["tool[6]"][0]
-    instance30004.TraceIndex = a["trace_index"][0]
-    instance30004.SixForceValue = a["six_force_value"][0]
-    instance30004.TargetQuaternion = a["target_quaternion"][0]
-    instance30004.ActualQuaternion = a["actual_quaternion"][0]
-    instance30004.AutoManualMode = a["AutoManualMode"][0]
-    instance30004.VibrationDisZ = a["VibrationDisZ"][0]
-    return instance30004
-
-
-instance30005 = FeedbackV4Instance()
-def GetFeedback30005():
-    a = np.frombuffer(feedback30005.feed_back(), dtype=MyType)
-    instance30005.MessageSize = a["MessageSize"][0]
-    instance30005.DigitalInputs = a["digital_input_bits"][0]
-    instance30005.DigitalOutputs = a["digital_output_bits"][0]
-    instance30005.RobotMode = a["robot_mode"][0]
-    instance30005.TimeStamp = a["time_stamp"][0]
-    instance30005.RunTime = a["run_time"][0]
-    instance30005.TestValue = a["test_value"][0]
-    instance30005.SpeedScaling = a["speed_scaling"][0]
-    instance30005.LinearMomentumNorm = a["linear_momentum_norm"][0]
-    instance30005.VMain = a["v_main"][0]
-    instance30005.VRobot = a["v_robot"][0]
-    instance30005.IRobot = a["i_robot"][0]
-    instance30005.ProgramState = a["ProgramState"][0]
-    instance30005.SafetyStatus = a["SafetyStatus"][0]
-    instance30005.ToolAcceleroMeter = a["ToolAcceleroMeter"][0]
-    instance30005.ElbowPosition = a["elbow_position"][0]
-    instance30005.ElbowVelocity = a["elbow_velocity"][0]
-    instance30005.QTarget = a["q_target"][0]
-    instance30005.QDTarget = a["qd_target"][0]
-    instance30005.QDDTarget = a["qdd_target"][0]
-    instance30005.ITarget = a["i_target"][0]
-    instance30005.MTarget = a["m_target"][0]
-    instance30005.QActual = a["q_actual"][0]
-    instance30005.QDActual = a["qd_actual"][0]
-    instance30005.IActual = a["i_actual"][0]
-    instance30005.ActualTCPForce = a["actual_TCP_force"][0]
-    instance30005.ToolVectorActual = a["tool_vector_actual"][0]
-    instance30005.TCPSpeedActual = a["TCP_speed_actual"][0]
-    instance30005.TCPForce = a["TCP_force"][0]
-    instance30005.ToolVectorTarget = a["Tool_vector_target"][0]
-    instance30005.TCPSpeedTarget = a["TCP_speed_target"][0]
-    instance30005.MotorTemperatures = a["motor_temperatures"][0]
-    instance30005.JointModes = a["joint_modes"][0]
-    instance30005.VActual = a["v_actual"][0]
-    instance30005.HandType = a["hand_type"][0]
-    instance30005.User = a["user"][0]
-    instance30005.Tool = a["tool"][0]
-    instance30005.RunQueuedCmd = a["run_queued_cmd"][0]
-    instance30005.PauseCmdFlag = a["pause_cmd_flag"][0]
-    instance30005.VelocityRatio = a["velocity_ratio"][0]
-    instance30005.AccelerationRatio = a["acceleration_ratio"][0]
-    instance30005.JerkRatio = a["jerk_ratio"][0]
-    instance30005.XYZVelocityRatio = a["xyz_velocity_ratio"][0]
-    instance30005.RVelocityRatio = a["r_velocity_ratio"][0]
-    instance30005.XYZAccelerationRatio = a["xyz_acceleration_ratio"][0]
-    instance30005.RAccelerationRatio = a["r_acceleration_ratio"][0]
-    instance30005.XYZJerkRatio = a["xyz_jerk_ratio"][0]
-    instance30005.RJerkRatio = a["r_jerk_ratio"][0]
-    instance30005.BrakeStatus = a["brake_status"][0]
-    instance30005.EnableStatus = a["enable_status"][0]
-    instance30005.DragStatus = a["drag_status"][0]
-    instance30005.RunningStatus = a["running_status"][0]
-    instance30005.ErrorStatus = a["error_status"][0]
-    instance30005.JogStatusCR = a["JogStatusCR"][0]
-    instance30005.CRRobotType = a["CRRobotType"][0]
-    instance30005.DragButtonSignal = a["drag_button_signal"][0]
-    instance30005.EnableButtonSignal = a["enable_button_signal"][0]
-    instance30005.RecordButtonSignal = a["record_button_signal"][0]
-    instance30005.ReappearButtonSignal = a["reappear_button_signal"][0]
-    instance30005.JawButtonSignal = a["jaw_button_signal"][0]
-    instance30005.SixForceOnline = a["six_force_online"][0]
-    instance30005.CollisionState = a["CollisionState"][0]
-    instance30005.ArmApproachState = a["ArmApproachState"][0]
-    instance30005.J4ApproachState = a["J4ApproachState"][0]
-    instance30005.J5ApproachState = a["J5ApproachState"][0]
-    instance30005.J6ApproachState = a["J6ApproachState"][0]
-    instance30005.MActual = a["m_actual"][0]
-    instance30005.Load = a["load"][0]
-    instance30005.CenterX = a["center_x"][0]
-    instance30005.CenterY = a["center_y"][0]
-    instance30005.CenterZ = a["center_z"][0]
-    instance30005.Users = a["user[6]"][0]
-    instance30005.Tools = a["tool[6]"][0]
-    instance30005.TraceIndex = a["trace_index"][0]
-    instance30005.SixForceValue = a["six_force_value"][0]
-    instance30005.TargetQuaternion = a["target_quaternion"][0]
-    instance30005.ActualQuaternion = a["actual_quaternion"][0]
-    instance30005.AutoManualMode = a["AutoManualMode"][0]
-    instance30005.VibrationDisZ = a["VibrationDisZ"][0]
-    return instance30005
+# FeedbackV4Instance 的属性名 -> MyType 字段名
+# FeedbackV4Instance attribute -> MyType field
+FEEDBACK_FIELDS = {
+    'MessageSize': 'len',
+    'DigitalInputs': 'DigitalInputs',
+    'DigitalOutputs': 'DigitalOutputs',
+    'RobotMode': 'RobotMode',
+    'TimeStamp': 'TimeStamp',
+    'RunTime': 'RunTime',
+    'TestValue': 'TestValue',
+    'SpeedScaling': 'SpeedScaling',
+    'LinearMomentumNorm': 'LinearMomentumNorm',
+    'VMain': 'VMain',
+    'VRobot': 'VRobot',
+    'IRobot': 'IRobot',
+    'ProgramState': 'ProgramState',
+    'SafetyStatus': 'SafetyStatus',
+    'ToolAcceleroMeter': 'ToolAcceleroMeter',
+    'ElbowPosition': 'ElbowPosition',
+    'ElbowVelocity': 'ElbowVelocity',
+    'QTarget': 'QTarget',
+    'QDTarget': 'QDTarget',
+    'QDDTarget': 'QDDTarget',
+    'ITarget': 'ITarget',
+    'MTarget': 'MTarget',
+    'QActual': 'QActual',
+    'QDActual': 'QDActual',
+    'IActual': 'IActual',
+    'ActualTCPForce': 'ActualTCPForce',
+    'ToolVectorActual': 'ToolVectorActual',
+    'TCPSpeedActual': 'TCPSpeedActual',
+    'TCPForce': 'TCPForce',
+    'ToolVectorTarget': 'ToolVectorTarget',
+    'TCPSpeedTarget': 'TCPSpeedTarget',
+    'MotorTemperatures': 'MotorTemperatures',
+    'JointModes': 'JointModes',
+    'VActual': 'VActual',
+    'HandType': 'HandType',
+    'User': 'User',
+    'Tool': 'Tool',
+    'RunQueuedCmd': 'RunQueuedCmd',
+    'PauseCmdFlag': 'PauseCmdFlag',
+    'VelocityRatio': 'VelocityRatio',
+    'AccelerationRatio': 'AccelerationRatio',
+    'JerkRatio': 'JerkRatio',
+    'XYZVelocityRatio': 'XYZVelocityRatio',
+    'RVelocityRatio': 'RVelocityRatio',
+    'XYZAccelerationRatio': 'XYZAccelerationRatio',
+    'RAccelerationRatio': 'RAccelerationRatio',
+    'XYZJerkRatio': 'XYZJerkRatio',
+    'RJerkRatio': 'RJerkRatio',
+    'BrakeStatus': 'BrakeStatus',
+    'EnableStatus': 'EnableStatus',
+    'DragStatus': 'DragStatus',
+    'RunningStatus': 'RunningStatus',
+    'ErrorStatus': 'ErrorStatus',
+    'JogStatusCR': 'JogStatusCR',
+    'CRRobotType': 'CRRobotType',
+    'DragButtonSignal': 'DragButtonSignal',
+    'EnableButtonSignal': 'EnableButtonSignal',
+    'RecordButtonSignal': 'RecordButtonSignal',
+    'ReappearButtonSignal': 'ReappearButtonSignal',
+    'JawButtonSignal': 'JawButtonSignal',
+    'SixForceOnline': 'SixForceOnline',
+    'CollisionState': 'CollisionState',
+    'ArmApproachState': 'ArmApproachState',
+    'J4ApproachState': 'J4ApproachState',
+    'J5ApproachState': 'J5ApproachState',
+    'J6ApproachState': 'J6ApproachState',
+    'MActual': 'MActual',
+    'Load': 'Load',
+    'CenterX': 'CenterX',
+    'CenterY': 'CenterY',
+    'CenterZ': 'CenterZ',
+    'Users': 'UserValue[6]',
+    'Tools': 'ToolValue[6]',
+    'TraceIndex': 'TraceIndex',
+    'SixForceValue': 'SixForceValue',
+    'TargetQuaternion': 'TargetQuaternion',
+    'ActualQuaternion': 'ActualQuaternion',
+    'AutoManualMode': 'AutoManualMode',
+    'VibrationDisZ': 'VibrationDisZ',
+}
+
+
+class FeedbackV4View:
+    """
+    反馈帧的惰性视图: 读取属性时才从帧中解码该字段, 不再每帧复制全部字段。
+    Lazy view on one feedback frame with the attributes of FeedbackV4Instance.
+
+    A field is decoded from the frame only when it is read, so a loop that
+    looks at RobotMode and QActual no longer pays for ~80 copies per frame.
+    Each call of GetFeedback30004()/GetFeedback30005() returns a new view, so
+    a view kept by the caller does not change. materialize() decodes every
+    field into a FeedbackV4Instance.
+    """
+    __slots__ = ('frame',)
+
+    def __init__(self, data):
+        self.frame = np.frombuffer(data, dtype=MyType)[0]
+
+    def materialize(self):
+        instance = FeedbackV4Instance()
+        for name in FEEDBACK_FIELDS:
+            setattr(instance, name, getattr(self, name))
+        return instance
+
+
+def _feedbackField(field):
+    return property(lambda self: self.frame[field])
+
+
+for _name, _field in FEEDBACK_FIELDS.items():
+    setattr(FeedbackV4View, _name, _feedbackField(_field))
+
+
+def GetFeedback30004(materialize=False):
+    """
+    materialize=True: 返回解码全部字段的 FeedbackV4Instance
+    materialize=True returns a fully decoded FeedbackV4Instance instead of a view.
+    """
+    view = FeedbackV4View(feedback30004.feed_back())
+    return view.materialize() if materialize else view
+
+
+def GetFeedback30005(materialize=False):
+    view = FeedbackV4View(feedback30005.feed_back())
+    return view.materialize() if materialize else view
@@ -3,12 +3,17 @@
 
 import chardet
 import logging
-import re
+import os
 import socket
+import sys
 import threading
 import time
 from time import sleep
 
+# 应答解析与 E6 SDK 共用 reply parsing is shared with the E6 SDK
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "TCP-IP-Python-V4-main"))
+from dobot_api import REPLY_NOT_TCP, parse_reply  # noqa: E402
+
 logging.basicConfig(level=logging.INFO)
 
 
@@ -73,10 +78,10 @@ class DobotRbt:
                     time.sleep(1)
 
         recvData = self.__reply()
-        # logging.info(f"rsp={self.get_rsp_id(recvData)}")
-        logging.info(f"recvData={recvData}")
-        self.get_rsp_id(recvData)
-        return self.get_rsp(recvData)
+        logging.debug("recvData=%s", recvData)
+        rsp = self.get_rsp(recvData)
+        self.__report_rsp(rsp)
+        return rsp
 
     ###
     def __reply(self):
@@ -103,38 +108,39 @@ class DobotRbt:
         解析Tcp返回值
         Parse the TCP return values
         """
-        if (
-            valueRecv.find("Not Tcp") != -1
-        ):  # 通过返回值判断机器是否处于tcp模式 Judge whether the robot is in TCP mode by the return value
-            logging.warning("Control Mode Is Not Tcp")
-            return valueRecv
-
-        recvData = re.findall(r"-?\d+", valueRecv)
-        recvData = [int(num) for num in recvData]
-        if len(recvData) > 0:
-            if recvData[0] != 0:
-                # 根据返回值来判断机器处于什么状态 Judge what status the robot is in based on the return value
-                if recvData[0] == -1:
-                    print("Command execution failed")
-                elif recvData[0] == -2:
-                    print("The robot is in an error state")
-                elif recvData[0] == -3:
-                    print("The robot is in emergency stop state")
-                elif recvData[0] == -4:
-                    print("The robot is in power down state")
-                else:
-                    print("ErrorId is ", recvData[0])
-        else:
-            print("ERROR VALUE")
-
-        return
+        rsp = self.get_rsp(valueRecv)
+        self.__report_rsp(rsp)
+        return rsp
 
     def get_rsp(self, valueRecv):
-        # 解析返回值，确保机器人在 TCP 控制模式
-        if "Not Tcp" in valueRecv:
-            print("Control Mode Is Not Tcp")
+        # 解析返回值 "ErrorID,{values},Command;": [ErrorID, 返回值...], 非TCP模式为 [1], 无法解析为 [2]
+        # [ErrorID, values...]; [1] when not in TCP mode, [2] when it is not a reply
+        try:
+            reply = parse_reply(valueRecv)
+        except ValueError:
+            return [2]
+        if reply.error_id == REPLY_NOT_TCP:
             return [1]
-        return [int(num) for num in re.findall(r"-?\d+", valueRecv)] or [2]
+        return [reply.error_id, *reply.values]
+
+    def __report_rsp(self, rsp):
+        if len(rsp) == 1 and rsp[0] == 1:
+            # 通过返回值判断机器是否处于tcp模式 Judge whether the robot is in TCP mode by the return value
+            logging.warning("Control Mode Is Not Tcp")
+        elif len(rsp) == 1 and rsp[0] == 2:
+            print("ERROR VALUE")
+        elif rsp[0] != 0:
+            # 根据返回值来判断机器处于什么状态 Judge what status the robot is in based on the return value
+            if rsp[0] == -1:
+                print("Command execution failed")
+            elif rsp[0] == -2:
+                print("The robot is in an error state")
+            elif rsp[0] == -3:
+                print("The robot is in emergency stop state")
+            elif rsp[0] == -4:
+                print("The robot is in power down state")
+            else:
+                print("ErrorId is ", rsp[0])
 
     ###
     def log(self, text):
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# E6 本地运动学: 批量正解、关节限位与工作空间检查, 不经过控制器
+# Local E6 kinematics: batched forward kinematics, joint-limit and workspace
+# checks over whole paths, without a round trip to port 29999.
+#
+#     joints = np.array([[0, 0, 0, 0, 0, 0], [0, 0, 0, 7, 3, 0]])
+#     forward(joints)        # (2, 6) poses x, y, z, rx, ry, rz
+#     check_path(joints)     # None, or the first PathIssue
+#     reachable(poses)       # (N,) bool, necessary condition before InverseKin
+#
+# 几何参数为名义值, 由零位位姿 (0, -150, 615.2, -90, 0, 180) 和
+# J(0,0,0,7,3,0) -> (-16, -150, 614, -90, 6, 177) 推得, 不是标定值。
+# The geometry is nominal: it reproduces the zero pose and the J4/J5 sample
+# above to about a millimetre, it is not a calibration. Use it to screen
+# paths; the controller's InverseKin / PositiveKin remain the reference.
+
+from collections import namedtuple
+
+import numpy as np
+
+# 名义几何参数, 单位 mm nominal geometry, mm
+E6_GEOMETRY = {
+    "d1": 165.2,  # 基座到 J2 轴 base to J2 axis
+    "a2": 200.0,  # 大臂 upper arm
+    "a3": 160.0,  # 小臂 forearm
+    "d4": 60.0,  # J4 到 J5 的横向偏距 J4 to J5 offset, along the J2/J3/J4 axes
+    "d5": 90.0,  # J4 轴到 J6 轴 J4 axis to J6 axis
+    "d6": 90.0,  # J6 到法兰 J6 axis to flange
+}
+
+# 关节限位, 单位度 joint limits, degree
+# 2025-03-26, from 越疆伍工
+E6_JOINT_LIMITS = np.array(
+    [
+        [-360.0, 360.0],
+        [-135.0, 135.0],
+        [-154.0, 154.0],
+        [-160.0, 160.0],
+        [-173.0, 173.0],
+        [-360.0, 360.0],
+    ]
+)
+
+# index: 路径中的点 point in the path; joint: 1-6, or 0 for a pose issue
+PathIssue = namedtuple("PathIssue", ["index", "joint", "value", "reason"])
+
+
+###
+def _screws(geometry: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    零位时各关节的旋转轴方向和轴上一点 (指数积公式), 以及零位法兰位姿。\n
+    joint axes (direction, point) at the zero position for the product of
+    exponentials, and the flange transform at zero.
+    """
+    d1, a2, a3, d4, d5, d6 = (geometry[k] for k in ("d1", "a2", "a3", "d4", "d5", "d6"))
+    shoulder = d1
+    elbow = d1 + a2
+    wrist = elbow + a3
+    axes = np.array(
+        [
+            [0.0, 0.0, 1.0],
+            [0.0, -1.0, 0.0],
+            [0.0, -1.0, 0.0],
+            [0.0, -1.0, 0.0],
+            [0.0, 0.0, -1.0],
+            [0.0, -1.0, 0.0],
+        ]
+    )
+    points = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, shoulder],
+            [0.0, 0.0, elbow],
+            [0.0, 0.0, wrist],
+            [0.0, -d4, 0.0],
+            [0.0, 0.0, wrist + d5],
+        ]
+    )
+    home = np.eye(4)
+    home[:3, :3] = _euler_to_matrix(np.array([[-90.0, 0.0, 180.0]]))[0]
+    home[:3, 3] = (0.0, -(d4 + d6), wrist + d5)
+    return axes, points, home
+
+
+###
+def _euler_to_matrix(angles: np.ndarray) -> np.ndarray:
+    """
+    (N,3) Rx, Ry, Rz (degree) -> (N,3,3), R = Rz @ Ry @ Rx as the controller reports poses.
+    """
+    rx, ry, rz = np.radians(angles).T
+    cx, sx, cy, sy, cz, sz = np.cos(rx), np.sin(rx), np.cos(ry), np.sin(ry), np.cos(rz), np.sin(rz)
+    matrix = np.empty((len(angles), 3, 3))
+    matrix[:, 0, 0] = cz * cy
+    matrix[:, 0, 1] = cz * sy * sx - sz * cx
+    matrix[:, 0, 2] = cz * sy * cx + sz * sx
+    matrix[:, 1, 0] = sz * cy
+    matrix[:, 1, 1] = sz * sy * sx + cz * cx
+    matrix[:, 1, 2] = sz * sy * cx - cz * sx
+    matrix[:, 2, 0] = -sy
+    matrix[:, 2, 1] = cy * sx
+    matrix[:, 2, 2] = cy * cx
+    return matrix
+
+
+###
+def _matrix_to_euler(matrix: np.ndarray) -> np.ndarray:
+    """
+    (N,3,3) -> (N,3) Rx, Ry, Rz in degree, inverse of _euler_to_matrix.
+    """
+    ry = np.arcsin(np.clip(-matrix[:, 2, 0], -1.0, 1.0))
+    rx = np.arctan2(matrix[:, 2, 1], matrix[:, 2, 2])
+    rz = np.arctan2(matrix[:, 1, 0], matrix[:, 0, 0])
+    return np.degrees(np.stack([rx, ry, rz], axis=1))
+
+
+_AXES, _POINTS, _HOME = _screws(E6_GEOMETRY)
+
+
+###
+def forward(joints, geometry: dict | None = None) -> np.ndarray:
+    """
+    批量正解 forward kinematics for a (N,6) or (6,) array of joint angles (degree). \n
+    return: poses of the same leading shape, x, y, z (mm), rx, ry, rz (degree)
+    """
+    joints = np.asarray(joints, dtype=np.float64)
+    single = joints.ndim == 1
+    joints = joints.reshape(-1, 6)
+    axes, points, home = (_AXES, _POINTS, _HOME) if geometry is None else _screws(geometry)
+
+    theta = np.radians(joints)
+    sin, cos = np.sin(theta), np.cos(theta)
+    # 每个关节的旋转 (Rodrigues), 所有点一次算完 one rotation per joint and point
+    rotation = np.zeros((len(joints), 6, 3, 3))
+    rotation[..., 0, 0] = rotation[..., 1, 1] = rotation[..., 2, 2] = 1.0
+    for j in range(6):
+        w = axes[j]
+        skew = np.array([[0.0, -w[2], w[1]], [w[2], 0.0, -w[0]], [-w[1], w[0], 0.0]])
+        rotation[:, j] += sin[:, j, None, None] * skew + (1.0 - cos[:, j, None, None]) * (skew @ skew)
+    # 绕经过 q 的轴旋转: p -> R p + (I - R) q  rotation about an axis through q
+    translation = points[None] - np.einsum("njab,jb->nja", rotation, points)
+
+    R = np.broadcast_to(np.eye(3), (len(joints), 3, 3)).copy()
+    t = np.zeros((len(joints), 3))
+    for j in range(6):
+        t = t + np.einsum("nab,nb->na", R, translation[:, j])
+        R = R @ rotation[:, j]
+    position = np.einsum("nab,b->na", R, home[:3, 3]) + t
+    orientation = R @ home[:3, :3]
+
+    poses = np.concatenate([position, _matrix_to_euler(orientation)], axis=1)
+    return poses[0] if single else poses
+
+
+###
+def joint_limit_mask(joints, limits: np.ndarray = E6_JOINT_LIMITS) -> np.ndarray:
+    """
+    (N,6) bool, True where a joint angle is outside its limits.
+    """
+    joints = np.asarray(joints, dtype=np.float64)
+    return (joints < limits[:, 0]) | (joints > limits[:, 1])
+
+
+###
+def check_joint_limits(joints, limits: np.ndarray = E6_JOINT_LIMITS) -> PathIssue | None:
+    """
+    检查一组或多组关节角 check one (6,) or a (N,6) array of joint angles. \n
+    return: the first PathIssue, or None when all angles are within the limits
+    """
+    joints = np.asarray(joints, dtype=np.float64).reshape(-1, 6)
+    out = joint_limit_mask(joints, limits)
+    if not out.any():
+        return None
+    index, joint = np.argwhere(out)[0]
+    return PathIssue(int(index), int(joint) + 1, float(joints[index, joint]), "joint limit")
+
+
+###
+def reachable(poses, margin: float = 10.0, geometry: dict | None = None) -> np.ndarray:
+    """
+    可达性预筛 pre-screen (N,6) or (6,) poses before asking the controller for InverseKin. \n
+    a pose farther from the J2 axis point than the arm can stretch (plus margin, mm)
+    is certainly unreachable; True does not guarantee that InverseKin succeeds.
+    """
+    g = E6_GEOMETRY if geometry is None else geometry
+    poses = np.asarray(poses, dtype=np.float64)
+    position = poses.reshape(-1, 6)[:, :3]
+    shoulder = np.array([0.0, 0.0, g["d1"]])
+    reach = g["a2"] + g["a3"] + np.hypot(g["d5"], g["d4"] + g["d6"])
+    result = np.linalg.norm(position - shoulder, axis=1) <= reach + margin
+    return result[0] if poses.ndim == 1 else result
+
+
+###
+def check_path(
+    joints,
+    z_min: float | None = None,
+    limits: np.ndarray = E6_JOINT_LIMITS,
+    geometry: dict | None = None,
+) -> PathIssue | None:
+    """
+    整条轨迹的离线检查 validate a whole (N,6) joint path: joint limits, and with
+    z_min (mm) that the flange stays above it at every point. \n
+    return: the first PathIssue, or None
+    """
+    joints = np.asarray(joints, dtype=np.float64).reshape(-1, 6)
+    issue = check_joint_limits(joints, limits)
+    if issue is not None:
+        return issue
+    if z_min is not None:
+        z = forward(joints, geometry)[:, 2]
+        low = np.flatnonzero(z < z_min)
+        if len(low):
+            return PathIssue(int(low[0]), 0, float(z[low[0]]), "below z_min")
+    return None
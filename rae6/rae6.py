@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+from collections import OrderedDict
 from datetime import datetime
 from enum import IntEnum
 import json
@@ -9,15 +10,34 @@ from logging.handlers import RotatingFileHandler
 import numpy as np
 import os
 from pathlib import Path
-import re
+import random
 import shutil
 import socket
+import sys
 import threading
 import time
 from time import sleep
 from typing import Dict, Union
 
+import e6kin
+
+# 应答解析和连接监管与 E6 SDK 共用 reply parsing and link supervision are shared with the E6 SDK
+E6_SDK_DIR = str(Path(__file__).resolve().parent.parent / "e6" / "TCP-IP-Python-V4-main")
+if E6_SDK_DIR not in sys.path:
+    sys.path.append(E6_SDK_DIR)
+from dobot_api import (  # noqa: E402
+    LINK_CLOSED,
+    LINK_CONNECTING,
+    LINK_DEGRADED,
+    LINK_READY,
+    REPLY_NOT_TCP,
+    ConnectionSupervisor,
+    DobotConnectionError,
+    parse_reply,
+)
+
 # Port Feedback
+# same layout and field names as FEEDBACK_LAYOUTS["V4"] in e6/TCP-IP-Python-V4-main/dobot_api.py
 MyType = np.dtype(
     [
         (
@@ -599,97 +619,296 @@ class RaE6Config:
             second = 1
         return second
 
+    @property
+    def move_timeout_secs(self):
+        sec = self.__config.get("move_timeout_seconds", 60)
+        if type(sec) in (int, float) and sec > 0:
+            return sec
+        return 60
+
+    @property
+    def command_timeout_secs(self):
+        # 每条指令等待回复的时限 deadline of one dashboard command
+        sec = self.__config.get("command_timeout_seconds", 10)
+        if type(sec) in (int, float) and sec > 0:
+            return sec
+        return 10
+
+    @property
+    def robot_ip(self):
+        # 可指向本地模拟器 may point at a local dobot_sim.py
+        return self.__config.get("robot_ip", "192.168.5.1")
+
 
 ###
 rae6cfg = RaE6Config()
 
 
 ### ----------------------------------------------------------------------------
+def parse_rsp(response: str) -> Dict[str, Union[int, str, tuple]]:
+    """
+    解析机器人命令响应字符串 "ErrorID,{ResultID},CommandString;", 返回结构化字典
+
+    返回:
+        {
+            "error_id": int,     # 错误码 (如 0)
+            "value": str,        # 结果值 (去掉大括号)
+            "command": str,      # 执行的原始命令 (去掉分号)
+            "values": tuple      # 解析后的结果值, 数字为 int/float, 列表为 list
+        }
+
+    异常:
+        ValueError: 当响应格式不符合预期时抛出
+
+    dict form of dobot_api.parse_reply().
+    """
+    if not isinstance(response, str):
+        raise ValueError("响应必须是字符串类型")
+    reply = parse_reply(response)
+    if reply.error_id == REPLY_NOT_TCP and "Not Tcp" in response:
+        return {"error_id": ErrorID.NOT_TCP, "value": "", "command": "", "values": ()}
+    begin = response.find("{", response.find(","))
+    return {
+        "error_id": reply.error_id,
+        "value": response[begin + 1:response.find("}", begin)].strip(),
+        "command": reply.command,
+        "values": reply.values,
+    }
+
+
+PROBE_TIMEOUT = 2.0  # 保活时 RobotMode() 的回复时限 keepalive answer timeout, seconds
+FEEDS_TIMEOUT = 2.0  # 超过此时间无反馈帧即断线 no feeds this long means a dead link, seconds
+MAX_STALE_RESPONSES = 8  # 超时未回复的指令过多即断线 more unanswered commands than this drop the link
+
+
+class RobotArmConnectionError(DobotConnectionError):
+    """
+    the port is not connected; raised at once instead of retrying in the caller.
+    """
+
+
+class RobotArmTimeoutError(TimeoutError):
+    """
+    no response before the deadline; the late response is discarded.
+    """
+
+
 class RobotArmApi:
 
     ###
-    def __init__(self, ip="192.168.5.1", port=29999):
+    def __init__(
+        self,
+        ip="192.168.5.1",
+        port=29999,
+        keepalive: float | None = None,
+        backoff: float = 0.2,
+        max_backoff: float = 10.0,
+        timeout: float | None = None,
+        probe=None,
+        keepalive_timeout: float = PROBE_TIMEOUT,
+    ):
         """
         - port_cmd: send command and get response via this port.
         - port_rti: get real time information from robot arm via this port. 30004 - every 8ms, 30005 - every 200ms
+        - keepalive: check an idle link every keepalive seconds with probe(), or,
+          without a probe, require data within keepalive_timeout seconds
+        - backoff, max_backoff: reconnect delay in seconds, doubled per failed attempt
+        - timeout: default deadline of send(), seconds; None waits for the response
+
+        the link itself (state, reconnect, keepalive, metrics) is a
+        ConnectionSupervisor of the E6 SDK, see self.link.
         """
         self.__ip = ip
         self.__port = port
-        self.__socket: socket = 0
         self.__global_lock = threading.Lock()
 
+        self.keepalive = keepalive
+        self.timeout = timeout
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.__probe = probe
+        self.__keepalive_timeout = keepalive_timeout
+        self.link = self.__new_link()
+        # 超时后仍会到达的回复数, 下次读取时丢弃 late responses still to come, discarded when read
+        self.__stale = 0
+        self.__rsp_buf = bytearray()
+        self.__rsp_socket = None
+
         return
 
     ###
-    def connect(self):
+    def __new_link(self) -> ConnectionSupervisor:
+        link = ConnectionSupervisor(
+            self.ip,
+            self.port,
+            backoff=self.backoff,
+            max_backoff=self.max_backoff,
+            keepalive=self.keepalive,
+            keepalive_timeout=self.__keepalive_timeout,
+            probe=None if self.__probe is None else lambda timeout: self.__probe(),
+        )
+        link.listeners.append(self.__log_state)
+        self.__logged_state = link.state
+        return link
 
-        if self.port == 29999 or self.port == 30004 or self.port == 30005:
-            try:
-                self.socket = socket.socket()
-                self.socket.connect((self.ip, self.port))
-                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 144000)
-            except socket.error:
-                rlog.error(f"socket error, ip={self.ip}, port={self.port}")
-                raise OSError(f"socket error, ip={self.ip}, port={self.port}")
-        else:
+    ###
+    def __log_state(self, state: str):
+        if state == LINK_DEGRADED:
+            rlog.error(f"e6:: {self.ip}:{self.port} lost: {self.link.last_error}")
+        rlog.info(f"e6:: {self.ip}:{self.port} {self.__logged_state} -> {state}")
+        self.__logged_state = state
+
+    ###
+    def connect(self):
+        """
+        connect once, raise OSError if that fails. after the first success a
+        background thread reconnects whenever the link is lost.
+        """
+        if self.port not in (29999, 30004, 30005):
             raise ValueError(
                 f"Connect to robot arm via port 29999 or 30004 or 30005. {self.port} is invalid."
             )
+        if self.link.state != LINK_CONNECTING:
+            return
+        link = self.link.start()
+        if link.state != LINK_READY:
+            error = link.last_error
+            link.close()
+            self.link = self.__new_link()
+            rlog.error(f"socket error, ip={self.ip}, port={self.port}: {error}")
+            raise OSError(f"socket error, ip={self.ip}, port={self.port}")
 
         return
 
     ###
-    def __send_command(self, command: str):
-        try:
-            self.socket.send(str.encode(command, "utf-8"))
-        except Exception as e:
-            rlog.error(f"socket error : {e}")
-            while True:
-                try:
-                    self.connect()
-                    self.socket.send(str.encode(command, "utf-8"))
-                    break
-                except Exception:
-                    sleep(1)
-        return
+    @property
+    def state(self) -> str:
+        return self.link.state
 
     ###
-    def __get_response(self) -> str:
+    @property
+    def last_error(self):
+        return self.link.last_error
+
+    ###
+    def touch(self):
+        """
+        record that the peer answered.
+        """
+        self.link.touch()
+
+    ###
+    def ready_socket(self):
         """
-        Read the return value
+        the socket if the link is ready, else raise RobotArmConnectionError.
         """
-        data = ""
         try:
-            data = self.socket.recv(1024)
+            return self.link.socket()
+        except DobotConnectionError as e:
+            raise RobotArmConnectionError(str(e)) from None
 
-        except Exception as e:
-            rlog.error(f"socket error : {e}")
-            self.connect()
+    ###
+    def lost(self, s, error=None):
+        """
+        s failed: close it and let the background thread reconnect.
+        ignored if s has already been replaced.
+        """
+        self.link.lost(s, error)
+
+    ###
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """
+        wait until the link is ready. \n
+        return: False if timeout (seconds) expired or the link was closed
+        """
+        return self.link.wait_ready(timeout)
+
+    ###
+    def metrics(self) -> dict:
+        """
+        state, counters and durations (seconds) of this link.
+        """
+        return self.link.metrics()
+
+    ###
+    def __send_command(self, command: str):
+        s = self.ready_socket()
+        try:
+            s.sendall(str.encode(command, "utf-8"))
+        except OSError as e:
+            self.lost(s, e)
+            raise RobotArmConnectionError(f"{self.ip}:{self.port} {e}") from e
+        return
 
-        finally:
+    ###
+    def __get_response(self, deadline: float | None) -> str:
+        """
+        Read the return value, skipping the late responses of timed out commands
+        """
+        s = self.ready_socket()
+        while True:
+            end = self.__rsp_buf.find(b";")
+            if end < 0 and self.__rsp_buf.find(b"Not Tcp") >= 0:
+                end = len(self.__rsp_buf) - 1  # 可能没有';' may come without ';'
+            if end >= 0:
+                data = bytes(self.__rsp_buf[: end + 1])
+                del self.__rsp_buf[: end + 1]
+                if self.__stale > 0:
+                    self.__stale -= 1
+                    rlog.info(f"e6:: late response discarded: {data}")
+                    continue
+                return str(data, encoding="utf-8")
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise RobotArmTimeoutError(f"{self.ip}:{self.port} no response")
+            try:
+                s.settimeout(remaining)
+                data = s.recv(1024)
+            except socket.timeout:
+                raise RobotArmTimeoutError(f"{self.ip}:{self.port} no response") from None
+            except OSError as e:
+                self.lost(s, e)
+                raise RobotArmConnectionError(f"{self.ip}:{self.port} {e}") from e
+            finally:
+                s.settimeout(None)
             if len(data) == 0:
-                data_str = data
-            else:
-                data_str = str(data, encoding="utf-8")
-            return data_str
+                self.lost(s, ConnectionError("closed by peer"))
+                raise RobotArmConnectionError(f"{self.ip}:{self.port} closed by peer")
+            self.touch()
+            self.__rsp_buf += data
 
     def __del__(self):
         self.close()
 
     def close(self):
-        if self.socket != 0:
-            try:
-                self.socket.shutdown(socket.SHUT_RDWR)
-                self.socket.close()
-            except socket.error as e:
-                rlog.error(f"Error while closing socket: {e}")
+        self.link.close()
         return
 
     ###
-    def send(self, command: str) -> str:
+    def send(self, command: str, timeout: float | None = None) -> str:
+        """
+        send command and return the response; raise RobotArmConnectionError
+        at once if the link is down, RobotArmTimeoutError if there is no
+        response within timeout (default self.timeout) seconds.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
         with self.global_lock:
+            s = self.ready_socket()
+            if s is not self.__rsp_socket:
+                # 新连接上没有迟到的回复 a new connection has no late responses
+                self.__rsp_socket = s
+                self.__stale = 0
+                self.__rsp_buf.clear()
             self.__send_command(command)
-            recv_data = self.__get_response()
+            try:
+                recv_data = self.__get_response(deadline)
+            except RobotArmTimeoutError:
+                self.__stale += 1
+                if self.__stale > MAX_STALE_RESPONSES:
+                    self.lost(s, TimeoutError(f"{self.__stale} commands without response"))
+                raise RobotArmTimeoutError(f"{self.ip}:{self.port} no response in {timeout} s: {command}") from None
             # get_rsp()
             return recv_data
 
@@ -703,44 +922,71 @@ class RobotArmApi:
 
     @property
     def socket(self):
-        return self.__socket
-
-    @socket.setter
-    def socket(self, s):
-        self.__socket = s
-        return
+        # 未连接时为0 0 while not connected
+        s = self.link.sock
+        return 0 if s is None else s
 
     @property
     def global_lock(self):
         return self.__global_lock
 
 
+###-----------------------------------------------------------------------------
+class RobotArmFeeds:
+    """
+    one snapshot of real time information: a read-only view on one frame.
+    a field is decoded from the frame only when it is read, e.g. feeds.robotMode
+    or feeds.QActual (any MyType field name). before the first frame every
+    field reads -1. materialize() decodes all fields into a dict.
+    """
+
+    __slots__ = ("frame",)
+
+    # attribute names that differ from the MyType field names
+    ALIASES = {
+        "robotMode": "RobotMode",
+        "robotCurrentCommandID": "CurrentCommandId",
+        "MessageSize": "len",
+    }
+    FIELDS = frozenset(MyType.names)
+
+    def __init__(self, frame=None):
+        self.frame = frame
+
+    def __getattr__(self, name):
+        field = RobotArmFeeds.ALIASES.get(name, name)
+        if field not in RobotArmFeeds.FIELDS:
+            raise AttributeError(name)
+        if self.frame is None:
+            return -1
+        return self.frame[field]
+
+    ###
+    def materialize(self) -> dict:
+        if self.frame is None:
+            return {}
+        return {
+            name: self.frame[name]
+            for name in MyType.names
+            if not name.startswith("reserve")
+        }
+
+
 ###-----------------------------------------------------------------------------
 class RobotArmFeedBack(RobotArmApi):
 
     ###
-    def __init__(self, ip="192.168.5.1", port=30004):
-        super().__init__(ip, port)
+    def __init__(self, ip="192.168.5.1", port=30004, keepalive: float | None = 1.0):
+        # 帧每 8ms 一次, FEEDS_TIMEOUT 内没有数据说明连接已失效
+        # a frame arrives every 8ms: no data for FEEDS_TIMEOUT means a dead link
+        super().__init__(ip, port, keepalive, keepalive_timeout=FEEDS_TIMEOUT)
         self.__MyType = []
         self.last_recv_time = time.perf_counter()
 
-        class item:
-            def __init__(self):
-                self.robotMode = -1  #
-                self.robotCurrentCommandID = 0
-                self.MessageSize = -1
-                self.DigitalInputs = -1
-                self.DigitalOutputs = -1
-
-                # 自定义添加所需反馈数据
-                self.ToolVectorActual = -1  # double 6 48 0624~0671 TCP笛卡尔实际坐标值
-                self.ToolVectorTarget = -1  # TCP笛卡尔目标坐标值
-                self.CurrentCommandId = -1  # 当前运动队列id
-                self.EnableStatus = -1
-                self.RunningStatus = -1
-                self.ErrorStatus = -1
-
-        self.feeds = item()
+        # replaced as a whole for every frame, readers need no lock.
+        self.feeds = RobotArmFeeds()
+        # notified for every frame, see wait_for_command()
+        self.__feeds_cond = threading.Condition()
 
         return
 
@@ -750,18 +996,18 @@ class RobotArmFeedBack(RobotArmApi):
         返回机械臂状态
         Return the robot status
         """
-        self.socket.setblocking(True)  # 设置为阻塞模式
+        s = self.ready_socket()
         data = bytes()
         current_recv_time = time.perf_counter()  # 计时，获取当前时间
-        temp = self.socket.recv(144000)  # 缓冲区
+        temp = self.__recv(s)  # 缓冲区
         if len(temp) > 1440:
-            temp = self.socket.recv(144000)
+            temp = self.__recv(s)
         # print("get:",len(temp))
         i = 0
         if len(temp) < 1440:
             while i < 5:
                 # print("重新接收")
-                temp = self.socket.recv(144000)
+                temp = self.__recv(s)
                 if len(temp) > 1440:
                     break
                 i += 1
@@ -782,49 +1028,191 @@ class RobotArmFeedBack(RobotArmApi):
 
         return self.__MyType
 
+    ###
+    def __recv(self, s) -> bytes:
+        try:
+            data = s.recv(144000)
+        except OSError as e:
+            self.lost(s, e)
+            raise RobotArmConnectionError(f"{self.ip}:{self.port} {e}") from e
+        if len(data) == 0:
+            self.lost(s, ConnectionError("closed by peer"))
+            raise RobotArmConnectionError(f"{self.ip}:{self.port} closed by peer")
+        self.touch()
+        return data
+
     ###
     def get_feeds(self):
         # 获取机器人状态
-        while True:
-            feeds = self.__get_rtinfo()
-            with self.global_lock:
-                if feeds is not None:
-
-                    # rlog.info(f'feeds.TestValue={feeds["TestValue"]}')
-                    # rlog.info(f'feeds.TestValue={feeds["TestValue"][0]}')
-                    # rlog.info(f'feeds.TestValue={hex(feeds["TestValue"][0])}')
-
-                    if hex((feeds["TestValue"][0])) == "0x123456789abcdef":
-                        # 基础字段
-                        self.feeds.MessageSize = feeds["len"][0]
-                        self.feeds.robotMode = feeds["RobotMode"][0]
-                        self.feeds.DigitalInputs = feeds["DigitalInputs"][0]
-                        self.feeds.DigitalOutputs = feeds["DigitalOutputs"][0]
-                        # 自定义添加所需反馈数据
-                        self.feeds.ToolVectorActual = feeds["ToolVectorActual"][0]
-                        self.feeds.ToolVectorTarget = feeds["ToolVectorTarget"][0]
-                        self.feeds.CurrentCommandId = feeds["CurrentCommandId"][0]
-                        self.feeds.EnableStatus = feeds["EnableStatus"][0]
-                        self.feeds.RunningStatus = feeds["RunningStatus"][0]
-                        self.feeds.ErrorStatus = feeds["ErrorStatus"][0]
-                        """
-                        self.feedData.DigitalOutputs = int(feedInfo['DigitalOutputs'][0])
-                        self.feedData.RobotMode = int(feedInfo['RobotMode'][0])
-                        self.feedData.TimeStamp = int(feedInfo['TimeStamp'][0])
-        
-                        """
-                else:
-                    rlog.info("feeds is none.")
+        # 每帧生成新的 RobotArmFeeds 并整体替换 self.feeds, 读取方无需加锁
+        # 字段在读取时才解码 fields are decoded only when read
+        # 连接断开时等待后台重连, 不退出 survives a lost link, waits for the reconnect
+        while self.state != LINK_CLOSED:
+            try:
+                feeds = self.__get_rtinfo()
+            except RobotArmConnectionError:
+                self.wait_ready(1.0)
+                continue
+            except Exception as e:
+                rlog.error(f"e6:: feeds error: {e}")
+                continue
+            if feeds is None:
+                rlog.info("feeds is none.")
+                continue
+
+            if feeds["TestValue"][0] != 0x0123456789ABCDEF:
+                continue
+
+            snapshot = RobotArmFeeds(feeds[0])
+            with self.__feeds_cond:
+                self.feeds = snapshot
+                self.__feeds_cond.notify_all()
 
         return
 
+    ###
+    def wait_until(self, predicate, timeout: float) -> bool:
+        """
+        wait until predicate(feeds) is true for the latest feeds. \n
+        return: False if timeout (seconds) expired first
+        """
+        deadline = time.monotonic() + timeout
+        with self.__feeds_cond:
+            while not predicate(self.feeds):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.__feeds_cond.wait(remaining)
+        return True
+
+    ###
+    def wait_for_command(self, command_id: int, timeout: float) -> bool:
+        """
+        wait until motion command command_id is done (robot back to ENABLE), or
+        robot is in ERROR / COLLISION mode. \n
+        return: False if timeout (seconds) expired first
+        """
+
+        def done(feeds: RobotArmFeeds) -> bool:
+            if feeds.robotMode in (RobotMode.ERROR, RobotMode.COLLISION):
+                return True
+            return (command_id <= feeds.CurrentCommandId) and (
+                feeds.robotMode == RobotMode.ENABLE
+            )
+
+        return self.wait_until(done, timeout)
+
+    ###
+    def wait_for_mode(self, modes: list[int], timeout: float) -> bool:
+        """
+        wait until robot mode is one of modes. \n
+        return: False if timeout (seconds) expired first
+        """
+        return self.wait_until(lambda feeds: feeds.robotMode in modes, timeout)
+
+
+### ----------------------------------------------------------------------------
+class KinCache:
+    """
+    LRU cache of successful InverseKin / PositiveKin responses. \n
+    key: command, the six values rounded to resolution (mm, degree), and
+    user / tool / useJointNear / JointNear. cleared when a coordinate system
+    command is sent (see RobotArmDashBoard.send) and when the User / Tool
+    index in the feeds changes (see sync).
+    """
+
+    # 这些指令改变坐标系, 发送后清空缓存 sending one of these clears the cache
+    INVALIDATING = ("SetUser(", "SetTool(", "CalcUser(", "CalcTool(", "User(", "Tool(")
+
+    ###
+    def __init__(self, maxsize: int = 256, resolution: float = 1e-3):
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__generation = 0
+        self.__user_tool = None
+
+    ###
+    def key(self, command: str, values, *options) -> tuple:
+        scale = 1.0 / self.resolution
+        return (command, tuple(round(value * scale) for value in values)) + options
+
+    ###
+    def fetch(self, key: tuple, send) -> str:
+        """
+        return the cached response for key, or call send() and cache its response.
+        """
+        with self.__lock:
+            response = self.__entries.get(key)
+            if response is not None:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return response
+            self.misses += 1
+            generation = self.__generation
+
+        response = send()
+        try:
+            ok = parse_rsp(response)["error_id"] == ErrorID.NO_ERROR
+        except ValueError:
+            ok = False
+        with self.__lock:
+            if ok and generation == self.__generation:
+                self.__entries[key] = response
+                if len(self.__entries) > self.maxsize:
+                    self.__entries.popitem(last=False)
+        return response
+
+    ###
+    def invalidate(self):
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+
+    ###
+    def sync(self, user, tool):
+        """
+        clear the cache if the User / Tool index of the feeds changed since the last call.
+        """
+        user_tool = (int(user), int(tool))
+        if user_tool != self.__user_tool:
+            if self.__user_tool is not None:
+                rlog.info(f"e6:: user/tool {self.__user_tool} -> {user_tool}, kinematics cache cleared.")
+                self.invalidate()
+            self.__user_tool = user_tool
+
+    def __len__(self):
+        return len(self.__entries)
+
 
 ### ----------------------------------------------------------------------------
 class RobotArmDashBoard(RobotArmApi):
 
     ###
-    def __init__(self, ip="192.168.5.1", port=29999):
-        super().__init__(ip, port)
+    def __init__(
+        self,
+        ip="192.168.5.1",
+        port=29999,
+        keepalive: float | None = 5.0,
+        timeout: float | None = None,
+    ):
+        super().__init__(ip, port, keepalive, timeout=timeout, probe=self.probe)
+        self.kin_cache = KinCache()
+
+    ###
+    def send(self, command: str, timeout: float | None = None) -> str:
+        if command.startswith(KinCache.INVALIDATING):
+            self.kin_cache.invalidate()
+        return super().send(command, timeout)
+
+    ###
+    def probe(self):
+        # 空闲时发 RobotMode(), 超时或断开即视为连接失效
+        # an idle link is checked with RobotMode(); no answer in time means it is dead
+        self.send("RobotMode()", PROBE_TIMEOUT)
 
     ###
     def RequestControl(self):
@@ -984,7 +1372,8 @@ class RobotArmDashBoard(RobotArmApi):
         for ii in params:
             string = string + "," + ii
         string = string + ")"
-        return self.send(string)
+        key = self.kin_cache.key("PositiveKin", (J1, J2, J3, J4, J5, J6), user, tool)
+        return self.kin_cache.fetch(key, lambda: self.send(string))
 
     ###
     def InverseKin(
@@ -1046,7 +1435,10 @@ class RobotArmDashBoard(RobotArmApi):
         for ii in params:
             string = string + "," + ii
         string = string + ")"
-        return self.send(string)
+        key = self.kin_cache.key(
+            "InverseKin", (X, Y, Z, Rx, Ry, Rz), user, tool, useJointNear, JointNear
+        )
+        return self.kin_cache.fetch(key, lambda: self.send(string))
 
     ###
     def GetAngle(self):
@@ -1274,90 +1666,49 @@ class RobotArmDashBoard(RobotArmApi):
         解析Tcp返回值
         Parse the TCP return values
         """
-        if (
-            valueRecv.find("Not Tcp") != -1
-        ):  # 通过返回值判断机器是否处于tcp模式 Judge whether the robot is in TCP mode by the return value
+        try:
+            result = self.parse_rsp(valueRecv)
+        except ValueError:
+            rlog.error("ERROR VALUE")
+            return []
+        if result["error_id"] == ErrorID.NOT_TCP:
+            # 通过返回值判断机器是否处于tcp模式 Judge whether the robot is in TCP mode by the return value
             rlog.warning("Control Mode Is Not Tcp")
             return [1]
 
-        recvData = re.findall(r"-?\d+", valueRecv)
-        recvData = [int(num) for num in recvData]
-        if len(recvData) > 0:
-            if recvData[0] != 0:
-                # 根据返回值来判断机器处于什么状态 Judge what status the robot is in based on the return value
-                if recvData[0] == -1:
-                    rlog.error("Command execution failed")
-                elif recvData[0] == -2:
-                    rlog.error("The robot is in an error state")
-                elif recvData[0] == -3:
-                    rlog.info("The robot is in emergency stop state")
-                elif recvData[0] == -4:
-                    rlog.info("The robot is in power down state")
-                else:
-                    rlog.info("ErrorId is ", recvData[0])
-        else:
-            rlog.error("ERROR VALUE")
+        recvData = [result["error_id"], *result["values"]]
+        if recvData[0] != 0:
+            # 根据返回值来判断机器处于什么状态 Judge what status the robot is in based on the return value
+            if recvData[0] == -1:
+                rlog.error("Command execution failed")
+            elif recvData[0] == -2:
+                rlog.error("The robot is in an error state")
+            elif recvData[0] == -3:
+                rlog.info("The robot is in emergency stop state")
+            elif recvData[0] == -4:
+                rlog.info("The robot is in power down state")
+            else:
+                rlog.info(f"ErrorId is {recvData[0]}")
 
         return recvData
 
     ###
-    def parse_rsp(self, response: str) -> Dict[str, Union[int, str]]:
+    def parse_rsp(self, response: str) -> Dict[str, Union[int, str, tuple]]:
         """
-        解析机器人命令响应字符串，返回结构化字典
-
-        参数:
-            response: 命令响应字符串，格式应为 "ErrorID,{ResultID},CommandString;"
-            例如: "0,{1},MovL(P,user,tool,a,v|speed,cp|r);"
-
-        返回:
-            包含解析结果的字典，结构:
-            {
-                "error_id": int,     # 错误码 (如 0)
-                "value": str,        # 结果值 (去掉大括号)
-                "command": str       # 执行的原始命令 (去掉分号)
-            }
-
-        异常:
-            ValueError: 当响应格式不符合预期时抛出
+        解析机器人命令响应字符串, 见模块函数 parse_rsp() see the module-level parse_rsp()
         """
-        if not isinstance(response, str):
-            raise ValueError("响应必须是字符串类型")
-
-        if "Not Tcp" in response:
-            return {
-                "error_id": ErrorID.NOT_TCP,
-                "value": "",  # 去掉ResultID可能的前后空格
-                "command": "",  # 去掉命令可能的前后空格
-            }
-
-        # 去除字符串两端的空白字符和结尾的分号
-        cleaned_response = response.strip().rstrip(";")
-
-        # 更健壮的正则表达式，允许各部分前后有空格
-        # pattern = r"^\s*(\d+)\s*,\s*{(.*?)}\s*,\s*(.*)\s*$"
-        pattern = r"^\s*(-?\d+)\s*,\s*{(.*?)}\s*,\s*(.*)\s*$"
-        match = re.fullmatch(pattern, cleaned_response)
-
-        rlog.info(f"match={match}")
-
-        if not match:
-            raise ValueError(
-                f"无效的响应格式: '{response}'。预期格式: 'ErrorID,{{ResultID}},Command;'"
-            )
-
-        try:
-            error_id = int(match.group(1))
-        except ValueError:
-            raise ValueError(f"ErrorID 必须是整数，得到: '{match.group(1)}'")
-
-        return {
-            "error_id": error_id,
-            "value": match.group(2).strip(),  # 去掉ResultID可能的前后空格
-            "command": match.group(3).strip(),  # 去掉命令可能的前后空格
-        }
+        return parse_rsp(response)
 
     ###
-    def move(self, target_6dof: list[int | float], e6feed: RobotArmFeedBack):
+    def move(
+        self,
+        target_6dof: list[int | float],
+        e6feed: RobotArmFeedBack,
+        timeout: float = 60.0,
+    ):
+        """
+        move to target_6dof and wait until done, timeout in seconds.
+        """
 
         is_error = True
         for i in range(0, 3):
@@ -1381,51 +1732,28 @@ class RobotArmDashBoard(RobotArmApi):
             return result
 
         # whether targe_6dof is out of range
+        # 重复的目标点不再请求控制器 repeated targets are answered from kin_cache
+        user, tool = int(e6feed.feeds.User), int(e6feed.feeds.Tool)
+        self.kin_cache.sync(user, tool)
+        # 明显够不到的点不必问控制器, 仅适用于基坐标系和法兰
+        # poses beyond the arm's reach need no InverseKin (base frame and flange only)
+        if (user, tool) == (0, 0) and not e6kin.reachable(target_6dof):
+            return {
+                "error_id": ErrorID.OUT_OF_RANGE,
+                "value": f"pose {target_6dof} out of reach",
+                "command": "InverseKin()",
+            }
         result = self.parse_rsp(self.InverseKin(*target_6dof))
         if result["error_id"] != ErrorID.NO_ERROR:
             return result
 
         joint_angles = [float(x) for x in result["value"].split(",")]
 
-        is_out_of_range = False
-        for index, angle in enumerate(joint_angles):
-            match index + 1:
-                case 1:
-                    if (angle < -360) or (angle > 360):
-                        is_out_of_range = True
-                        break
-                case 2:
-                    if (angle < -135) or (angle > 135):
-                        is_out_of_range = True
-                        break
-                case 3:
-                    if (angle < -154) or (angle > 154):
-                        is_out_of_range = True
-                        break
-                case 4:
-                    if (angle < -160) or (angle > 160):
-                        is_out_of_range = True
-                        break
-                case 5:
-                    if (angle < -173) or (angle > 173):
-                        is_out_of_range = True
-                        break
-                case 6:
-                    if (angle < -360) or (angle > 135):
-                        is_out_of_range = True
-                        break
-
-                # 2025-03-26， from 越疆伍工
-                # 1)轴1: 工作范围-360°到+360°
-                # 2)轴2: 工作范围-135°到+135°
-                # 3)轴3: 工作范围-154°到+154
-                # 4)轴4: 工作范围-160°到+160°
-                # 5)轴5: 工作范围-173°到+173°
-                # 6)轴6: 工作范围-360°到+360°
-        if is_out_of_range:
+        issue = e6kin.check_joint_limits(joint_angles)
+        if issue is not None:
             return {
                 "error_id": ErrorID.OUT_OF_RANGE,
-                "value": f"joint{index+1}, {angle} degree",
+                "value": f"joint{issue.joint}, {issue.value} degree",
                 "command": "InverseKin()",
             }
         rlog.info(f"joint_angles={joint_angles}")
@@ -1438,20 +1766,125 @@ class RobotArmDashBoard(RobotArmApi):
             return result
 
         command_id = int(result["value"])
-        for i in range(0, 5):
-            if (command_id <= e6feed.feeds.CurrentCommandId) and (
-                e6feed.feeds.robotMode == RobotMode.ENABLE
+        rlog.info(f"e6:: moving to {target_6dof}, command id {command_id}")
+        if not e6feed.wait_for_command(command_id, timeout):
+            rlog.info(f"e6:: move to {target_6dof}, not done in {timeout} second(s).")
+            result["error_id"] = ErrorID.NOT_FULFIL
+        elif e6feed.feeds.robotMode != RobotMode.ENABLE:
+            rlog.info(f"e6:: move to {target_6dof}, mode[{e6feed.feeds.robotMode}].")
+            result["error_id"] = ErrorID.NOT_FULFIL
+        else:
+            rlog.info(f"e6:: move to {target_6dof}, done.")
+            result["error_id"] = ErrorID.NO_ERROR
+
+        return result
+
+    ###
+    def move_path(
+        self,
+        targets: list[list[int | float]],
+        e6feed: RobotArmFeedBack,
+        timeout: float = 60.0,
+        depth: int = 8,
+        cp: int = 50,
+    ):
+        """
+        move through targets (poses) with MovL and cp blending, without stopping
+        at each point, and wait until the last one is reached. \n
+        every point is solved with InverseKin and the joints of the whole path
+        are checked against the joint limits before the first MovL is sent;
+        the MovL then go out with those joints. \n
+        at most depth MovL are in the controller's queue at a time: the next one
+        is sent when CurrentCommandId in the feeds shows there is room. timeout
+        in seconds, for any one point.
+        """
+        user, tool = int(e6feed.feeds.User), int(e6feed.feeds.Tool)
+        self.kin_cache.sync(user, tool)
+        if (user, tool) == (0, 0):
+            out = np.flatnonzero(~e6kin.reachable(np.asarray(targets, dtype=np.float64)))
+            if len(out):
+                return {
+                    "error_id": ErrorID.OUT_OF_RANGE,
+                    "value": f"pose {targets[out[0]]} out of reach",
+                    "command": "MovL()",
+                }
+
+        # 整条路径先逆解并检查关节限位 solve and check the whole path first
+        joints = []
+        for target in targets:
+            result = self.parse_rsp(self.InverseKin(*target))
+            if result["error_id"] != ErrorID.NO_ERROR:
+                return result
+            joints.append([float(x) for x in result["value"].split(",")])
+        issue = e6kin.check_path(joints)
+        if issue is not None:
+            return {
+                "error_id": ErrorID.OUT_OF_RANGE,
+                "value": f"point {issue.index}, joint{issue.joint}, {issue.value} degree",
+                "command": "InverseKin()",
+            }
+
+        def queued(feeds: RobotArmFeeds) -> int:
+            if not ids:
+                return 0
+            current = int(feeds.CurrentCommandId)
+            if (
+                current >= ids[-1]
+                and not feeds.RunQueuedCmd
+                and feeds.robotMode == RobotMode.ENABLE
             ):
-                rlog.info(f"e6:: move to {target_6dof}, done.")
-                result["error_id"] = ErrorID.NO_ERROR
-                break
+                return 0
+            return len([i for i in ids if i >= current])
 
-            sleep(0.5)
-            rlog.info(f"e6:: moving to {target_6dof}, try#{i+1}")
-            result["error_id"] = ErrorID.NOT_FULFIL
+        def failed(feeds: RobotArmFeeds) -> bool:
+            return feeds.robotMode in (RobotMode.ERROR, RobotMode.COLLISION)
+
+        ids = []
+        result = {"error_id": ErrorID.NO_ERROR, "value": "", "command": "MovL()"}
+        try:
+            for joint_angles in joints:
+                if not e6feed.wait_until(
+                    lambda feeds: failed(feeds) or queued(feeds) < depth, timeout
+                ):
+                    result["error_id"] = ErrorID.NOT_FULFIL
+                    break
+                if failed(e6feed.feeds):
+                    result["error_id"] = ErrorID.NOT_FULFIL
+                    break
+                result = self.parse_rsp(self.MovL(*joint_angles, coordinateMode=1, cp=cp))
+                if result["error_id"] != ErrorID.NO_ERROR:
+                    break
+                ids.append(int(result["value"]))
 
+            if result["error_id"] == ErrorID.NO_ERROR:
+                if not e6feed.wait_until(
+                    lambda feeds: failed(feeds) or queued(feeds) == 0, timeout
+                ) or failed(e6feed.feeds):
+                    result["error_id"] = ErrorID.NOT_FULFIL
+        except Exception as e:
+            # 已排队的 MovL 会继续执行, 先停下再抛出 queued MovL keep running: stop them, then re-raise
+            rlog.error(f"e6:: path of {len(targets)} point(s) failed after {len(ids)} sent: {e}")
+            self.__stop()
+            raise
+
+        if result["error_id"] != ErrorID.NO_ERROR:
+            rlog.info(f"e6:: path of {len(targets)} point(s) stopped after {len(ids)} sent: {result}")
+            self.__stop()
+        else:
+            rlog.info(f"e6:: path of {len(targets)} point(s), done.")
         return result
 
+    ###
+    def __stop(self):
+        # 停止运动; 连接断开时等待重连 stop the motion, waiting for a reconnect if the link is down
+        try:
+            if self.wait_ready(PROBE_TIMEOUT):
+                self.send("Stop()", PROBE_TIMEOUT)
+            else:
+                rlog.error(f"e6:: Stop() not sent, {self.ip}:{self.port} {self.state}")
+        except (RobotArmConnectionError, RobotArmTimeoutError) as e:
+            rlog.error(f"e6:: Stop() failed: {e}")
+
 
 def find_6dof_file(fpath: str) -> list[str]:
     """
@@ -1471,30 +1904,28 @@ def find_6dof_file(fpath: str) -> list[str]:
     return txt_files_sorted
 
 
-#
-def read_6dof_file(file: str) -> list[float]:
+def read_path_file(file: str) -> list[list[float]]:
     """
-    file: txt file to read
-    return: 6dof
+    file: txt file to read, one 6dof per line; a single-pose file is a path of one point
+    return: list of 6dof
     """
-    floats = []
-
+    targets = []
     with open(file, encoding="utf-8") as f:
-        line = f.readline().strip()
-        numbers = line.split(",")
-        # print(f"numbers=#{numbers}#")
-
-        if len(numbers) != 6:
-            raise ValueError(
-                f"文件 {file.name} 数据格式错误：应为 6 个数字，实际为 {len(numbers)} 个"
-            )
-
-        for num in numbers:
+        for line in f:
+            numbers = line.strip().split(",")
+            if numbers == [""]:
+                continue
+            if len(numbers) != 6:
+                raise ValueError(
+                    f"文件 {file.name} 数据格式错误：应为 6 个数字，实际为 {len(numbers)} 个"
+                )
             try:
-                floats.append(float(num))
+                targets.append([float(num) for num in numbers])
             except ValueError:
-                raise ValueError(f"文件 {file.name} 包含非浮点数: '{num}'")
-    return floats
+                raise ValueError(f"文件 {file.name} 包含非浮点数: '{line.strip()}'")
+    if not targets:
+        raise ValueError(f"文件 {file.name} 为空")
+    return targets
 
 
 ###-----------------------------------------------------------------------------
@@ -1513,8 +1944,10 @@ def main():
 
     # connect to e6
     rlog.info("connecting ...")
-    e6rarm = RobotArmDashBoard(ip="192.168.5.1", port=29999)
-    e6feed = RobotArmFeedBack(ip="192.168.5.1", port=30004)
+    e6rarm = RobotArmDashBoard(
+        ip=rae6cfg.robot_ip, port=29999, timeout=rae6cfg.command_timeout_secs
+    )
+    e6feed = RobotArmFeedBack(ip=rae6cfg.robot_ip, port=30004)
     e6rarm.connect()
     e6feed.connect()
     rlog.info("e6:: initialized and connected.")
@@ -1595,12 +2028,14 @@ def main():
             for file in flist:
                 fn = file.name
                 try:
-                    floats = read_6dof_file(file)
+                    # 多行文件按一条连续轨迹执行 a file of several lines is one blended path
+                    targets = read_path_file(file)
                 except Exception as e:
                     rlog.error(f"处理文件 {file.name} 时出错: {e}")
                     fn += "_" + datetime.now().strftime("%Y%m%d%H%M%S") + "_file_error"
                     shutil.move(str(file), str(dest_dir / fn))
                     rlog.info(f"已移动 {file.name} 到 moved 子目录 {fn}")
+                    continue
                 # else:
                 #     fn += "_" + datetime.now().strftime("%Y%m%d%H%M%S") + "_moved"
                 # finally:
@@ -1620,8 +2055,18 @@ def main():
                 # else:
                 #     rlog.warning(f"e6 :: {rae6.get_status_message(error_id)}.\n")
                 #     fn += "_" + datetime.now().strftime("%Y%m%d%H%M%S") + "_robot_error"
-                target_6dof = floats
-                result = e6rarm.move(target_6dof, e6feed)
+                try:
+                    if len(targets) == 1:
+                        target_6dof = targets[0]
+                        result = e6rarm.move(target_6dof, e6feed, rae6cfg.move_timeout_secs)
+                    else:
+                        target_6dof = targets
+                        result = e6rarm.move_path(targets, e6feed, rae6cfg.move_timeout_secs)
+                except (RobotArmConnectionError, RobotArmTimeoutError) as e:
+                    # 文件留在原处, 重连后再执行 leave the file, retry it once reconnected
+                    rlog.error(f"e6:: {file.name} not done, {e}. metrics={e6rarm.metrics()}")
+                    e6rarm.wait_ready(rae6cfg.move_timeout_secs)
+                    break
                 if result["error_id"] != ErrorID.NO_ERROR:
                     rlog.error(
                         f"e6:: error occured while try move to {target_6dof} : {result}"